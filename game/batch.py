@@ -0,0 +1,156 @@
+# batch.py
+# Desc: Vectorized simulator that advances many games at once as arrays of board masks.
+#   Policies are lookup tables indexed by board.tableIndex(board, roll), rather than player objects.
+# Author: Noah Black (noah.black0425@gmail.com)
+# Last Updated: October 17th, 2026
+
+
+# NATIVE IMPORTS.
+from functools import cache
+from typing import Generator
+# THIRD-PARTY IMPORTS.
+import numpy as np
+# LOCAL IMPORTS.
+from .board import ROLL_SLOTS, fullBoard, loadMoveTable
+
+
+# CONSTANTS.
+DEFAULT_CHUNK_SIZE: int = 1000000
+
+
+# FUNCTIONS.
+@cache
+def moveArrays(tileCount: int = 9) -> tuple[np.ndarray, np.ndarray]:
+    """Get the move table as padded arrays for vectorized lookups.
+
+    :param tileCount: Number of tiles in the game
+    :type tileCount: int
+    :return: Move masks of shape (boards * ROLL_SLOTS, max moves) and move counts per table index
+    :rtype: tuple[np.ndarray, np.ndarray]
+    """
+    # Scatter the CSR move list into a padded 2D array, one row per table entry.
+    moveTable = loadMoveTable(tileCount)
+    offsets = np.frombuffer(moveTable.offsets, dtype = np.uint32).astype(np.intp)
+    moveMasks = np.frombuffer(moveTable.moveMasks, dtype = np.uint16)
+    counts = np.diff(offsets)
+    rows = np.repeat(np.arange(len(counts)), counts)
+    slots = np.arange(len(moveMasks)) - offsets[rows]
+    moves = np.zeros((len(counts), max(int(counts.max()), 1)), dtype = np.uint16)
+    moves[rows, slots] = moveMasks
+    return moves, counts.astype(np.uint8)
+
+@cache
+def scoreArray(tileCount: int = 9) -> np.ndarray:
+    """Get the final score for every possible board as an array.
+
+    :param tileCount: Number of tiles in the game
+    :type tileCount: int
+    :return: Tile sums indexed by board mask
+    :rtype: np.ndarray
+    """
+    return np.array(loadMoveTable(tileCount).sums, dtype = np.uint8)
+
+def emptyPolicy(tileCount: int = 9) -> np.ndarray:
+    """Create a blank deterministic policy table.
+
+    :param tileCount: Number of tiles in the game
+    :type tileCount: int
+    :return: Zeroed move masks of shape (boards, ROLL_SLOTS)
+    :rtype: np.ndarray
+    """
+    return np.zeros((1 << tileCount, ROLL_SLOTS), dtype = np.uint16)
+
+def uniformPolicy(tileCount: int = 9) -> np.ndarray:
+    """Create a stochastic policy that picks uniformly between all valid moves.
+
+    :param tileCount: Number of tiles in the game
+    :type tileCount: int
+    :return: Move probabilities of shape (boards, ROLL_SLOTS, max moves)
+    :rtype: np.ndarray
+    """
+    moves, counts = moveArrays(tileCount)
+    probabilities = np.zeros(moves.shape, dtype = np.float64)
+    hasMoves = counts > 0
+    slots = np.arange(moves.shape[1])
+    probabilities[hasMoves] = (slots < counts[hasMoves, None]) / counts[hasMoves, None]
+    return probabilities.reshape(1 << tileCount, ROLL_SLOTS, -1)
+
+def runBatch(policy: np.ndarray, count: int, tileCount: int = 9, rng: np.random.Generator | None = None) -> tuple[np.ndarray, np.ndarray]:
+    """Play a batch of games in lockstep using a policy table.
+
+    Deterministic policies hold the selected move mask for each (board, roll), with 0 where no move exists.
+    Stochastic policies hold a probability for each move slot of moveArrays() instead.
+
+    :param policy: Policy table of shape (boards, ROLL_SLOTS) or (boards, ROLL_SLOTS, max moves)
+    :type policy: np.ndarray
+    :param count: Number of games to play
+    :type count: int
+    :param tileCount: Number of tiles in each game
+    :type tileCount: int
+    :param rng: Random generator used for dice and stochastic moves
+    :type rng: np.random.Generator | None
+    :return: Final scores and roll counts for each game
+    :rtype: tuple[np.ndarray, np.ndarray]
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+
+    # Flatten the policy so it can be indexed with the same (board << 4) | roll layout as the move tables.
+    isStochastic = (policy.ndim == 3)
+    if isStochastic:
+        moves, counts = moveArrays(tileCount)
+        cumulative = np.cumsum(policy.reshape(len(moves), -1), axis = 1)
+    else:
+        flatPolicy = policy.reshape(-1)
+
+    boards = np.full(count, fullBoard(tileCount), dtype = np.uint16)
+    rollCounts = np.zeros(count, dtype = np.uint8)
+    active = np.arange(count)
+    while active.size > 0:
+        # Roll two dice for every game still in progress.
+        rolls = rng.integers(1, 7, size = active.size, dtype = np.uint16)
+        rolls += rng.integers(1, 7, size = active.size, dtype = np.uint16)
+        rollCounts[active] += 1
+        # Widen boards before shifting, since from 13 tiles up the shifted board no longer fits in 16 bits.
+        indices = (boards[active].astype(np.intp) << 4) | rolls
+
+        # Look up the selected move for each game. Games without a move select the empty mask.
+        if isStochastic:
+            draws = rng.random(active.size)
+            slots = (cumulative[indices] <= draws[:, None]).sum(axis = 1)
+            slots = np.minimum(slots, np.maximum(counts[indices].astype(np.intp) - 1, 0))
+            selected = moves[indices, slots]
+        else:
+            selected = flatPolicy[indices]
+
+        # Apply moves, then drop any games that are stuck or have shut the box.
+        boards[active] ^= selected
+        active = active[(selected != 0) & (boards[active] != 0)]
+
+    return scoreArray(tileCount)[boards], rollCounts
+
+def runBatchIterator(policy: np.ndarray, limit: int, chunkSize: int = DEFAULT_CHUNK_SIZE, **batchKwargs) -> Generator[tuple[np.ndarray, np.ndarray], None, None]:
+    """Play a large number of games as a series of fixed-size batches.
+
+    :param policy: Policy table passed to runBatch()
+    :type policy: np.ndarray
+    :param limit: Total number of games to play
+    :type limit: int
+    :param chunkSize: Maximum number of games per batch
+    :type chunkSize: int
+    :return: Final scores and roll counts for each batch
+    :rtype: Generator[tuple[np.ndarray, np.ndarray], None, None]
+    """
+    remaining = limit
+    while remaining > 0:
+        batchSize = min(remaining, chunkSize)
+        yield runBatch(policy, batchSize, **batchKwargs)
+        remaining -= batchSize
+
+
+# MAIN ENTRY.
+def main() -> None:
+    raise NotImplementedError
+
+if __name__=="__main__":
+    main()
@@ -0,0 +1,236 @@
+# board.py
+# Desc: Bitmask helpers and precomputed move tables for the game engine.
+#   A board is stored as an integer where bit (n - 1) is set while tile n is still open, and moves use the same layout.
+# Author: Noah Black (noah.black0425@gmail.com)
+# Last Updated: October 17th, 2026
+
+
+# NATIVE IMPORTS.
+import os
+from array import array
+from functools import cache
+# THIRD-PARTY IMPORTS.
+# LOCAL IMPORTS.
+from .cache import ARTIFACT_PATH, ROLL_SLOTS, generateMoveTable, readMoveTable
+
+
+# CONSTANTS.
+MAX_TILE_COUNT: int = 16
+# Artifact read by loadMoveTable(). Worker pools can point this at a shared file with useMoveTableFile().
+moveTablePath: str = ARTIFACT_PATH
+
+
+# CLASSES.
+class MoveTable():
+    def __init__(self, tileCount: int, offsets: array | memoryview, moveMasks: array | memoryview) -> None:
+        # Moves are stored CSR-style: every (board, roll) entry is a slice of moveMasks, bounded by offsets[index:index + 2].
+        self._tileCount: int = tileCount
+        self._boardCount: int = 1 << tileCount
+        self._offsets: array | memoryview = offsets
+        self._moveMasks: array | memoryview = moveMasks
+
+        # Sum of the tiles held in each possible board.
+        self._sums: list[int] = [ 0 ] * self._boardCount
+        for mask in range(1, self._boardCount):
+            lowestBit = mask & -mask
+            self._sums[mask] = self._sums[mask ^ lowestBit] + lowestBit.bit_length()
+
+        # Tuple views are built the first time an entry is read. Identical moves and identical entries share one
+        # interned tuple, so the views only ever hold a handful of distinct objects.
+        entryCount = self._boardCount * ROLL_SLOTS
+        self._maskViews: list[tuple[int, ...] | None] = [ None ] * entryCount
+        self._moveViews: list[tuple[tuple[int, ...], ...] | None] = [ None ] * entryCount
+        self._internedMasks: dict[tuple[int, ...], tuple[int, ...]] = {}
+        self._internedMoves: dict[tuple[int, ...], tuple[tuple[int, ...], ...]] = {}
+        self._internedTiles: dict[int, tuple[int, ...]] = {}
+
+    @property
+    def tileCount(self) -> int:
+        return self._tileCount
+
+    @property
+    def boardCount(self) -> int:
+        return self._boardCount
+
+    @property
+    def entryCount(self) -> int:
+        return len(self._offsets) - 1
+
+    @property
+    def offsets(self) -> array | memoryview:
+        return self._offsets
+
+    @property
+    def moveMasks(self) -> array | memoryview:
+        return self._moveMasks
+
+    @property
+    def sums(self) -> list[int]:
+        return self._sums
+
+    def moveCount(self, index: int) -> int:
+        """Get the # of valid moves for a table entry.
+
+        :param index: Table index from tableIndex()
+        :type index: int
+        :return: Number of moves
+        :rtype: int
+        """
+        return self._offsets[index + 1] - self._offsets[index]
+
+    def masksAt(self, index: int) -> tuple[int, ...]:
+        """Get the move masks for a table entry.
+
+        :param index: Table index from tableIndex()
+        :type index: int
+        :return: Interned tuple of move masks
+        :rtype: tuple[int, ...]
+        """
+        masks = self._maskViews[index]
+        if masks is None:
+            masks = tuple(self._moveMasks[self._offsets[index]:self._offsets[index + 1]])
+            masks = self._internedMasks.setdefault(masks, masks)
+            self._maskViews[index] = masks
+        return masks
+
+    def movesAt(self, index: int) -> tuple[tuple[int, ...], ...]:
+        """Get the moves for a table entry as tuples of tile values.
+
+        :param index: Table index from tableIndex()
+        :type index: int
+        :return: Interned tuple of moves
+        :rtype: tuple[tuple[int, ...], ...]
+        """
+        moves = self._moveViews[index]
+        if moves is None:
+            masks = self.masksAt(index)
+            moves = self._internedMoves.get(masks)
+            if moves is None:
+                moves = tuple(self._tilesFor(mask) for mask in masks)
+                self._internedMoves[masks] = moves
+            self._moveViews[index] = moves
+        return moves
+
+    def _tilesFor(self, mask: int) -> tuple[int, ...]:
+        tiles = self._internedTiles.get(mask)
+        if tiles is None:
+            tiles = tuple(maskToTiles(mask))
+            self._internedTiles[mask] = tiles
+        return tiles
+
+
+# FUNCTIONS.
+def tileMask(tile: int) -> int:
+    """Get the bit used to represent a single tile.
+
+    :param tile: Tile value, starting from 1
+    :type tile: int
+    :return: Bitmask with only the given tile set
+    :rtype: int
+    """
+    return 1 << (tile - 1)
+
+def fullBoard(tileCount: int) -> int:
+    """Get the starting board for a game with the given # of tiles.
+
+    :param tileCount: Number of tiles in the game
+    :type tileCount: int
+    :return: Bitmask with every tile set
+    :rtype: int
+    """
+    return (1 << tileCount) - 1
+
+def tilesToMask(tiles: list[int]) -> int:
+    """Convert a list of tile values into a bitmask.
+
+    :param tiles: Tile values, starting from 1
+    :type tiles: list[int]
+    :return: Bitmask containing each given tile
+    :rtype: int
+    """
+    mask = 0
+    for tile in tiles:
+        mask |= 1 << (tile - 1)
+    return mask
+
+def maskToTiles(mask: int) -> list[int]:
+    """Convert a bitmask into a sorted list of tile values.
+
+    :param mask: Board or move bitmask
+    :type mask: int
+    :return: Tile values in ascending order
+    :rtype: list[int]
+    """
+    tiles = []
+    tile = 1
+    while mask:
+        if mask & 1:
+            tiles.append(tile)
+        mask >>= 1
+        tile += 1
+    return tiles
+
+def tableIndex(board: int, roll: int) -> int:
+    """Get the flat move table index for a given board and roll total.
+
+    :param board: Board bitmask
+    :type board: int
+    :param roll: Roll total
+    :type roll: int
+    :return: Index into the move tables
+    :rtype: int
+    """
+    return (board << 4) | roll
+
+def useMoveTableFile(path: str) -> None:
+    """Load move tables from a different artifact, such as one written once for a whole worker pool.
+
+    :param path: Move table artifact path, as written by game.cache.writeMoveTable()
+    :type path: str
+    """
+    global moveTablePath
+    moveTablePath = path
+    loadMoveTable.cache_clear()
+    return
+
+def artifactTileCount() -> int:
+    """Get the largest tile count that can be mapped from the current move table artifact.
+
+    :return: Tile count of the artifact, or 0 if it does not exist
+    :rtype: int
+    """
+    if not os.path.exists(moveTablePath):
+        return 0
+    return readMoveTable(moveTablePath)[0]
+
+@cache
+def loadMoveTable(tileCount: int = 9) -> MoveTable:
+    """Load the move table for a game with the given # of tiles.
+
+    Tables are built on first use, then shared by every caller in the process. Boards made up of the lowest tiles are
+    a prefix of any larger table, so games up to the artifact's tile count map it directly. Larger games are generated.
+
+    :param tileCount: Number of tiles in the game
+    :type tileCount: int
+    :return: Move table
+    :rtype: MoveTable
+    """
+    if tileCount < 1 or tileCount > MAX_TILE_COUNT:
+        raise Exception(f"Tile count {tileCount} is not supported by the move table (1-{MAX_TILE_COUNT}).")
+
+    # Fall back to generating the table if the artifact is missing or too small.
+    if artifactTileCount() >= tileCount:
+        _, offsets, moveMasks = readMoveTable(moveTablePath)
+    else:
+        offsets, moveMasks = generateMoveTable(tileCount)
+
+    entryCount = (1 << tileCount) * ROLL_SLOTS
+    return MoveTable(tileCount, offsets[:entryCount + 1], moveMasks[:offsets[entryCount]])
+
+
+# MAIN ENTRY.
+def main() -> None:
+    raise NotImplementedError
+
+if __name__=="__main__":
+    main()
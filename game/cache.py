@@ -1,5882 +1,143 @@
-BASIC_ROLL_CACHE = {
-    2:  [[2]],
-    3:  [[3], [1, 2]],
-    4:  [[4], [1, 3]],
-    5:  [[5], [1, 4], [2, 3]],
-    6:  [[6], [1, 5], [2, 4], [1, 2, 3]],
-    7:  [[7], [1, 6], [2, 5], [3, 4], [1, 2, 4]],
-    8:  [[8], [1, 7], [2, 6], [3, 5], [1, 2, 5], [1, 3, 4]],
-    9:  [[9], [1, 8], [2, 7], [3, 6], [4, 5], [1, 2, 6], [1, 3, 5], [2, 3, 4]],
-    10: [[1, 9], [2, 8], [3, 7], [4, 6], [1, 2, 7], [1, 3, 6], [1, 4, 5], [2, 3, 5], [1, 2, 3, 4]],
-    11: [[2, 9], [3, 8], [4, 7], [5, 6], [1, 2, 8], [1, 3, 7], [1, 4, 6], [2, 3, 6], [2, 4, 5], [1, 2, 3, 5]],
-    12: [[3, 9], [4, 8], [5, 7], [1, 2, 9], [1, 3, 8], [1, 4, 7], [1, 5, 6], [2, 3, 7], [2, 4, 6], [3, 4, 5], [1, 2, 3, 6], [1, 2, 4, 5]]
-}
+# cache.py
+# Desc: Generates the move table for every (board, roll) pair, and reads/writes it and policy tables as binary files.
+#   Files are memory-mapped read-only when loaded, so every process in a worker pool shares one copy of their pages.
+#   The move table artifact is reproducible from generateMoveTable(), and can be rebuilt by running this module directly.
+# Author: Noah Black (noah.black0425@gmail.com)
+# Last Updated: October 17th, 2026
 
-FULL_ROLL_CACHE: dict = {'10+': [],
- '10+1': [],
- '10+12': [],
- '10+123': [],
- '10+1234': [[1, 2, 3, 4]],
- '10+12345': [[1, 4, 5], [2, 3, 5], [1, 2, 3, 4]],
- '10+123456': [[4, 6], [1, 3, 6], [1, 4, 5], [2, 3, 5], [1, 2, 3, 4]],
- '10+1234567': [[3, 7],
-                [4, 6],
-                [1, 2, 7],
-                [1, 3, 6],
-                [1, 4, 5],
-                [2, 3, 5],
-                [1, 2, 3, 4]],
- '10+12345678': [[2, 8],
-                 [3, 7],
-                 [4, 6],
-                 [1, 2, 7],
-                 [1, 3, 6],
-                 [1, 4, 5],
-                 [2, 3, 5],
-                 [1, 2, 3, 4]],
- '10+123456789': [[1, 9],
-                  [2, 8],
-                  [3, 7],
-                  [4, 6],
-                  [1, 2, 7],
-                  [1, 3, 6],
-                  [1, 4, 5],
-                  [2, 3, 5],
-                  [1, 2, 3, 4]],
- '10+12345679': [[1, 9],
-                 [3, 7],
-                 [4, 6],
-                 [1, 2, 7],
-                 [1, 3, 6],
-                 [1, 4, 5],
-                 [2, 3, 5],
-                 [1, 2, 3, 4]],
- '10+1234568': [[2, 8], [4, 6], [1, 3, 6], [1, 4, 5], [2, 3, 5], [1, 2, 3, 4]],
- '10+12345689': [[1, 9],
-                 [2, 8],
-                 [4, 6],
-                 [1, 3, 6],
-                 [1, 4, 5],
-                 [2, 3, 5],
-                 [1, 2, 3, 4]],
- '10+1234569': [[1, 9], [4, 6], [1, 3, 6], [1, 4, 5], [2, 3, 5], [1, 2, 3, 4]],
- '10+123457': [[3, 7], [1, 2, 7], [1, 4, 5], [2, 3, 5], [1, 2, 3, 4]],
- '10+1234578': [[2, 8], [3, 7], [1, 2, 7], [1, 4, 5], [2, 3, 5], [1, 2, 3, 4]],
- '10+12345789': [[1, 9],
-                 [2, 8],
-                 [3, 7],
-                 [1, 2, 7],
-                 [1, 4, 5],
-                 [2, 3, 5],
-                 [1, 2, 3, 4]],
- '10+1234579': [[1, 9], [3, 7], [1, 2, 7], [1, 4, 5], [2, 3, 5], [1, 2, 3, 4]],
- '10+123458': [[2, 8], [1, 4, 5], [2, 3, 5], [1, 2, 3, 4]],
- '10+1234589': [[1, 9], [2, 8], [1, 4, 5], [2, 3, 5], [1, 2, 3, 4]],
- '10+123459': [[1, 9], [1, 4, 5], [2, 3, 5], [1, 2, 3, 4]],
- '10+12346': [[4, 6], [1, 3, 6], [1, 2, 3, 4]],
- '10+123467': [[3, 7], [4, 6], [1, 2, 7], [1, 3, 6], [1, 2, 3, 4]],
- '10+1234678': [[2, 8], [3, 7], [4, 6], [1, 2, 7], [1, 3, 6], [1, 2, 3, 4]],
- '10+12346789': [[1, 9],
-                 [2, 8],
-                 [3, 7],
-                 [4, 6],
-                 [1, 2, 7],
-                 [1, 3, 6],
-                 [1, 2, 3, 4]],
- '10+1234679': [[1, 9], [3, 7], [4, 6], [1, 2, 7], [1, 3, 6], [1, 2, 3, 4]],
- '10+123468': [[2, 8], [4, 6], [1, 3, 6], [1, 2, 3, 4]],
- '10+1234689': [[1, 9], [2, 8], [4, 6], [1, 3, 6], [1, 2, 3, 4]],
- '10+123469': [[1, 9], [4, 6], [1, 3, 6], [1, 2, 3, 4]],
- '10+12347': [[3, 7], [1, 2, 7], [1, 2, 3, 4]],
- '10+123478': [[2, 8], [3, 7], [1, 2, 7], [1, 2, 3, 4]],
- '10+1234789': [[1, 9], [2, 8], [3, 7], [1, 2, 7], [1, 2, 3, 4]],
- '10+123479': [[1, 9], [3, 7], [1, 2, 7], [1, 2, 3, 4]],
- '10+12348': [[2, 8], [1, 2, 3, 4]],
- '10+123489': [[1, 9], [2, 8], [1, 2, 3, 4]],
- '10+12349': [[1, 9], [1, 2, 3, 4]],
- '10+1235': [[2, 3, 5]],
- '10+12356': [[1, 3, 6], [2, 3, 5]],
- '10+123567': [[3, 7], [1, 2, 7], [1, 3, 6], [2, 3, 5]],
- '10+1235678': [[2, 8], [3, 7], [1, 2, 7], [1, 3, 6], [2, 3, 5]],
- '10+12356789': [[1, 9], [2, 8], [3, 7], [1, 2, 7], [1, 3, 6], [2, 3, 5]],
- '10+1235679': [[1, 9], [3, 7], [1, 2, 7], [1, 3, 6], [2, 3, 5]],
- '10+123568': [[2, 8], [1, 3, 6], [2, 3, 5]],
- '10+1235689': [[1, 9], [2, 8], [1, 3, 6], [2, 3, 5]],
- '10+123569': [[1, 9], [1, 3, 6], [2, 3, 5]],
- '10+12357': [[3, 7], [1, 2, 7], [2, 3, 5]],
- '10+123578': [[2, 8], [3, 7], [1, 2, 7], [2, 3, 5]],
- '10+1235789': [[1, 9], [2, 8], [3, 7], [1, 2, 7], [2, 3, 5]],
- '10+123579': [[1, 9], [3, 7], [1, 2, 7], [2, 3, 5]],
- '10+12358': [[2, 8], [2, 3, 5]],
- '10+123589': [[1, 9], [2, 8], [2, 3, 5]],
- '10+12359': [[1, 9], [2, 3, 5]],
- '10+1236': [[1, 3, 6]],
- '10+12367': [[3, 7], [1, 2, 7], [1, 3, 6]],
- '10+123678': [[2, 8], [3, 7], [1, 2, 7], [1, 3, 6]],
- '10+1236789': [[1, 9], [2, 8], [3, 7], [1, 2, 7], [1, 3, 6]],
- '10+123679': [[1, 9], [3, 7], [1, 2, 7], [1, 3, 6]],
- '10+12368': [[2, 8], [1, 3, 6]],
- '10+123689': [[1, 9], [2, 8], [1, 3, 6]],
- '10+12369': [[1, 9], [1, 3, 6]],
- '10+1237': [[3, 7], [1, 2, 7]],
- '10+12378': [[2, 8], [3, 7], [1, 2, 7]],
- '10+123789': [[1, 9], [2, 8], [3, 7], [1, 2, 7]],
- '10+12379': [[1, 9], [3, 7], [1, 2, 7]],
- '10+1238': [[2, 8]],
- '10+12389': [[1, 9], [2, 8]],
- '10+1239': [[1, 9]],
- '10+124': [],
- '10+1245': [[1, 4, 5]],
- '10+12456': [[4, 6], [1, 4, 5]],
- '10+124567': [[4, 6], [1, 2, 7], [1, 4, 5]],
- '10+1245678': [[2, 8], [4, 6], [1, 2, 7], [1, 4, 5]],
- '10+12456789': [[1, 9], [2, 8], [4, 6], [1, 2, 7], [1, 4, 5]],
- '10+1245679': [[1, 9], [4, 6], [1, 2, 7], [1, 4, 5]],
- '10+124568': [[2, 8], [4, 6], [1, 4, 5]],
- '10+1245689': [[1, 9], [2, 8], [4, 6], [1, 4, 5]],
- '10+124569': [[1, 9], [4, 6], [1, 4, 5]],
- '10+12457': [[1, 2, 7], [1, 4, 5]],
- '10+124578': [[2, 8], [1, 2, 7], [1, 4, 5]],
- '10+1245789': [[1, 9], [2, 8], [1, 2, 7], [1, 4, 5]],
- '10+124579': [[1, 9], [1, 2, 7], [1, 4, 5]],
- '10+12458': [[2, 8], [1, 4, 5]],
- '10+124589': [[1, 9], [2, 8], [1, 4, 5]],
- '10+12459': [[1, 9], [1, 4, 5]],
- '10+1246': [[4, 6]],
- '10+12467': [[4, 6], [1, 2, 7]],
- '10+124678': [[2, 8], [4, 6], [1, 2, 7]],
- '10+1246789': [[1, 9], [2, 8], [4, 6], [1, 2, 7]],
- '10+124679': [[1, 9], [4, 6], [1, 2, 7]],
- '10+12468': [[2, 8], [4, 6]],
- '10+124689': [[1, 9], [2, 8], [4, 6]],
- '10+12469': [[1, 9], [4, 6]],
- '10+1247': [[1, 2, 7]],
- '10+12478': [[2, 8], [1, 2, 7]],
- '10+124789': [[1, 9], [2, 8], [1, 2, 7]],
- '10+12479': [[1, 9], [1, 2, 7]],
- '10+1248': [[2, 8]],
- '10+12489': [[1, 9], [2, 8]],
- '10+1249': [[1, 9]],
- '10+125': [],
- '10+1256': [],
- '10+12567': [[1, 2, 7]],
- '10+125678': [[2, 8], [1, 2, 7]],
- '10+1256789': [[1, 9], [2, 8], [1, 2, 7]],
- '10+125679': [[1, 9], [1, 2, 7]],
- '10+12568': [[2, 8]],
- '10+125689': [[1, 9], [2, 8]],
- '10+12569': [[1, 9]],
- '10+1257': [[1, 2, 7]],
- '10+12578': [[2, 8], [1, 2, 7]],
- '10+125789': [[1, 9], [2, 8], [1, 2, 7]],
- '10+12579': [[1, 9], [1, 2, 7]],
- '10+1258': [[2, 8]],
- '10+12589': [[1, 9], [2, 8]],
- '10+1259': [[1, 9]],
- '10+126': [],
- '10+1267': [[1, 2, 7]],
- '10+12678': [[2, 8], [1, 2, 7]],
- '10+126789': [[1, 9], [2, 8], [1, 2, 7]],
- '10+12679': [[1, 9], [1, 2, 7]],
- '10+1268': [[2, 8]],
- '10+12689': [[1, 9], [2, 8]],
- '10+1269': [[1, 9]],
- '10+127': [[1, 2, 7]],
- '10+1278': [[2, 8], [1, 2, 7]],
- '10+12789': [[1, 9], [2, 8], [1, 2, 7]],
- '10+1279': [[1, 9], [1, 2, 7]],
- '10+128': [[2, 8]],
- '10+1289': [[1, 9], [2, 8]],
- '10+129': [[1, 9]],
- '10+13': [],
- '10+134': [],
- '10+1345': [[1, 4, 5]],
- '10+13456': [[4, 6], [1, 3, 6], [1, 4, 5]],
- '10+134567': [[3, 7], [4, 6], [1, 3, 6], [1, 4, 5]],
- '10+1345678': [[3, 7], [4, 6], [1, 3, 6], [1, 4, 5]],
- '10+13456789': [[1, 9], [3, 7], [4, 6], [1, 3, 6], [1, 4, 5]],
- '10+1345679': [[1, 9], [3, 7], [4, 6], [1, 3, 6], [1, 4, 5]],
- '10+134568': [[4, 6], [1, 3, 6], [1, 4, 5]],
- '10+1345689': [[1, 9], [4, 6], [1, 3, 6], [1, 4, 5]],
- '10+134569': [[1, 9], [4, 6], [1, 3, 6], [1, 4, 5]],
- '10+13457': [[3, 7], [1, 4, 5]],
- '10+134578': [[3, 7], [1, 4, 5]],
- '10+1345789': [[1, 9], [3, 7], [1, 4, 5]],
- '10+134579': [[1, 9], [3, 7], [1, 4, 5]],
- '10+13458': [[1, 4, 5]],
- '10+134589': [[1, 9], [1, 4, 5]],
- '10+13459': [[1, 9], [1, 4, 5]],
- '10+1346': [[4, 6], [1, 3, 6]],
- '10+13467': [[3, 7], [4, 6], [1, 3, 6]],
- '10+134678': [[3, 7], [4, 6], [1, 3, 6]],
- '10+1346789': [[1, 9], [3, 7], [4, 6], [1, 3, 6]],
- '10+134679': [[1, 9], [3, 7], [4, 6], [1, 3, 6]],
- '10+13468': [[4, 6], [1, 3, 6]],
- '10+134689': [[1, 9], [4, 6], [1, 3, 6]],
- '10+13469': [[1, 9], [4, 6], [1, 3, 6]],
- '10+1347': [[3, 7]],
- '10+13478': [[3, 7]],
- '10+134789': [[1, 9], [3, 7]],
- '10+13479': [[1, 9], [3, 7]],
- '10+1348': [],
- '10+13489': [[1, 9]],
- '10+1349': [[1, 9]],
- '10+135': [],
- '10+1356': [[1, 3, 6]],
- '10+13567': [[3, 7], [1, 3, 6]],
- '10+135678': [[3, 7], [1, 3, 6]],
- '10+1356789': [[1, 9], [3, 7], [1, 3, 6]],
- '10+135679': [[1, 9], [3, 7], [1, 3, 6]],
- '10+13568': [[1, 3, 6]],
- '10+135689': [[1, 9], [1, 3, 6]],
- '10+13569': [[1, 9], [1, 3, 6]],
- '10+1357': [[3, 7]],
- '10+13578': [[3, 7]],
- '10+135789': [[1, 9], [3, 7]],
- '10+13579': [[1, 9], [3, 7]],
- '10+1358': [],
- '10+13589': [[1, 9]],
- '10+1359': [[1, 9]],
- '10+136': [[1, 3, 6]],
- '10+1367': [[3, 7], [1, 3, 6]],
- '10+13678': [[3, 7], [1, 3, 6]],
- '10+136789': [[1, 9], [3, 7], [1, 3, 6]],
- '10+13679': [[1, 9], [3, 7], [1, 3, 6]],
- '10+1368': [[1, 3, 6]],
- '10+13689': [[1, 9], [1, 3, 6]],
- '10+1369': [[1, 9], [1, 3, 6]],
- '10+137': [[3, 7]],
- '10+1378': [[3, 7]],
- '10+13789': [[1, 9], [3, 7]],
- '10+1379': [[1, 9], [3, 7]],
- '10+138': [],
- '10+1389': [[1, 9]],
- '10+139': [[1, 9]],
- '10+14': [],
- '10+145': [[1, 4, 5]],
- '10+1456': [[4, 6], [1, 4, 5]],
- '10+14567': [[4, 6], [1, 4, 5]],
- '10+145678': [[4, 6], [1, 4, 5]],
- '10+1456789': [[1, 9], [4, 6], [1, 4, 5]],
- '10+145679': [[1, 9], [4, 6], [1, 4, 5]],
- '10+14568': [[4, 6], [1, 4, 5]],
- '10+145689': [[1, 9], [4, 6], [1, 4, 5]],
- '10+14569': [[1, 9], [4, 6], [1, 4, 5]],
- '10+1457': [[1, 4, 5]],
- '10+14578': [[1, 4, 5]],
- '10+145789': [[1, 9], [1, 4, 5]],
- '10+14579': [[1, 9], [1, 4, 5]],
- '10+1458': [[1, 4, 5]],
- '10+14589': [[1, 9], [1, 4, 5]],
- '10+1459': [[1, 9], [1, 4, 5]],
- '10+146': [[4, 6]],
- '10+1467': [[4, 6]],
- '10+14678': [[4, 6]],
- '10+146789': [[1, 9], [4, 6]],
- '10+14679': [[1, 9], [4, 6]],
- '10+1468': [[4, 6]],
- '10+14689': [[1, 9], [4, 6]],
- '10+1469': [[1, 9], [4, 6]],
- '10+147': [],
- '10+1478': [],
- '10+14789': [[1, 9]],
- '10+1479': [[1, 9]],
- '10+148': [],
- '10+1489': [[1, 9]],
- '10+149': [[1, 9]],
- '10+15': [],
- '10+156': [],
- '10+1567': [],
- '10+15678': [],
- '10+156789': [[1, 9]],
- '10+15679': [[1, 9]],
- '10+1568': [],
- '10+15689': [[1, 9]],
- '10+1569': [[1, 9]],
- '10+157': [],
- '10+1578': [],
- '10+15789': [[1, 9]],
- '10+1579': [[1, 9]],
- '10+158': [],
- '10+1589': [[1, 9]],
- '10+159': [[1, 9]],
- '10+16': [],
- '10+167': [],
- '10+1678': [],
- '10+16789': [[1, 9]],
- '10+1679': [[1, 9]],
- '10+168': [],
- '10+1689': [[1, 9]],
- '10+169': [[1, 9]],
- '10+17': [],
- '10+178': [],
- '10+1789': [[1, 9]],
- '10+179': [[1, 9]],
- '10+18': [],
- '10+189': [[1, 9]],
- '10+19': [[1, 9]],
- '10+2': [],
- '10+23': [],
- '10+234': [],
- '10+2345': [[2, 3, 5]],
- '10+23456': [[4, 6], [2, 3, 5]],
- '10+234567': [[3, 7], [4, 6], [2, 3, 5]],
- '10+2345678': [[2, 8], [3, 7], [4, 6], [2, 3, 5]],
- '10+23456789': [[2, 8], [3, 7], [4, 6], [2, 3, 5]],
- '10+2345679': [[3, 7], [4, 6], [2, 3, 5]],
- '10+234568': [[2, 8], [4, 6], [2, 3, 5]],
- '10+2345689': [[2, 8], [4, 6], [2, 3, 5]],
- '10+234569': [[4, 6], [2, 3, 5]],
- '10+23457': [[3, 7], [2, 3, 5]],
- '10+234578': [[2, 8], [3, 7], [2, 3, 5]],
- '10+2345789': [[2, 8], [3, 7], [2, 3, 5]],
- '10+234579': [[3, 7], [2, 3, 5]],
- '10+23458': [[2, 8], [2, 3, 5]],
- '10+234589': [[2, 8], [2, 3, 5]],
- '10+23459': [[2, 3, 5]],
- '10+2346': [[4, 6]],
- '10+23467': [[3, 7], [4, 6]],
- '10+234678': [[2, 8], [3, 7], [4, 6]],
- '10+2346789': [[2, 8], [3, 7], [4, 6]],
- '10+234679': [[3, 7], [4, 6]],
- '10+23468': [[2, 8], [4, 6]],
- '10+234689': [[2, 8], [4, 6]],
- '10+23469': [[4, 6]],
- '10+2347': [[3, 7]],
- '10+23478': [[2, 8], [3, 7]],
- '10+234789': [[2, 8], [3, 7]],
- '10+23479': [[3, 7]],
- '10+2348': [[2, 8]],
- '10+23489': [[2, 8]],
- '10+2349': [],
- '10+235': [[2, 3, 5]],
- '10+2356': [[2, 3, 5]],
- '10+23567': [[3, 7], [2, 3, 5]],
- '10+235678': [[2, 8], [3, 7], [2, 3, 5]],
- '10+2356789': [[2, 8], [3, 7], [2, 3, 5]],
- '10+235679': [[3, 7], [2, 3, 5]],
- '10+23568': [[2, 8], [2, 3, 5]],
- '10+235689': [[2, 8], [2, 3, 5]],
- '10+23569': [[2, 3, 5]],
- '10+2357': [[3, 7], [2, 3, 5]],
- '10+23578': [[2, 8], [3, 7], [2, 3, 5]],
- '10+235789': [[2, 8], [3, 7], [2, 3, 5]],
- '10+23579': [[3, 7], [2, 3, 5]],
- '10+2358': [[2, 8], [2, 3, 5]],
- '10+23589': [[2, 8], [2, 3, 5]],
- '10+2359': [[2, 3, 5]],
- '10+236': [],
- '10+2367': [[3, 7]],
- '10+23678': [[2, 8], [3, 7]],
- '10+236789': [[2, 8], [3, 7]],
- '10+23679': [[3, 7]],
- '10+2368': [[2, 8]],
- '10+23689': [[2, 8]],
- '10+2369': [],
- '10+237': [[3, 7]],
- '10+2378': [[2, 8], [3, 7]],
- '10+23789': [[2, 8], [3, 7]],
- '10+2379': [[3, 7]],
- '10+238': [[2, 8]],
- '10+2389': [[2, 8]],
- '10+239': [],
- '10+24': [],
- '10+245': [],
- '10+2456': [[4, 6]],
- '10+24567': [[4, 6]],
- '10+245678': [[2, 8], [4, 6]],
- '10+2456789': [[2, 8], [4, 6]],
- '10+245679': [[4, 6]],
- '10+24568': [[2, 8], [4, 6]],
- '10+245689': [[2, 8], [4, 6]],
- '10+24569': [[4, 6]],
- '10+2457': [],
- '10+24578': [[2, 8]],
- '10+245789': [[2, 8]],
- '10+24579': [],
- '10+2458': [[2, 8]],
- '10+24589': [[2, 8]],
- '10+2459': [],
- '10+246': [[4, 6]],
- '10+2467': [[4, 6]],
- '10+24678': [[2, 8], [4, 6]],
- '10+246789': [[2, 8], [4, 6]],
- '10+24679': [[4, 6]],
- '10+2468': [[2, 8], [4, 6]],
- '10+24689': [[2, 8], [4, 6]],
- '10+2469': [[4, 6]],
- '10+247': [],
- '10+2478': [[2, 8]],
- '10+24789': [[2, 8]],
- '10+2479': [],
- '10+248': [[2, 8]],
- '10+2489': [[2, 8]],
- '10+249': [],
- '10+25': [],
- '10+256': [],
- '10+2567': [],
- '10+25678': [[2, 8]],
- '10+256789': [[2, 8]],
- '10+25679': [],
- '10+2568': [[2, 8]],
- '10+25689': [[2, 8]],
- '10+2569': [],
- '10+257': [],
- '10+2578': [[2, 8]],
- '10+25789': [[2, 8]],
- '10+2579': [],
- '10+258': [[2, 8]],
- '10+2589': [[2, 8]],
- '10+259': [],
- '10+26': [],
- '10+267': [],
- '10+2678': [[2, 8]],
- '10+26789': [[2, 8]],
- '10+2679': [],
- '10+268': [[2, 8]],
- '10+2689': [[2, 8]],
- '10+269': [],
- '10+27': [],
- '10+278': [[2, 8]],
- '10+2789': [[2, 8]],
- '10+279': [],
- '10+28': [[2, 8]],
- '10+289': [[2, 8]],
- '10+29': [],
- '10+3': [],
- '10+34': [],
- '10+345': [],
- '10+3456': [[4, 6]],
- '10+34567': [[3, 7], [4, 6]],
- '10+345678': [[3, 7], [4, 6]],
- '10+3456789': [[3, 7], [4, 6]],
- '10+345679': [[3, 7], [4, 6]],
- '10+34568': [[4, 6]],
- '10+345689': [[4, 6]],
- '10+34569': [[4, 6]],
- '10+3457': [[3, 7]],
- '10+34578': [[3, 7]],
- '10+345789': [[3, 7]],
- '10+34579': [[3, 7]],
- '10+3458': [],
- '10+34589': [],
- '10+3459': [],
- '10+346': [[4, 6]],
- '10+3467': [[3, 7], [4, 6]],
- '10+34678': [[3, 7], [4, 6]],
- '10+346789': [[3, 7], [4, 6]],
- '10+34679': [[3, 7], [4, 6]],
- '10+3468': [[4, 6]],
- '10+34689': [[4, 6]],
- '10+3469': [[4, 6]],
- '10+347': [[3, 7]],
- '10+3478': [[3, 7]],
- '10+34789': [[3, 7]],
- '10+3479': [[3, 7]],
- '10+348': [],
- '10+3489': [],
- '10+349': [],
- '10+35': [],
- '10+356': [],
- '10+3567': [[3, 7]],
- '10+35678': [[3, 7]],
- '10+356789': [[3, 7]],
- '10+35679': [[3, 7]],
- '10+3568': [],
- '10+35689': [],
- '10+3569': [],
- '10+357': [[3, 7]],
- '10+3578': [[3, 7]],
- '10+35789': [[3, 7]],
- '10+3579': [[3, 7]],
- '10+358': [],
- '10+3589': [],
- '10+359': [],
- '10+36': [],
- '10+367': [[3, 7]],
- '10+3678': [[3, 7]],
- '10+36789': [[3, 7]],
- '10+3679': [[3, 7]],
- '10+368': [],
- '10+3689': [],
- '10+369': [],
- '10+37': [[3, 7]],
- '10+378': [[3, 7]],
- '10+3789': [[3, 7]],
- '10+379': [[3, 7]],
- '10+38': [],
- '10+389': [],
- '10+39': [],
- '10+4': [],
- '10+45': [],
- '10+456': [[4, 6]],
- '10+4567': [[4, 6]],
- '10+45678': [[4, 6]],
- '10+456789': [[4, 6]],
- '10+45679': [[4, 6]],
- '10+4568': [[4, 6]],
- '10+45689': [[4, 6]],
- '10+4569': [[4, 6]],
- '10+457': [],
- '10+4578': [],
- '10+45789': [],
- '10+4579': [],
- '10+458': [],
- '10+4589': [],
- '10+459': [],
- '10+46': [[4, 6]],
- '10+467': [[4, 6]],
- '10+4678': [[4, 6]],
- '10+46789': [[4, 6]],
- '10+4679': [[4, 6]],
- '10+468': [[4, 6]],
- '10+4689': [[4, 6]],
- '10+469': [[4, 6]],
- '10+47': [],
- '10+478': [],
- '10+4789': [],
- '10+479': [],
- '10+48': [],
- '10+489': [],
- '10+49': [],
- '10+5': [],
- '10+56': [],
- '10+567': [],
- '10+5678': [],
- '10+56789': [],
- '10+5679': [],
- '10+568': [],
- '10+5689': [],
- '10+569': [],
- '10+57': [],
- '10+578': [],
- '10+5789': [],
- '10+579': [],
- '10+58': [],
- '10+589': [],
- '10+59': [],
- '10+6': [],
- '10+67': [],
- '10+678': [],
- '10+6789': [],
- '10+679': [],
- '10+68': [],
- '10+689': [],
- '10+69': [],
- '10+7': [],
- '10+78': [],
- '10+789': [],
- '10+79': [],
- '10+8': [],
- '10+89': [],
- '10+9': [],
- '11+': [],
- '11+1': [],
- '11+12': [],
- '11+123': [],
- '11+1234': [],
- '11+12345': [[2, 4, 5], [1, 2, 3, 5]],
- '11+123456': [[5, 6], [1, 4, 6], [2, 3, 6], [2, 4, 5], [1, 2, 3, 5]],
- '11+1234567': [[4, 7],
-                [5, 6],
-                [1, 3, 7],
-                [1, 4, 6],
-                [2, 3, 6],
-                [2, 4, 5],
-                [1, 2, 3, 5]],
- '11+12345678': [[3, 8],
-                 [4, 7],
-                 [5, 6],
-                 [1, 2, 8],
-                 [1, 3, 7],
-                 [1, 4, 6],
-                 [2, 3, 6],
-                 [2, 4, 5],
-                 [1, 2, 3, 5]],
- '11+123456789': [[2, 9],
-                  [3, 8],
-                  [4, 7],
-                  [5, 6],
-                  [1, 2, 8],
-                  [1, 3, 7],
-                  [1, 4, 6],
-                  [2, 3, 6],
-                  [2, 4, 5],
-                  [1, 2, 3, 5]],
- '11+12345679': [[2, 9],
-                 [4, 7],
-                 [5, 6],
-                 [1, 3, 7],
-                 [1, 4, 6],
-                 [2, 3, 6],
-                 [2, 4, 5],
-                 [1, 2, 3, 5]],
- '11+1234568': [[3, 8],
-                [5, 6],
-                [1, 2, 8],
-                [1, 4, 6],
-                [2, 3, 6],
-                [2, 4, 5],
-                [1, 2, 3, 5]],
- '11+12345689': [[2, 9],
-                 [3, 8],
-                 [5, 6],
-                 [1, 2, 8],
-                 [1, 4, 6],
-                 [2, 3, 6],
-                 [2, 4, 5],
-                 [1, 2, 3, 5]],
- '11+1234569': [[2, 9], [5, 6], [1, 4, 6], [2, 3, 6], [2, 4, 5], [1, 2, 3, 5]],
- '11+123457': [[4, 7], [1, 3, 7], [2, 4, 5], [1, 2, 3, 5]],
- '11+1234578': [[3, 8], [4, 7], [1, 2, 8], [1, 3, 7], [2, 4, 5], [1, 2, 3, 5]],
- '11+12345789': [[2, 9],
-                 [3, 8],
-                 [4, 7],
-                 [1, 2, 8],
-                 [1, 3, 7],
-                 [2, 4, 5],
-                 [1, 2, 3, 5]],
- '11+1234579': [[2, 9], [4, 7], [1, 3, 7], [2, 4, 5], [1, 2, 3, 5]],
- '11+123458': [[3, 8], [1, 2, 8], [2, 4, 5], [1, 2, 3, 5]],
- '11+1234589': [[2, 9], [3, 8], [1, 2, 8], [2, 4, 5], [1, 2, 3, 5]],
- '11+123459': [[2, 9], [2, 4, 5], [1, 2, 3, 5]],
- '11+12346': [[1, 4, 6], [2, 3, 6]],
- '11+123467': [[4, 7], [1, 3, 7], [1, 4, 6], [2, 3, 6]],
- '11+1234678': [[3, 8], [4, 7], [1, 2, 8], [1, 3, 7], [1, 4, 6], [2, 3, 6]],
- '11+12346789': [[2, 9],
-                 [3, 8],
-                 [4, 7],
-                 [1, 2, 8],
-                 [1, 3, 7],
-                 [1, 4, 6],
-                 [2, 3, 6]],
- '11+1234679': [[2, 9], [4, 7], [1, 3, 7], [1, 4, 6], [2, 3, 6]],
- '11+123468': [[3, 8], [1, 2, 8], [1, 4, 6], [2, 3, 6]],
- '11+1234689': [[2, 9], [3, 8], [1, 2, 8], [1, 4, 6], [2, 3, 6]],
- '11+123469': [[2, 9], [1, 4, 6], [2, 3, 6]],
- '11+12347': [[4, 7], [1, 3, 7]],
- '11+123478': [[3, 8], [4, 7], [1, 2, 8], [1, 3, 7]],
- '11+1234789': [[2, 9], [3, 8], [4, 7], [1, 2, 8], [1, 3, 7]],
- '11+123479': [[2, 9], [4, 7], [1, 3, 7]],
- '11+12348': [[3, 8], [1, 2, 8]],
- '11+123489': [[2, 9], [3, 8], [1, 2, 8]],
- '11+12349': [[2, 9]],
- '11+1235': [[1, 2, 3, 5]],
- '11+12356': [[5, 6], [2, 3, 6], [1, 2, 3, 5]],
- '11+123567': [[5, 6], [1, 3, 7], [2, 3, 6], [1, 2, 3, 5]],
- '11+1235678': [[3, 8], [5, 6], [1, 2, 8], [1, 3, 7], [2, 3, 6], [1, 2, 3, 5]],
- '11+12356789': [[2, 9],
-                 [3, 8],
-                 [5, 6],
-                 [1, 2, 8],
-                 [1, 3, 7],
-                 [2, 3, 6],
-                 [1, 2, 3, 5]],
- '11+1235679': [[2, 9], [5, 6], [1, 3, 7], [2, 3, 6], [1, 2, 3, 5]],
- '11+123568': [[3, 8], [5, 6], [1, 2, 8], [2, 3, 6], [1, 2, 3, 5]],
- '11+1235689': [[2, 9], [3, 8], [5, 6], [1, 2, 8], [2, 3, 6], [1, 2, 3, 5]],
- '11+123569': [[2, 9], [5, 6], [2, 3, 6], [1, 2, 3, 5]],
- '11+12357': [[1, 3, 7], [1, 2, 3, 5]],
- '11+123578': [[3, 8], [1, 2, 8], [1, 3, 7], [1, 2, 3, 5]],
- '11+1235789': [[2, 9], [3, 8], [1, 2, 8], [1, 3, 7], [1, 2, 3, 5]],
- '11+123579': [[2, 9], [1, 3, 7], [1, 2, 3, 5]],
- '11+12358': [[3, 8], [1, 2, 8], [1, 2, 3, 5]],
- '11+123589': [[2, 9], [3, 8], [1, 2, 8], [1, 2, 3, 5]],
- '11+12359': [[2, 9], [1, 2, 3, 5]],
- '11+1236': [[2, 3, 6]],
- '11+12367': [[1, 3, 7], [2, 3, 6]],
- '11+123678': [[3, 8], [1, 2, 8], [1, 3, 7], [2, 3, 6]],
- '11+1236789': [[2, 9], [3, 8], [1, 2, 8], [1, 3, 7], [2, 3, 6]],
- '11+123679': [[2, 9], [1, 3, 7], [2, 3, 6]],
- '11+12368': [[3, 8], [1, 2, 8], [2, 3, 6]],
- '11+123689': [[2, 9], [3, 8], [1, 2, 8], [2, 3, 6]],
- '11+12369': [[2, 9], [2, 3, 6]],
- '11+1237': [[1, 3, 7]],
- '11+12378': [[3, 8], [1, 2, 8], [1, 3, 7]],
- '11+123789': [[2, 9], [3, 8], [1, 2, 8], [1, 3, 7]],
- '11+12379': [[2, 9], [1, 3, 7]],
- '11+1238': [[3, 8], [1, 2, 8]],
- '11+12389': [[2, 9], [3, 8], [1, 2, 8]],
- '11+1239': [[2, 9]],
- '11+124': [],
- '11+1245': [[2, 4, 5]],
- '11+12456': [[5, 6], [1, 4, 6], [2, 4, 5]],
- '11+124567': [[4, 7], [5, 6], [1, 4, 6], [2, 4, 5]],
- '11+1245678': [[4, 7], [5, 6], [1, 2, 8], [1, 4, 6], [2, 4, 5]],
- '11+12456789': [[2, 9], [4, 7], [5, 6], [1, 2, 8], [1, 4, 6], [2, 4, 5]],
- '11+1245679': [[2, 9], [4, 7], [5, 6], [1, 4, 6], [2, 4, 5]],
- '11+124568': [[5, 6], [1, 2, 8], [1, 4, 6], [2, 4, 5]],
- '11+1245689': [[2, 9], [5, 6], [1, 2, 8], [1, 4, 6], [2, 4, 5]],
- '11+124569': [[2, 9], [5, 6], [1, 4, 6], [2, 4, 5]],
- '11+12457': [[4, 7], [2, 4, 5]],
- '11+124578': [[4, 7], [1, 2, 8], [2, 4, 5]],
- '11+1245789': [[2, 9], [4, 7], [1, 2, 8], [2, 4, 5]],
- '11+124579': [[2, 9], [4, 7], [2, 4, 5]],
- '11+12458': [[1, 2, 8], [2, 4, 5]],
- '11+124589': [[2, 9], [1, 2, 8], [2, 4, 5]],
- '11+12459': [[2, 9], [2, 4, 5]],
- '11+1246': [[1, 4, 6]],
- '11+12467': [[4, 7], [1, 4, 6]],
- '11+124678': [[4, 7], [1, 2, 8], [1, 4, 6]],
- '11+1246789': [[2, 9], [4, 7], [1, 2, 8], [1, 4, 6]],
- '11+124679': [[2, 9], [4, 7], [1, 4, 6]],
- '11+12468': [[1, 2, 8], [1, 4, 6]],
- '11+124689': [[2, 9], [1, 2, 8], [1, 4, 6]],
- '11+12469': [[2, 9], [1, 4, 6]],
- '11+1247': [[4, 7]],
- '11+12478': [[4, 7], [1, 2, 8]],
- '11+124789': [[2, 9], [4, 7], [1, 2, 8]],
- '11+12479': [[2, 9], [4, 7]],
- '11+1248': [[1, 2, 8]],
- '11+12489': [[2, 9], [1, 2, 8]],
- '11+1249': [[2, 9]],
- '11+125': [],
- '11+1256': [[5, 6]],
- '11+12567': [[5, 6]],
- '11+125678': [[5, 6], [1, 2, 8]],
- '11+1256789': [[2, 9], [5, 6], [1, 2, 8]],
- '11+125679': [[2, 9], [5, 6]],
- '11+12568': [[5, 6], [1, 2, 8]],
- '11+125689': [[2, 9], [5, 6], [1, 2, 8]],
- '11+12569': [[2, 9], [5, 6]],
- '11+1257': [],
- '11+12578': [[1, 2, 8]],
- '11+125789': [[2, 9], [1, 2, 8]],
- '11+12579': [[2, 9]],
- '11+1258': [[1, 2, 8]],
- '11+12589': [[2, 9], [1, 2, 8]],
- '11+1259': [[2, 9]],
- '11+126': [],
- '11+1267': [],
- '11+12678': [[1, 2, 8]],
- '11+126789': [[2, 9], [1, 2, 8]],
- '11+12679': [[2, 9]],
- '11+1268': [[1, 2, 8]],
- '11+12689': [[2, 9], [1, 2, 8]],
- '11+1269': [[2, 9]],
- '11+127': [],
- '11+1278': [[1, 2, 8]],
- '11+12789': [[2, 9], [1, 2, 8]],
- '11+1279': [[2, 9]],
- '11+128': [[1, 2, 8]],
- '11+1289': [[2, 9], [1, 2, 8]],
- '11+129': [[2, 9]],
- '11+13': [],
- '11+134': [],
- '11+1345': [],
- '11+13456': [[5, 6], [1, 4, 6]],
- '11+134567': [[4, 7], [5, 6], [1, 3, 7], [1, 4, 6]],
- '11+1345678': [[3, 8], [4, 7], [5, 6], [1, 3, 7], [1, 4, 6]],
- '11+13456789': [[3, 8], [4, 7], [5, 6], [1, 3, 7], [1, 4, 6]],
- '11+1345679': [[4, 7], [5, 6], [1, 3, 7], [1, 4, 6]],
- '11+134568': [[3, 8], [5, 6], [1, 4, 6]],
- '11+1345689': [[3, 8], [5, 6], [1, 4, 6]],
- '11+134569': [[5, 6], [1, 4, 6]],
- '11+13457': [[4, 7], [1, 3, 7]],
- '11+134578': [[3, 8], [4, 7], [1, 3, 7]],
- '11+1345789': [[3, 8], [4, 7], [1, 3, 7]],
- '11+134579': [[4, 7], [1, 3, 7]],
- '11+13458': [[3, 8]],
- '11+134589': [[3, 8]],
- '11+13459': [],
- '11+1346': [[1, 4, 6]],
- '11+13467': [[4, 7], [1, 3, 7], [1, 4, 6]],
- '11+134678': [[3, 8], [4, 7], [1, 3, 7], [1, 4, 6]],
- '11+1346789': [[3, 8], [4, 7], [1, 3, 7], [1, 4, 6]],
- '11+134679': [[4, 7], [1, 3, 7], [1, 4, 6]],
- '11+13468': [[3, 8], [1, 4, 6]],
- '11+134689': [[3, 8], [1, 4, 6]],
- '11+13469': [[1, 4, 6]],
- '11+1347': [[4, 7], [1, 3, 7]],
- '11+13478': [[3, 8], [4, 7], [1, 3, 7]],
- '11+134789': [[3, 8], [4, 7], [1, 3, 7]],
- '11+13479': [[4, 7], [1, 3, 7]],
- '11+1348': [[3, 8]],
- '11+13489': [[3, 8]],
- '11+1349': [],
- '11+135': [],
- '11+1356': [[5, 6]],
- '11+13567': [[5, 6], [1, 3, 7]],
- '11+135678': [[3, 8], [5, 6], [1, 3, 7]],
- '11+1356789': [[3, 8], [5, 6], [1, 3, 7]],
- '11+135679': [[5, 6], [1, 3, 7]],
- '11+13568': [[3, 8], [5, 6]],
- '11+135689': [[3, 8], [5, 6]],
- '11+13569': [[5, 6]],
- '11+1357': [[1, 3, 7]],
- '11+13578': [[3, 8], [1, 3, 7]],
- '11+135789': [[3, 8], [1, 3, 7]],
- '11+13579': [[1, 3, 7]],
- '11+1358': [[3, 8]],
- '11+13589': [[3, 8]],
- '11+1359': [],
- '11+136': [],
- '11+1367': [[1, 3, 7]],
- '11+13678': [[3, 8], [1, 3, 7]],
- '11+136789': [[3, 8], [1, 3, 7]],
- '11+13679': [[1, 3, 7]],
- '11+1368': [[3, 8]],
- '11+13689': [[3, 8]],
- '11+1369': [],
- '11+137': [[1, 3, 7]],
- '11+1378': [[3, 8], [1, 3, 7]],
- '11+13789': [[3, 8], [1, 3, 7]],
- '11+1379': [[1, 3, 7]],
- '11+138': [[3, 8]],
- '11+1389': [[3, 8]],
- '11+139': [],
- '11+14': [],
- '11+145': [],
- '11+1456': [[5, 6], [1, 4, 6]],
- '11+14567': [[4, 7], [5, 6], [1, 4, 6]],
- '11+145678': [[4, 7], [5, 6], [1, 4, 6]],
- '11+1456789': [[4, 7], [5, 6], [1, 4, 6]],
- '11+145679': [[4, 7], [5, 6], [1, 4, 6]],
- '11+14568': [[5, 6], [1, 4, 6]],
- '11+145689': [[5, 6], [1, 4, 6]],
- '11+14569': [[5, 6], [1, 4, 6]],
- '11+1457': [[4, 7]],
- '11+14578': [[4, 7]],
- '11+145789': [[4, 7]],
- '11+14579': [[4, 7]],
- '11+1458': [],
- '11+14589': [],
- '11+1459': [],
- '11+146': [[1, 4, 6]],
- '11+1467': [[4, 7], [1, 4, 6]],
- '11+14678': [[4, 7], [1, 4, 6]],
- '11+146789': [[4, 7], [1, 4, 6]],
- '11+14679': [[4, 7], [1, 4, 6]],
- '11+1468': [[1, 4, 6]],
- '11+14689': [[1, 4, 6]],
- '11+1469': [[1, 4, 6]],
- '11+147': [[4, 7]],
- '11+1478': [[4, 7]],
- '11+14789': [[4, 7]],
- '11+1479': [[4, 7]],
- '11+148': [],
- '11+1489': [],
- '11+149': [],
- '11+15': [],
- '11+156': [[5, 6]],
- '11+1567': [[5, 6]],
- '11+15678': [[5, 6]],
- '11+156789': [[5, 6]],
- '11+15679': [[5, 6]],
- '11+1568': [[5, 6]],
- '11+15689': [[5, 6]],
- '11+1569': [[5, 6]],
- '11+157': [],
- '11+1578': [],
- '11+15789': [],
- '11+1579': [],
- '11+158': [],
- '11+1589': [],
- '11+159': [],
- '11+16': [],
- '11+167': [],
- '11+1678': [],
- '11+16789': [],
- '11+1679': [],
- '11+168': [],
- '11+1689': [],
- '11+169': [],
- '11+17': [],
- '11+178': [],
- '11+1789': [],
- '11+179': [],
- '11+18': [],
- '11+189': [],
- '11+19': [],
- '11+2': [],
- '11+23': [],
- '11+234': [],
- '11+2345': [[2, 4, 5]],
- '11+23456': [[5, 6], [2, 3, 6], [2, 4, 5]],
- '11+234567': [[4, 7], [5, 6], [2, 3, 6], [2, 4, 5]],
- '11+2345678': [[3, 8], [4, 7], [5, 6], [2, 3, 6], [2, 4, 5]],
- '11+23456789': [[2, 9], [3, 8], [4, 7], [5, 6], [2, 3, 6], [2, 4, 5]],
- '11+2345679': [[2, 9], [4, 7], [5, 6], [2, 3, 6], [2, 4, 5]],
- '11+234568': [[3, 8], [5, 6], [2, 3, 6], [2, 4, 5]],
- '11+2345689': [[2, 9], [3, 8], [5, 6], [2, 3, 6], [2, 4, 5]],
- '11+234569': [[2, 9], [5, 6], [2, 3, 6], [2, 4, 5]],
- '11+23457': [[4, 7], [2, 4, 5]],
- '11+234578': [[3, 8], [4, 7], [2, 4, 5]],
- '11+2345789': [[2, 9], [3, 8], [4, 7], [2, 4, 5]],
- '11+234579': [[2, 9], [4, 7], [2, 4, 5]],
- '11+23458': [[3, 8], [2, 4, 5]],
- '11+234589': [[2, 9], [3, 8], [2, 4, 5]],
- '11+23459': [[2, 9], [2, 4, 5]],
- '11+2346': [[2, 3, 6]],
- '11+23467': [[4, 7], [2, 3, 6]],
- '11+234678': [[3, 8], [4, 7], [2, 3, 6]],
- '11+2346789': [[2, 9], [3, 8], [4, 7], [2, 3, 6]],
- '11+234679': [[2, 9], [4, 7], [2, 3, 6]],
- '11+23468': [[3, 8], [2, 3, 6]],
- '11+234689': [[2, 9], [3, 8], [2, 3, 6]],
- '11+23469': [[2, 9], [2, 3, 6]],
- '11+2347': [[4, 7]],
- '11+23478': [[3, 8], [4, 7]],
- '11+234789': [[2, 9], [3, 8], [4, 7]],
- '11+23479': [[2, 9], [4, 7]],
- '11+2348': [[3, 8]],
- '11+23489': [[2, 9], [3, 8]],
- '11+2349': [[2, 9]],
- '11+235': [],
- '11+2356': [[5, 6], [2, 3, 6]],
- '11+23567': [[5, 6], [2, 3, 6]],
- '11+235678': [[3, 8], [5, 6], [2, 3, 6]],
- '11+2356789': [[2, 9], [3, 8], [5, 6], [2, 3, 6]],
- '11+235679': [[2, 9], [5, 6], [2, 3, 6]],
- '11+23568': [[3, 8], [5, 6], [2, 3, 6]],
- '11+235689': [[2, 9], [3, 8], [5, 6], [2, 3, 6]],
- '11+23569': [[2, 9], [5, 6], [2, 3, 6]],
- '11+2357': [],
- '11+23578': [[3, 8]],
- '11+235789': [[2, 9], [3, 8]],
- '11+23579': [[2, 9]],
- '11+2358': [[3, 8]],
- '11+23589': [[2, 9], [3, 8]],
- '11+2359': [[2, 9]],
- '11+236': [[2, 3, 6]],
- '11+2367': [[2, 3, 6]],
- '11+23678': [[3, 8], [2, 3, 6]],
- '11+236789': [[2, 9], [3, 8], [2, 3, 6]],
- '11+23679': [[2, 9], [2, 3, 6]],
- '11+2368': [[3, 8], [2, 3, 6]],
- '11+23689': [[2, 9], [3, 8], [2, 3, 6]],
- '11+2369': [[2, 9], [2, 3, 6]],
- '11+237': [],
- '11+2378': [[3, 8]],
- '11+23789': [[2, 9], [3, 8]],
- '11+2379': [[2, 9]],
- '11+238': [[3, 8]],
- '11+2389': [[2, 9], [3, 8]],
- '11+239': [[2, 9]],
- '11+24': [],
- '11+245': [[2, 4, 5]],
- '11+2456': [[5, 6], [2, 4, 5]],
- '11+24567': [[4, 7], [5, 6], [2, 4, 5]],
- '11+245678': [[4, 7], [5, 6], [2, 4, 5]],
- '11+2456789': [[2, 9], [4, 7], [5, 6], [2, 4, 5]],
- '11+245679': [[2, 9], [4, 7], [5, 6], [2, 4, 5]],
- '11+24568': [[5, 6], [2, 4, 5]],
- '11+245689': [[2, 9], [5, 6], [2, 4, 5]],
- '11+24569': [[2, 9], [5, 6], [2, 4, 5]],
- '11+2457': [[4, 7], [2, 4, 5]],
- '11+24578': [[4, 7], [2, 4, 5]],
- '11+245789': [[2, 9], [4, 7], [2, 4, 5]],
- '11+24579': [[2, 9], [4, 7], [2, 4, 5]],
- '11+2458': [[2, 4, 5]],
- '11+24589': [[2, 9], [2, 4, 5]],
- '11+2459': [[2, 9], [2, 4, 5]],
- '11+246': [],
- '11+2467': [[4, 7]],
- '11+24678': [[4, 7]],
- '11+246789': [[2, 9], [4, 7]],
- '11+24679': [[2, 9], [4, 7]],
- '11+2468': [],
- '11+24689': [[2, 9]],
- '11+2469': [[2, 9]],
- '11+247': [[4, 7]],
- '11+2478': [[4, 7]],
- '11+24789': [[2, 9], [4, 7]],
- '11+2479': [[2, 9], [4, 7]],
- '11+248': [],
- '11+2489': [[2, 9]],
- '11+249': [[2, 9]],
- '11+25': [],
- '11+256': [[5, 6]],
- '11+2567': [[5, 6]],
- '11+25678': [[5, 6]],
- '11+256789': [[2, 9], [5, 6]],
- '11+25679': [[2, 9], [5, 6]],
- '11+2568': [[5, 6]],
- '11+25689': [[2, 9], [5, 6]],
- '11+2569': [[2, 9], [5, 6]],
- '11+257': [],
- '11+2578': [],
- '11+25789': [[2, 9]],
- '11+2579': [[2, 9]],
- '11+258': [],
- '11+2589': [[2, 9]],
- '11+259': [[2, 9]],
- '11+26': [],
- '11+267': [],
- '11+2678': [],
- '11+26789': [[2, 9]],
- '11+2679': [[2, 9]],
- '11+268': [],
- '11+2689': [[2, 9]],
- '11+269': [[2, 9]],
- '11+27': [],
- '11+278': [],
- '11+2789': [[2, 9]],
- '11+279': [[2, 9]],
- '11+28': [],
- '11+289': [[2, 9]],
- '11+29': [[2, 9]],
- '11+3': [],
- '11+34': [],
- '11+345': [],
- '11+3456': [[5, 6]],
- '11+34567': [[4, 7], [5, 6]],
- '11+345678': [[3, 8], [4, 7], [5, 6]],
- '11+3456789': [[3, 8], [4, 7], [5, 6]],
- '11+345679': [[4, 7], [5, 6]],
- '11+34568': [[3, 8], [5, 6]],
- '11+345689': [[3, 8], [5, 6]],
- '11+34569': [[5, 6]],
- '11+3457': [[4, 7]],
- '11+34578': [[3, 8], [4, 7]],
- '11+345789': [[3, 8], [4, 7]],
- '11+34579': [[4, 7]],
- '11+3458': [[3, 8]],
- '11+34589': [[3, 8]],
- '11+3459': [],
- '11+346': [],
- '11+3467': [[4, 7]],
- '11+34678': [[3, 8], [4, 7]],
- '11+346789': [[3, 8], [4, 7]],
- '11+34679': [[4, 7]],
- '11+3468': [[3, 8]],
- '11+34689': [[3, 8]],
- '11+3469': [],
- '11+347': [[4, 7]],
- '11+3478': [[3, 8], [4, 7]],
- '11+34789': [[3, 8], [4, 7]],
- '11+3479': [[4, 7]],
- '11+348': [[3, 8]],
- '11+3489': [[3, 8]],
- '11+349': [],
- '11+35': [],
- '11+356': [[5, 6]],
- '11+3567': [[5, 6]],
- '11+35678': [[3, 8], [5, 6]],
- '11+356789': [[3, 8], [5, 6]],
- '11+35679': [[5, 6]],
- '11+3568': [[3, 8], [5, 6]],
- '11+35689': [[3, 8], [5, 6]],
- '11+3569': [[5, 6]],
- '11+357': [],
- '11+3578': [[3, 8]],
- '11+35789': [[3, 8]],
- '11+3579': [],
- '11+358': [[3, 8]],
- '11+3589': [[3, 8]],
- '11+359': [],
- '11+36': [],
- '11+367': [],
- '11+3678': [[3, 8]],
- '11+36789': [[3, 8]],
- '11+3679': [],
- '11+368': [[3, 8]],
- '11+3689': [[3, 8]],
- '11+369': [],
- '11+37': [],
- '11+378': [[3, 8]],
- '11+3789': [[3, 8]],
- '11+379': [],
- '11+38': [[3, 8]],
- '11+389': [[3, 8]],
- '11+39': [],
- '11+4': [],
- '11+45': [],
- '11+456': [[5, 6]],
- '11+4567': [[4, 7], [5, 6]],
- '11+45678': [[4, 7], [5, 6]],
- '11+456789': [[4, 7], [5, 6]],
- '11+45679': [[4, 7], [5, 6]],
- '11+4568': [[5, 6]],
- '11+45689': [[5, 6]],
- '11+4569': [[5, 6]],
- '11+457': [[4, 7]],
- '11+4578': [[4, 7]],
- '11+45789': [[4, 7]],
- '11+4579': [[4, 7]],
- '11+458': [],
- '11+4589': [],
- '11+459': [],
- '11+46': [],
- '11+467': [[4, 7]],
- '11+4678': [[4, 7]],
- '11+46789': [[4, 7]],
- '11+4679': [[4, 7]],
- '11+468': [],
- '11+4689': [],
- '11+469': [],
- '11+47': [[4, 7]],
- '11+478': [[4, 7]],
- '11+4789': [[4, 7]],
- '11+479': [[4, 7]],
- '11+48': [],
- '11+489': [],
- '11+49': [],
- '11+5': [],
- '11+56': [[5, 6]],
- '11+567': [[5, 6]],
- '11+5678': [[5, 6]],
- '11+56789': [[5, 6]],
- '11+5679': [[5, 6]],
- '11+568': [[5, 6]],
- '11+5689': [[5, 6]],
- '11+569': [[5, 6]],
- '11+57': [],
- '11+578': [],
- '11+5789': [],
- '11+579': [],
- '11+58': [],
- '11+589': [],
- '11+59': [],
- '11+6': [],
- '11+67': [],
- '11+678': [],
- '11+6789': [],
- '11+679': [],
- '11+68': [],
- '11+689': [],
- '11+69': [],
- '11+7': [],
- '11+78': [],
- '11+789': [],
- '11+79': [],
- '11+8': [],
- '11+89': [],
- '11+9': [],
- '12+': [],
- '12+1': [],
- '12+12': [],
- '12+123': [],
- '12+1234': [],
- '12+12345': [[3, 4, 5], [1, 2, 4, 5]],
- '12+123456': [[1, 5, 6], [2, 4, 6], [3, 4, 5], [1, 2, 3, 6], [1, 2, 4, 5]],
- '12+1234567': [[5, 7],
-                [1, 4, 7],
-                [1, 5, 6],
-                [2, 3, 7],
-                [2, 4, 6],
-                [3, 4, 5],
-                [1, 2, 3, 6],
-                [1, 2, 4, 5]],
- '12+12345678': [[4, 8],
-                 [5, 7],
-                 [1, 3, 8],
-                 [1, 4, 7],
-                 [1, 5, 6],
-                 [2, 3, 7],
-                 [2, 4, 6],
-                 [3, 4, 5],
-                 [1, 2, 3, 6],
-                 [1, 2, 4, 5]],
- '12+123456789': [[3, 9],
-                  [4, 8],
-                  [5, 7],
-                  [1, 2, 9],
-                  [1, 3, 8],
-                  [1, 4, 7],
-                  [1, 5, 6],
-                  [2, 3, 7],
-                  [2, 4, 6],
-                  [3, 4, 5],
-                  [1, 2, 3, 6],
-                  [1, 2, 4, 5]],
- '12+12345679': [[3, 9],
-                 [5, 7],
-                 [1, 2, 9],
-                 [1, 4, 7],
-                 [1, 5, 6],
-                 [2, 3, 7],
-                 [2, 4, 6],
-                 [3, 4, 5],
-                 [1, 2, 3, 6],
-                 [1, 2, 4, 5]],
- '12+1234568': [[4, 8],
-                [1, 3, 8],
-                [1, 5, 6],
-                [2, 4, 6],
-                [3, 4, 5],
-                [1, 2, 3, 6],
-                [1, 2, 4, 5]],
- '12+12345689': [[3, 9],
-                 [4, 8],
-                 [1, 2, 9],
-                 [1, 3, 8],
-                 [1, 5, 6],
-                 [2, 4, 6],
-                 [3, 4, 5],
-                 [1, 2, 3, 6],
-                 [1, 2, 4, 5]],
- '12+1234569': [[3, 9],
-                [1, 2, 9],
-                [1, 5, 6],
-                [2, 4, 6],
-                [3, 4, 5],
-                [1, 2, 3, 6],
-                [1, 2, 4, 5]],
- '12+123457': [[5, 7], [1, 4, 7], [2, 3, 7], [3, 4, 5], [1, 2, 4, 5]],
- '12+1234578': [[4, 8],
-                [5, 7],
-                [1, 3, 8],
-                [1, 4, 7],
-                [2, 3, 7],
-                [3, 4, 5],
-                [1, 2, 4, 5]],
- '12+12345789': [[3, 9],
-                 [4, 8],
-                 [5, 7],
-                 [1, 2, 9],
-                 [1, 3, 8],
-                 [1, 4, 7],
-                 [2, 3, 7],
-                 [3, 4, 5],
-                 [1, 2, 4, 5]],
- '12+1234579': [[3, 9],
-                [5, 7],
-                [1, 2, 9],
-                [1, 4, 7],
-                [2, 3, 7],
-                [3, 4, 5],
-                [1, 2, 4, 5]],
- '12+123458': [[4, 8], [1, 3, 8], [3, 4, 5], [1, 2, 4, 5]],
- '12+1234589': [[3, 9], [4, 8], [1, 2, 9], [1, 3, 8], [3, 4, 5], [1, 2, 4, 5]],
- '12+123459': [[3, 9], [1, 2, 9], [3, 4, 5], [1, 2, 4, 5]],
- '12+12346': [[2, 4, 6], [1, 2, 3, 6]],
- '12+123467': [[1, 4, 7], [2, 3, 7], [2, 4, 6], [1, 2, 3, 6]],
- '12+1234678': [[4, 8],
-                [1, 3, 8],
-                [1, 4, 7],
-                [2, 3, 7],
-                [2, 4, 6],
-                [1, 2, 3, 6]],
- '12+12346789': [[3, 9],
-                 [4, 8],
-                 [1, 2, 9],
-                 [1, 3, 8],
-                 [1, 4, 7],
-                 [2, 3, 7],
-                 [2, 4, 6],
-                 [1, 2, 3, 6]],
- '12+1234679': [[3, 9],
-                [1, 2, 9],
-                [1, 4, 7],
-                [2, 3, 7],
-                [2, 4, 6],
-                [1, 2, 3, 6]],
- '12+123468': [[4, 8], [1, 3, 8], [2, 4, 6], [1, 2, 3, 6]],
- '12+1234689': [[3, 9], [4, 8], [1, 2, 9], [1, 3, 8], [2, 4, 6], [1, 2, 3, 6]],
- '12+123469': [[3, 9], [1, 2, 9], [2, 4, 6], [1, 2, 3, 6]],
- '12+12347': [[1, 4, 7], [2, 3, 7]],
- '12+123478': [[4, 8], [1, 3, 8], [1, 4, 7], [2, 3, 7]],
- '12+1234789': [[3, 9], [4, 8], [1, 2, 9], [1, 3, 8], [1, 4, 7], [2, 3, 7]],
- '12+123479': [[3, 9], [1, 2, 9], [1, 4, 7], [2, 3, 7]],
- '12+12348': [[4, 8], [1, 3, 8]],
- '12+123489': [[3, 9], [4, 8], [1, 2, 9], [1, 3, 8]],
- '12+12349': [[3, 9], [1, 2, 9]],
- '12+1235': [],
- '12+12356': [[1, 5, 6], [1, 2, 3, 6]],
- '12+123567': [[5, 7], [1, 5, 6], [2, 3, 7], [1, 2, 3, 6]],
- '12+1235678': [[5, 7], [1, 3, 8], [1, 5, 6], [2, 3, 7], [1, 2, 3, 6]],
- '12+12356789': [[3, 9],
-                 [5, 7],
-                 [1, 2, 9],
-                 [1, 3, 8],
-                 [1, 5, 6],
-                 [2, 3, 7],
-                 [1, 2, 3, 6]],
- '12+1235679': [[3, 9], [5, 7], [1, 2, 9], [1, 5, 6], [2, 3, 7], [1, 2, 3, 6]],
- '12+123568': [[1, 3, 8], [1, 5, 6], [1, 2, 3, 6]],
- '12+1235689': [[3, 9], [1, 2, 9], [1, 3, 8], [1, 5, 6], [1, 2, 3, 6]],
- '12+123569': [[3, 9], [1, 2, 9], [1, 5, 6], [1, 2, 3, 6]],
- '12+12357': [[5, 7], [2, 3, 7]],
- '12+123578': [[5, 7], [1, 3, 8], [2, 3, 7]],
- '12+1235789': [[3, 9], [5, 7], [1, 2, 9], [1, 3, 8], [2, 3, 7]],
- '12+123579': [[3, 9], [5, 7], [1, 2, 9], [2, 3, 7]],
- '12+12358': [[1, 3, 8]],
- '12+123589': [[3, 9], [1, 2, 9], [1, 3, 8]],
- '12+12359': [[3, 9], [1, 2, 9]],
- '12+1236': [[1, 2, 3, 6]],
- '12+12367': [[2, 3, 7], [1, 2, 3, 6]],
- '12+123678': [[1, 3, 8], [2, 3, 7], [1, 2, 3, 6]],
- '12+1236789': [[3, 9], [1, 2, 9], [1, 3, 8], [2, 3, 7], [1, 2, 3, 6]],
- '12+123679': [[3, 9], [1, 2, 9], [2, 3, 7], [1, 2, 3, 6]],
- '12+12368': [[1, 3, 8], [1, 2, 3, 6]],
- '12+123689': [[3, 9], [1, 2, 9], [1, 3, 8], [1, 2, 3, 6]],
- '12+12369': [[3, 9], [1, 2, 9], [1, 2, 3, 6]],
- '12+1237': [[2, 3, 7]],
- '12+12378': [[1, 3, 8], [2, 3, 7]],
- '12+123789': [[3, 9], [1, 2, 9], [1, 3, 8], [2, 3, 7]],
- '12+12379': [[3, 9], [1, 2, 9], [2, 3, 7]],
- '12+1238': [[1, 3, 8]],
- '12+12389': [[3, 9], [1, 2, 9], [1, 3, 8]],
- '12+1239': [[3, 9], [1, 2, 9]],
- '12+124': [],
- '12+1245': [[1, 2, 4, 5]],
- '12+12456': [[1, 5, 6], [2, 4, 6], [1, 2, 4, 5]],
- '12+124567': [[5, 7], [1, 4, 7], [1, 5, 6], [2, 4, 6], [1, 2, 4, 5]],
- '12+1245678': [[4, 8], [5, 7], [1, 4, 7], [1, 5, 6], [2, 4, 6], [1, 2, 4, 5]],
- '12+12456789': [[4, 8],
-                 [5, 7],
-                 [1, 2, 9],
-                 [1, 4, 7],
-                 [1, 5, 6],
-                 [2, 4, 6],
-                 [1, 2, 4, 5]],
- '12+1245679': [[5, 7],
-                [1, 2, 9],
-                [1, 4, 7],
-                [1, 5, 6],
-                [2, 4, 6],
-                [1, 2, 4, 5]],
- '12+124568': [[4, 8], [1, 5, 6], [2, 4, 6], [1, 2, 4, 5]],
- '12+1245689': [[4, 8], [1, 2, 9], [1, 5, 6], [2, 4, 6], [1, 2, 4, 5]],
- '12+124569': [[1, 2, 9], [1, 5, 6], [2, 4, 6], [1, 2, 4, 5]],
- '12+12457': [[5, 7], [1, 4, 7], [1, 2, 4, 5]],
- '12+124578': [[4, 8], [5, 7], [1, 4, 7], [1, 2, 4, 5]],
- '12+1245789': [[4, 8], [5, 7], [1, 2, 9], [1, 4, 7], [1, 2, 4, 5]],
- '12+124579': [[5, 7], [1, 2, 9], [1, 4, 7], [1, 2, 4, 5]],
- '12+12458': [[4, 8], [1, 2, 4, 5]],
- '12+124589': [[4, 8], [1, 2, 9], [1, 2, 4, 5]],
- '12+12459': [[1, 2, 9], [1, 2, 4, 5]],
- '12+1246': [[2, 4, 6]],
- '12+12467': [[1, 4, 7], [2, 4, 6]],
- '12+124678': [[4, 8], [1, 4, 7], [2, 4, 6]],
- '12+1246789': [[4, 8], [1, 2, 9], [1, 4, 7], [2, 4, 6]],
- '12+124679': [[1, 2, 9], [1, 4, 7], [2, 4, 6]],
- '12+12468': [[4, 8], [2, 4, 6]],
- '12+124689': [[4, 8], [1, 2, 9], [2, 4, 6]],
- '12+12469': [[1, 2, 9], [2, 4, 6]],
- '12+1247': [[1, 4, 7]],
- '12+12478': [[4, 8], [1, 4, 7]],
- '12+124789': [[4, 8], [1, 2, 9], [1, 4, 7]],
- '12+12479': [[1, 2, 9], [1, 4, 7]],
- '12+1248': [[4, 8]],
- '12+12489': [[4, 8], [1, 2, 9]],
- '12+1249': [[1, 2, 9]],
- '12+125': [],
- '12+1256': [[1, 5, 6]],
- '12+12567': [[5, 7], [1, 5, 6]],
- '12+125678': [[5, 7], [1, 5, 6]],
- '12+1256789': [[5, 7], [1, 2, 9], [1, 5, 6]],
- '12+125679': [[5, 7], [1, 2, 9], [1, 5, 6]],
- '12+12568': [[1, 5, 6]],
- '12+125689': [[1, 2, 9], [1, 5, 6]],
- '12+12569': [[1, 2, 9], [1, 5, 6]],
- '12+1257': [[5, 7]],
- '12+12578': [[5, 7]],
- '12+125789': [[5, 7], [1, 2, 9]],
- '12+12579': [[5, 7], [1, 2, 9]],
- '12+1258': [],
- '12+12589': [[1, 2, 9]],
- '12+1259': [[1, 2, 9]],
- '12+126': [],
- '12+1267': [],
- '12+12678': [],
- '12+126789': [[1, 2, 9]],
- '12+12679': [[1, 2, 9]],
- '12+1268': [],
- '12+12689': [[1, 2, 9]],
- '12+1269': [[1, 2, 9]],
- '12+127': [],
- '12+1278': [],
- '12+12789': [[1, 2, 9]],
- '12+1279': [[1, 2, 9]],
- '12+128': [],
- '12+1289': [[1, 2, 9]],
- '12+129': [[1, 2, 9]],
- '12+13': [],
- '12+134': [],
- '12+1345': [[3, 4, 5]],
- '12+13456': [[1, 5, 6], [3, 4, 5]],
- '12+134567': [[5, 7], [1, 4, 7], [1, 5, 6], [3, 4, 5]],
- '12+1345678': [[4, 8], [5, 7], [1, 3, 8], [1, 4, 7], [1, 5, 6], [3, 4, 5]],
- '12+13456789': [[3, 9],
-                 [4, 8],
-                 [5, 7],
-                 [1, 3, 8],
-                 [1, 4, 7],
-                 [1, 5, 6],
-                 [3, 4, 5]],
- '12+1345679': [[3, 9], [5, 7], [1, 4, 7], [1, 5, 6], [3, 4, 5]],
- '12+134568': [[4, 8], [1, 3, 8], [1, 5, 6], [3, 4, 5]],
- '12+1345689': [[3, 9], [4, 8], [1, 3, 8], [1, 5, 6], [3, 4, 5]],
- '12+134569': [[3, 9], [1, 5, 6], [3, 4, 5]],
- '12+13457': [[5, 7], [1, 4, 7], [3, 4, 5]],
- '12+134578': [[4, 8], [5, 7], [1, 3, 8], [1, 4, 7], [3, 4, 5]],
- '12+1345789': [[3, 9], [4, 8], [5, 7], [1, 3, 8], [1, 4, 7], [3, 4, 5]],
- '12+134579': [[3, 9], [5, 7], [1, 4, 7], [3, 4, 5]],
- '12+13458': [[4, 8], [1, 3, 8], [3, 4, 5]],
- '12+134589': [[3, 9], [4, 8], [1, 3, 8], [3, 4, 5]],
- '12+13459': [[3, 9], [3, 4, 5]],
- '12+1346': [],
- '12+13467': [[1, 4, 7]],
- '12+134678': [[4, 8], [1, 3, 8], [1, 4, 7]],
- '12+1346789': [[3, 9], [4, 8], [1, 3, 8], [1, 4, 7]],
- '12+134679': [[3, 9], [1, 4, 7]],
- '12+13468': [[4, 8], [1, 3, 8]],
- '12+134689': [[3, 9], [4, 8], [1, 3, 8]],
- '12+13469': [[3, 9]],
- '12+1347': [[1, 4, 7]],
- '12+13478': [[4, 8], [1, 3, 8], [1, 4, 7]],
- '12+134789': [[3, 9], [4, 8], [1, 3, 8], [1, 4, 7]],
- '12+13479': [[3, 9], [1, 4, 7]],
- '12+1348': [[4, 8], [1, 3, 8]],
- '12+13489': [[3, 9], [4, 8], [1, 3, 8]],
- '12+1349': [[3, 9]],
- '12+135': [],
- '12+1356': [[1, 5, 6]],
- '12+13567': [[5, 7], [1, 5, 6]],
- '12+135678': [[5, 7], [1, 3, 8], [1, 5, 6]],
- '12+1356789': [[3, 9], [5, 7], [1, 3, 8], [1, 5, 6]],
- '12+135679': [[3, 9], [5, 7], [1, 5, 6]],
- '12+13568': [[1, 3, 8], [1, 5, 6]],
- '12+135689': [[3, 9], [1, 3, 8], [1, 5, 6]],
- '12+13569': [[3, 9], [1, 5, 6]],
- '12+1357': [[5, 7]],
- '12+13578': [[5, 7], [1, 3, 8]],
- '12+135789': [[3, 9], [5, 7], [1, 3, 8]],
- '12+13579': [[3, 9], [5, 7]],
- '12+1358': [[1, 3, 8]],
- '12+13589': [[3, 9], [1, 3, 8]],
- '12+1359': [[3, 9]],
- '12+136': [],
- '12+1367': [],
- '12+13678': [[1, 3, 8]],
- '12+136789': [[3, 9], [1, 3, 8]],
- '12+13679': [[3, 9]],
- '12+1368': [[1, 3, 8]],
- '12+13689': [[3, 9], [1, 3, 8]],
- '12+1369': [[3, 9]],
- '12+137': [],
- '12+1378': [[1, 3, 8]],
- '12+13789': [[3, 9], [1, 3, 8]],
- '12+1379': [[3, 9]],
- '12+138': [[1, 3, 8]],
- '12+1389': [[3, 9], [1, 3, 8]],
- '12+139': [[3, 9]],
- '12+14': [],
- '12+145': [],
- '12+1456': [[1, 5, 6]],
- '12+14567': [[5, 7], [1, 4, 7], [1, 5, 6]],
- '12+145678': [[4, 8], [5, 7], [1, 4, 7], [1, 5, 6]],
- '12+1456789': [[4, 8], [5, 7], [1, 4, 7], [1, 5, 6]],
- '12+145679': [[5, 7], [1, 4, 7], [1, 5, 6]],
- '12+14568': [[4, 8], [1, 5, 6]],
- '12+145689': [[4, 8], [1, 5, 6]],
- '12+14569': [[1, 5, 6]],
- '12+1457': [[5, 7], [1, 4, 7]],
- '12+14578': [[4, 8], [5, 7], [1, 4, 7]],
- '12+145789': [[4, 8], [5, 7], [1, 4, 7]],
- '12+14579': [[5, 7], [1, 4, 7]],
- '12+1458': [[4, 8]],
- '12+14589': [[4, 8]],
- '12+1459': [],
- '12+146': [],
- '12+1467': [[1, 4, 7]],
- '12+14678': [[4, 8], [1, 4, 7]],
- '12+146789': [[4, 8], [1, 4, 7]],
- '12+14679': [[1, 4, 7]],
- '12+1468': [[4, 8]],
- '12+14689': [[4, 8]],
- '12+1469': [],
- '12+147': [[1, 4, 7]],
- '12+1478': [[4, 8], [1, 4, 7]],
- '12+14789': [[4, 8], [1, 4, 7]],
- '12+1479': [[1, 4, 7]],
- '12+148': [[4, 8]],
- '12+1489': [[4, 8]],
- '12+149': [],
- '12+15': [],
- '12+156': [[1, 5, 6]],
- '12+1567': [[5, 7], [1, 5, 6]],
- '12+15678': [[5, 7], [1, 5, 6]],
- '12+156789': [[5, 7], [1, 5, 6]],
- '12+15679': [[5, 7], [1, 5, 6]],
- '12+1568': [[1, 5, 6]],
- '12+15689': [[1, 5, 6]],
- '12+1569': [[1, 5, 6]],
- '12+157': [[5, 7]],
- '12+1578': [[5, 7]],
- '12+15789': [[5, 7]],
- '12+1579': [[5, 7]],
- '12+158': [],
- '12+1589': [],
- '12+159': [],
- '12+16': [],
- '12+167': [],
- '12+1678': [],
- '12+16789': [],
- '12+1679': [],
- '12+168': [],
- '12+1689': [],
- '12+169': [],
- '12+17': [],
- '12+178': [],
- '12+1789': [],
- '12+179': [],
- '12+18': [],
- '12+189': [],
- '12+19': [],
- '12+2': [],
- '12+23': [],
- '12+234': [],
- '12+2345': [[3, 4, 5]],
- '12+23456': [[2, 4, 6], [3, 4, 5]],
- '12+234567': [[5, 7], [2, 3, 7], [2, 4, 6], [3, 4, 5]],
- '12+2345678': [[4, 8], [5, 7], [2, 3, 7], [2, 4, 6], [3, 4, 5]],
- '12+23456789': [[3, 9], [4, 8], [5, 7], [2, 3, 7], [2, 4, 6], [3, 4, 5]],
- '12+2345679': [[3, 9], [5, 7], [2, 3, 7], [2, 4, 6], [3, 4, 5]],
- '12+234568': [[4, 8], [2, 4, 6], [3, 4, 5]],
- '12+2345689': [[3, 9], [4, 8], [2, 4, 6], [3, 4, 5]],
- '12+234569': [[3, 9], [2, 4, 6], [3, 4, 5]],
- '12+23457': [[5, 7], [2, 3, 7], [3, 4, 5]],
- '12+234578': [[4, 8], [5, 7], [2, 3, 7], [3, 4, 5]],
- '12+2345789': [[3, 9], [4, 8], [5, 7], [2, 3, 7], [3, 4, 5]],
- '12+234579': [[3, 9], [5, 7], [2, 3, 7], [3, 4, 5]],
- '12+23458': [[4, 8], [3, 4, 5]],
- '12+234589': [[3, 9], [4, 8], [3, 4, 5]],
- '12+23459': [[3, 9], [3, 4, 5]],
- '12+2346': [[2, 4, 6]],
- '12+23467': [[2, 3, 7], [2, 4, 6]],
- '12+234678': [[4, 8], [2, 3, 7], [2, 4, 6]],
- '12+2346789': [[3, 9], [4, 8], [2, 3, 7], [2, 4, 6]],
- '12+234679': [[3, 9], [2, 3, 7], [2, 4, 6]],
- '12+23468': [[4, 8], [2, 4, 6]],
- '12+234689': [[3, 9], [4, 8], [2, 4, 6]],
- '12+23469': [[3, 9], [2, 4, 6]],
- '12+2347': [[2, 3, 7]],
- '12+23478': [[4, 8], [2, 3, 7]],
- '12+234789': [[3, 9], [4, 8], [2, 3, 7]],
- '12+23479': [[3, 9], [2, 3, 7]],
- '12+2348': [[4, 8]],
- '12+23489': [[3, 9], [4, 8]],
- '12+2349': [[3, 9]],
- '12+235': [],
- '12+2356': [],
- '12+23567': [[5, 7], [2, 3, 7]],
- '12+235678': [[5, 7], [2, 3, 7]],
- '12+2356789': [[3, 9], [5, 7], [2, 3, 7]],
- '12+235679': [[3, 9], [5, 7], [2, 3, 7]],
- '12+23568': [],
- '12+235689': [[3, 9]],
- '12+23569': [[3, 9]],
- '12+2357': [[5, 7], [2, 3, 7]],
- '12+23578': [[5, 7], [2, 3, 7]],
- '12+235789': [[3, 9], [5, 7], [2, 3, 7]],
- '12+23579': [[3, 9], [5, 7], [2, 3, 7]],
- '12+2358': [],
- '12+23589': [[3, 9]],
- '12+2359': [[3, 9]],
- '12+236': [],
- '12+2367': [[2, 3, 7]],
- '12+23678': [[2, 3, 7]],
- '12+236789': [[3, 9], [2, 3, 7]],
- '12+23679': [[3, 9], [2, 3, 7]],
- '12+2368': [],
- '12+23689': [[3, 9]],
- '12+2369': [[3, 9]],
- '12+237': [[2, 3, 7]],
- '12+2378': [[2, 3, 7]],
- '12+23789': [[3, 9], [2, 3, 7]],
- '12+2379': [[3, 9], [2, 3, 7]],
- '12+238': [],
- '12+2389': [[3, 9]],
- '12+239': [[3, 9]],
- '12+24': [],
- '12+245': [],
- '12+2456': [[2, 4, 6]],
- '12+24567': [[5, 7], [2, 4, 6]],
- '12+245678': [[4, 8], [5, 7], [2, 4, 6]],
- '12+2456789': [[4, 8], [5, 7], [2, 4, 6]],
- '12+245679': [[5, 7], [2, 4, 6]],
- '12+24568': [[4, 8], [2, 4, 6]],
- '12+245689': [[4, 8], [2, 4, 6]],
- '12+24569': [[2, 4, 6]],
- '12+2457': [[5, 7]],
- '12+24578': [[4, 8], [5, 7]],
- '12+245789': [[4, 8], [5, 7]],
- '12+24579': [[5, 7]],
- '12+2458': [[4, 8]],
- '12+24589': [[4, 8]],
- '12+2459': [],
- '12+246': [[2, 4, 6]],
- '12+2467': [[2, 4, 6]],
- '12+24678': [[4, 8], [2, 4, 6]],
- '12+246789': [[4, 8], [2, 4, 6]],
- '12+24679': [[2, 4, 6]],
- '12+2468': [[4, 8], [2, 4, 6]],
- '12+24689': [[4, 8], [2, 4, 6]],
- '12+2469': [[2, 4, 6]],
- '12+247': [],
- '12+2478': [[4, 8]],
- '12+24789': [[4, 8]],
- '12+2479': [],
- '12+248': [[4, 8]],
- '12+2489': [[4, 8]],
- '12+249': [],
- '12+25': [],
- '12+256': [],
- '12+2567': [[5, 7]],
- '12+25678': [[5, 7]],
- '12+256789': [[5, 7]],
- '12+25679': [[5, 7]],
- '12+2568': [],
- '12+25689': [],
- '12+2569': [],
- '12+257': [[5, 7]],
- '12+2578': [[5, 7]],
- '12+25789': [[5, 7]],
- '12+2579': [[5, 7]],
- '12+258': [],
- '12+2589': [],
- '12+259': [],
- '12+26': [],
- '12+267': [],
- '12+2678': [],
- '12+26789': [],
- '12+2679': [],
- '12+268': [],
- '12+2689': [],
- '12+269': [],
- '12+27': [],
- '12+278': [],
- '12+2789': [],
- '12+279': [],
- '12+28': [],
- '12+289': [],
- '12+29': [],
- '12+3': [],
- '12+34': [],
- '12+345': [[3, 4, 5]],
- '12+3456': [[3, 4, 5]],
- '12+34567': [[5, 7], [3, 4, 5]],
- '12+345678': [[4, 8], [5, 7], [3, 4, 5]],
- '12+3456789': [[3, 9], [4, 8], [5, 7], [3, 4, 5]],
- '12+345679': [[3, 9], [5, 7], [3, 4, 5]],
- '12+34568': [[4, 8], [3, 4, 5]],
- '12+345689': [[3, 9], [4, 8], [3, 4, 5]],
- '12+34569': [[3, 9], [3, 4, 5]],
- '12+3457': [[5, 7], [3, 4, 5]],
- '12+34578': [[4, 8], [5, 7], [3, 4, 5]],
- '12+345789': [[3, 9], [4, 8], [5, 7], [3, 4, 5]],
- '12+34579': [[3, 9], [5, 7], [3, 4, 5]],
- '12+3458': [[4, 8], [3, 4, 5]],
- '12+34589': [[3, 9], [4, 8], [3, 4, 5]],
- '12+3459': [[3, 9], [3, 4, 5]],
- '12+346': [],
- '12+3467': [],
- '12+34678': [[4, 8]],
- '12+346789': [[3, 9], [4, 8]],
- '12+34679': [[3, 9]],
- '12+3468': [[4, 8]],
- '12+34689': [[3, 9], [4, 8]],
- '12+3469': [[3, 9]],
- '12+347': [],
- '12+3478': [[4, 8]],
- '12+34789': [[3, 9], [4, 8]],
- '12+3479': [[3, 9]],
- '12+348': [[4, 8]],
- '12+3489': [[3, 9], [4, 8]],
- '12+349': [[3, 9]],
- '12+35': [],
- '12+356': [],
- '12+3567': [[5, 7]],
- '12+35678': [[5, 7]],
- '12+356789': [[3, 9], [5, 7]],
- '12+35679': [[3, 9], [5, 7]],
- '12+3568': [],
- '12+35689': [[3, 9]],
- '12+3569': [[3, 9]],
- '12+357': [[5, 7]],
- '12+3578': [[5, 7]],
- '12+35789': [[3, 9], [5, 7]],
- '12+3579': [[3, 9], [5, 7]],
- '12+358': [],
- '12+3589': [[3, 9]],
- '12+359': [[3, 9]],
- '12+36': [],
- '12+367': [],
- '12+3678': [],
- '12+36789': [[3, 9]],
- '12+3679': [[3, 9]],
- '12+368': [],
- '12+3689': [[3, 9]],
- '12+369': [[3, 9]],
- '12+37': [],
- '12+378': [],
- '12+3789': [[3, 9]],
- '12+379': [[3, 9]],
- '12+38': [],
- '12+389': [[3, 9]],
- '12+39': [[3, 9]],
- '12+4': [],
- '12+45': [],
- '12+456': [],
- '12+4567': [[5, 7]],
- '12+45678': [[4, 8], [5, 7]],
- '12+456789': [[4, 8], [5, 7]],
- '12+45679': [[5, 7]],
- '12+4568': [[4, 8]],
- '12+45689': [[4, 8]],
- '12+4569': [],
- '12+457': [[5, 7]],
- '12+4578': [[4, 8], [5, 7]],
- '12+45789': [[4, 8], [5, 7]],
- '12+4579': [[5, 7]],
- '12+458': [[4, 8]],
- '12+4589': [[4, 8]],
- '12+459': [],
- '12+46': [],
- '12+467': [],
- '12+4678': [[4, 8]],
- '12+46789': [[4, 8]],
- '12+4679': [],
- '12+468': [[4, 8]],
- '12+4689': [[4, 8]],
- '12+469': [],
- '12+47': [],
- '12+478': [[4, 8]],
- '12+4789': [[4, 8]],
- '12+479': [],
- '12+48': [[4, 8]],
- '12+489': [[4, 8]],
- '12+49': [],
- '12+5': [],
- '12+56': [],
- '12+567': [[5, 7]],
- '12+5678': [[5, 7]],
- '12+56789': [[5, 7]],
- '12+5679': [[5, 7]],
- '12+568': [],
- '12+5689': [],
- '12+569': [],
- '12+57': [[5, 7]],
- '12+578': [[5, 7]],
- '12+5789': [[5, 7]],
- '12+579': [[5, 7]],
- '12+58': [],
- '12+589': [],
- '12+59': [],
- '12+6': [],
- '12+67': [],
- '12+678': [],
- '12+6789': [],
- '12+679': [],
- '12+68': [],
- '12+689': [],
- '12+69': [],
- '12+7': [],
- '12+78': [],
- '12+789': [],
- '12+79': [],
- '12+8': [],
- '12+89': [],
- '12+9': [],
- '2+': [],
- '2+1': [],
- '2+12': [[2]],
- '2+123': [[2]],
- '2+1234': [[2]],
- '2+12345': [[2]],
- '2+123456': [[2]],
- '2+1234567': [[2]],
- '2+12345678': [[2]],
- '2+123456789': [[2]],
- '2+12345679': [[2]],
- '2+1234568': [[2]],
- '2+12345689': [[2]],
- '2+1234569': [[2]],
- '2+123457': [[2]],
- '2+1234578': [[2]],
- '2+12345789': [[2]],
- '2+1234579': [[2]],
- '2+123458': [[2]],
- '2+1234589': [[2]],
- '2+123459': [[2]],
- '2+12346': [[2]],
- '2+123467': [[2]],
- '2+1234678': [[2]],
- '2+12346789': [[2]],
- '2+1234679': [[2]],
- '2+123468': [[2]],
- '2+1234689': [[2]],
- '2+123469': [[2]],
- '2+12347': [[2]],
- '2+123478': [[2]],
- '2+1234789': [[2]],
- '2+123479': [[2]],
- '2+12348': [[2]],
- '2+123489': [[2]],
- '2+12349': [[2]],
- '2+1235': [[2]],
- '2+12356': [[2]],
- '2+123567': [[2]],
- '2+1235678': [[2]],
- '2+12356789': [[2]],
- '2+1235679': [[2]],
- '2+123568': [[2]],
- '2+1235689': [[2]],
- '2+123569': [[2]],
- '2+12357': [[2]],
- '2+123578': [[2]],
- '2+1235789': [[2]],
- '2+123579': [[2]],
- '2+12358': [[2]],
- '2+123589': [[2]],
- '2+12359': [[2]],
- '2+1236': [[2]],
- '2+12367': [[2]],
- '2+123678': [[2]],
- '2+1236789': [[2]],
- '2+123679': [[2]],
- '2+12368': [[2]],
- '2+123689': [[2]],
- '2+12369': [[2]],
- '2+1237': [[2]],
- '2+12378': [[2]],
- '2+123789': [[2]],
- '2+12379': [[2]],
- '2+1238': [[2]],
- '2+12389': [[2]],
- '2+1239': [[2]],
- '2+124': [[2]],
- '2+1245': [[2]],
- '2+12456': [[2]],
- '2+124567': [[2]],
- '2+1245678': [[2]],
- '2+12456789': [[2]],
- '2+1245679': [[2]],
- '2+124568': [[2]],
- '2+1245689': [[2]],
- '2+124569': [[2]],
- '2+12457': [[2]],
- '2+124578': [[2]],
- '2+1245789': [[2]],
- '2+124579': [[2]],
- '2+12458': [[2]],
- '2+124589': [[2]],
- '2+12459': [[2]],
- '2+1246': [[2]],
- '2+12467': [[2]],
- '2+124678': [[2]],
- '2+1246789': [[2]],
- '2+124679': [[2]],
- '2+12468': [[2]],
- '2+124689': [[2]],
- '2+12469': [[2]],
- '2+1247': [[2]],
- '2+12478': [[2]],
- '2+124789': [[2]],
- '2+12479': [[2]],
- '2+1248': [[2]],
- '2+12489': [[2]],
- '2+1249': [[2]],
- '2+125': [[2]],
- '2+1256': [[2]],
- '2+12567': [[2]],
- '2+125678': [[2]],
- '2+1256789': [[2]],
- '2+125679': [[2]],
- '2+12568': [[2]],
- '2+125689': [[2]],
- '2+12569': [[2]],
- '2+1257': [[2]],
- '2+12578': [[2]],
- '2+125789': [[2]],
- '2+12579': [[2]],
- '2+1258': [[2]],
- '2+12589': [[2]],
- '2+1259': [[2]],
- '2+126': [[2]],
- '2+1267': [[2]],
- '2+12678': [[2]],
- '2+126789': [[2]],
- '2+12679': [[2]],
- '2+1268': [[2]],
- '2+12689': [[2]],
- '2+1269': [[2]],
- '2+127': [[2]],
- '2+1278': [[2]],
- '2+12789': [[2]],
- '2+1279': [[2]],
- '2+128': [[2]],
- '2+1289': [[2]],
- '2+129': [[2]],
- '2+13': [],
- '2+134': [],
- '2+1345': [],
- '2+13456': [],
- '2+134567': [],
- '2+1345678': [],
- '2+13456789': [],
- '2+1345679': [],
- '2+134568': [],
- '2+1345689': [],
- '2+134569': [],
- '2+13457': [],
- '2+134578': [],
- '2+1345789': [],
- '2+134579': [],
- '2+13458': [],
- '2+134589': [],
- '2+13459': [],
- '2+1346': [],
- '2+13467': [],
- '2+134678': [],
- '2+1346789': [],
- '2+134679': [],
- '2+13468': [],
- '2+134689': [],
- '2+13469': [],
- '2+1347': [],
- '2+13478': [],
- '2+134789': [],
- '2+13479': [],
- '2+1348': [],
- '2+13489': [],
- '2+1349': [],
- '2+135': [],
- '2+1356': [],
- '2+13567': [],
- '2+135678': [],
- '2+1356789': [],
- '2+135679': [],
- '2+13568': [],
- '2+135689': [],
- '2+13569': [],
- '2+1357': [],
- '2+13578': [],
- '2+135789': [],
- '2+13579': [],
- '2+1358': [],
- '2+13589': [],
- '2+1359': [],
- '2+136': [],
- '2+1367': [],
- '2+13678': [],
- '2+136789': [],
- '2+13679': [],
- '2+1368': [],
- '2+13689': [],
- '2+1369': [],
- '2+137': [],
- '2+1378': [],
- '2+13789': [],
- '2+1379': [],
- '2+138': [],
- '2+1389': [],
- '2+139': [],
- '2+14': [],
- '2+145': [],
- '2+1456': [],
- '2+14567': [],
- '2+145678': [],
- '2+1456789': [],
- '2+145679': [],
- '2+14568': [],
- '2+145689': [],
- '2+14569': [],
- '2+1457': [],
- '2+14578': [],
- '2+145789': [],
- '2+14579': [],
- '2+1458': [],
- '2+14589': [],
- '2+1459': [],
- '2+146': [],
- '2+1467': [],
- '2+14678': [],
- '2+146789': [],
- '2+14679': [],
- '2+1468': [],
- '2+14689': [],
- '2+1469': [],
- '2+147': [],
- '2+1478': [],
- '2+14789': [],
- '2+1479': [],
- '2+148': [],
- '2+1489': [],
- '2+149': [],
- '2+15': [],
- '2+156': [],
- '2+1567': [],
- '2+15678': [],
- '2+156789': [],
- '2+15679': [],
- '2+1568': [],
- '2+15689': [],
- '2+1569': [],
- '2+157': [],
- '2+1578': [],
- '2+15789': [],
- '2+1579': [],
- '2+158': [],
- '2+1589': [],
- '2+159': [],
- '2+16': [],
- '2+167': [],
- '2+1678': [],
- '2+16789': [],
- '2+1679': [],
- '2+168': [],
- '2+1689': [],
- '2+169': [],
- '2+17': [],
- '2+178': [],
- '2+1789': [],
- '2+179': [],
- '2+18': [],
- '2+189': [],
- '2+19': [],
- '2+2': [[2]],
- '2+23': [[2]],
- '2+234': [[2]],
- '2+2345': [[2]],
- '2+23456': [[2]],
- '2+234567': [[2]],
- '2+2345678': [[2]],
- '2+23456789': [[2]],
- '2+2345679': [[2]],
- '2+234568': [[2]],
- '2+2345689': [[2]],
- '2+234569': [[2]],
- '2+23457': [[2]],
- '2+234578': [[2]],
- '2+2345789': [[2]],
- '2+234579': [[2]],
- '2+23458': [[2]],
- '2+234589': [[2]],
- '2+23459': [[2]],
- '2+2346': [[2]],
- '2+23467': [[2]],
- '2+234678': [[2]],
- '2+2346789': [[2]],
- '2+234679': [[2]],
- '2+23468': [[2]],
- '2+234689': [[2]],
- '2+23469': [[2]],
- '2+2347': [[2]],
- '2+23478': [[2]],
- '2+234789': [[2]],
- '2+23479': [[2]],
- '2+2348': [[2]],
- '2+23489': [[2]],
- '2+2349': [[2]],
- '2+235': [[2]],
- '2+2356': [[2]],
- '2+23567': [[2]],
- '2+235678': [[2]],
- '2+2356789': [[2]],
- '2+235679': [[2]],
- '2+23568': [[2]],
- '2+235689': [[2]],
- '2+23569': [[2]],
- '2+2357': [[2]],
- '2+23578': [[2]],
- '2+235789': [[2]],
- '2+23579': [[2]],
- '2+2358': [[2]],
- '2+23589': [[2]],
- '2+2359': [[2]],
- '2+236': [[2]],
- '2+2367': [[2]],
- '2+23678': [[2]],
- '2+236789': [[2]],
- '2+23679': [[2]],
- '2+2368': [[2]],
- '2+23689': [[2]],
- '2+2369': [[2]],
- '2+237': [[2]],
- '2+2378': [[2]],
- '2+23789': [[2]],
- '2+2379': [[2]],
- '2+238': [[2]],
- '2+2389': [[2]],
- '2+239': [[2]],
- '2+24': [[2]],
- '2+245': [[2]],
- '2+2456': [[2]],
- '2+24567': [[2]],
- '2+245678': [[2]],
- '2+2456789': [[2]],
- '2+245679': [[2]],
- '2+24568': [[2]],
- '2+245689': [[2]],
- '2+24569': [[2]],
- '2+2457': [[2]],
- '2+24578': [[2]],
- '2+245789': [[2]],
- '2+24579': [[2]],
- '2+2458': [[2]],
- '2+24589': [[2]],
- '2+2459': [[2]],
- '2+246': [[2]],
- '2+2467': [[2]],
- '2+24678': [[2]],
- '2+246789': [[2]],
- '2+24679': [[2]],
- '2+2468': [[2]],
- '2+24689': [[2]],
- '2+2469': [[2]],
- '2+247': [[2]],
- '2+2478': [[2]],
- '2+24789': [[2]],
- '2+2479': [[2]],
- '2+248': [[2]],
- '2+2489': [[2]],
- '2+249': [[2]],
- '2+25': [[2]],
- '2+256': [[2]],
- '2+2567': [[2]],
- '2+25678': [[2]],
- '2+256789': [[2]],
- '2+25679': [[2]],
- '2+2568': [[2]],
- '2+25689': [[2]],
- '2+2569': [[2]],
- '2+257': [[2]],
- '2+2578': [[2]],
- '2+25789': [[2]],
- '2+2579': [[2]],
- '2+258': [[2]],
- '2+2589': [[2]],
- '2+259': [[2]],
- '2+26': [[2]],
- '2+267': [[2]],
- '2+2678': [[2]],
- '2+26789': [[2]],
- '2+2679': [[2]],
- '2+268': [[2]],
- '2+2689': [[2]],
- '2+269': [[2]],
- '2+27': [[2]],
- '2+278': [[2]],
- '2+2789': [[2]],
- '2+279': [[2]],
- '2+28': [[2]],
- '2+289': [[2]],
- '2+29': [[2]],
- '2+3': [],
- '2+34': [],
- '2+345': [],
- '2+3456': [],
- '2+34567': [],
- '2+345678': [],
- '2+3456789': [],
- '2+345679': [],
- '2+34568': [],
- '2+345689': [],
- '2+34569': [],
- '2+3457': [],
- '2+34578': [],
- '2+345789': [],
- '2+34579': [],
- '2+3458': [],
- '2+34589': [],
- '2+3459': [],
- '2+346': [],
- '2+3467': [],
- '2+34678': [],
- '2+346789': [],
- '2+34679': [],
- '2+3468': [],
- '2+34689': [],
- '2+3469': [],
- '2+347': [],
- '2+3478': [],
- '2+34789': [],
- '2+3479': [],
- '2+348': [],
- '2+3489': [],
- '2+349': [],
- '2+35': [],
- '2+356': [],
- '2+3567': [],
- '2+35678': [],
- '2+356789': [],
- '2+35679': [],
- '2+3568': [],
- '2+35689': [],
- '2+3569': [],
- '2+357': [],
- '2+3578': [],
- '2+35789': [],
- '2+3579': [],
- '2+358': [],
- '2+3589': [],
- '2+359': [],
- '2+36': [],
- '2+367': [],
- '2+3678': [],
- '2+36789': [],
- '2+3679': [],
- '2+368': [],
- '2+3689': [],
- '2+369': [],
- '2+37': [],
- '2+378': [],
- '2+3789': [],
- '2+379': [],
- '2+38': [],
- '2+389': [],
- '2+39': [],
- '2+4': [],
- '2+45': [],
- '2+456': [],
- '2+4567': [],
- '2+45678': [],
- '2+456789': [],
- '2+45679': [],
- '2+4568': [],
- '2+45689': [],
- '2+4569': [],
- '2+457': [],
- '2+4578': [],
- '2+45789': [],
- '2+4579': [],
- '2+458': [],
- '2+4589': [],
- '2+459': [],
- '2+46': [],
- '2+467': [],
- '2+4678': [],
- '2+46789': [],
- '2+4679': [],
- '2+468': [],
- '2+4689': [],
- '2+469': [],
- '2+47': [],
- '2+478': [],
- '2+4789': [],
- '2+479': [],
- '2+48': [],
- '2+489': [],
- '2+49': [],
- '2+5': [],
- '2+56': [],
- '2+567': [],
- '2+5678': [],
- '2+56789': [],
- '2+5679': [],
- '2+568': [],
- '2+5689': [],
- '2+569': [],
- '2+57': [],
- '2+578': [],
- '2+5789': [],
- '2+579': [],
- '2+58': [],
- '2+589': [],
- '2+59': [],
- '2+6': [],
- '2+67': [],
- '2+678': [],
- '2+6789': [],
- '2+679': [],
- '2+68': [],
- '2+689': [],
- '2+69': [],
- '2+7': [],
- '2+78': [],
- '2+789': [],
- '2+79': [],
- '2+8': [],
- '2+89': [],
- '2+9': [],
- '3+': [],
- '3+1': [],
- '3+12': [[1, 2]],
- '3+123': [[3], [1, 2]],
- '3+1234': [[3], [1, 2]],
- '3+12345': [[3], [1, 2]],
- '3+123456': [[3], [1, 2]],
- '3+1234567': [[3], [1, 2]],
- '3+12345678': [[3], [1, 2]],
- '3+123456789': [[3], [1, 2]],
- '3+12345679': [[3], [1, 2]],
- '3+1234568': [[3], [1, 2]],
- '3+12345689': [[3], [1, 2]],
- '3+1234569': [[3], [1, 2]],
- '3+123457': [[3], [1, 2]],
- '3+1234578': [[3], [1, 2]],
- '3+12345789': [[3], [1, 2]],
- '3+1234579': [[3], [1, 2]],
- '3+123458': [[3], [1, 2]],
- '3+1234589': [[3], [1, 2]],
- '3+123459': [[3], [1, 2]],
- '3+12346': [[3], [1, 2]],
- '3+123467': [[3], [1, 2]],
- '3+1234678': [[3], [1, 2]],
- '3+12346789': [[3], [1, 2]],
- '3+1234679': [[3], [1, 2]],
- '3+123468': [[3], [1, 2]],
- '3+1234689': [[3], [1, 2]],
- '3+123469': [[3], [1, 2]],
- '3+12347': [[3], [1, 2]],
- '3+123478': [[3], [1, 2]],
- '3+1234789': [[3], [1, 2]],
- '3+123479': [[3], [1, 2]],
- '3+12348': [[3], [1, 2]],
- '3+123489': [[3], [1, 2]],
- '3+12349': [[3], [1, 2]],
- '3+1235': [[3], [1, 2]],
- '3+12356': [[3], [1, 2]],
- '3+123567': [[3], [1, 2]],
- '3+1235678': [[3], [1, 2]],
- '3+12356789': [[3], [1, 2]],
- '3+1235679': [[3], [1, 2]],
- '3+123568': [[3], [1, 2]],
- '3+1235689': [[3], [1, 2]],
- '3+123569': [[3], [1, 2]],
- '3+12357': [[3], [1, 2]],
- '3+123578': [[3], [1, 2]],
- '3+1235789': [[3], [1, 2]],
- '3+123579': [[3], [1, 2]],
- '3+12358': [[3], [1, 2]],
- '3+123589': [[3], [1, 2]],
- '3+12359': [[3], [1, 2]],
- '3+1236': [[3], [1, 2]],
- '3+12367': [[3], [1, 2]],
- '3+123678': [[3], [1, 2]],
- '3+1236789': [[3], [1, 2]],
- '3+123679': [[3], [1, 2]],
- '3+12368': [[3], [1, 2]],
- '3+123689': [[3], [1, 2]],
- '3+12369': [[3], [1, 2]],
- '3+1237': [[3], [1, 2]],
- '3+12378': [[3], [1, 2]],
- '3+123789': [[3], [1, 2]],
- '3+12379': [[3], [1, 2]],
- '3+1238': [[3], [1, 2]],
- '3+12389': [[3], [1, 2]],
- '3+1239': [[3], [1, 2]],
- '3+124': [[1, 2]],
- '3+1245': [[1, 2]],
- '3+12456': [[1, 2]],
- '3+124567': [[1, 2]],
- '3+1245678': [[1, 2]],
- '3+12456789': [[1, 2]],
- '3+1245679': [[1, 2]],
- '3+124568': [[1, 2]],
- '3+1245689': [[1, 2]],
- '3+124569': [[1, 2]],
- '3+12457': [[1, 2]],
- '3+124578': [[1, 2]],
- '3+1245789': [[1, 2]],
- '3+124579': [[1, 2]],
- '3+12458': [[1, 2]],
- '3+124589': [[1, 2]],
- '3+12459': [[1, 2]],
- '3+1246': [[1, 2]],
- '3+12467': [[1, 2]],
- '3+124678': [[1, 2]],
- '3+1246789': [[1, 2]],
- '3+124679': [[1, 2]],
- '3+12468': [[1, 2]],
- '3+124689': [[1, 2]],
- '3+12469': [[1, 2]],
- '3+1247': [[1, 2]],
- '3+12478': [[1, 2]],
- '3+124789': [[1, 2]],
- '3+12479': [[1, 2]],
- '3+1248': [[1, 2]],
- '3+12489': [[1, 2]],
- '3+1249': [[1, 2]],
- '3+125': [[1, 2]],
- '3+1256': [[1, 2]],
- '3+12567': [[1, 2]],
- '3+125678': [[1, 2]],
- '3+1256789': [[1, 2]],
- '3+125679': [[1, 2]],
- '3+12568': [[1, 2]],
- '3+125689': [[1, 2]],
- '3+12569': [[1, 2]],
- '3+1257': [[1, 2]],
- '3+12578': [[1, 2]],
- '3+125789': [[1, 2]],
- '3+12579': [[1, 2]],
- '3+1258': [[1, 2]],
- '3+12589': [[1, 2]],
- '3+1259': [[1, 2]],
- '3+126': [[1, 2]],
- '3+1267': [[1, 2]],
- '3+12678': [[1, 2]],
- '3+126789': [[1, 2]],
- '3+12679': [[1, 2]],
- '3+1268': [[1, 2]],
- '3+12689': [[1, 2]],
- '3+1269': [[1, 2]],
- '3+127': [[1, 2]],
- '3+1278': [[1, 2]],
- '3+12789': [[1, 2]],
- '3+1279': [[1, 2]],
- '3+128': [[1, 2]],
- '3+1289': [[1, 2]],
- '3+129': [[1, 2]],
- '3+13': [[3]],
- '3+134': [[3]],
- '3+1345': [[3]],
- '3+13456': [[3]],
- '3+134567': [[3]],
- '3+1345678': [[3]],
- '3+13456789': [[3]],
- '3+1345679': [[3]],
- '3+134568': [[3]],
- '3+1345689': [[3]],
- '3+134569': [[3]],
- '3+13457': [[3]],
- '3+134578': [[3]],
- '3+1345789': [[3]],
- '3+134579': [[3]],
- '3+13458': [[3]],
- '3+134589': [[3]],
- '3+13459': [[3]],
- '3+1346': [[3]],
- '3+13467': [[3]],
- '3+134678': [[3]],
- '3+1346789': [[3]],
- '3+134679': [[3]],
- '3+13468': [[3]],
- '3+134689': [[3]],
- '3+13469': [[3]],
- '3+1347': [[3]],
- '3+13478': [[3]],
- '3+134789': [[3]],
- '3+13479': [[3]],
- '3+1348': [[3]],
- '3+13489': [[3]],
- '3+1349': [[3]],
- '3+135': [[3]],
- '3+1356': [[3]],
- '3+13567': [[3]],
- '3+135678': [[3]],
- '3+1356789': [[3]],
- '3+135679': [[3]],
- '3+13568': [[3]],
- '3+135689': [[3]],
- '3+13569': [[3]],
- '3+1357': [[3]],
- '3+13578': [[3]],
- '3+135789': [[3]],
- '3+13579': [[3]],
- '3+1358': [[3]],
- '3+13589': [[3]],
- '3+1359': [[3]],
- '3+136': [[3]],
- '3+1367': [[3]],
- '3+13678': [[3]],
- '3+136789': [[3]],
- '3+13679': [[3]],
- '3+1368': [[3]],
- '3+13689': [[3]],
- '3+1369': [[3]],
- '3+137': [[3]],
- '3+1378': [[3]],
- '3+13789': [[3]],
- '3+1379': [[3]],
- '3+138': [[3]],
- '3+1389': [[3]],
- '3+139': [[3]],
- '3+14': [],
- '3+145': [],
- '3+1456': [],
- '3+14567': [],
- '3+145678': [],
- '3+1456789': [],
- '3+145679': [],
- '3+14568': [],
- '3+145689': [],
- '3+14569': [],
- '3+1457': [],
- '3+14578': [],
- '3+145789': [],
- '3+14579': [],
- '3+1458': [],
- '3+14589': [],
- '3+1459': [],
- '3+146': [],
- '3+1467': [],
- '3+14678': [],
- '3+146789': [],
- '3+14679': [],
- '3+1468': [],
- '3+14689': [],
- '3+1469': [],
- '3+147': [],
- '3+1478': [],
- '3+14789': [],
- '3+1479': [],
- '3+148': [],
- '3+1489': [],
- '3+149': [],
- '3+15': [],
- '3+156': [],
- '3+1567': [],
- '3+15678': [],
- '3+156789': [],
- '3+15679': [],
- '3+1568': [],
- '3+15689': [],
- '3+1569': [],
- '3+157': [],
- '3+1578': [],
- '3+15789': [],
- '3+1579': [],
- '3+158': [],
- '3+1589': [],
- '3+159': [],
- '3+16': [],
- '3+167': [],
- '3+1678': [],
- '3+16789': [],
- '3+1679': [],
- '3+168': [],
- '3+1689': [],
- '3+169': [],
- '3+17': [],
- '3+178': [],
- '3+1789': [],
- '3+179': [],
- '3+18': [],
- '3+189': [],
- '3+19': [],
- '3+2': [],
- '3+23': [[3]],
- '3+234': [[3]],
- '3+2345': [[3]],
- '3+23456': [[3]],
- '3+234567': [[3]],
- '3+2345678': [[3]],
- '3+23456789': [[3]],
- '3+2345679': [[3]],
- '3+234568': [[3]],
- '3+2345689': [[3]],
- '3+234569': [[3]],
- '3+23457': [[3]],
- '3+234578': [[3]],
- '3+2345789': [[3]],
- '3+234579': [[3]],
- '3+23458': [[3]],
- '3+234589': [[3]],
- '3+23459': [[3]],
- '3+2346': [[3]],
- '3+23467': [[3]],
- '3+234678': [[3]],
- '3+2346789': [[3]],
- '3+234679': [[3]],
- '3+23468': [[3]],
- '3+234689': [[3]],
- '3+23469': [[3]],
- '3+2347': [[3]],
- '3+23478': [[3]],
- '3+234789': [[3]],
- '3+23479': [[3]],
- '3+2348': [[3]],
- '3+23489': [[3]],
- '3+2349': [[3]],
- '3+235': [[3]],
- '3+2356': [[3]],
- '3+23567': [[3]],
- '3+235678': [[3]],
- '3+2356789': [[3]],
- '3+235679': [[3]],
- '3+23568': [[3]],
- '3+235689': [[3]],
- '3+23569': [[3]],
- '3+2357': [[3]],
- '3+23578': [[3]],
- '3+235789': [[3]],
- '3+23579': [[3]],
- '3+2358': [[3]],
- '3+23589': [[3]],
- '3+2359': [[3]],
- '3+236': [[3]],
- '3+2367': [[3]],
- '3+23678': [[3]],
- '3+236789': [[3]],
- '3+23679': [[3]],
- '3+2368': [[3]],
- '3+23689': [[3]],
- '3+2369': [[3]],
- '3+237': [[3]],
- '3+2378': [[3]],
- '3+23789': [[3]],
- '3+2379': [[3]],
- '3+238': [[3]],
- '3+2389': [[3]],
- '3+239': [[3]],
- '3+24': [],
- '3+245': [],
- '3+2456': [],
- '3+24567': [],
- '3+245678': [],
- '3+2456789': [],
- '3+245679': [],
- '3+24568': [],
- '3+245689': [],
- '3+24569': [],
- '3+2457': [],
- '3+24578': [],
- '3+245789': [],
- '3+24579': [],
- '3+2458': [],
- '3+24589': [],
- '3+2459': [],
- '3+246': [],
- '3+2467': [],
- '3+24678': [],
- '3+246789': [],
- '3+24679': [],
- '3+2468': [],
- '3+24689': [],
- '3+2469': [],
- '3+247': [],
- '3+2478': [],
- '3+24789': [],
- '3+2479': [],
- '3+248': [],
- '3+2489': [],
- '3+249': [],
- '3+25': [],
- '3+256': [],
- '3+2567': [],
- '3+25678': [],
- '3+256789': [],
- '3+25679': [],
- '3+2568': [],
- '3+25689': [],
- '3+2569': [],
- '3+257': [],
- '3+2578': [],
- '3+25789': [],
- '3+2579': [],
- '3+258': [],
- '3+2589': [],
- '3+259': [],
- '3+26': [],
- '3+267': [],
- '3+2678': [],
- '3+26789': [],
- '3+2679': [],
- '3+268': [],
- '3+2689': [],
- '3+269': [],
- '3+27': [],
- '3+278': [],
- '3+2789': [],
- '3+279': [],
- '3+28': [],
- '3+289': [],
- '3+29': [],
- '3+3': [[3]],
- '3+34': [[3]],
- '3+345': [[3]],
- '3+3456': [[3]],
- '3+34567': [[3]],
- '3+345678': [[3]],
- '3+3456789': [[3]],
- '3+345679': [[3]],
- '3+34568': [[3]],
- '3+345689': [[3]],
- '3+34569': [[3]],
- '3+3457': [[3]],
- '3+34578': [[3]],
- '3+345789': [[3]],
- '3+34579': [[3]],
- '3+3458': [[3]],
- '3+34589': [[3]],
- '3+3459': [[3]],
- '3+346': [[3]],
- '3+3467': [[3]],
- '3+34678': [[3]],
- '3+346789': [[3]],
- '3+34679': [[3]],
- '3+3468': [[3]],
- '3+34689': [[3]],
- '3+3469': [[3]],
- '3+347': [[3]],
- '3+3478': [[3]],
- '3+34789': [[3]],
- '3+3479': [[3]],
- '3+348': [[3]],
- '3+3489': [[3]],
- '3+349': [[3]],
- '3+35': [[3]],
- '3+356': [[3]],
- '3+3567': [[3]],
- '3+35678': [[3]],
- '3+356789': [[3]],
- '3+35679': [[3]],
- '3+3568': [[3]],
- '3+35689': [[3]],
- '3+3569': [[3]],
- '3+357': [[3]],
- '3+3578': [[3]],
- '3+35789': [[3]],
- '3+3579': [[3]],
- '3+358': [[3]],
- '3+3589': [[3]],
- '3+359': [[3]],
- '3+36': [[3]],
- '3+367': [[3]],
- '3+3678': [[3]],
- '3+36789': [[3]],
- '3+3679': [[3]],
- '3+368': [[3]],
- '3+3689': [[3]],
- '3+369': [[3]],
- '3+37': [[3]],
- '3+378': [[3]],
- '3+3789': [[3]],
- '3+379': [[3]],
- '3+38': [[3]],
- '3+389': [[3]],
- '3+39': [[3]],
- '3+4': [],
- '3+45': [],
- '3+456': [],
- '3+4567': [],
- '3+45678': [],
- '3+456789': [],
- '3+45679': [],
- '3+4568': [],
- '3+45689': [],
- '3+4569': [],
- '3+457': [],
- '3+4578': [],
- '3+45789': [],
- '3+4579': [],
- '3+458': [],
- '3+4589': [],
- '3+459': [],
- '3+46': [],
- '3+467': [],
- '3+4678': [],
- '3+46789': [],
- '3+4679': [],
- '3+468': [],
- '3+4689': [],
- '3+469': [],
- '3+47': [],
- '3+478': [],
- '3+4789': [],
- '3+479': [],
- '3+48': [],
- '3+489': [],
- '3+49': [],
- '3+5': [],
- '3+56': [],
- '3+567': [],
- '3+5678': [],
- '3+56789': [],
- '3+5679': [],
- '3+568': [],
- '3+5689': [],
- '3+569': [],
- '3+57': [],
- '3+578': [],
- '3+5789': [],
- '3+579': [],
- '3+58': [],
- '3+589': [],
- '3+59': [],
- '3+6': [],
- '3+67': [],
- '3+678': [],
- '3+6789': [],
- '3+679': [],
- '3+68': [],
- '3+689': [],
- '3+69': [],
- '3+7': [],
- '3+78': [],
- '3+789': [],
- '3+79': [],
- '3+8': [],
- '3+89': [],
- '3+9': [],
- '4+': [],
- '4+1': [],
- '4+12': [],
- '4+123': [[1, 3]],
- '4+1234': [[4], [1, 3]],
- '4+12345': [[4], [1, 3]],
- '4+123456': [[4], [1, 3]],
- '4+1234567': [[4], [1, 3]],
- '4+12345678': [[4], [1, 3]],
- '4+123456789': [[4], [1, 3]],
- '4+12345679': [[4], [1, 3]],
- '4+1234568': [[4], [1, 3]],
- '4+12345689': [[4], [1, 3]],
- '4+1234569': [[4], [1, 3]],
- '4+123457': [[4], [1, 3]],
- '4+1234578': [[4], [1, 3]],
- '4+12345789': [[4], [1, 3]],
- '4+1234579': [[4], [1, 3]],
- '4+123458': [[4], [1, 3]],
- '4+1234589': [[4], [1, 3]],
- '4+123459': [[4], [1, 3]],
- '4+12346': [[4], [1, 3]],
- '4+123467': [[4], [1, 3]],
- '4+1234678': [[4], [1, 3]],
- '4+12346789': [[4], [1, 3]],
- '4+1234679': [[4], [1, 3]],
- '4+123468': [[4], [1, 3]],
- '4+1234689': [[4], [1, 3]],
- '4+123469': [[4], [1, 3]],
- '4+12347': [[4], [1, 3]],
- '4+123478': [[4], [1, 3]],
- '4+1234789': [[4], [1, 3]],
- '4+123479': [[4], [1, 3]],
- '4+12348': [[4], [1, 3]],
- '4+123489': [[4], [1, 3]],
- '4+12349': [[4], [1, 3]],
- '4+1235': [[1, 3]],
- '4+12356': [[1, 3]],
- '4+123567': [[1, 3]],
- '4+1235678': [[1, 3]],
- '4+12356789': [[1, 3]],
- '4+1235679': [[1, 3]],
- '4+123568': [[1, 3]],
- '4+1235689': [[1, 3]],
- '4+123569': [[1, 3]],
- '4+12357': [[1, 3]],
- '4+123578': [[1, 3]],
- '4+1235789': [[1, 3]],
- '4+123579': [[1, 3]],
- '4+12358': [[1, 3]],
- '4+123589': [[1, 3]],
- '4+12359': [[1, 3]],
- '4+1236': [[1, 3]],
- '4+12367': [[1, 3]],
- '4+123678': [[1, 3]],
- '4+1236789': [[1, 3]],
- '4+123679': [[1, 3]],
- '4+12368': [[1, 3]],
- '4+123689': [[1, 3]],
- '4+12369': [[1, 3]],
- '4+1237': [[1, 3]],
- '4+12378': [[1, 3]],
- '4+123789': [[1, 3]],
- '4+12379': [[1, 3]],
- '4+1238': [[1, 3]],
- '4+12389': [[1, 3]],
- '4+1239': [[1, 3]],
- '4+124': [[4]],
- '4+1245': [[4]],
- '4+12456': [[4]],
- '4+124567': [[4]],
- '4+1245678': [[4]],
- '4+12456789': [[4]],
- '4+1245679': [[4]],
- '4+124568': [[4]],
- '4+1245689': [[4]],
- '4+124569': [[4]],
- '4+12457': [[4]],
- '4+124578': [[4]],
- '4+1245789': [[4]],
- '4+124579': [[4]],
- '4+12458': [[4]],
- '4+124589': [[4]],
- '4+12459': [[4]],
- '4+1246': [[4]],
- '4+12467': [[4]],
- '4+124678': [[4]],
- '4+1246789': [[4]],
- '4+124679': [[4]],
- '4+12468': [[4]],
- '4+124689': [[4]],
- '4+12469': [[4]],
- '4+1247': [[4]],
- '4+12478': [[4]],
- '4+124789': [[4]],
- '4+12479': [[4]],
- '4+1248': [[4]],
- '4+12489': [[4]],
- '4+1249': [[4]],
- '4+125': [],
- '4+1256': [],
- '4+12567': [],
- '4+125678': [],
- '4+1256789': [],
- '4+125679': [],
- '4+12568': [],
- '4+125689': [],
- '4+12569': [],
- '4+1257': [],
- '4+12578': [],
- '4+125789': [],
- '4+12579': [],
- '4+1258': [],
- '4+12589': [],
- '4+1259': [],
- '4+126': [],
- '4+1267': [],
- '4+12678': [],
- '4+126789': [],
- '4+12679': [],
- '4+1268': [],
- '4+12689': [],
- '4+1269': [],
- '4+127': [],
- '4+1278': [],
- '4+12789': [],
- '4+1279': [],
- '4+128': [],
- '4+1289': [],
- '4+129': [],
- '4+13': [[1, 3]],
- '4+134': [[4], [1, 3]],
- '4+1345': [[4], [1, 3]],
- '4+13456': [[4], [1, 3]],
- '4+134567': [[4], [1, 3]],
- '4+1345678': [[4], [1, 3]],
- '4+13456789': [[4], [1, 3]],
- '4+1345679': [[4], [1, 3]],
- '4+134568': [[4], [1, 3]],
- '4+1345689': [[4], [1, 3]],
- '4+134569': [[4], [1, 3]],
- '4+13457': [[4], [1, 3]],
- '4+134578': [[4], [1, 3]],
- '4+1345789': [[4], [1, 3]],
- '4+134579': [[4], [1, 3]],
- '4+13458': [[4], [1, 3]],
- '4+134589': [[4], [1, 3]],
- '4+13459': [[4], [1, 3]],
- '4+1346': [[4], [1, 3]],
- '4+13467': [[4], [1, 3]],
- '4+134678': [[4], [1, 3]],
- '4+1346789': [[4], [1, 3]],
- '4+134679': [[4], [1, 3]],
- '4+13468': [[4], [1, 3]],
- '4+134689': [[4], [1, 3]],
- '4+13469': [[4], [1, 3]],
- '4+1347': [[4], [1, 3]],
- '4+13478': [[4], [1, 3]],
- '4+134789': [[4], [1, 3]],
- '4+13479': [[4], [1, 3]],
- '4+1348': [[4], [1, 3]],
- '4+13489': [[4], [1, 3]],
- '4+1349': [[4], [1, 3]],
- '4+135': [[1, 3]],
- '4+1356': [[1, 3]],
- '4+13567': [[1, 3]],
- '4+135678': [[1, 3]],
- '4+1356789': [[1, 3]],
- '4+135679': [[1, 3]],
- '4+13568': [[1, 3]],
- '4+135689': [[1, 3]],
- '4+13569': [[1, 3]],
- '4+1357': [[1, 3]],
- '4+13578': [[1, 3]],
- '4+135789': [[1, 3]],
- '4+13579': [[1, 3]],
- '4+1358': [[1, 3]],
- '4+13589': [[1, 3]],
- '4+1359': [[1, 3]],
- '4+136': [[1, 3]],
- '4+1367': [[1, 3]],
- '4+13678': [[1, 3]],
- '4+136789': [[1, 3]],
- '4+13679': [[1, 3]],
- '4+1368': [[1, 3]],
- '4+13689': [[1, 3]],
- '4+1369': [[1, 3]],
- '4+137': [[1, 3]],
- '4+1378': [[1, 3]],
- '4+13789': [[1, 3]],
- '4+1379': [[1, 3]],
- '4+138': [[1, 3]],
- '4+1389': [[1, 3]],
- '4+139': [[1, 3]],
- '4+14': [[4]],
- '4+145': [[4]],
- '4+1456': [[4]],
- '4+14567': [[4]],
- '4+145678': [[4]],
- '4+1456789': [[4]],
- '4+145679': [[4]],
- '4+14568': [[4]],
- '4+145689': [[4]],
- '4+14569': [[4]],
- '4+1457': [[4]],
- '4+14578': [[4]],
- '4+145789': [[4]],
- '4+14579': [[4]],
- '4+1458': [[4]],
- '4+14589': [[4]],
- '4+1459': [[4]],
- '4+146': [[4]],
- '4+1467': [[4]],
- '4+14678': [[4]],
- '4+146789': [[4]],
- '4+14679': [[4]],
- '4+1468': [[4]],
- '4+14689': [[4]],
- '4+1469': [[4]],
- '4+147': [[4]],
- '4+1478': [[4]],
- '4+14789': [[4]],
- '4+1479': [[4]],
- '4+148': [[4]],
- '4+1489': [[4]],
- '4+149': [[4]],
- '4+15': [],
- '4+156': [],
- '4+1567': [],
- '4+15678': [],
- '4+156789': [],
- '4+15679': [],
- '4+1568': [],
- '4+15689': [],
- '4+1569': [],
- '4+157': [],
- '4+1578': [],
- '4+15789': [],
- '4+1579': [],
- '4+158': [],
- '4+1589': [],
- '4+159': [],
- '4+16': [],
- '4+167': [],
- '4+1678': [],
- '4+16789': [],
- '4+1679': [],
- '4+168': [],
- '4+1689': [],
- '4+169': [],
- '4+17': [],
- '4+178': [],
- '4+1789': [],
- '4+179': [],
- '4+18': [],
- '4+189': [],
- '4+19': [],
- '4+2': [],
- '4+23': [],
- '4+234': [[4]],
- '4+2345': [[4]],
- '4+23456': [[4]],
- '4+234567': [[4]],
- '4+2345678': [[4]],
- '4+23456789': [[4]],
- '4+2345679': [[4]],
- '4+234568': [[4]],
- '4+2345689': [[4]],
- '4+234569': [[4]],
- '4+23457': [[4]],
- '4+234578': [[4]],
- '4+2345789': [[4]],
- '4+234579': [[4]],
- '4+23458': [[4]],
- '4+234589': [[4]],
- '4+23459': [[4]],
- '4+2346': [[4]],
- '4+23467': [[4]],
- '4+234678': [[4]],
- '4+2346789': [[4]],
- '4+234679': [[4]],
- '4+23468': [[4]],
- '4+234689': [[4]],
- '4+23469': [[4]],
- '4+2347': [[4]],
- '4+23478': [[4]],
- '4+234789': [[4]],
- '4+23479': [[4]],
- '4+2348': [[4]],
- '4+23489': [[4]],
- '4+2349': [[4]],
- '4+235': [],
- '4+2356': [],
- '4+23567': [],
- '4+235678': [],
- '4+2356789': [],
- '4+235679': [],
- '4+23568': [],
- '4+235689': [],
- '4+23569': [],
- '4+2357': [],
- '4+23578': [],
- '4+235789': [],
- '4+23579': [],
- '4+2358': [],
- '4+23589': [],
- '4+2359': [],
- '4+236': [],
- '4+2367': [],
- '4+23678': [],
- '4+236789': [],
- '4+23679': [],
- '4+2368': [],
- '4+23689': [],
- '4+2369': [],
- '4+237': [],
- '4+2378': [],
- '4+23789': [],
- '4+2379': [],
- '4+238': [],
- '4+2389': [],
- '4+239': [],
- '4+24': [[4]],
- '4+245': [[4]],
- '4+2456': [[4]],
- '4+24567': [[4]],
- '4+245678': [[4]],
- '4+2456789': [[4]],
- '4+245679': [[4]],
- '4+24568': [[4]],
- '4+245689': [[4]],
- '4+24569': [[4]],
- '4+2457': [[4]],
- '4+24578': [[4]],
- '4+245789': [[4]],
- '4+24579': [[4]],
- '4+2458': [[4]],
- '4+24589': [[4]],
- '4+2459': [[4]],
- '4+246': [[4]],
- '4+2467': [[4]],
- '4+24678': [[4]],
- '4+246789': [[4]],
- '4+24679': [[4]],
- '4+2468': [[4]],
- '4+24689': [[4]],
- '4+2469': [[4]],
- '4+247': [[4]],
- '4+2478': [[4]],
- '4+24789': [[4]],
- '4+2479': [[4]],
- '4+248': [[4]],
- '4+2489': [[4]],
- '4+249': [[4]],
- '4+25': [],
- '4+256': [],
- '4+2567': [],
- '4+25678': [],
- '4+256789': [],
- '4+25679': [],
- '4+2568': [],
- '4+25689': [],
- '4+2569': [],
- '4+257': [],
- '4+2578': [],
- '4+25789': [],
- '4+2579': [],
- '4+258': [],
- '4+2589': [],
- '4+259': [],
- '4+26': [],
- '4+267': [],
- '4+2678': [],
- '4+26789': [],
- '4+2679': [],
- '4+268': [],
- '4+2689': [],
- '4+269': [],
- '4+27': [],
- '4+278': [],
- '4+2789': [],
- '4+279': [],
- '4+28': [],
- '4+289': [],
- '4+29': [],
- '4+3': [],
- '4+34': [[4]],
- '4+345': [[4]],
- '4+3456': [[4]],
- '4+34567': [[4]],
- '4+345678': [[4]],
- '4+3456789': [[4]],
- '4+345679': [[4]],
- '4+34568': [[4]],
- '4+345689': [[4]],
- '4+34569': [[4]],
- '4+3457': [[4]],
- '4+34578': [[4]],
- '4+345789': [[4]],
- '4+34579': [[4]],
- '4+3458': [[4]],
- '4+34589': [[4]],
- '4+3459': [[4]],
- '4+346': [[4]],
- '4+3467': [[4]],
- '4+34678': [[4]],
- '4+346789': [[4]],
- '4+34679': [[4]],
- '4+3468': [[4]],
- '4+34689': [[4]],
- '4+3469': [[4]],
- '4+347': [[4]],
- '4+3478': [[4]],
- '4+34789': [[4]],
- '4+3479': [[4]],
- '4+348': [[4]],
- '4+3489': [[4]],
- '4+349': [[4]],
- '4+35': [],
- '4+356': [],
- '4+3567': [],
- '4+35678': [],
- '4+356789': [],
- '4+35679': [],
- '4+3568': [],
- '4+35689': [],
- '4+3569': [],
- '4+357': [],
- '4+3578': [],
- '4+35789': [],
- '4+3579': [],
- '4+358': [],
- '4+3589': [],
- '4+359': [],
- '4+36': [],
- '4+367': [],
- '4+3678': [],
- '4+36789': [],
- '4+3679': [],
- '4+368': [],
- '4+3689': [],
- '4+369': [],
- '4+37': [],
- '4+378': [],
- '4+3789': [],
- '4+379': [],
- '4+38': [],
- '4+389': [],
- '4+39': [],
- '4+4': [[4]],
- '4+45': [[4]],
- '4+456': [[4]],
- '4+4567': [[4]],
- '4+45678': [[4]],
- '4+456789': [[4]],
- '4+45679': [[4]],
- '4+4568': [[4]],
- '4+45689': [[4]],
- '4+4569': [[4]],
- '4+457': [[4]],
- '4+4578': [[4]],
- '4+45789': [[4]],
- '4+4579': [[4]],
- '4+458': [[4]],
- '4+4589': [[4]],
- '4+459': [[4]],
- '4+46': [[4]],
- '4+467': [[4]],
- '4+4678': [[4]],
- '4+46789': [[4]],
- '4+4679': [[4]],
- '4+468': [[4]],
- '4+4689': [[4]],
- '4+469': [[4]],
- '4+47': [[4]],
- '4+478': [[4]],
- '4+4789': [[4]],
- '4+479': [[4]],
- '4+48': [[4]],
- '4+489': [[4]],
- '4+49': [[4]],
- '4+5': [],
- '4+56': [],
- '4+567': [],
- '4+5678': [],
- '4+56789': [],
- '4+5679': [],
- '4+568': [],
- '4+5689': [],
- '4+569': [],
- '4+57': [],
- '4+578': [],
- '4+5789': [],
- '4+579': [],
- '4+58': [],
- '4+589': [],
- '4+59': [],
- '4+6': [],
- '4+67': [],
- '4+678': [],
- '4+6789': [],
- '4+679': [],
- '4+68': [],
- '4+689': [],
- '4+69': [],
- '4+7': [],
- '4+78': [],
- '4+789': [],
- '4+79': [],
- '4+8': [],
- '4+89': [],
- '4+9': [],
- '5+': [],
- '5+1': [],
- '5+12': [],
- '5+123': [[2, 3]],
- '5+1234': [[1, 4], [2, 3]],
- '5+12345': [[5], [1, 4], [2, 3]],
- '5+123456': [[5], [1, 4], [2, 3]],
- '5+1234567': [[5], [1, 4], [2, 3]],
- '5+12345678': [[5], [1, 4], [2, 3]],
- '5+123456789': [[5], [1, 4], [2, 3]],
- '5+12345679': [[5], [1, 4], [2, 3]],
- '5+1234568': [[5], [1, 4], [2, 3]],
- '5+12345689': [[5], [1, 4], [2, 3]],
- '5+1234569': [[5], [1, 4], [2, 3]],
- '5+123457': [[5], [1, 4], [2, 3]],
- '5+1234578': [[5], [1, 4], [2, 3]],
- '5+12345789': [[5], [1, 4], [2, 3]],
- '5+1234579': [[5], [1, 4], [2, 3]],
- '5+123458': [[5], [1, 4], [2, 3]],
- '5+1234589': [[5], [1, 4], [2, 3]],
- '5+123459': [[5], [1, 4], [2, 3]],
- '5+12346': [[1, 4], [2, 3]],
- '5+123467': [[1, 4], [2, 3]],
- '5+1234678': [[1, 4], [2, 3]],
- '5+12346789': [[1, 4], [2, 3]],
- '5+1234679': [[1, 4], [2, 3]],
- '5+123468': [[1, 4], [2, 3]],
- '5+1234689': [[1, 4], [2, 3]],
- '5+123469': [[1, 4], [2, 3]],
- '5+12347': [[1, 4], [2, 3]],
- '5+123478': [[1, 4], [2, 3]],
- '5+1234789': [[1, 4], [2, 3]],
- '5+123479': [[1, 4], [2, 3]],
- '5+12348': [[1, 4], [2, 3]],
- '5+123489': [[1, 4], [2, 3]],
- '5+12349': [[1, 4], [2, 3]],
- '5+1235': [[5], [2, 3]],
- '5+12356': [[5], [2, 3]],
- '5+123567': [[5], [2, 3]],
- '5+1235678': [[5], [2, 3]],
- '5+12356789': [[5], [2, 3]],
- '5+1235679': [[5], [2, 3]],
- '5+123568': [[5], [2, 3]],
- '5+1235689': [[5], [2, 3]],
- '5+123569': [[5], [2, 3]],
- '5+12357': [[5], [2, 3]],
- '5+123578': [[5], [2, 3]],
- '5+1235789': [[5], [2, 3]],
- '5+123579': [[5], [2, 3]],
- '5+12358': [[5], [2, 3]],
- '5+123589': [[5], [2, 3]],
- '5+12359': [[5], [2, 3]],
- '5+1236': [[2, 3]],
- '5+12367': [[2, 3]],
- '5+123678': [[2, 3]],
- '5+1236789': [[2, 3]],
- '5+123679': [[2, 3]],
- '5+12368': [[2, 3]],
- '5+123689': [[2, 3]],
- '5+12369': [[2, 3]],
- '5+1237': [[2, 3]],
- '5+12378': [[2, 3]],
- '5+123789': [[2, 3]],
- '5+12379': [[2, 3]],
- '5+1238': [[2, 3]],
- '5+12389': [[2, 3]],
- '5+1239': [[2, 3]],
- '5+124': [[1, 4]],
- '5+1245': [[5], [1, 4]],
- '5+12456': [[5], [1, 4]],
- '5+124567': [[5], [1, 4]],
- '5+1245678': [[5], [1, 4]],
- '5+12456789': [[5], [1, 4]],
- '5+1245679': [[5], [1, 4]],
- '5+124568': [[5], [1, 4]],
- '5+1245689': [[5], [1, 4]],
- '5+124569': [[5], [1, 4]],
- '5+12457': [[5], [1, 4]],
- '5+124578': [[5], [1, 4]],
- '5+1245789': [[5], [1, 4]],
- '5+124579': [[5], [1, 4]],
- '5+12458': [[5], [1, 4]],
- '5+124589': [[5], [1, 4]],
- '5+12459': [[5], [1, 4]],
- '5+1246': [[1, 4]],
- '5+12467': [[1, 4]],
- '5+124678': [[1, 4]],
- '5+1246789': [[1, 4]],
- '5+124679': [[1, 4]],
- '5+12468': [[1, 4]],
- '5+124689': [[1, 4]],
- '5+12469': [[1, 4]],
- '5+1247': [[1, 4]],
- '5+12478': [[1, 4]],
- '5+124789': [[1, 4]],
- '5+12479': [[1, 4]],
- '5+1248': [[1, 4]],
- '5+12489': [[1, 4]],
- '5+1249': [[1, 4]],
- '5+125': [[5]],
- '5+1256': [[5]],
- '5+12567': [[5]],
- '5+125678': [[5]],
- '5+1256789': [[5]],
- '5+125679': [[5]],
- '5+12568': [[5]],
- '5+125689': [[5]],
- '5+12569': [[5]],
- '5+1257': [[5]],
- '5+12578': [[5]],
- '5+125789': [[5]],
- '5+12579': [[5]],
- '5+1258': [[5]],
- '5+12589': [[5]],
- '5+1259': [[5]],
- '5+126': [],
- '5+1267': [],
- '5+12678': [],
- '5+126789': [],
- '5+12679': [],
- '5+1268': [],
- '5+12689': [],
- '5+1269': [],
- '5+127': [],
- '5+1278': [],
- '5+12789': [],
- '5+1279': [],
- '5+128': [],
- '5+1289': [],
- '5+129': [],
- '5+13': [],
- '5+134': [[1, 4]],
- '5+1345': [[5], [1, 4]],
- '5+13456': [[5], [1, 4]],
- '5+134567': [[5], [1, 4]],
- '5+1345678': [[5], [1, 4]],
- '5+13456789': [[5], [1, 4]],
- '5+1345679': [[5], [1, 4]],
- '5+134568': [[5], [1, 4]],
- '5+1345689': [[5], [1, 4]],
- '5+134569': [[5], [1, 4]],
- '5+13457': [[5], [1, 4]],
- '5+134578': [[5], [1, 4]],
- '5+1345789': [[5], [1, 4]],
- '5+134579': [[5], [1, 4]],
- '5+13458': [[5], [1, 4]],
- '5+134589': [[5], [1, 4]],
- '5+13459': [[5], [1, 4]],
- '5+1346': [[1, 4]],
- '5+13467': [[1, 4]],
- '5+134678': [[1, 4]],
- '5+1346789': [[1, 4]],
- '5+134679': [[1, 4]],
- '5+13468': [[1, 4]],
- '5+134689': [[1, 4]],
- '5+13469': [[1, 4]],
- '5+1347': [[1, 4]],
- '5+13478': [[1, 4]],
- '5+134789': [[1, 4]],
- '5+13479': [[1, 4]],
- '5+1348': [[1, 4]],
- '5+13489': [[1, 4]],
- '5+1349': [[1, 4]],
- '5+135': [[5]],
- '5+1356': [[5]],
- '5+13567': [[5]],
- '5+135678': [[5]],
- '5+1356789': [[5]],
- '5+135679': [[5]],
- '5+13568': [[5]],
- '5+135689': [[5]],
- '5+13569': [[5]],
- '5+1357': [[5]],
- '5+13578': [[5]],
- '5+135789': [[5]],
- '5+13579': [[5]],
- '5+1358': [[5]],
- '5+13589': [[5]],
- '5+1359': [[5]],
- '5+136': [],
- '5+1367': [],
- '5+13678': [],
- '5+136789': [],
- '5+13679': [],
- '5+1368': [],
- '5+13689': [],
- '5+1369': [],
- '5+137': [],
- '5+1378': [],
- '5+13789': [],
- '5+1379': [],
- '5+138': [],
- '5+1389': [],
- '5+139': [],
- '5+14': [[1, 4]],
- '5+145': [[5], [1, 4]],
- '5+1456': [[5], [1, 4]],
- '5+14567': [[5], [1, 4]],
- '5+145678': [[5], [1, 4]],
- '5+1456789': [[5], [1, 4]],
- '5+145679': [[5], [1, 4]],
- '5+14568': [[5], [1, 4]],
- '5+145689': [[5], [1, 4]],
- '5+14569': [[5], [1, 4]],
- '5+1457': [[5], [1, 4]],
- '5+14578': [[5], [1, 4]],
- '5+145789': [[5], [1, 4]],
- '5+14579': [[5], [1, 4]],
- '5+1458': [[5], [1, 4]],
- '5+14589': [[5], [1, 4]],
- '5+1459': [[5], [1, 4]],
- '5+146': [[1, 4]],
- '5+1467': [[1, 4]],
- '5+14678': [[1, 4]],
- '5+146789': [[1, 4]],
- '5+14679': [[1, 4]],
- '5+1468': [[1, 4]],
- '5+14689': [[1, 4]],
- '5+1469': [[1, 4]],
- '5+147': [[1, 4]],
- '5+1478': [[1, 4]],
- '5+14789': [[1, 4]],
- '5+1479': [[1, 4]],
- '5+148': [[1, 4]],
- '5+1489': [[1, 4]],
- '5+149': [[1, 4]],
- '5+15': [[5]],
- '5+156': [[5]],
- '5+1567': [[5]],
- '5+15678': [[5]],
- '5+156789': [[5]],
- '5+15679': [[5]],
- '5+1568': [[5]],
- '5+15689': [[5]],
- '5+1569': [[5]],
- '5+157': [[5]],
- '5+1578': [[5]],
- '5+15789': [[5]],
- '5+1579': [[5]],
- '5+158': [[5]],
- '5+1589': [[5]],
- '5+159': [[5]],
- '5+16': [],
- '5+167': [],
- '5+1678': [],
- '5+16789': [],
- '5+1679': [],
- '5+168': [],
- '5+1689': [],
- '5+169': [],
- '5+17': [],
- '5+178': [],
- '5+1789': [],
- '5+179': [],
- '5+18': [],
- '5+189': [],
- '5+19': [],
- '5+2': [],
- '5+23': [[2, 3]],
- '5+234': [[2, 3]],
- '5+2345': [[5], [2, 3]],
- '5+23456': [[5], [2, 3]],
- '5+234567': [[5], [2, 3]],
- '5+2345678': [[5], [2, 3]],
- '5+23456789': [[5], [2, 3]],
- '5+2345679': [[5], [2, 3]],
- '5+234568': [[5], [2, 3]],
- '5+2345689': [[5], [2, 3]],
- '5+234569': [[5], [2, 3]],
- '5+23457': [[5], [2, 3]],
- '5+234578': [[5], [2, 3]],
- '5+2345789': [[5], [2, 3]],
- '5+234579': [[5], [2, 3]],
- '5+23458': [[5], [2, 3]],
- '5+234589': [[5], [2, 3]],
- '5+23459': [[5], [2, 3]],
- '5+2346': [[2, 3]],
- '5+23467': [[2, 3]],
- '5+234678': [[2, 3]],
- '5+2346789': [[2, 3]],
- '5+234679': [[2, 3]],
- '5+23468': [[2, 3]],
- '5+234689': [[2, 3]],
- '5+23469': [[2, 3]],
- '5+2347': [[2, 3]],
- '5+23478': [[2, 3]],
- '5+234789': [[2, 3]],
- '5+23479': [[2, 3]],
- '5+2348': [[2, 3]],
- '5+23489': [[2, 3]],
- '5+2349': [[2, 3]],
- '5+235': [[5], [2, 3]],
- '5+2356': [[5], [2, 3]],
- '5+23567': [[5], [2, 3]],
- '5+235678': [[5], [2, 3]],
- '5+2356789': [[5], [2, 3]],
- '5+235679': [[5], [2, 3]],
- '5+23568': [[5], [2, 3]],
- '5+235689': [[5], [2, 3]],
- '5+23569': [[5], [2, 3]],
- '5+2357': [[5], [2, 3]],
- '5+23578': [[5], [2, 3]],
- '5+235789': [[5], [2, 3]],
- '5+23579': [[5], [2, 3]],
- '5+2358': [[5], [2, 3]],
- '5+23589': [[5], [2, 3]],
- '5+2359': [[5], [2, 3]],
- '5+236': [[2, 3]],
- '5+2367': [[2, 3]],
- '5+23678': [[2, 3]],
- '5+236789': [[2, 3]],
- '5+23679': [[2, 3]],
- '5+2368': [[2, 3]],
- '5+23689': [[2, 3]],
- '5+2369': [[2, 3]],
- '5+237': [[2, 3]],
- '5+2378': [[2, 3]],
- '5+23789': [[2, 3]],
- '5+2379': [[2, 3]],
- '5+238': [[2, 3]],
- '5+2389': [[2, 3]],
- '5+239': [[2, 3]],
- '5+24': [],
- '5+245': [[5]],
- '5+2456': [[5]],
- '5+24567': [[5]],
- '5+245678': [[5]],
- '5+2456789': [[5]],
- '5+245679': [[5]],
- '5+24568': [[5]],
- '5+245689': [[5]],
- '5+24569': [[5]],
- '5+2457': [[5]],
- '5+24578': [[5]],
- '5+245789': [[5]],
- '5+24579': [[5]],
- '5+2458': [[5]],
- '5+24589': [[5]],
- '5+2459': [[5]],
- '5+246': [],
- '5+2467': [],
- '5+24678': [],
- '5+246789': [],
- '5+24679': [],
- '5+2468': [],
- '5+24689': [],
- '5+2469': [],
- '5+247': [],
- '5+2478': [],
- '5+24789': [],
- '5+2479': [],
- '5+248': [],
- '5+2489': [],
- '5+249': [],
- '5+25': [[5]],
- '5+256': [[5]],
- '5+2567': [[5]],
- '5+25678': [[5]],
- '5+256789': [[5]],
- '5+25679': [[5]],
- '5+2568': [[5]],
- '5+25689': [[5]],
- '5+2569': [[5]],
- '5+257': [[5]],
- '5+2578': [[5]],
- '5+25789': [[5]],
- '5+2579': [[5]],
- '5+258': [[5]],
- '5+2589': [[5]],
- '5+259': [[5]],
- '5+26': [],
- '5+267': [],
- '5+2678': [],
- '5+26789': [],
- '5+2679': [],
- '5+268': [],
- '5+2689': [],
- '5+269': [],
- '5+27': [],
- '5+278': [],
- '5+2789': [],
- '5+279': [],
- '5+28': [],
- '5+289': [],
- '5+29': [],
- '5+3': [],
- '5+34': [],
- '5+345': [[5]],
- '5+3456': [[5]],
- '5+34567': [[5]],
- '5+345678': [[5]],
- '5+3456789': [[5]],
- '5+345679': [[5]],
- '5+34568': [[5]],
- '5+345689': [[5]],
- '5+34569': [[5]],
- '5+3457': [[5]],
- '5+34578': [[5]],
- '5+345789': [[5]],
- '5+34579': [[5]],
- '5+3458': [[5]],
- '5+34589': [[5]],
- '5+3459': [[5]],
- '5+346': [],
- '5+3467': [],
- '5+34678': [],
- '5+346789': [],
- '5+34679': [],
- '5+3468': [],
- '5+34689': [],
- '5+3469': [],
- '5+347': [],
- '5+3478': [],
- '5+34789': [],
- '5+3479': [],
- '5+348': [],
- '5+3489': [],
- '5+349': [],
- '5+35': [[5]],
- '5+356': [[5]],
- '5+3567': [[5]],
- '5+35678': [[5]],
- '5+356789': [[5]],
- '5+35679': [[5]],
- '5+3568': [[5]],
- '5+35689': [[5]],
- '5+3569': [[5]],
- '5+357': [[5]],
- '5+3578': [[5]],
- '5+35789': [[5]],
- '5+3579': [[5]],
- '5+358': [[5]],
- '5+3589': [[5]],
- '5+359': [[5]],
- '5+36': [],
- '5+367': [],
- '5+3678': [],
- '5+36789': [],
- '5+3679': [],
- '5+368': [],
- '5+3689': [],
- '5+369': [],
- '5+37': [],
- '5+378': [],
- '5+3789': [],
- '5+379': [],
- '5+38': [],
- '5+389': [],
- '5+39': [],
- '5+4': [],
- '5+45': [[5]],
- '5+456': [[5]],
- '5+4567': [[5]],
- '5+45678': [[5]],
- '5+456789': [[5]],
- '5+45679': [[5]],
- '5+4568': [[5]],
- '5+45689': [[5]],
- '5+4569': [[5]],
- '5+457': [[5]],
- '5+4578': [[5]],
- '5+45789': [[5]],
- '5+4579': [[5]],
- '5+458': [[5]],
- '5+4589': [[5]],
- '5+459': [[5]],
- '5+46': [],
- '5+467': [],
- '5+4678': [],
- '5+46789': [],
- '5+4679': [],
- '5+468': [],
- '5+4689': [],
- '5+469': [],
- '5+47': [],
- '5+478': [],
- '5+4789': [],
- '5+479': [],
- '5+48': [],
- '5+489': [],
- '5+49': [],
- '5+5': [[5]],
- '5+56': [[5]],
- '5+567': [[5]],
- '5+5678': [[5]],
- '5+56789': [[5]],
- '5+5679': [[5]],
- '5+568': [[5]],
- '5+5689': [[5]],
- '5+569': [[5]],
- '5+57': [[5]],
- '5+578': [[5]],
- '5+5789': [[5]],
- '5+579': [[5]],
- '5+58': [[5]],
- '5+589': [[5]],
- '5+59': [[5]],
- '5+6': [],
- '5+67': [],
- '5+678': [],
- '5+6789': [],
- '5+679': [],
- '5+68': [],
- '5+689': [],
- '5+69': [],
- '5+7': [],
- '5+78': [],
- '5+789': [],
- '5+79': [],
- '5+8': [],
- '5+89': [],
- '5+9': [],
- '6+': [],
- '6+1': [],
- '6+12': [],
- '6+123': [[1, 2, 3]],
- '6+1234': [[2, 4], [1, 2, 3]],
- '6+12345': [[1, 5], [2, 4], [1, 2, 3]],
- '6+123456': [[6], [1, 5], [2, 4], [1, 2, 3]],
- '6+1234567': [[6], [1, 5], [2, 4], [1, 2, 3]],
- '6+12345678': [[6], [1, 5], [2, 4], [1, 2, 3]],
- '6+123456789': [[6], [1, 5], [2, 4], [1, 2, 3]],
- '6+12345679': [[6], [1, 5], [2, 4], [1, 2, 3]],
- '6+1234568': [[6], [1, 5], [2, 4], [1, 2, 3]],
- '6+12345689': [[6], [1, 5], [2, 4], [1, 2, 3]],
- '6+1234569': [[6], [1, 5], [2, 4], [1, 2, 3]],
- '6+123457': [[1, 5], [2, 4], [1, 2, 3]],
- '6+1234578': [[1, 5], [2, 4], [1, 2, 3]],
- '6+12345789': [[1, 5], [2, 4], [1, 2, 3]],
- '6+1234579': [[1, 5], [2, 4], [1, 2, 3]],
- '6+123458': [[1, 5], [2, 4], [1, 2, 3]],
- '6+1234589': [[1, 5], [2, 4], [1, 2, 3]],
- '6+123459': [[1, 5], [2, 4], [1, 2, 3]],
- '6+12346': [[6], [2, 4], [1, 2, 3]],
- '6+123467': [[6], [2, 4], [1, 2, 3]],
- '6+1234678': [[6], [2, 4], [1, 2, 3]],
- '6+12346789': [[6], [2, 4], [1, 2, 3]],
- '6+1234679': [[6], [2, 4], [1, 2, 3]],
- '6+123468': [[6], [2, 4], [1, 2, 3]],
- '6+1234689': [[6], [2, 4], [1, 2, 3]],
- '6+123469': [[6], [2, 4], [1, 2, 3]],
- '6+12347': [[2, 4], [1, 2, 3]],
- '6+123478': [[2, 4], [1, 2, 3]],
- '6+1234789': [[2, 4], [1, 2, 3]],
- '6+123479': [[2, 4], [1, 2, 3]],
- '6+12348': [[2, 4], [1, 2, 3]],
- '6+123489': [[2, 4], [1, 2, 3]],
- '6+12349': [[2, 4], [1, 2, 3]],
- '6+1235': [[1, 5], [1, 2, 3]],
- '6+12356': [[6], [1, 5], [1, 2, 3]],
- '6+123567': [[6], [1, 5], [1, 2, 3]],
- '6+1235678': [[6], [1, 5], [1, 2, 3]],
- '6+12356789': [[6], [1, 5], [1, 2, 3]],
- '6+1235679': [[6], [1, 5], [1, 2, 3]],
- '6+123568': [[6], [1, 5], [1, 2, 3]],
- '6+1235689': [[6], [1, 5], [1, 2, 3]],
- '6+123569': [[6], [1, 5], [1, 2, 3]],
- '6+12357': [[1, 5], [1, 2, 3]],
- '6+123578': [[1, 5], [1, 2, 3]],
- '6+1235789': [[1, 5], [1, 2, 3]],
- '6+123579': [[1, 5], [1, 2, 3]],
- '6+12358': [[1, 5], [1, 2, 3]],
- '6+123589': [[1, 5], [1, 2, 3]],
- '6+12359': [[1, 5], [1, 2, 3]],
- '6+1236': [[6], [1, 2, 3]],
- '6+12367': [[6], [1, 2, 3]],
- '6+123678': [[6], [1, 2, 3]],
- '6+1236789': [[6], [1, 2, 3]],
- '6+123679': [[6], [1, 2, 3]],
- '6+12368': [[6], [1, 2, 3]],
- '6+123689': [[6], [1, 2, 3]],
- '6+12369': [[6], [1, 2, 3]],
- '6+1237': [[1, 2, 3]],
- '6+12378': [[1, 2, 3]],
- '6+123789': [[1, 2, 3]],
- '6+12379': [[1, 2, 3]],
- '6+1238': [[1, 2, 3]],
- '6+12389': [[1, 2, 3]],
- '6+1239': [[1, 2, 3]],
- '6+124': [[2, 4]],
- '6+1245': [[1, 5], [2, 4]],
- '6+12456': [[6], [1, 5], [2, 4]],
- '6+124567': [[6], [1, 5], [2, 4]],
- '6+1245678': [[6], [1, 5], [2, 4]],
- '6+12456789': [[6], [1, 5], [2, 4]],
- '6+1245679': [[6], [1, 5], [2, 4]],
- '6+124568': [[6], [1, 5], [2, 4]],
- '6+1245689': [[6], [1, 5], [2, 4]],
- '6+124569': [[6], [1, 5], [2, 4]],
- '6+12457': [[1, 5], [2, 4]],
- '6+124578': [[1, 5], [2, 4]],
- '6+1245789': [[1, 5], [2, 4]],
- '6+124579': [[1, 5], [2, 4]],
- '6+12458': [[1, 5], [2, 4]],
- '6+124589': [[1, 5], [2, 4]],
- '6+12459': [[1, 5], [2, 4]],
- '6+1246': [[6], [2, 4]],
- '6+12467': [[6], [2, 4]],
- '6+124678': [[6], [2, 4]],
- '6+1246789': [[6], [2, 4]],
- '6+124679': [[6], [2, 4]],
- '6+12468': [[6], [2, 4]],
- '6+124689': [[6], [2, 4]],
- '6+12469': [[6], [2, 4]],
- '6+1247': [[2, 4]],
- '6+12478': [[2, 4]],
- '6+124789': [[2, 4]],
- '6+12479': [[2, 4]],
- '6+1248': [[2, 4]],
- '6+12489': [[2, 4]],
- '6+1249': [[2, 4]],
- '6+125': [[1, 5]],
- '6+1256': [[6], [1, 5]],
- '6+12567': [[6], [1, 5]],
- '6+125678': [[6], [1, 5]],
- '6+1256789': [[6], [1, 5]],
- '6+125679': [[6], [1, 5]],
- '6+12568': [[6], [1, 5]],
- '6+125689': [[6], [1, 5]],
- '6+12569': [[6], [1, 5]],
- '6+1257': [[1, 5]],
- '6+12578': [[1, 5]],
- '6+125789': [[1, 5]],
- '6+12579': [[1, 5]],
- '6+1258': [[1, 5]],
- '6+12589': [[1, 5]],
- '6+1259': [[1, 5]],
- '6+126': [[6]],
- '6+1267': [[6]],
- '6+12678': [[6]],
- '6+126789': [[6]],
- '6+12679': [[6]],
- '6+1268': [[6]],
- '6+12689': [[6]],
- '6+1269': [[6]],
- '6+127': [],
- '6+1278': [],
- '6+12789': [],
- '6+1279': [],
- '6+128': [],
- '6+1289': [],
- '6+129': [],
- '6+13': [],
- '6+134': [],
- '6+1345': [[1, 5]],
- '6+13456': [[6], [1, 5]],
- '6+134567': [[6], [1, 5]],
- '6+1345678': [[6], [1, 5]],
- '6+13456789': [[6], [1, 5]],
- '6+1345679': [[6], [1, 5]],
- '6+134568': [[6], [1, 5]],
- '6+1345689': [[6], [1, 5]],
- '6+134569': [[6], [1, 5]],
- '6+13457': [[1, 5]],
- '6+134578': [[1, 5]],
- '6+1345789': [[1, 5]],
- '6+134579': [[1, 5]],
- '6+13458': [[1, 5]],
- '6+134589': [[1, 5]],
- '6+13459': [[1, 5]],
- '6+1346': [[6]],
- '6+13467': [[6]],
- '6+134678': [[6]],
- '6+1346789': [[6]],
- '6+134679': [[6]],
- '6+13468': [[6]],
- '6+134689': [[6]],
- '6+13469': [[6]],
- '6+1347': [],
- '6+13478': [],
- '6+134789': [],
- '6+13479': [],
- '6+1348': [],
- '6+13489': [],
- '6+1349': [],
- '6+135': [[1, 5]],
- '6+1356': [[6], [1, 5]],
- '6+13567': [[6], [1, 5]],
- '6+135678': [[6], [1, 5]],
- '6+1356789': [[6], [1, 5]],
- '6+135679': [[6], [1, 5]],
- '6+13568': [[6], [1, 5]],
- '6+135689': [[6], [1, 5]],
- '6+13569': [[6], [1, 5]],
- '6+1357': [[1, 5]],
- '6+13578': [[1, 5]],
- '6+135789': [[1, 5]],
- '6+13579': [[1, 5]],
- '6+1358': [[1, 5]],
- '6+13589': [[1, 5]],
- '6+1359': [[1, 5]],
- '6+136': [[6]],
- '6+1367': [[6]],
- '6+13678': [[6]],
- '6+136789': [[6]],
- '6+13679': [[6]],
- '6+1368': [[6]],
- '6+13689': [[6]],
- '6+1369': [[6]],
- '6+137': [],
- '6+1378': [],
- '6+13789': [],
- '6+1379': [],
- '6+138': [],
- '6+1389': [],
- '6+139': [],
- '6+14': [],
- '6+145': [[1, 5]],
- '6+1456': [[6], [1, 5]],
- '6+14567': [[6], [1, 5]],
- '6+145678': [[6], [1, 5]],
- '6+1456789': [[6], [1, 5]],
- '6+145679': [[6], [1, 5]],
- '6+14568': [[6], [1, 5]],
- '6+145689': [[6], [1, 5]],
- '6+14569': [[6], [1, 5]],
- '6+1457': [[1, 5]],
- '6+14578': [[1, 5]],
- '6+145789': [[1, 5]],
- '6+14579': [[1, 5]],
- '6+1458': [[1, 5]],
- '6+14589': [[1, 5]],
- '6+1459': [[1, 5]],
- '6+146': [[6]],
- '6+1467': [[6]],
- '6+14678': [[6]],
- '6+146789': [[6]],
- '6+14679': [[6]],
- '6+1468': [[6]],
- '6+14689': [[6]],
- '6+1469': [[6]],
- '6+147': [],
- '6+1478': [],
- '6+14789': [],
- '6+1479': [],
- '6+148': [],
- '6+1489': [],
- '6+149': [],
- '6+15': [[1, 5]],
- '6+156': [[6], [1, 5]],
- '6+1567': [[6], [1, 5]],
- '6+15678': [[6], [1, 5]],
- '6+156789': [[6], [1, 5]],
- '6+15679': [[6], [1, 5]],
- '6+1568': [[6], [1, 5]],
- '6+15689': [[6], [1, 5]],
- '6+1569': [[6], [1, 5]],
- '6+157': [[1, 5]],
- '6+1578': [[1, 5]],
- '6+15789': [[1, 5]],
- '6+1579': [[1, 5]],
- '6+158': [[1, 5]],
- '6+1589': [[1, 5]],
- '6+159': [[1, 5]],
- '6+16': [[6]],
- '6+167': [[6]],
- '6+1678': [[6]],
- '6+16789': [[6]],
- '6+1679': [[6]],
- '6+168': [[6]],
- '6+1689': [[6]],
- '6+169': [[6]],
- '6+17': [],
- '6+178': [],
- '6+1789': [],
- '6+179': [],
- '6+18': [],
- '6+189': [],
- '6+19': [],
- '6+2': [],
- '6+23': [],
- '6+234': [[2, 4]],
- '6+2345': [[2, 4]],
- '6+23456': [[6], [2, 4]],
- '6+234567': [[6], [2, 4]],
- '6+2345678': [[6], [2, 4]],
- '6+23456789': [[6], [2, 4]],
- '6+2345679': [[6], [2, 4]],
- '6+234568': [[6], [2, 4]],
- '6+2345689': [[6], [2, 4]],
- '6+234569': [[6], [2, 4]],
- '6+23457': [[2, 4]],
- '6+234578': [[2, 4]],
- '6+2345789': [[2, 4]],
- '6+234579': [[2, 4]],
- '6+23458': [[2, 4]],
- '6+234589': [[2, 4]],
- '6+23459': [[2, 4]],
- '6+2346': [[6], [2, 4]],
- '6+23467': [[6], [2, 4]],
- '6+234678': [[6], [2, 4]],
- '6+2346789': [[6], [2, 4]],
- '6+234679': [[6], [2, 4]],
- '6+23468': [[6], [2, 4]],
- '6+234689': [[6], [2, 4]],
- '6+23469': [[6], [2, 4]],
- '6+2347': [[2, 4]],
- '6+23478': [[2, 4]],
- '6+234789': [[2, 4]],
- '6+23479': [[2, 4]],
- '6+2348': [[2, 4]],
- '6+23489': [[2, 4]],
- '6+2349': [[2, 4]],
- '6+235': [],
- '6+2356': [[6]],
- '6+23567': [[6]],
- '6+235678': [[6]],
- '6+2356789': [[6]],
- '6+235679': [[6]],
- '6+23568': [[6]],
- '6+235689': [[6]],
- '6+23569': [[6]],
- '6+2357': [],
- '6+23578': [],
- '6+235789': [],
- '6+23579': [],
- '6+2358': [],
- '6+23589': [],
- '6+2359': [],
- '6+236': [[6]],
- '6+2367': [[6]],
- '6+23678': [[6]],
- '6+236789': [[6]],
- '6+23679': [[6]],
- '6+2368': [[6]],
- '6+23689': [[6]],
- '6+2369': [[6]],
- '6+237': [],
- '6+2378': [],
- '6+23789': [],
- '6+2379': [],
- '6+238': [],
- '6+2389': [],
- '6+239': [],
- '6+24': [[2, 4]],
- '6+245': [[2, 4]],
- '6+2456': [[6], [2, 4]],
- '6+24567': [[6], [2, 4]],
- '6+245678': [[6], [2, 4]],
- '6+2456789': [[6], [2, 4]],
- '6+245679': [[6], [2, 4]],
- '6+24568': [[6], [2, 4]],
- '6+245689': [[6], [2, 4]],
- '6+24569': [[6], [2, 4]],
- '6+2457': [[2, 4]],
- '6+24578': [[2, 4]],
- '6+245789': [[2, 4]],
- '6+24579': [[2, 4]],
- '6+2458': [[2, 4]],
- '6+24589': [[2, 4]],
- '6+2459': [[2, 4]],
- '6+246': [[6], [2, 4]],
- '6+2467': [[6], [2, 4]],
- '6+24678': [[6], [2, 4]],
- '6+246789': [[6], [2, 4]],
- '6+24679': [[6], [2, 4]],
- '6+2468': [[6], [2, 4]],
- '6+24689': [[6], [2, 4]],
- '6+2469': [[6], [2, 4]],
- '6+247': [[2, 4]],
- '6+2478': [[2, 4]],
- '6+24789': [[2, 4]],
- '6+2479': [[2, 4]],
- '6+248': [[2, 4]],
- '6+2489': [[2, 4]],
- '6+249': [[2, 4]],
- '6+25': [],
- '6+256': [[6]],
- '6+2567': [[6]],
- '6+25678': [[6]],
- '6+256789': [[6]],
- '6+25679': [[6]],
- '6+2568': [[6]],
- '6+25689': [[6]],
- '6+2569': [[6]],
- '6+257': [],
- '6+2578': [],
- '6+25789': [],
- '6+2579': [],
- '6+258': [],
- '6+2589': [],
- '6+259': [],
- '6+26': [[6]],
- '6+267': [[6]],
- '6+2678': [[6]],
- '6+26789': [[6]],
- '6+2679': [[6]],
- '6+268': [[6]],
- '6+2689': [[6]],
- '6+269': [[6]],
- '6+27': [],
- '6+278': [],
- '6+2789': [],
- '6+279': [],
- '6+28': [],
- '6+289': [],
- '6+29': [],
- '6+3': [],
- '6+34': [],
- '6+345': [],
- '6+3456': [[6]],
- '6+34567': [[6]],
- '6+345678': [[6]],
- '6+3456789': [[6]],
- '6+345679': [[6]],
- '6+34568': [[6]],
- '6+345689': [[6]],
- '6+34569': [[6]],
- '6+3457': [],
- '6+34578': [],
- '6+345789': [],
- '6+34579': [],
- '6+3458': [],
- '6+34589': [],
- '6+3459': [],
- '6+346': [[6]],
- '6+3467': [[6]],
- '6+34678': [[6]],
- '6+346789': [[6]],
- '6+34679': [[6]],
- '6+3468': [[6]],
- '6+34689': [[6]],
- '6+3469': [[6]],
- '6+347': [],
- '6+3478': [],
- '6+34789': [],
- '6+3479': [],
- '6+348': [],
- '6+3489': [],
- '6+349': [],
- '6+35': [],
- '6+356': [[6]],
- '6+3567': [[6]],
- '6+35678': [[6]],
- '6+356789': [[6]],
- '6+35679': [[6]],
- '6+3568': [[6]],
- '6+35689': [[6]],
- '6+3569': [[6]],
- '6+357': [],
- '6+3578': [],
- '6+35789': [],
- '6+3579': [],
- '6+358': [],
- '6+3589': [],
- '6+359': [],
- '6+36': [[6]],
- '6+367': [[6]],
- '6+3678': [[6]],
- '6+36789': [[6]],
- '6+3679': [[6]],
- '6+368': [[6]],
- '6+3689': [[6]],
- '6+369': [[6]],
- '6+37': [],
- '6+378': [],
- '6+3789': [],
- '6+379': [],
- '6+38': [],
- '6+389': [],
- '6+39': [],
- '6+4': [],
- '6+45': [],
- '6+456': [[6]],
- '6+4567': [[6]],
- '6+45678': [[6]],
- '6+456789': [[6]],
- '6+45679': [[6]],
- '6+4568': [[6]],
- '6+45689': [[6]],
- '6+4569': [[6]],
- '6+457': [],
- '6+4578': [],
- '6+45789': [],
- '6+4579': [],
- '6+458': [],
- '6+4589': [],
- '6+459': [],
- '6+46': [[6]],
- '6+467': [[6]],
- '6+4678': [[6]],
- '6+46789': [[6]],
- '6+4679': [[6]],
- '6+468': [[6]],
- '6+4689': [[6]],
- '6+469': [[6]],
- '6+47': [],
- '6+478': [],
- '6+4789': [],
- '6+479': [],
- '6+48': [],
- '6+489': [],
- '6+49': [],
- '6+5': [],
- '6+56': [[6]],
- '6+567': [[6]],
- '6+5678': [[6]],
- '6+56789': [[6]],
- '6+5679': [[6]],
- '6+568': [[6]],
- '6+5689': [[6]],
- '6+569': [[6]],
- '6+57': [],
- '6+578': [],
- '6+5789': [],
- '6+579': [],
- '6+58': [],
- '6+589': [],
- '6+59': [],
- '6+6': [[6]],
- '6+67': [[6]],
- '6+678': [[6]],
- '6+6789': [[6]],
- '6+679': [[6]],
- '6+68': [[6]],
- '6+689': [[6]],
- '6+69': [[6]],
- '6+7': [],
- '6+78': [],
- '6+789': [],
- '6+79': [],
- '6+8': [],
- '6+89': [],
- '6+9': [],
- '7+': [],
- '7+1': [],
- '7+12': [],
- '7+123': [],
- '7+1234': [[3, 4], [1, 2, 4]],
- '7+12345': [[2, 5], [3, 4], [1, 2, 4]],
- '7+123456': [[1, 6], [2, 5], [3, 4], [1, 2, 4]],
- '7+1234567': [[7], [1, 6], [2, 5], [3, 4], [1, 2, 4]],
- '7+12345678': [[7], [1, 6], [2, 5], [3, 4], [1, 2, 4]],
- '7+123456789': [[7], [1, 6], [2, 5], [3, 4], [1, 2, 4]],
- '7+12345679': [[7], [1, 6], [2, 5], [3, 4], [1, 2, 4]],
- '7+1234568': [[1, 6], [2, 5], [3, 4], [1, 2, 4]],
- '7+12345689': [[1, 6], [2, 5], [3, 4], [1, 2, 4]],
- '7+1234569': [[1, 6], [2, 5], [3, 4], [1, 2, 4]],
- '7+123457': [[7], [2, 5], [3, 4], [1, 2, 4]],
- '7+1234578': [[7], [2, 5], [3, 4], [1, 2, 4]],
- '7+12345789': [[7], [2, 5], [3, 4], [1, 2, 4]],
- '7+1234579': [[7], [2, 5], [3, 4], [1, 2, 4]],
- '7+123458': [[2, 5], [3, 4], [1, 2, 4]],
- '7+1234589': [[2, 5], [3, 4], [1, 2, 4]],
- '7+123459': [[2, 5], [3, 4], [1, 2, 4]],
- '7+12346': [[1, 6], [3, 4], [1, 2, 4]],
- '7+123467': [[7], [1, 6], [3, 4], [1, 2, 4]],
- '7+1234678': [[7], [1, 6], [3, 4], [1, 2, 4]],
- '7+12346789': [[7], [1, 6], [3, 4], [1, 2, 4]],
- '7+1234679': [[7], [1, 6], [3, 4], [1, 2, 4]],
- '7+123468': [[1, 6], [3, 4], [1, 2, 4]],
- '7+1234689': [[1, 6], [3, 4], [1, 2, 4]],
- '7+123469': [[1, 6], [3, 4], [1, 2, 4]],
- '7+12347': [[7], [3, 4], [1, 2, 4]],
- '7+123478': [[7], [3, 4], [1, 2, 4]],
- '7+1234789': [[7], [3, 4], [1, 2, 4]],
- '7+123479': [[7], [3, 4], [1, 2, 4]],
- '7+12348': [[3, 4], [1, 2, 4]],
- '7+123489': [[3, 4], [1, 2, 4]],
- '7+12349': [[3, 4], [1, 2, 4]],
- '7+1235': [[2, 5]],
- '7+12356': [[1, 6], [2, 5]],
- '7+123567': [[7], [1, 6], [2, 5]],
- '7+1235678': [[7], [1, 6], [2, 5]],
- '7+12356789': [[7], [1, 6], [2, 5]],
- '7+1235679': [[7], [1, 6], [2, 5]],
- '7+123568': [[1, 6], [2, 5]],
- '7+1235689': [[1, 6], [2, 5]],
- '7+123569': [[1, 6], [2, 5]],
- '7+12357': [[7], [2, 5]],
- '7+123578': [[7], [2, 5]],
- '7+1235789': [[7], [2, 5]],
- '7+123579': [[7], [2, 5]],
- '7+12358': [[2, 5]],
- '7+123589': [[2, 5]],
- '7+12359': [[2, 5]],
- '7+1236': [[1, 6]],
- '7+12367': [[7], [1, 6]],
- '7+123678': [[7], [1, 6]],
- '7+1236789': [[7], [1, 6]],
- '7+123679': [[7], [1, 6]],
- '7+12368': [[1, 6]],
- '7+123689': [[1, 6]],
- '7+12369': [[1, 6]],
- '7+1237': [[7]],
- '7+12378': [[7]],
- '7+123789': [[7]],
- '7+12379': [[7]],
- '7+1238': [],
- '7+12389': [],
- '7+1239': [],
- '7+124': [[1, 2, 4]],
- '7+1245': [[2, 5], [1, 2, 4]],
- '7+12456': [[1, 6], [2, 5], [1, 2, 4]],
- '7+124567': [[7], [1, 6], [2, 5], [1, 2, 4]],
- '7+1245678': [[7], [1, 6], [2, 5], [1, 2, 4]],
- '7+12456789': [[7], [1, 6], [2, 5], [1, 2, 4]],
- '7+1245679': [[7], [1, 6], [2, 5], [1, 2, 4]],
- '7+124568': [[1, 6], [2, 5], [1, 2, 4]],
- '7+1245689': [[1, 6], [2, 5], [1, 2, 4]],
- '7+124569': [[1, 6], [2, 5], [1, 2, 4]],
- '7+12457': [[7], [2, 5], [1, 2, 4]],
- '7+124578': [[7], [2, 5], [1, 2, 4]],
- '7+1245789': [[7], [2, 5], [1, 2, 4]],
- '7+124579': [[7], [2, 5], [1, 2, 4]],
- '7+12458': [[2, 5], [1, 2, 4]],
- '7+124589': [[2, 5], [1, 2, 4]],
- '7+12459': [[2, 5], [1, 2, 4]],
- '7+1246': [[1, 6], [1, 2, 4]],
- '7+12467': [[7], [1, 6], [1, 2, 4]],
- '7+124678': [[7], [1, 6], [1, 2, 4]],
- '7+1246789': [[7], [1, 6], [1, 2, 4]],
- '7+124679': [[7], [1, 6], [1, 2, 4]],
- '7+12468': [[1, 6], [1, 2, 4]],
- '7+124689': [[1, 6], [1, 2, 4]],
- '7+12469': [[1, 6], [1, 2, 4]],
- '7+1247': [[7], [1, 2, 4]],
- '7+12478': [[7], [1, 2, 4]],
- '7+124789': [[7], [1, 2, 4]],
- '7+12479': [[7], [1, 2, 4]],
- '7+1248': [[1, 2, 4]],
- '7+12489': [[1, 2, 4]],
- '7+1249': [[1, 2, 4]],
- '7+125': [[2, 5]],
- '7+1256': [[1, 6], [2, 5]],
- '7+12567': [[7], [1, 6], [2, 5]],
- '7+125678': [[7], [1, 6], [2, 5]],
- '7+1256789': [[7], [1, 6], [2, 5]],
- '7+125679': [[7], [1, 6], [2, 5]],
- '7+12568': [[1, 6], [2, 5]],
- '7+125689': [[1, 6], [2, 5]],
- '7+12569': [[1, 6], [2, 5]],
- '7+1257': [[7], [2, 5]],
- '7+12578': [[7], [2, 5]],
- '7+125789': [[7], [2, 5]],
- '7+12579': [[7], [2, 5]],
- '7+1258': [[2, 5]],
- '7+12589': [[2, 5]],
- '7+1259': [[2, 5]],
- '7+126': [[1, 6]],
- '7+1267': [[7], [1, 6]],
- '7+12678': [[7], [1, 6]],
- '7+126789': [[7], [1, 6]],
- '7+12679': [[7], [1, 6]],
- '7+1268': [[1, 6]],
- '7+12689': [[1, 6]],
- '7+1269': [[1, 6]],
- '7+127': [[7]],
- '7+1278': [[7]],
- '7+12789': [[7]],
- '7+1279': [[7]],
- '7+128': [],
- '7+1289': [],
- '7+129': [],
- '7+13': [],
- '7+134': [[3, 4]],
- '7+1345': [[3, 4]],
- '7+13456': [[1, 6], [3, 4]],
- '7+134567': [[7], [1, 6], [3, 4]],
- '7+1345678': [[7], [1, 6], [3, 4]],
- '7+13456789': [[7], [1, 6], [3, 4]],
- '7+1345679': [[7], [1, 6], [3, 4]],
- '7+134568': [[1, 6], [3, 4]],
- '7+1345689': [[1, 6], [3, 4]],
- '7+134569': [[1, 6], [3, 4]],
- '7+13457': [[7], [3, 4]],
- '7+134578': [[7], [3, 4]],
- '7+1345789': [[7], [3, 4]],
- '7+134579': [[7], [3, 4]],
- '7+13458': [[3, 4]],
- '7+134589': [[3, 4]],
- '7+13459': [[3, 4]],
- '7+1346': [[1, 6], [3, 4]],
- '7+13467': [[7], [1, 6], [3, 4]],
- '7+134678': [[7], [1, 6], [3, 4]],
- '7+1346789': [[7], [1, 6], [3, 4]],
- '7+134679': [[7], [1, 6], [3, 4]],
- '7+13468': [[1, 6], [3, 4]],
- '7+134689': [[1, 6], [3, 4]],
- '7+13469': [[1, 6], [3, 4]],
- '7+1347': [[7], [3, 4]],
- '7+13478': [[7], [3, 4]],
- '7+134789': [[7], [3, 4]],
- '7+13479': [[7], [3, 4]],
- '7+1348': [[3, 4]],
- '7+13489': [[3, 4]],
- '7+1349': [[3, 4]],
- '7+135': [],
- '7+1356': [[1, 6]],
- '7+13567': [[7], [1, 6]],
- '7+135678': [[7], [1, 6]],
- '7+1356789': [[7], [1, 6]],
- '7+135679': [[7], [1, 6]],
- '7+13568': [[1, 6]],
- '7+135689': [[1, 6]],
- '7+13569': [[1, 6]],
- '7+1357': [[7]],
- '7+13578': [[7]],
- '7+135789': [[7]],
- '7+13579': [[7]],
- '7+1358': [],
- '7+13589': [],
- '7+1359': [],
- '7+136': [[1, 6]],
- '7+1367': [[7], [1, 6]],
- '7+13678': [[7], [1, 6]],
- '7+136789': [[7], [1, 6]],
- '7+13679': [[7], [1, 6]],
- '7+1368': [[1, 6]],
- '7+13689': [[1, 6]],
- '7+1369': [[1, 6]],
- '7+137': [[7]],
- '7+1378': [[7]],
- '7+13789': [[7]],
- '7+1379': [[7]],
- '7+138': [],
- '7+1389': [],
- '7+139': [],
- '7+14': [],
- '7+145': [],
- '7+1456': [[1, 6]],
- '7+14567': [[7], [1, 6]],
- '7+145678': [[7], [1, 6]],
- '7+1456789': [[7], [1, 6]],
- '7+145679': [[7], [1, 6]],
- '7+14568': [[1, 6]],
- '7+145689': [[1, 6]],
- '7+14569': [[1, 6]],
- '7+1457': [[7]],
- '7+14578': [[7]],
- '7+145789': [[7]],
- '7+14579': [[7]],
- '7+1458': [],
- '7+14589': [],
- '7+1459': [],
- '7+146': [[1, 6]],
- '7+1467': [[7], [1, 6]],
- '7+14678': [[7], [1, 6]],
- '7+146789': [[7], [1, 6]],
- '7+14679': [[7], [1, 6]],
- '7+1468': [[1, 6]],
- '7+14689': [[1, 6]],
- '7+1469': [[1, 6]],
- '7+147': [[7]],
- '7+1478': [[7]],
- '7+14789': [[7]],
- '7+1479': [[7]],
- '7+148': [],
- '7+1489': [],
- '7+149': [],
- '7+15': [],
- '7+156': [[1, 6]],
- '7+1567': [[7], [1, 6]],
- '7+15678': [[7], [1, 6]],
- '7+156789': [[7], [1, 6]],
- '7+15679': [[7], [1, 6]],
- '7+1568': [[1, 6]],
- '7+15689': [[1, 6]],
- '7+1569': [[1, 6]],
- '7+157': [[7]],
- '7+1578': [[7]],
- '7+15789': [[7]],
- '7+1579': [[7]],
- '7+158': [],
- '7+1589': [],
- '7+159': [],
- '7+16': [[1, 6]],
- '7+167': [[7], [1, 6]],
- '7+1678': [[7], [1, 6]],
- '7+16789': [[7], [1, 6]],
- '7+1679': [[7], [1, 6]],
- '7+168': [[1, 6]],
- '7+1689': [[1, 6]],
- '7+169': [[1, 6]],
- '7+17': [[7]],
- '7+178': [[7]],
- '7+1789': [[7]],
- '7+179': [[7]],
- '7+18': [],
- '7+189': [],
- '7+19': [],
- '7+2': [],
- '7+23': [],
- '7+234': [[3, 4]],
- '7+2345': [[2, 5], [3, 4]],
- '7+23456': [[2, 5], [3, 4]],
- '7+234567': [[7], [2, 5], [3, 4]],
- '7+2345678': [[7], [2, 5], [3, 4]],
- '7+23456789': [[7], [2, 5], [3, 4]],
- '7+2345679': [[7], [2, 5], [3, 4]],
- '7+234568': [[2, 5], [3, 4]],
- '7+2345689': [[2, 5], [3, 4]],
- '7+234569': [[2, 5], [3, 4]],
- '7+23457': [[7], [2, 5], [3, 4]],
- '7+234578': [[7], [2, 5], [3, 4]],
- '7+2345789': [[7], [2, 5], [3, 4]],
- '7+234579': [[7], [2, 5], [3, 4]],
- '7+23458': [[2, 5], [3, 4]],
- '7+234589': [[2, 5], [3, 4]],
- '7+23459': [[2, 5], [3, 4]],
- '7+2346': [[3, 4]],
- '7+23467': [[7], [3, 4]],
- '7+234678': [[7], [3, 4]],
- '7+2346789': [[7], [3, 4]],
- '7+234679': [[7], [3, 4]],
- '7+23468': [[3, 4]],
- '7+234689': [[3, 4]],
- '7+23469': [[3, 4]],
- '7+2347': [[7], [3, 4]],
- '7+23478': [[7], [3, 4]],
- '7+234789': [[7], [3, 4]],
- '7+23479': [[7], [3, 4]],
- '7+2348': [[3, 4]],
- '7+23489': [[3, 4]],
- '7+2349': [[3, 4]],
- '7+235': [[2, 5]],
- '7+2356': [[2, 5]],
- '7+23567': [[7], [2, 5]],
- '7+235678': [[7], [2, 5]],
- '7+2356789': [[7], [2, 5]],
- '7+235679': [[7], [2, 5]],
- '7+23568': [[2, 5]],
- '7+235689': [[2, 5]],
- '7+23569': [[2, 5]],
- '7+2357': [[7], [2, 5]],
- '7+23578': [[7], [2, 5]],
- '7+235789': [[7], [2, 5]],
- '7+23579': [[7], [2, 5]],
- '7+2358': [[2, 5]],
- '7+23589': [[2, 5]],
- '7+2359': [[2, 5]],
- '7+236': [],
- '7+2367': [[7]],
- '7+23678': [[7]],
- '7+236789': [[7]],
- '7+23679': [[7]],
- '7+2368': [],
- '7+23689': [],
- '7+2369': [],
- '7+237': [[7]],
- '7+2378': [[7]],
- '7+23789': [[7]],
- '7+2379': [[7]],
- '7+238': [],
- '7+2389': [],
- '7+239': [],
- '7+24': [],
- '7+245': [[2, 5]],
- '7+2456': [[2, 5]],
- '7+24567': [[7], [2, 5]],
- '7+245678': [[7], [2, 5]],
- '7+2456789': [[7], [2, 5]],
- '7+245679': [[7], [2, 5]],
- '7+24568': [[2, 5]],
- '7+245689': [[2, 5]],
- '7+24569': [[2, 5]],
- '7+2457': [[7], [2, 5]],
- '7+24578': [[7], [2, 5]],
- '7+245789': [[7], [2, 5]],
- '7+24579': [[7], [2, 5]],
- '7+2458': [[2, 5]],
- '7+24589': [[2, 5]],
- '7+2459': [[2, 5]],
- '7+246': [],
- '7+2467': [[7]],
- '7+24678': [[7]],
- '7+246789': [[7]],
- '7+24679': [[7]],
- '7+2468': [],
- '7+24689': [],
- '7+2469': [],
- '7+247': [[7]],
- '7+2478': [[7]],
- '7+24789': [[7]],
- '7+2479': [[7]],
- '7+248': [],
- '7+2489': [],
- '7+249': [],
- '7+25': [[2, 5]],
- '7+256': [[2, 5]],
- '7+2567': [[7], [2, 5]],
- '7+25678': [[7], [2, 5]],
- '7+256789': [[7], [2, 5]],
- '7+25679': [[7], [2, 5]],
- '7+2568': [[2, 5]],
- '7+25689': [[2, 5]],
- '7+2569': [[2, 5]],
- '7+257': [[7], [2, 5]],
- '7+2578': [[7], [2, 5]],
- '7+25789': [[7], [2, 5]],
- '7+2579': [[7], [2, 5]],
- '7+258': [[2, 5]],
- '7+2589': [[2, 5]],
- '7+259': [[2, 5]],
- '7+26': [],
- '7+267': [[7]],
- '7+2678': [[7]],
- '7+26789': [[7]],
- '7+2679': [[7]],
- '7+268': [],
- '7+2689': [],
- '7+269': [],
- '7+27': [[7]],
- '7+278': [[7]],
- '7+2789': [[7]],
- '7+279': [[7]],
- '7+28': [],
- '7+289': [],
- '7+29': [],
- '7+3': [],
- '7+34': [[3, 4]],
- '7+345': [[3, 4]],
- '7+3456': [[3, 4]],
- '7+34567': [[7], [3, 4]],
- '7+345678': [[7], [3, 4]],
- '7+3456789': [[7], [3, 4]],
- '7+345679': [[7], [3, 4]],
- '7+34568': [[3, 4]],
- '7+345689': [[3, 4]],
- '7+34569': [[3, 4]],
- '7+3457': [[7], [3, 4]],
- '7+34578': [[7], [3, 4]],
- '7+345789': [[7], [3, 4]],
- '7+34579': [[7], [3, 4]],
- '7+3458': [[3, 4]],
- '7+34589': [[3, 4]],
- '7+3459': [[3, 4]],
- '7+346': [[3, 4]],
- '7+3467': [[7], [3, 4]],
- '7+34678': [[7], [3, 4]],
- '7+346789': [[7], [3, 4]],
- '7+34679': [[7], [3, 4]],
- '7+3468': [[3, 4]],
- '7+34689': [[3, 4]],
- '7+3469': [[3, 4]],
- '7+347': [[7], [3, 4]],
- '7+3478': [[7], [3, 4]],
- '7+34789': [[7], [3, 4]],
- '7+3479': [[7], [3, 4]],
- '7+348': [[3, 4]],
- '7+3489': [[3, 4]],
- '7+349': [[3, 4]],
- '7+35': [],
- '7+356': [],
- '7+3567': [[7]],
- '7+35678': [[7]],
- '7+356789': [[7]],
- '7+35679': [[7]],
- '7+3568': [],
- '7+35689': [],
- '7+3569': [],
- '7+357': [[7]],
- '7+3578': [[7]],
- '7+35789': [[7]],
- '7+3579': [[7]],
- '7+358': [],
- '7+3589': [],
- '7+359': [],
- '7+36': [],
- '7+367': [[7]],
- '7+3678': [[7]],
- '7+36789': [[7]],
- '7+3679': [[7]],
- '7+368': [],
- '7+3689': [],
- '7+369': [],
- '7+37': [[7]],
- '7+378': [[7]],
- '7+3789': [[7]],
- '7+379': [[7]],
- '7+38': [],
- '7+389': [],
- '7+39': [],
- '7+4': [],
- '7+45': [],
- '7+456': [],
- '7+4567': [[7]],
- '7+45678': [[7]],
- '7+456789': [[7]],
- '7+45679': [[7]],
- '7+4568': [],
- '7+45689': [],
- '7+4569': [],
- '7+457': [[7]],
- '7+4578': [[7]],
- '7+45789': [[7]],
- '7+4579': [[7]],
- '7+458': [],
- '7+4589': [],
- '7+459': [],
- '7+46': [],
- '7+467': [[7]],
- '7+4678': [[7]],
- '7+46789': [[7]],
- '7+4679': [[7]],
- '7+468': [],
- '7+4689': [],
- '7+469': [],
- '7+47': [[7]],
- '7+478': [[7]],
- '7+4789': [[7]],
- '7+479': [[7]],
- '7+48': [],
- '7+489': [],
- '7+49': [],
- '7+5': [],
- '7+56': [],
- '7+567': [[7]],
- '7+5678': [[7]],
- '7+56789': [[7]],
- '7+5679': [[7]],
- '7+568': [],
- '7+5689': [],
- '7+569': [],
- '7+57': [[7]],
- '7+578': [[7]],
- '7+5789': [[7]],
- '7+579': [[7]],
- '7+58': [],
- '7+589': [],
- '7+59': [],
- '7+6': [],
- '7+67': [[7]],
- '7+678': [[7]],
- '7+6789': [[7]],
- '7+679': [[7]],
- '7+68': [],
- '7+689': [],
- '7+69': [],
- '7+7': [[7]],
- '7+78': [[7]],
- '7+789': [[7]],
- '7+79': [[7]],
- '7+8': [],
- '7+89': [],
- '7+9': [],
- '8+': [],
- '8+1': [],
- '8+12': [],
- '8+123': [],
- '8+1234': [[1, 3, 4]],
- '8+12345': [[3, 5], [1, 2, 5], [1, 3, 4]],
- '8+123456': [[2, 6], [3, 5], [1, 2, 5], [1, 3, 4]],
- '8+1234567': [[1, 7], [2, 6], [3, 5], [1, 2, 5], [1, 3, 4]],
- '8+12345678': [[8], [1, 7], [2, 6], [3, 5], [1, 2, 5], [1, 3, 4]],
- '8+123456789': [[8], [1, 7], [2, 6], [3, 5], [1, 2, 5], [1, 3, 4]],
- '8+12345679': [[1, 7], [2, 6], [3, 5], [1, 2, 5], [1, 3, 4]],
- '8+1234568': [[8], [2, 6], [3, 5], [1, 2, 5], [1, 3, 4]],
- '8+12345689': [[8], [2, 6], [3, 5], [1, 2, 5], [1, 3, 4]],
- '8+1234569': [[2, 6], [3, 5], [1, 2, 5], [1, 3, 4]],
- '8+123457': [[1, 7], [3, 5], [1, 2, 5], [1, 3, 4]],
- '8+1234578': [[8], [1, 7], [3, 5], [1, 2, 5], [1, 3, 4]],
- '8+12345789': [[8], [1, 7], [3, 5], [1, 2, 5], [1, 3, 4]],
- '8+1234579': [[1, 7], [3, 5], [1, 2, 5], [1, 3, 4]],
- '8+123458': [[8], [3, 5], [1, 2, 5], [1, 3, 4]],
- '8+1234589': [[8], [3, 5], [1, 2, 5], [1, 3, 4]],
- '8+123459': [[3, 5], [1, 2, 5], [1, 3, 4]],
- '8+12346': [[2, 6], [1, 3, 4]],
- '8+123467': [[1, 7], [2, 6], [1, 3, 4]],
- '8+1234678': [[8], [1, 7], [2, 6], [1, 3, 4]],
- '8+12346789': [[8], [1, 7], [2, 6], [1, 3, 4]],
- '8+1234679': [[1, 7], [2, 6], [1, 3, 4]],
- '8+123468': [[8], [2, 6], [1, 3, 4]],
- '8+1234689': [[8], [2, 6], [1, 3, 4]],
- '8+123469': [[2, 6], [1, 3, 4]],
- '8+12347': [[1, 7], [1, 3, 4]],
- '8+123478': [[8], [1, 7], [1, 3, 4]],
- '8+1234789': [[8], [1, 7], [1, 3, 4]],
- '8+123479': [[1, 7], [1, 3, 4]],
- '8+12348': [[8], [1, 3, 4]],
- '8+123489': [[8], [1, 3, 4]],
- '8+12349': [[1, 3, 4]],
- '8+1235': [[3, 5], [1, 2, 5]],
- '8+12356': [[2, 6], [3, 5], [1, 2, 5]],
- '8+123567': [[1, 7], [2, 6], [3, 5], [1, 2, 5]],
- '8+1235678': [[8], [1, 7], [2, 6], [3, 5], [1, 2, 5]],
- '8+12356789': [[8], [1, 7], [2, 6], [3, 5], [1, 2, 5]],
- '8+1235679': [[1, 7], [2, 6], [3, 5], [1, 2, 5]],
- '8+123568': [[8], [2, 6], [3, 5], [1, 2, 5]],
- '8+1235689': [[8], [2, 6], [3, 5], [1, 2, 5]],
- '8+123569': [[2, 6], [3, 5], [1, 2, 5]],
- '8+12357': [[1, 7], [3, 5], [1, 2, 5]],
- '8+123578': [[8], [1, 7], [3, 5], [1, 2, 5]],
- '8+1235789': [[8], [1, 7], [3, 5], [1, 2, 5]],
- '8+123579': [[1, 7], [3, 5], [1, 2, 5]],
- '8+12358': [[8], [3, 5], [1, 2, 5]],
- '8+123589': [[8], [3, 5], [1, 2, 5]],
- '8+12359': [[3, 5], [1, 2, 5]],
- '8+1236': [[2, 6]],
- '8+12367': [[1, 7], [2, 6]],
- '8+123678': [[8], [1, 7], [2, 6]],
- '8+1236789': [[8], [1, 7], [2, 6]],
- '8+123679': [[1, 7], [2, 6]],
- '8+12368': [[8], [2, 6]],
- '8+123689': [[8], [2, 6]],
- '8+12369': [[2, 6]],
- '8+1237': [[1, 7]],
- '8+12378': [[8], [1, 7]],
- '8+123789': [[8], [1, 7]],
- '8+12379': [[1, 7]],
- '8+1238': [[8]],
- '8+12389': [[8]],
- '8+1239': [],
- '8+124': [],
- '8+1245': [[1, 2, 5]],
- '8+12456': [[2, 6], [1, 2, 5]],
- '8+124567': [[1, 7], [2, 6], [1, 2, 5]],
- '8+1245678': [[8], [1, 7], [2, 6], [1, 2, 5]],
- '8+12456789': [[8], [1, 7], [2, 6], [1, 2, 5]],
- '8+1245679': [[1, 7], [2, 6], [1, 2, 5]],
- '8+124568': [[8], [2, 6], [1, 2, 5]],
- '8+1245689': [[8], [2, 6], [1, 2, 5]],
- '8+124569': [[2, 6], [1, 2, 5]],
- '8+12457': [[1, 7], [1, 2, 5]],
- '8+124578': [[8], [1, 7], [1, 2, 5]],
- '8+1245789': [[8], [1, 7], [1, 2, 5]],
- '8+124579': [[1, 7], [1, 2, 5]],
- '8+12458': [[8], [1, 2, 5]],
- '8+124589': [[8], [1, 2, 5]],
- '8+12459': [[1, 2, 5]],
- '8+1246': [[2, 6]],
- '8+12467': [[1, 7], [2, 6]],
- '8+124678': [[8], [1, 7], [2, 6]],
- '8+1246789': [[8], [1, 7], [2, 6]],
- '8+124679': [[1, 7], [2, 6]],
- '8+12468': [[8], [2, 6]],
- '8+124689': [[8], [2, 6]],
- '8+12469': [[2, 6]],
- '8+1247': [[1, 7]],
- '8+12478': [[8], [1, 7]],
- '8+124789': [[8], [1, 7]],
- '8+12479': [[1, 7]],
- '8+1248': [[8]],
- '8+12489': [[8]],
- '8+1249': [],
- '8+125': [[1, 2, 5]],
- '8+1256': [[2, 6], [1, 2, 5]],
- '8+12567': [[1, 7], [2, 6], [1, 2, 5]],
- '8+125678': [[8], [1, 7], [2, 6], [1, 2, 5]],
- '8+1256789': [[8], [1, 7], [2, 6], [1, 2, 5]],
- '8+125679': [[1, 7], [2, 6], [1, 2, 5]],
- '8+12568': [[8], [2, 6], [1, 2, 5]],
- '8+125689': [[8], [2, 6], [1, 2, 5]],
- '8+12569': [[2, 6], [1, 2, 5]],
- '8+1257': [[1, 7], [1, 2, 5]],
- '8+12578': [[8], [1, 7], [1, 2, 5]],
- '8+125789': [[8], [1, 7], [1, 2, 5]],
- '8+12579': [[1, 7], [1, 2, 5]],
- '8+1258': [[8], [1, 2, 5]],
- '8+12589': [[8], [1, 2, 5]],
- '8+1259': [[1, 2, 5]],
- '8+126': [[2, 6]],
- '8+1267': [[1, 7], [2, 6]],
- '8+12678': [[8], [1, 7], [2, 6]],
- '8+126789': [[8], [1, 7], [2, 6]],
- '8+12679': [[1, 7], [2, 6]],
- '8+1268': [[8], [2, 6]],
- '8+12689': [[8], [2, 6]],
- '8+1269': [[2, 6]],
- '8+127': [[1, 7]],
- '8+1278': [[8], [1, 7]],
- '8+12789': [[8], [1, 7]],
- '8+1279': [[1, 7]],
- '8+128': [[8]],
- '8+1289': [[8]],
- '8+129': [],
- '8+13': [],
- '8+134': [[1, 3, 4]],
- '8+1345': [[3, 5], [1, 3, 4]],
- '8+13456': [[3, 5], [1, 3, 4]],
- '8+134567': [[1, 7], [3, 5], [1, 3, 4]],
- '8+1345678': [[8], [1, 7], [3, 5], [1, 3, 4]],
- '8+13456789': [[8], [1, 7], [3, 5], [1, 3, 4]],
- '8+1345679': [[1, 7], [3, 5], [1, 3, 4]],
- '8+134568': [[8], [3, 5], [1, 3, 4]],
- '8+1345689': [[8], [3, 5], [1, 3, 4]],
- '8+134569': [[3, 5], [1, 3, 4]],
- '8+13457': [[1, 7], [3, 5], [1, 3, 4]],
- '8+134578': [[8], [1, 7], [3, 5], [1, 3, 4]],
- '8+1345789': [[8], [1, 7], [3, 5], [1, 3, 4]],
- '8+134579': [[1, 7], [3, 5], [1, 3, 4]],
- '8+13458': [[8], [3, 5], [1, 3, 4]],
- '8+134589': [[8], [3, 5], [1, 3, 4]],
- '8+13459': [[3, 5], [1, 3, 4]],
- '8+1346': [[1, 3, 4]],
- '8+13467': [[1, 7], [1, 3, 4]],
- '8+134678': [[8], [1, 7], [1, 3, 4]],
- '8+1346789': [[8], [1, 7], [1, 3, 4]],
- '8+134679': [[1, 7], [1, 3, 4]],
- '8+13468': [[8], [1, 3, 4]],
- '8+134689': [[8], [1, 3, 4]],
- '8+13469': [[1, 3, 4]],
- '8+1347': [[1, 7], [1, 3, 4]],
- '8+13478': [[8], [1, 7], [1, 3, 4]],
- '8+134789': [[8], [1, 7], [1, 3, 4]],
- '8+13479': [[1, 7], [1, 3, 4]],
- '8+1348': [[8], [1, 3, 4]],
- '8+13489': [[8], [1, 3, 4]],
- '8+1349': [[1, 3, 4]],
- '8+135': [[3, 5]],
- '8+1356': [[3, 5]],
- '8+13567': [[1, 7], [3, 5]],
- '8+135678': [[8], [1, 7], [3, 5]],
- '8+1356789': [[8], [1, 7], [3, 5]],
- '8+135679': [[1, 7], [3, 5]],
- '8+13568': [[8], [3, 5]],
- '8+135689': [[8], [3, 5]],
- '8+13569': [[3, 5]],
- '8+1357': [[1, 7], [3, 5]],
- '8+13578': [[8], [1, 7], [3, 5]],
- '8+135789': [[8], [1, 7], [3, 5]],
- '8+13579': [[1, 7], [3, 5]],
- '8+1358': [[8], [3, 5]],
- '8+13589': [[8], [3, 5]],
- '8+1359': [[3, 5]],
- '8+136': [],
- '8+1367': [[1, 7]],
- '8+13678': [[8], [1, 7]],
- '8+136789': [[8], [1, 7]],
- '8+13679': [[1, 7]],
- '8+1368': [[8]],
- '8+13689': [[8]],
- '8+1369': [],
- '8+137': [[1, 7]],
- '8+1378': [[8], [1, 7]],
- '8+13789': [[8], [1, 7]],
- '8+1379': [[1, 7]],
- '8+138': [[8]],
- '8+1389': [[8]],
- '8+139': [],
- '8+14': [],
- '8+145': [],
- '8+1456': [],
- '8+14567': [[1, 7]],
- '8+145678': [[8], [1, 7]],
- '8+1456789': [[8], [1, 7]],
- '8+145679': [[1, 7]],
- '8+14568': [[8]],
- '8+145689': [[8]],
- '8+14569': [],
- '8+1457': [[1, 7]],
- '8+14578': [[8], [1, 7]],
- '8+145789': [[8], [1, 7]],
- '8+14579': [[1, 7]],
- '8+1458': [[8]],
- '8+14589': [[8]],
- '8+1459': [],
- '8+146': [],
- '8+1467': [[1, 7]],
- '8+14678': [[8], [1, 7]],
- '8+146789': [[8], [1, 7]],
- '8+14679': [[1, 7]],
- '8+1468': [[8]],
- '8+14689': [[8]],
- '8+1469': [],
- '8+147': [[1, 7]],
- '8+1478': [[8], [1, 7]],
- '8+14789': [[8], [1, 7]],
- '8+1479': [[1, 7]],
- '8+148': [[8]],
- '8+1489': [[8]],
- '8+149': [],
- '8+15': [],
- '8+156': [],
- '8+1567': [[1, 7]],
- '8+15678': [[8], [1, 7]],
- '8+156789': [[8], [1, 7]],
- '8+15679': [[1, 7]],
- '8+1568': [[8]],
- '8+15689': [[8]],
- '8+1569': [],
- '8+157': [[1, 7]],
- '8+1578': [[8], [1, 7]],
- '8+15789': [[8], [1, 7]],
- '8+1579': [[1, 7]],
- '8+158': [[8]],
- '8+1589': [[8]],
- '8+159': [],
- '8+16': [],
- '8+167': [[1, 7]],
- '8+1678': [[8], [1, 7]],
- '8+16789': [[8], [1, 7]],
- '8+1679': [[1, 7]],
- '8+168': [[8]],
- '8+1689': [[8]],
- '8+169': [],
- '8+17': [[1, 7]],
- '8+178': [[8], [1, 7]],
- '8+1789': [[8], [1, 7]],
- '8+179': [[1, 7]],
- '8+18': [[8]],
- '8+189': [[8]],
- '8+19': [],
- '8+2': [],
- '8+23': [],
- '8+234': [],
- '8+2345': [[3, 5]],
- '8+23456': [[2, 6], [3, 5]],
- '8+234567': [[2, 6], [3, 5]],
- '8+2345678': [[8], [2, 6], [3, 5]],
- '8+23456789': [[8], [2, 6], [3, 5]],
- '8+2345679': [[2, 6], [3, 5]],
- '8+234568': [[8], [2, 6], [3, 5]],
- '8+2345689': [[8], [2, 6], [3, 5]],
- '8+234569': [[2, 6], [3, 5]],
- '8+23457': [[3, 5]],
- '8+234578': [[8], [3, 5]],
- '8+2345789': [[8], [3, 5]],
- '8+234579': [[3, 5]],
- '8+23458': [[8], [3, 5]],
- '8+234589': [[8], [3, 5]],
- '8+23459': [[3, 5]],
- '8+2346': [[2, 6]],
- '8+23467': [[2, 6]],
- '8+234678': [[8], [2, 6]],
- '8+2346789': [[8], [2, 6]],
- '8+234679': [[2, 6]],
- '8+23468': [[8], [2, 6]],
- '8+234689': [[8], [2, 6]],
- '8+23469': [[2, 6]],
- '8+2347': [],
- '8+23478': [[8]],
- '8+234789': [[8]],
- '8+23479': [],
- '8+2348': [[8]],
- '8+23489': [[8]],
- '8+2349': [],
- '8+235': [[3, 5]],
- '8+2356': [[2, 6], [3, 5]],
- '8+23567': [[2, 6], [3, 5]],
- '8+235678': [[8], [2, 6], [3, 5]],
- '8+2356789': [[8], [2, 6], [3, 5]],
- '8+235679': [[2, 6], [3, 5]],
- '8+23568': [[8], [2, 6], [3, 5]],
- '8+235689': [[8], [2, 6], [3, 5]],
- '8+23569': [[2, 6], [3, 5]],
- '8+2357': [[3, 5]],
- '8+23578': [[8], [3, 5]],
- '8+235789': [[8], [3, 5]],
- '8+23579': [[3, 5]],
- '8+2358': [[8], [3, 5]],
- '8+23589': [[8], [3, 5]],
- '8+2359': [[3, 5]],
- '8+236': [[2, 6]],
- '8+2367': [[2, 6]],
- '8+23678': [[8], [2, 6]],
- '8+236789': [[8], [2, 6]],
- '8+23679': [[2, 6]],
- '8+2368': [[8], [2, 6]],
- '8+23689': [[8], [2, 6]],
- '8+2369': [[2, 6]],
- '8+237': [],
- '8+2378': [[8]],
- '8+23789': [[8]],
- '8+2379': [],
- '8+238': [[8]],
- '8+2389': [[8]],
- '8+239': [],
- '8+24': [],
- '8+245': [],
- '8+2456': [[2, 6]],
- '8+24567': [[2, 6]],
- '8+245678': [[8], [2, 6]],
- '8+2456789': [[8], [2, 6]],
- '8+245679': [[2, 6]],
- '8+24568': [[8], [2, 6]],
- '8+245689': [[8], [2, 6]],
- '8+24569': [[2, 6]],
- '8+2457': [],
- '8+24578': [[8]],
- '8+245789': [[8]],
- '8+24579': [],
- '8+2458': [[8]],
- '8+24589': [[8]],
- '8+2459': [],
- '8+246': [[2, 6]],
- '8+2467': [[2, 6]],
- '8+24678': [[8], [2, 6]],
- '8+246789': [[8], [2, 6]],
- '8+24679': [[2, 6]],
- '8+2468': [[8], [2, 6]],
- '8+24689': [[8], [2, 6]],
- '8+2469': [[2, 6]],
- '8+247': [],
- '8+2478': [[8]],
- '8+24789': [[8]],
- '8+2479': [],
- '8+248': [[8]],
- '8+2489': [[8]],
- '8+249': [],
- '8+25': [],
- '8+256': [[2, 6]],
- '8+2567': [[2, 6]],
- '8+25678': [[8], [2, 6]],
- '8+256789': [[8], [2, 6]],
- '8+25679': [[2, 6]],
- '8+2568': [[8], [2, 6]],
- '8+25689': [[8], [2, 6]],
- '8+2569': [[2, 6]],
- '8+257': [],
- '8+2578': [[8]],
- '8+25789': [[8]],
- '8+2579': [],
- '8+258': [[8]],
- '8+2589': [[8]],
- '8+259': [],
- '8+26': [[2, 6]],
- '8+267': [[2, 6]],
- '8+2678': [[8], [2, 6]],
- '8+26789': [[8], [2, 6]],
- '8+2679': [[2, 6]],
- '8+268': [[8], [2, 6]],
- '8+2689': [[8], [2, 6]],
- '8+269': [[2, 6]],
- '8+27': [],
- '8+278': [[8]],
- '8+2789': [[8]],
- '8+279': [],
- '8+28': [[8]],
- '8+289': [[8]],
- '8+29': [],
- '8+3': [],
- '8+34': [],
- '8+345': [[3, 5]],
- '8+3456': [[3, 5]],
- '8+34567': [[3, 5]],
- '8+345678': [[8], [3, 5]],
- '8+3456789': [[8], [3, 5]],
- '8+345679': [[3, 5]],
- '8+34568': [[8], [3, 5]],
- '8+345689': [[8], [3, 5]],
- '8+34569': [[3, 5]],
- '8+3457': [[3, 5]],
- '8+34578': [[8], [3, 5]],
- '8+345789': [[8], [3, 5]],
- '8+34579': [[3, 5]],
- '8+3458': [[8], [3, 5]],
- '8+34589': [[8], [3, 5]],
- '8+3459': [[3, 5]],
- '8+346': [],
- '8+3467': [],
- '8+34678': [[8]],
- '8+346789': [[8]],
- '8+34679': [],
- '8+3468': [[8]],
- '8+34689': [[8]],
- '8+3469': [],
- '8+347': [],
- '8+3478': [[8]],
- '8+34789': [[8]],
- '8+3479': [],
- '8+348': [[8]],
- '8+3489': [[8]],
- '8+349': [],
- '8+35': [[3, 5]],
- '8+356': [[3, 5]],
- '8+3567': [[3, 5]],
- '8+35678': [[8], [3, 5]],
- '8+356789': [[8], [3, 5]],
- '8+35679': [[3, 5]],
- '8+3568': [[8], [3, 5]],
- '8+35689': [[8], [3, 5]],
- '8+3569': [[3, 5]],
- '8+357': [[3, 5]],
- '8+3578': [[8], [3, 5]],
- '8+35789': [[8], [3, 5]],
- '8+3579': [[3, 5]],
- '8+358': [[8], [3, 5]],
- '8+3589': [[8], [3, 5]],
- '8+359': [[3, 5]],
- '8+36': [],
- '8+367': [],
- '8+3678': [[8]],
- '8+36789': [[8]],
- '8+3679': [],
- '8+368': [[8]],
- '8+3689': [[8]],
- '8+369': [],
- '8+37': [],
- '8+378': [[8]],
- '8+3789': [[8]],
- '8+379': [],
- '8+38': [[8]],
- '8+389': [[8]],
- '8+39': [],
- '8+4': [],
- '8+45': [],
- '8+456': [],
- '8+4567': [],
- '8+45678': [[8]],
- '8+456789': [[8]],
- '8+45679': [],
- '8+4568': [[8]],
- '8+45689': [[8]],
- '8+4569': [],
- '8+457': [],
- '8+4578': [[8]],
- '8+45789': [[8]],
- '8+4579': [],
- '8+458': [[8]],
- '8+4589': [[8]],
- '8+459': [],
- '8+46': [],
- '8+467': [],
- '8+4678': [[8]],
- '8+46789': [[8]],
- '8+4679': [],
- '8+468': [[8]],
- '8+4689': [[8]],
- '8+469': [],
- '8+47': [],
- '8+478': [[8]],
- '8+4789': [[8]],
- '8+479': [],
- '8+48': [[8]],
- '8+489': [[8]],
- '8+49': [],
- '8+5': [],
- '8+56': [],
- '8+567': [],
- '8+5678': [[8]],
- '8+56789': [[8]],
- '8+5679': [],
- '8+568': [[8]],
- '8+5689': [[8]],
- '8+569': [],
- '8+57': [],
- '8+578': [[8]],
- '8+5789': [[8]],
- '8+579': [],
- '8+58': [[8]],
- '8+589': [[8]],
- '8+59': [],
- '8+6': [],
- '8+67': [],
- '8+678': [[8]],
- '8+6789': [[8]],
- '8+679': [],
- '8+68': [[8]],
- '8+689': [[8]],
- '8+69': [],
- '8+7': [],
- '8+78': [[8]],
- '8+789': [[8]],
- '8+79': [],
- '8+8': [[8]],
- '8+89': [[8]],
- '8+9': [],
- '9+': [],
- '9+1': [],
- '9+12': [],
- '9+123': [],
- '9+1234': [[2, 3, 4]],
- '9+12345': [[4, 5], [1, 3, 5], [2, 3, 4]],
- '9+123456': [[3, 6], [4, 5], [1, 2, 6], [1, 3, 5], [2, 3, 4]],
- '9+1234567': [[2, 7], [3, 6], [4, 5], [1, 2, 6], [1, 3, 5], [2, 3, 4]],
- '9+12345678': [[1, 8],
-                [2, 7],
-                [3, 6],
-                [4, 5],
-                [1, 2, 6],
-                [1, 3, 5],
-                [2, 3, 4]],
- '9+123456789': [[9],
-                 [1, 8],
-                 [2, 7],
-                 [3, 6],
-                 [4, 5],
-                 [1, 2, 6],
-                 [1, 3, 5],
-                 [2, 3, 4]],
- '9+12345679': [[9], [2, 7], [3, 6], [4, 5], [1, 2, 6], [1, 3, 5], [2, 3, 4]],
- '9+1234568': [[1, 8], [3, 6], [4, 5], [1, 2, 6], [1, 3, 5], [2, 3, 4]],
- '9+12345689': [[9], [1, 8], [3, 6], [4, 5], [1, 2, 6], [1, 3, 5], [2, 3, 4]],
- '9+1234569': [[9], [3, 6], [4, 5], [1, 2, 6], [1, 3, 5], [2, 3, 4]],
- '9+123457': [[2, 7], [4, 5], [1, 3, 5], [2, 3, 4]],
- '9+1234578': [[1, 8], [2, 7], [4, 5], [1, 3, 5], [2, 3, 4]],
- '9+12345789': [[9], [1, 8], [2, 7], [4, 5], [1, 3, 5], [2, 3, 4]],
- '9+1234579': [[9], [2, 7], [4, 5], [1, 3, 5], [2, 3, 4]],
- '9+123458': [[1, 8], [4, 5], [1, 3, 5], [2, 3, 4]],
- '9+1234589': [[9], [1, 8], [4, 5], [1, 3, 5], [2, 3, 4]],
- '9+123459': [[9], [4, 5], [1, 3, 5], [2, 3, 4]],
- '9+12346': [[3, 6], [1, 2, 6], [2, 3, 4]],
- '9+123467': [[2, 7], [3, 6], [1, 2, 6], [2, 3, 4]],
- '9+1234678': [[1, 8], [2, 7], [3, 6], [1, 2, 6], [2, 3, 4]],
- '9+12346789': [[9], [1, 8], [2, 7], [3, 6], [1, 2, 6], [2, 3, 4]],
- '9+1234679': [[9], [2, 7], [3, 6], [1, 2, 6], [2, 3, 4]],
- '9+123468': [[1, 8], [3, 6], [1, 2, 6], [2, 3, 4]],
- '9+1234689': [[9], [1, 8], [3, 6], [1, 2, 6], [2, 3, 4]],
- '9+123469': [[9], [3, 6], [1, 2, 6], [2, 3, 4]],
- '9+12347': [[2, 7], [2, 3, 4]],
- '9+123478': [[1, 8], [2, 7], [2, 3, 4]],
- '9+1234789': [[9], [1, 8], [2, 7], [2, 3, 4]],
- '9+123479': [[9], [2, 7], [2, 3, 4]],
- '9+12348': [[1, 8], [2, 3, 4]],
- '9+123489': [[9], [1, 8], [2, 3, 4]],
- '9+12349': [[9], [2, 3, 4]],
- '9+1235': [[1, 3, 5]],
- '9+12356': [[3, 6], [1, 2, 6], [1, 3, 5]],
- '9+123567': [[2, 7], [3, 6], [1, 2, 6], [1, 3, 5]],
- '9+1235678': [[1, 8], [2, 7], [3, 6], [1, 2, 6], [1, 3, 5]],
- '9+12356789': [[9], [1, 8], [2, 7], [3, 6], [1, 2, 6], [1, 3, 5]],
- '9+1235679': [[9], [2, 7], [3, 6], [1, 2, 6], [1, 3, 5]],
- '9+123568': [[1, 8], [3, 6], [1, 2, 6], [1, 3, 5]],
- '9+1235689': [[9], [1, 8], [3, 6], [1, 2, 6], [1, 3, 5]],
- '9+123569': [[9], [3, 6], [1, 2, 6], [1, 3, 5]],
- '9+12357': [[2, 7], [1, 3, 5]],
- '9+123578': [[1, 8], [2, 7], [1, 3, 5]],
- '9+1235789': [[9], [1, 8], [2, 7], [1, 3, 5]],
- '9+123579': [[9], [2, 7], [1, 3, 5]],
- '9+12358': [[1, 8], [1, 3, 5]],
- '9+123589': [[9], [1, 8], [1, 3, 5]],
- '9+12359': [[9], [1, 3, 5]],
- '9+1236': [[3, 6], [1, 2, 6]],
- '9+12367': [[2, 7], [3, 6], [1, 2, 6]],
- '9+123678': [[1, 8], [2, 7], [3, 6], [1, 2, 6]],
- '9+1236789': [[9], [1, 8], [2, 7], [3, 6], [1, 2, 6]],
- '9+123679': [[9], [2, 7], [3, 6], [1, 2, 6]],
- '9+12368': [[1, 8], [3, 6], [1, 2, 6]],
- '9+123689': [[9], [1, 8], [3, 6], [1, 2, 6]],
- '9+12369': [[9], [3, 6], [1, 2, 6]],
- '9+1237': [[2, 7]],
- '9+12378': [[1, 8], [2, 7]],
- '9+123789': [[9], [1, 8], [2, 7]],
- '9+12379': [[9], [2, 7]],
- '9+1238': [[1, 8]],
- '9+12389': [[9], [1, 8]],
- '9+1239': [[9]],
- '9+124': [],
- '9+1245': [[4, 5]],
- '9+12456': [[4, 5], [1, 2, 6]],
- '9+124567': [[2, 7], [4, 5], [1, 2, 6]],
- '9+1245678': [[1, 8], [2, 7], [4, 5], [1, 2, 6]],
- '9+12456789': [[9], [1, 8], [2, 7], [4, 5], [1, 2, 6]],
- '9+1245679': [[9], [2, 7], [4, 5], [1, 2, 6]],
- '9+124568': [[1, 8], [4, 5], [1, 2, 6]],
- '9+1245689': [[9], [1, 8], [4, 5], [1, 2, 6]],
- '9+124569': [[9], [4, 5], [1, 2, 6]],
- '9+12457': [[2, 7], [4, 5]],
- '9+124578': [[1, 8], [2, 7], [4, 5]],
- '9+1245789': [[9], [1, 8], [2, 7], [4, 5]],
- '9+124579': [[9], [2, 7], [4, 5]],
- '9+12458': [[1, 8], [4, 5]],
- '9+124589': [[9], [1, 8], [4, 5]],
- '9+12459': [[9], [4, 5]],
- '9+1246': [[1, 2, 6]],
- '9+12467': [[2, 7], [1, 2, 6]],
- '9+124678': [[1, 8], [2, 7], [1, 2, 6]],
- '9+1246789': [[9], [1, 8], [2, 7], [1, 2, 6]],
- '9+124679': [[9], [2, 7], [1, 2, 6]],
- '9+12468': [[1, 8], [1, 2, 6]],
- '9+124689': [[9], [1, 8], [1, 2, 6]],
- '9+12469': [[9], [1, 2, 6]],
- '9+1247': [[2, 7]],
- '9+12478': [[1, 8], [2, 7]],
- '9+124789': [[9], [1, 8], [2, 7]],
- '9+12479': [[9], [2, 7]],
- '9+1248': [[1, 8]],
- '9+12489': [[9], [1, 8]],
- '9+1249': [[9]],
- '9+125': [],
- '9+1256': [[1, 2, 6]],
- '9+12567': [[2, 7], [1, 2, 6]],
- '9+125678': [[1, 8], [2, 7], [1, 2, 6]],
- '9+1256789': [[9], [1, 8], [2, 7], [1, 2, 6]],
- '9+125679': [[9], [2, 7], [1, 2, 6]],
- '9+12568': [[1, 8], [1, 2, 6]],
- '9+125689': [[9], [1, 8], [1, 2, 6]],
- '9+12569': [[9], [1, 2, 6]],
- '9+1257': [[2, 7]],
- '9+12578': [[1, 8], [2, 7]],
- '9+125789': [[9], [1, 8], [2, 7]],
- '9+12579': [[9], [2, 7]],
- '9+1258': [[1, 8]],
- '9+12589': [[9], [1, 8]],
- '9+1259': [[9]],
- '9+126': [[1, 2, 6]],
- '9+1267': [[2, 7], [1, 2, 6]],
- '9+12678': [[1, 8], [2, 7], [1, 2, 6]],
- '9+126789': [[9], [1, 8], [2, 7], [1, 2, 6]],
- '9+12679': [[9], [2, 7], [1, 2, 6]],
- '9+1268': [[1, 8], [1, 2, 6]],
- '9+12689': [[9], [1, 8], [1, 2, 6]],
- '9+1269': [[9], [1, 2, 6]],
- '9+127': [[2, 7]],
- '9+1278': [[1, 8], [2, 7]],
- '9+12789': [[9], [1, 8], [2, 7]],
- '9+1279': [[9], [2, 7]],
- '9+128': [[1, 8]],
- '9+1289': [[9], [1, 8]],
- '9+129': [[9]],
- '9+13': [],
- '9+134': [],
- '9+1345': [[4, 5], [1, 3, 5]],
- '9+13456': [[3, 6], [4, 5], [1, 3, 5]],
- '9+134567': [[3, 6], [4, 5], [1, 3, 5]],
- '9+1345678': [[1, 8], [3, 6], [4, 5], [1, 3, 5]],
- '9+13456789': [[9], [1, 8], [3, 6], [4, 5], [1, 3, 5]],
- '9+1345679': [[9], [3, 6], [4, 5], [1, 3, 5]],
- '9+134568': [[1, 8], [3, 6], [4, 5], [1, 3, 5]],
- '9+1345689': [[9], [1, 8], [3, 6], [4, 5], [1, 3, 5]],
- '9+134569': [[9], [3, 6], [4, 5], [1, 3, 5]],
- '9+13457': [[4, 5], [1, 3, 5]],
- '9+134578': [[1, 8], [4, 5], [1, 3, 5]],
- '9+1345789': [[9], [1, 8], [4, 5], [1, 3, 5]],
- '9+134579': [[9], [4, 5], [1, 3, 5]],
- '9+13458': [[1, 8], [4, 5], [1, 3, 5]],
- '9+134589': [[9], [1, 8], [4, 5], [1, 3, 5]],
- '9+13459': [[9], [4, 5], [1, 3, 5]],
- '9+1346': [[3, 6]],
- '9+13467': [[3, 6]],
- '9+134678': [[1, 8], [3, 6]],
- '9+1346789': [[9], [1, 8], [3, 6]],
- '9+134679': [[9], [3, 6]],
- '9+13468': [[1, 8], [3, 6]],
- '9+134689': [[9], [1, 8], [3, 6]],
- '9+13469': [[9], [3, 6]],
- '9+1347': [],
- '9+13478': [[1, 8]],
- '9+134789': [[9], [1, 8]],
- '9+13479': [[9]],
- '9+1348': [[1, 8]],
- '9+13489': [[9], [1, 8]],
- '9+1349': [[9]],
- '9+135': [[1, 3, 5]],
- '9+1356': [[3, 6], [1, 3, 5]],
- '9+13567': [[3, 6], [1, 3, 5]],
- '9+135678': [[1, 8], [3, 6], [1, 3, 5]],
- '9+1356789': [[9], [1, 8], [3, 6], [1, 3, 5]],
- '9+135679': [[9], [3, 6], [1, 3, 5]],
- '9+13568': [[1, 8], [3, 6], [1, 3, 5]],
- '9+135689': [[9], [1, 8], [3, 6], [1, 3, 5]],
- '9+13569': [[9], [3, 6], [1, 3, 5]],
- '9+1357': [[1, 3, 5]],
- '9+13578': [[1, 8], [1, 3, 5]],
- '9+135789': [[9], [1, 8], [1, 3, 5]],
- '9+13579': [[9], [1, 3, 5]],
- '9+1358': [[1, 8], [1, 3, 5]],
- '9+13589': [[9], [1, 8], [1, 3, 5]],
- '9+1359': [[9], [1, 3, 5]],
- '9+136': [[3, 6]],
- '9+1367': [[3, 6]],
- '9+13678': [[1, 8], [3, 6]],
- '9+136789': [[9], [1, 8], [3, 6]],
- '9+13679': [[9], [3, 6]],
- '9+1368': [[1, 8], [3, 6]],
- '9+13689': [[9], [1, 8], [3, 6]],
- '9+1369': [[9], [3, 6]],
- '9+137': [],
- '9+1378': [[1, 8]],
- '9+13789': [[9], [1, 8]],
- '9+1379': [[9]],
- '9+138': [[1, 8]],
- '9+1389': [[9], [1, 8]],
- '9+139': [[9]],
- '9+14': [],
- '9+145': [[4, 5]],
- '9+1456': [[4, 5]],
- '9+14567': [[4, 5]],
- '9+145678': [[1, 8], [4, 5]],
- '9+1456789': [[9], [1, 8], [4, 5]],
- '9+145679': [[9], [4, 5]],
- '9+14568': [[1, 8], [4, 5]],
- '9+145689': [[9], [1, 8], [4, 5]],
- '9+14569': [[9], [4, 5]],
- '9+1457': [[4, 5]],
- '9+14578': [[1, 8], [4, 5]],
- '9+145789': [[9], [1, 8], [4, 5]],
- '9+14579': [[9], [4, 5]],
- '9+1458': [[1, 8], [4, 5]],
- '9+14589': [[9], [1, 8], [4, 5]],
- '9+1459': [[9], [4, 5]],
- '9+146': [],
- '9+1467': [],
- '9+14678': [[1, 8]],
- '9+146789': [[9], [1, 8]],
- '9+14679': [[9]],
- '9+1468': [[1, 8]],
- '9+14689': [[9], [1, 8]],
- '9+1469': [[9]],
- '9+147': [],
- '9+1478': [[1, 8]],
- '9+14789': [[9], [1, 8]],
- '9+1479': [[9]],
- '9+148': [[1, 8]],
- '9+1489': [[9], [1, 8]],
- '9+149': [[9]],
- '9+15': [],
- '9+156': [],
- '9+1567': [],
- '9+15678': [[1, 8]],
- '9+156789': [[9], [1, 8]],
- '9+15679': [[9]],
- '9+1568': [[1, 8]],
- '9+15689': [[9], [1, 8]],
- '9+1569': [[9]],
- '9+157': [],
- '9+1578': [[1, 8]],
- '9+15789': [[9], [1, 8]],
- '9+1579': [[9]],
- '9+158': [[1, 8]],
- '9+1589': [[9], [1, 8]],
- '9+159': [[9]],
- '9+16': [],
- '9+167': [],
- '9+1678': [[1, 8]],
- '9+16789': [[9], [1, 8]],
- '9+1679': [[9]],
- '9+168': [[1, 8]],
- '9+1689': [[9], [1, 8]],
- '9+169': [[9]],
- '9+17': [],
- '9+178': [[1, 8]],
- '9+1789': [[9], [1, 8]],
- '9+179': [[9]],
- '9+18': [[1, 8]],
- '9+189': [[9], [1, 8]],
- '9+19': [[9]],
- '9+2': [],
- '9+23': [],
- '9+234': [[2, 3, 4]],
- '9+2345': [[4, 5], [2, 3, 4]],
- '9+23456': [[3, 6], [4, 5], [2, 3, 4]],
- '9+234567': [[2, 7], [3, 6], [4, 5], [2, 3, 4]],
- '9+2345678': [[2, 7], [3, 6], [4, 5], [2, 3, 4]],
- '9+23456789': [[9], [2, 7], [3, 6], [4, 5], [2, 3, 4]],
- '9+2345679': [[9], [2, 7], [3, 6], [4, 5], [2, 3, 4]],
- '9+234568': [[3, 6], [4, 5], [2, 3, 4]],
- '9+2345689': [[9], [3, 6], [4, 5], [2, 3, 4]],
- '9+234569': [[9], [3, 6], [4, 5], [2, 3, 4]],
- '9+23457': [[2, 7], [4, 5], [2, 3, 4]],
- '9+234578': [[2, 7], [4, 5], [2, 3, 4]],
- '9+2345789': [[9], [2, 7], [4, 5], [2, 3, 4]],
- '9+234579': [[9], [2, 7], [4, 5], [2, 3, 4]],
- '9+23458': [[4, 5], [2, 3, 4]],
- '9+234589': [[9], [4, 5], [2, 3, 4]],
- '9+23459': [[9], [4, 5], [2, 3, 4]],
- '9+2346': [[3, 6], [2, 3, 4]],
- '9+23467': [[2, 7], [3, 6], [2, 3, 4]],
- '9+234678': [[2, 7], [3, 6], [2, 3, 4]],
- '9+2346789': [[9], [2, 7], [3, 6], [2, 3, 4]],
- '9+234679': [[9], [2, 7], [3, 6], [2, 3, 4]],
- '9+23468': [[3, 6], [2, 3, 4]],
- '9+234689': [[9], [3, 6], [2, 3, 4]],
- '9+23469': [[9], [3, 6], [2, 3, 4]],
- '9+2347': [[2, 7], [2, 3, 4]],
- '9+23478': [[2, 7], [2, 3, 4]],
- '9+234789': [[9], [2, 7], [2, 3, 4]],
- '9+23479': [[9], [2, 7], [2, 3, 4]],
- '9+2348': [[2, 3, 4]],
- '9+23489': [[9], [2, 3, 4]],
- '9+2349': [[9], [2, 3, 4]],
- '9+235': [],
- '9+2356': [[3, 6]],
- '9+23567': [[2, 7], [3, 6]],
- '9+235678': [[2, 7], [3, 6]],
- '9+2356789': [[9], [2, 7], [3, 6]],
- '9+235679': [[9], [2, 7], [3, 6]],
- '9+23568': [[3, 6]],
- '9+235689': [[9], [3, 6]],
- '9+23569': [[9], [3, 6]],
- '9+2357': [[2, 7]],
- '9+23578': [[2, 7]],
- '9+235789': [[9], [2, 7]],
- '9+23579': [[9], [2, 7]],
- '9+2358': [],
- '9+23589': [[9]],
- '9+2359': [[9]],
- '9+236': [[3, 6]],
- '9+2367': [[2, 7], [3, 6]],
- '9+23678': [[2, 7], [3, 6]],
- '9+236789': [[9], [2, 7], [3, 6]],
- '9+23679': [[9], [2, 7], [3, 6]],
- '9+2368': [[3, 6]],
- '9+23689': [[9], [3, 6]],
- '9+2369': [[9], [3, 6]],
- '9+237': [[2, 7]],
- '9+2378': [[2, 7]],
- '9+23789': [[9], [2, 7]],
- '9+2379': [[9], [2, 7]],
- '9+238': [],
- '9+2389': [[9]],
- '9+239': [[9]],
- '9+24': [],
- '9+245': [[4, 5]],
- '9+2456': [[4, 5]],
- '9+24567': [[2, 7], [4, 5]],
- '9+245678': [[2, 7], [4, 5]],
- '9+2456789': [[9], [2, 7], [4, 5]],
- '9+245679': [[9], [2, 7], [4, 5]],
- '9+24568': [[4, 5]],
- '9+245689': [[9], [4, 5]],
- '9+24569': [[9], [4, 5]],
- '9+2457': [[2, 7], [4, 5]],
- '9+24578': [[2, 7], [4, 5]],
- '9+245789': [[9], [2, 7], [4, 5]],
- '9+24579': [[9], [2, 7], [4, 5]],
- '9+2458': [[4, 5]],
- '9+24589': [[9], [4, 5]],
- '9+2459': [[9], [4, 5]],
- '9+246': [],
- '9+2467': [[2, 7]],
- '9+24678': [[2, 7]],
- '9+246789': [[9], [2, 7]],
- '9+24679': [[9], [2, 7]],
- '9+2468': [],
- '9+24689': [[9]],
- '9+2469': [[9]],
- '9+247': [[2, 7]],
- '9+2478': [[2, 7]],
- '9+24789': [[9], [2, 7]],
- '9+2479': [[9], [2, 7]],
- '9+248': [],
- '9+2489': [[9]],
- '9+249': [[9]],
- '9+25': [],
- '9+256': [],
- '9+2567': [[2, 7]],
- '9+25678': [[2, 7]],
- '9+256789': [[9], [2, 7]],
- '9+25679': [[9], [2, 7]],
- '9+2568': [],
- '9+25689': [[9]],
- '9+2569': [[9]],
- '9+257': [[2, 7]],
- '9+2578': [[2, 7]],
- '9+25789': [[9], [2, 7]],
- '9+2579': [[9], [2, 7]],
- '9+258': [],
- '9+2589': [[9]],
- '9+259': [[9]],
- '9+26': [],
- '9+267': [[2, 7]],
- '9+2678': [[2, 7]],
- '9+26789': [[9], [2, 7]],
- '9+2679': [[9], [2, 7]],
- '9+268': [],
- '9+2689': [[9]],
- '9+269': [[9]],
- '9+27': [[2, 7]],
- '9+278': [[2, 7]],
- '9+2789': [[9], [2, 7]],
- '9+279': [[9], [2, 7]],
- '9+28': [],
- '9+289': [[9]],
- '9+29': [[9]],
- '9+3': [],
- '9+34': [],
- '9+345': [[4, 5]],
- '9+3456': [[3, 6], [4, 5]],
- '9+34567': [[3, 6], [4, 5]],
- '9+345678': [[3, 6], [4, 5]],
- '9+3456789': [[9], [3, 6], [4, 5]],
- '9+345679': [[9], [3, 6], [4, 5]],
- '9+34568': [[3, 6], [4, 5]],
- '9+345689': [[9], [3, 6], [4, 5]],
- '9+34569': [[9], [3, 6], [4, 5]],
- '9+3457': [[4, 5]],
- '9+34578': [[4, 5]],
- '9+345789': [[9], [4, 5]],
- '9+34579': [[9], [4, 5]],
- '9+3458': [[4, 5]],
- '9+34589': [[9], [4, 5]],
- '9+3459': [[9], [4, 5]],
- '9+346': [[3, 6]],
- '9+3467': [[3, 6]],
- '9+34678': [[3, 6]],
- '9+346789': [[9], [3, 6]],
- '9+34679': [[9], [3, 6]],
- '9+3468': [[3, 6]],
- '9+34689': [[9], [3, 6]],
- '9+3469': [[9], [3, 6]],
- '9+347': [],
- '9+3478': [],
- '9+34789': [[9]],
- '9+3479': [[9]],
- '9+348': [],
- '9+3489': [[9]],
- '9+349': [[9]],
- '9+35': [],
- '9+356': [[3, 6]],
- '9+3567': [[3, 6]],
- '9+35678': [[3, 6]],
- '9+356789': [[9], [3, 6]],
- '9+35679': [[9], [3, 6]],
- '9+3568': [[3, 6]],
- '9+35689': [[9], [3, 6]],
- '9+3569': [[9], [3, 6]],
- '9+357': [],
- '9+3578': [],
- '9+35789': [[9]],
- '9+3579': [[9]],
- '9+358': [],
- '9+3589': [[9]],
- '9+359': [[9]],
- '9+36': [[3, 6]],
- '9+367': [[3, 6]],
- '9+3678': [[3, 6]],
- '9+36789': [[9], [3, 6]],
- '9+3679': [[9], [3, 6]],
- '9+368': [[3, 6]],
- '9+3689': [[9], [3, 6]],
- '9+369': [[9], [3, 6]],
- '9+37': [],
- '9+378': [],
- '9+3789': [[9]],
- '9+379': [[9]],
- '9+38': [],
- '9+389': [[9]],
- '9+39': [[9]],
- '9+4': [],
- '9+45': [[4, 5]],
- '9+456': [[4, 5]],
- '9+4567': [[4, 5]],
- '9+45678': [[4, 5]],
- '9+456789': [[9], [4, 5]],
- '9+45679': [[9], [4, 5]],
- '9+4568': [[4, 5]],
- '9+45689': [[9], [4, 5]],
- '9+4569': [[9], [4, 5]],
- '9+457': [[4, 5]],
- '9+4578': [[4, 5]],
- '9+45789': [[9], [4, 5]],
- '9+4579': [[9], [4, 5]],
- '9+458': [[4, 5]],
- '9+4589': [[9], [4, 5]],
- '9+459': [[9], [4, 5]],
- '9+46': [],
- '9+467': [],
- '9+4678': [],
- '9+46789': [[9]],
- '9+4679': [[9]],
- '9+468': [],
- '9+4689': [[9]],
- '9+469': [[9]],
- '9+47': [],
- '9+478': [],
- '9+4789': [[9]],
- '9+479': [[9]],
- '9+48': [],
- '9+489': [[9]],
- '9+49': [[9]],
- '9+5': [],
- '9+56': [],
- '9+567': [],
- '9+5678': [],
- '9+56789': [[9]],
- '9+5679': [[9]],
- '9+568': [],
- '9+5689': [[9]],
- '9+569': [[9]],
- '9+57': [],
- '9+578': [],
- '9+5789': [[9]],
- '9+579': [[9]],
- '9+58': [],
- '9+589': [[9]],
- '9+59': [[9]],
- '9+6': [],
- '9+67': [],
- '9+678': [],
- '9+6789': [[9]],
- '9+679': [[9]],
- '9+68': [],
- '9+689': [[9]],
- '9+69': [[9]],
- '9+7': [],
- '9+78': [],
- '9+789': [[9]],
- '9+79': [[9]],
- '9+8': [],
- '9+89': [[9]],
- '9+9': [[9]]}
+
+# NATIVE IMPORTS.
+import mmap
+import os
+import struct
+from array import array
+from typing import TYPE_CHECKING
+# THIRD-PARTY IMPORTS.
+# NumPy is imported by the functions that use it, so that the move table can be loaded without the cost of loading it.
+if TYPE_CHECKING:
+    import numpy as np
+# LOCAL IMPORTS.
+
+
+# CONSTANTS.
+MIN_ROLL: int = 2
+MAX_ROLL: int = 12
+ROLL_SLOTS: int = 16
+ARTIFACT_MAGIC: bytes = b"STBM"
+ARTIFACT_VERSION: int = 1
+ARTIFACT_HEADER: struct.Struct = struct.Struct("<4sHHII")
+ARTIFACT_PATH: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "moves.bin")
+
+
+# FUNCTIONS.
+def generateMoveTable(tileCount: int = 9) -> tuple[array, array]:
+    """Enumerate every move for every (board, roll) pair using subset sums.
+
+    Entries are indexed by (board << 4) | roll. Moves within an entry are ordered by tile count, then by tile values,
+    which keeps the smallest single-tile move first and the moves using the most tiles last.
+
+    :param tileCount: Number of tiles in the game
+    :type tileCount: int
+    :return: Offsets into the move list for each entry (plus a final end offset), and all move masks in order
+    :rtype: tuple[array, array]
+    """
+    # Tiles above the largest roll can never be part of a move, so only the low tiles need to be enumerated.
+    lowTileCount = min(tileCount, MAX_ROLL)
+    lowBoardCount = 1 << lowTileCount
+    maskSums = [ 0 ] * lowBoardCount
+    for mask in range(1, lowBoardCount):
+        lowestBit = mask & -mask
+        maskSums[mask] = maskSums[mask ^ lowestBit] + lowestBit.bit_length()
+
+    # Group each mask by its tile sum once, already in the final move order.
+    sortKey = lambda mask: (mask.bit_count(), [ tile for tile in range(1, lowTileCount + 1) if mask & (1 << (tile - 1)) ])
+    masksByRoll = [ sorted((mask for mask in range(1, lowBoardCount) if maskSums[mask] == roll), key = sortKey) for roll in range(MAX_ROLL + 1) ]
+
+    # Every entry keeps the moves for its roll that only use tiles still on the board.
+    lowOffsets = [ 0 ]
+    lowMoveMasks = array("H")
+    for board in range(lowBoardCount):
+        for roll in range(ROLL_SLOTS):
+            if MIN_ROLL <= roll <= MAX_ROLL:
+                lowMoveMasks.extend(mask for mask in masksByRoll[roll] if mask & board == mask)
+            lowOffsets.append(len(lowMoveMasks))
+
+    # Boards that only differ in their high tiles share the same moves, so the low block repeats for each of them.
+    repeatCount = 1 << (tileCount - lowTileCount)
+    offsets = array("I", [ repeat * len(lowMoveMasks) + offset for repeat in range(repeatCount) for offset in lowOffsets[:-1] ])
+    offsets.append(repeatCount * len(lowMoveMasks))
+    return offsets, lowMoveMasks * repeatCount
+
+def writeMoveTable(path: str = ARTIFACT_PATH, tileCount: int = 9) -> None:
+    """Generate the move table and write it to a binary artifact.
+
+    :param path: Output file path
+    :type path: str
+    :param tileCount: Number of tiles in the game
+    :type tileCount: int
+    """
+    offsets, moveMasks = generateMoveTable(tileCount)
+    with open(path, "wb") as artifactFile:
+        artifactFile.write(ARTIFACT_HEADER.pack(ARTIFACT_MAGIC, ARTIFACT_VERSION, tileCount, len(offsets), len(moveMasks)))
+        artifactFile.write(offsets.tobytes())
+        artifactFile.write(moveMasks.tobytes())
+    return
+
+def readMoveTable(path: str = ARTIFACT_PATH) -> tuple[int, memoryview, memoryview]:
+    """Map a move table artifact into memory, read-only.
+
+    The returned views read straight from the mapped file, so processes that load the same artifact share its pages.
+
+    :param path: Input file path
+    :type path: str
+    :return: Tile count, entry offsets and move masks
+    :rtype: tuple[int, memoryview, memoryview]
+    """
+    with open(path, "rb") as artifactFile:
+        data = memoryview(mmap.mmap(artifactFile.fileno(), 0, access = mmap.ACCESS_READ))
+    magic, version, tileCount, offsetCount, moveCount = ARTIFACT_HEADER.unpack_from(data)
+    if magic != ARTIFACT_MAGIC or version != ARTIFACT_VERSION:
+        raise Exception(f"Move table artifact {path} has an unsupported format.")
+
+    masksStart = ARTIFACT_HEADER.size + offsetCount * 4
+    if len(data) != masksStart + moveCount * 2:
+        raise Exception(f"Move table artifact {path} is truncated.")
+    offsets = data[ARTIFACT_HEADER.size:masksStart].cast("I")
+    moveMasks = data[masksStart:].cast("H")
+    return tileCount, offsets, moveMasks
+
+def writePolicyTable(path: str, policy: "np.ndarray") -> None:
+    """Write a policy table to a file that can be memory-mapped by other processes.
+
+    :param path: Output file path, normally ending in .npy
+    :type path: str
+    :param policy: Policy table in the layout used by game.batch, or any other fixed-width table
+    :type policy: np.ndarray
+    """
+    import numpy as np
+    # Write to a new file, then swap it into place. Processes that still map the old file keep reading the old pages.
+    temporaryPath = f"{path}.tmp"
+    with open(temporaryPath, "wb") as policyFile:
+        np.save(policyFile, np.ascontiguousarray(policy))
+    os.replace(temporaryPath, path)
+    return
+
+def readPolicyTable(path: str) -> "np.ndarray":
+    """Map a policy table file into memory, read-only.
+
+    :param path: Input file path
+    :type path: str
+    :return: Policy table backed by the mapped file
+    :rtype: np.ndarray
+    """
+    import numpy as np
+    return np.load(path, mmap_mode = "r")
+
+
+# MAIN ENTRY.
+def main() -> None:
+    writeMoveTable()
+    print(f"Wrote move table to {ARTIFACT_PATH}")
+
+if __name__=="__main__":
+    main()
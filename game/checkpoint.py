@@ -0,0 +1,147 @@
+# checkpoint.py
+# Desc: Periodic checkpoints for long simulation and training runs, so that interrupted runs can be resumed.
+#   A checkpoint is a small JSON file holding the run's settings and progress, plus any large arrays saved beside it.
+#   Arrays are saved to new files on every save, and the JSON file names them, so the two never disagree.
+# Author: Noah Black (noah.black0425@gmail.com)
+# Last Updated: October 17th, 2026
+
+
+# NATIVE IMPORTS.
+import json
+import os
+import time
+# THIRD-PARTY IMPORTS.
+import numpy as np
+# LOCAL IMPORTS.
+from .cache import readPolicyTable, writePolicyTable
+
+
+# CONSTANTS.
+DEFAULT_CHECKPOINT_PATH: str = "checkpoint.json"
+DEFAULT_CHECKPOINT_INTERVAL: float = 60.0
+
+
+# CLASSES.
+class Checkpoint():
+    def __init__(self, path: str, config: dict, state: dict | None = None, interval: float = DEFAULT_CHECKPOINT_INTERVAL, tables: dict[str, str] | None = None, saveCount: int = 0) -> None:
+        # Config holds the settings a run was started with, and must match for the run to be resumed. State holds
+        # progress and running totals, and is updated in place by the run. Tables maps the name of each saved array to
+        # its file beside the checkpoint, which is numbered by the save that wrote it.
+        self._path: str = path
+        self._config: dict = config
+        self._state: dict = state if state is not None else {}
+        self._interval: float = interval
+        self._tables: dict[str, str] = tables if tables is not None else {}
+        self._saveCount: int = saveCount
+        self._lastSaved: float = time.monotonic()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def config(self) -> dict:
+        return self._config
+
+    @property
+    def state(self) -> dict:
+        return self._state
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_CHECKPOINT_PATH, interval: float = DEFAULT_CHECKPOINT_INTERVAL) -> "Checkpoint":
+        """Read a checkpoint written by save().
+
+        :param path: Checkpoint file path
+        :type path: str
+        :param interval: Minimum # of seconds between saves made by saveIfDue()
+        :type interval: float
+        :return: Loaded checkpoint
+        :rtype: Checkpoint
+        """
+        if not os.path.exists(path):
+            raise Exception(f"No checkpoint found at {path}.")
+        with open(path, "r") as checkpointFile:
+            contents = json.load(checkpointFile)
+        return cls(path, contents["config"], contents["state"], interval = interval, tables = contents.get("tables", {}), saveCount = contents.get("saveCount", 0))
+
+    def requireConfig(self, config: dict) -> None:
+        """Make sure that a run is being resumed with the same settings it was started with.
+
+        :param config: Settings of the run being resumed
+        :type config: dict
+        """
+        for key, value in config.items():
+            if self._config.get(key) != value:
+                raise Exception(f"Checkpoint {self._path} was made with {key} = {self._config.get(key)}, not {value}.")
+        return
+
+    def tablePath(self, name: str) -> str:
+        """Get the file that a named array was last saved to beside the checkpoint.
+
+        :param name: Array name
+        :type name: str
+        :return: Array file path
+        :rtype: str
+        """
+        if name not in self._tables:
+            raise Exception(f"Checkpoint {self._path} has no saved table named {name}.")
+        return os.path.join(os.path.dirname(self._path), self._tables[name])
+
+    def loadTable(self, name: str) -> np.ndarray:
+        """Map a named array saved with the checkpoint, read-only.
+
+        :param name: Array name
+        :type name: str
+        :return: Saved array
+        :rtype: np.ndarray
+        """
+        return readPolicyTable(self.tablePath(name))
+
+    def save(self, tables: dict[str, np.ndarray] | None = None) -> None:
+        """Write the checkpoint, along with any named arrays.
+
+        Arrays are written to new files first, and the JSON file naming them is swapped into place last. An
+        interruption at any point leaves the previous checkpoint, and the arrays it names, intact.
+
+        :param tables: Arrays to save with the checkpoint, by name
+        :type tables: dict[str, np.ndarray] | None
+        """
+        saveCount = self._saveCount + 1
+        savedTables = dict(self._tables)
+        for name, table in (tables or {}).items():
+            savedTables[name] = f"{os.path.splitext(os.path.basename(self._path))[0]}-{name}-{saveCount}.npy"
+            writePolicyTable(os.path.join(os.path.dirname(self._path), savedTables[name]), table)
+        temporaryPath = f"{self._path}.tmp"
+        with open(temporaryPath, "w") as checkpointFile:
+            json.dump({ "config": self._config, "state": self._state, "tables": savedTables, "saveCount": saveCount }, checkpointFile)
+        os.replace(temporaryPath, self._path)
+
+        # Arrays from the previous save are no longer named by the checkpoint, and can be removed.
+        for name, fileName in self._tables.items():
+            if savedTables[name] != fileName and os.path.exists(os.path.join(os.path.dirname(self._path), fileName)):
+                os.remove(os.path.join(os.path.dirname(self._path), fileName))
+        self._tables = savedTables
+        self._saveCount = saveCount
+        self._lastSaved = time.monotonic()
+        return
+
+    def saveIfDue(self, tables: dict[str, np.ndarray] | None = None) -> bool:
+        """Write the checkpoint if enough time has passed since it was last saved.
+
+        :param tables: Arrays to save with the checkpoint, by name
+        :type tables: dict[str, np.ndarray] | None
+        :return: Whether the checkpoint was saved
+        :rtype: bool
+        """
+        if time.monotonic() - self._lastSaved < self._interval:
+            return False
+        self.save(tables)
+        return True
+
+
+# MAIN ENTRY.
+def main() -> None:
+    raise NotImplementedError
+
+if __name__=="__main__":
+    main()
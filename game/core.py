@@ -1,27 +1,50 @@
 # core.py
 # Desc: Core classes for starting and interacting with a single game instance.
 # Author: Noah Black (noah.black0425@gmail.com)
-# Last Updated: June 21st, 2025
+# Last Updated: October 17th, 2026
 
 
 # NATIVE IMPORTS.
-from random import randint
+import random
 # THIRD-PARTY IMPORTS.
 # LOCAL IMPORTS.
-from .cache import BASIC_ROLL_CACHE, FULL_ROLL_CACHE
+from .dice import DiceSource
+from .board import MoveTable, fullBoard, loadMoveTable, maskToTiles, tableIndex
+from .cache import MAX_ROLL
+
+
+# CONSTANTS.
+# Shared by every game that is not given its own dice source.
+DEFAULT_DICE: DiceSource = DiceSource()
+# Recording levels. Every level tracks the board and the last roll total, which is all that players and scoring need.
+# Summary recording also tracks the roll count and dice faces, and full recording keeps every roll and move made.
+RECORD_NONE: int = 0
+RECORD_SUMMARY: int = 1
+RECORD_FULL: int = 2
 
 
 # CLASSES.
 class GameInstance():
-    def __init__(self, tileCount: int = 9) -> None:
-        self._isRunning: bool = False
-        self._isFinished: bool = False
+    __slots__ = (
+        "_isRunning", "_isFinished", "_tileCount", "_moveTable", "_board", "_rollCount", "_rollHistory", "_moveHistory",
+        "_lastRoll", "_lastRollTotal", "_validMoves", "_validMoveMasks", "_dice", "_recording", "_trusted",
+        "_resetCount",
+    )
+
+    def __init__(self, tileCount: int = 9, dice: DiceSource | None = None, recording: int = RECORD_FULL, trusted: bool = False) -> None:
+        if recording not in (RECORD_NONE, RECORD_SUMMARY, RECORD_FULL):
+            raise Exception(f"Unsupported recording level: {recording}.")
         self._tileCount: int = tileCount
-        self._tiles: list[int] = []
+        self._moveTable: MoveTable = loadMoveTable(tileCount)
         self._rollHistory: list[int] = []
-        self._moveHistory: list[list[int]] = []
-        self._lastRoll: tuple[int, int] = (-1, -1)
-        self._validMoves: list[list[int]] = []
+        self._moveHistory: list[tuple[int, ...]] = []
+        self._dice: DiceSource = dice if dice is not None else DEFAULT_DICE
+        self._recording: int = recording
+        # Trusted games skip move validation, for players that only ever pick from validMoves.
+        self._trusted: bool = trusted
+        # Counts calls to reset(), so that snapshots from an earlier game can be told apart.
+        self._resetCount: int = -1
+        self.reset()
 
     @property
     def running(self) -> bool:
@@ -33,42 +56,144 @@ class GameInstance():
     
     @property
     def rollCount(self) -> int:
-        return len(self._rollHistory)
+        # Only tracked with summary or full recording, and never guessed at otherwise.
+        if self._recording == RECORD_NONE:
+            raise Exception("Roll count is not tracked by games without recording.")
+        return self._rollCount
     
+    @property
+    def tileCount(self) -> int:
+        return self._tileCount
+
+    @property
+    def recording(self) -> int:
+        return self._recording
+
+    @property
+    def trusted(self) -> bool:
+        return self._trusted
+
+    @property
+    def rng(self) -> random.Random:
+        # Random choices by players draw from their own RNG, so that they never change the rolls of the game.
+        return self._dice.rng
+
+    @property
+    def board(self) -> int:
+        return self._board
+
     @property
     def tiles(self) -> list[int]:
-        return self._tiles
+        return maskToTiles(self._board)
     
     @property
     def lastRoll(self) -> tuple[int, int]:
+        # Only tracked with summary or full recording. The total of the last roll is always tracked, as lastRollTotal.
+        if self._recording == RECORD_NONE:
+            raise Exception("Dice faces are not tracked by games without recording, only lastRollTotal.")
         return self._lastRoll
     
     @property
     def lastRollTotal(self) -> int:
-        return sum(self._lastRoll)
+        return self._lastRollTotal
     
     @property
     def rollHistory(self) -> list[int]:
+        # Stays empty unless the game uses full recording.
         return self._rollHistory
     
     @property
-    def moveHistory(self) -> list[list[int]]:
+    def moveHistory(self) -> list[tuple[int, ...]]:
+        # Stays empty unless the game uses full recording.
         return self._moveHistory
     
     @property
-    def validMoves(self) -> list[list[int]]:
+    def validMoves(self) -> tuple[tuple[int, ...], ...]:
         return self._validMoves
+
+    @property
+    def validMoveMasks(self) -> tuple[int, ...]:
+        return self._validMoveMasks
         
     @property
     def score(self) -> int:
-        return sum(self.tiles)
+        return self._moveTable.sums[self._board]
     
-    def start(self) -> list[list[int]]:
+    @classmethod
+    def fromState(cls, board: int, roll: int, tileCount: int = 9) -> "GameInstance":
+        # Build a running game positioned just after the given roll, such as when probing players.
+        game = cls(tileCount = tileCount)
+        game._board = board
+        game._isRunning = True
+        dice1 = min(6, roll - 1)
+        game._lastRoll = (dice1, roll - dice1)
+        game._applyRoll(roll)
+        return game
+
+    def reset(self) -> None:
+        # Return to the unstarted state in place, keeping the tile count, dice and history lists for the next game.
+        self._resetCount += 1
+        self._isRunning = False
+        self._isFinished = False
+        self._board = 0
+        self._rollCount = 0
+        self._rollHistory.clear()
+        self._moveHistory.clear()
+        self._lastRoll = (-1, -1)
+        self._lastRollTotal = -2
+        self._validMoves = ()
+        self._validMoveMasks = ()
+        return
+
+    def snapshot(self) -> tuple:
+        # Capture the game state and dice position. Histories only grow until the next reset(), so only their lengths
+        # are kept, and the snapshot is only valid until then.
+        return (
+            self._resetCount, self._isRunning, self._isFinished, self._board, self._rollCount, len(self._rollHistory), len(self._moveHistory),
+            self._lastRoll, self._lastRollTotal, self._validMoves, self._validMoveMasks, self._dice.snapshot(),
+        )
+
+    def restore(self, state: tuple) -> None:
+        # Return to a state captured by snapshot() on this game, rewinding its dice and truncating its histories.
+        if state[0] != self._resetCount:
+            raise Exception("Snapshot was taken before the game was reset, and cannot be restored.")
+        (
+            _, self._isRunning, self._isFinished, self._board, self._rollCount, rollHistoryLength, moveHistoryLength,
+            self._lastRoll, self._lastRollTotal, self._validMoves, self._validMoveMasks, diceState,
+        ) = state
+        del self._rollHistory[rollHistoryLength:]
+        del self._moveHistory[moveHistoryLength:]
+        self._dice.restore(diceState)
+        return
+
+    def clone(self, dice: DiceSource | None = None, recording: int = RECORD_NONE) -> "GameInstance":
+        # Copy the game state into a new game without histories, such as for simulating futures. Unless other dice
+        # are given, the clone rolls a copy of this game's dice, so it sees the same rolls from here on.
+        game = type(self).__new__(type(self))
+        game._resetCount = 0
+        game._tileCount = self._tileCount
+        game._moveTable = self._moveTable
+        game._rollHistory = []
+        game._moveHistory = []
+        game._dice = dice if dice is not None else self._dice.copy()
+        game._recording = recording
+        game._trusted = self._trusted
+        game._isRunning = self._isRunning
+        game._isFinished = self._isFinished
+        game._board = self._board
+        game._rollCount = self._rollCount
+        game._lastRoll = self._lastRoll
+        game._lastRollTotal = self._lastRollTotal
+        game._validMoves = self._validMoves
+        game._validMoveMasks = self._validMoveMasks
+        return game
+
+    def start(self) -> tuple[tuple[int, ...], ...]:
         if self.running:
             raise Exception("Game cannot be started twice.")
 
         # Set up the available tiles based on the configured tile count.
-        self._tiles = [ value for value in range(1, self._tileCount + 1) ]
+        self._board = fullBoard(self._tileCount)
         self._isRunning = True
 
         # MAKE FIRST MOVE.
@@ -91,7 +216,7 @@ class GameInstance():
                 f"\n"
                 f"Remaining: {', '.join(str(tile) for tile in self.tiles)}\n"
                 f"Last Roll: {self.lastRoll[0]} + {self.lastRoll[1]} (sum of {self.lastRollTotal})\n"
-                f"Moves:     {', '.join(str(move) for move in self.moveHistory)}"
+                f"Moves:     {', '.join(str(list(move)) for move in self.moveHistory)}"
             )
         
         else:
@@ -103,70 +228,96 @@ class GameInstance():
                 f"\n"
                 f"Remaining: {', '.join(str(tile) for tile in self.tiles)}\n"
                 f"Last Roll: {self.lastRoll[0]} + {self.lastRoll[1]} (sum of {self.lastRollTotal})\n"
-                f"Moves:     {', '.join(str(move) for move in self.moveHistory)}"
+                f"Moves:     {', '.join(str(list(move)) for move in self.moveHistory)}"
             )
     
-    def turn(self, move: list[int]) -> list[list[int]]:
+    def turn(self, move: tuple[int, ...]) -> tuple[tuple[int, ...], ...]:
         # Start the turn by applying the prior move.
         self._flipTiles(move)
 
         # Check if game is complete and handle.
         if self.finished:
-            return []
+            return ()
 
         # Otherwise, make the next roll and return moves.
         else:
             return self._makeRoll()
 
-    def _makeRoll(self) -> list[list[int]]:
-        newRoll = self._roll()
-        self._rollHistory.append(newRoll)
+    def turnIndex(self, moveIndex: int) -> tuple[tuple[int, ...], ...]:
+        # Apply the move at the given position in validMoves, skipping the tile matching done by turn().
+        if not self._trusted and not 0 <= moveIndex < len(self._validMoveMasks):
+            raise Exception(f"Move index {moveIndex} not a possible move from previous roll {self._lastRollTotal}")
+        self._applyMove(self._validMoveMasks[moveIndex], self._validMoves[moveIndex])
+
+        # Check if game is complete and handle, otherwise make the next roll and return moves.
+        if self._isFinished:
+            return ()
+        return self._makeRoll()
+
+    def _makeRoll(self) -> tuple[tuple[int, ...], ...]:
+        return self._applyRoll(self._roll())
+
+    def _applyRoll(self, newRoll: int) -> tuple[tuple[int, ...], ...]:
+        self._lastRollTotal = newRoll
+        if self._recording != RECORD_NONE:
+            self._rollCount += 1
+            if self._recording == RECORD_FULL:
+                self._rollHistory.append(newRoll)
         validMovesForRoll = self._getValidMovesForRoll(newRoll)
         validMovesRemaining = (len(validMovesForRoll) > 0)
         
         if validMovesRemaining:
             self._validMoves = validMovesForRoll
+            self._validMoveMasks = self._moveTable.masksAt(tableIndex(self._board, newRoll))
             return validMovesForRoll
         
         else:
-            self._validMoves = []
+            self._validMoves = ()
+            self._validMoveMasks = ()
             self._isFinished = True
-            return []
-        
-    def _flipTiles(self, move: list[int]) -> None:
-        if move not in self.validMoves:
-            raise Exception(f"Move {move} not a possible move from previous roll {self._rollHistory[-1]}")
+            return ()
         
+    def _flipTiles(self, move: tuple[int, ...]) -> None:
+        # Convert the move into a mask, then match it against the masks for the current roll.
+        # Invalid tile values (0 or below) can never match, so they are mapped to an empty mask.
+        moveMask = 0
         for moveTile in move:
+            moveMask |= (1 << (moveTile - 1)) if moveTile > 0 else 0
+        if not self._trusted:
             try:
-                self._tiles.remove(moveTile)
-            except:
-                raise Exception(f"Cannot flip tile {moveTile} that has already been flipped!")
+                moveIndex = self._validMoveMasks.index(moveMask)
+            except ValueError:
+                moveIndex = -1
+            if moveIndex < 0 or (self._validMoves[moveIndex] is not move and self._validMoves[moveIndex] != tuple(move)):
+                raise Exception(f"Move {move} not a possible move from previous roll {self._lastRollTotal}")
+        self._applyMove(moveMask, move)
+        return
 
-        self._moveHistory.append(move)
+    def _applyMove(self, moveMask: int, move: tuple[int, ...]) -> None:
+        # Flip all tiles in the move at once.
+        self._board ^= moveMask
+        if self._recording == RECORD_FULL:
+            self._moveHistory.append(move)
         
         # Check if the game is complete and flag if so.
-        gameIsComplete = (len(self.tiles) == 0)
+        gameIsComplete = (self._board == 0)
         if gameIsComplete:
             self._isFinished = True
         return
 
     def _roll(self) -> int:
-        dice1, dice2 = randint(1, 6), randint(1, 6)
-        self._lastRoll = (dice1, dice2)
-        return dice1 + dice2
-
-    def _getValidMovesForRoll(self, roll: int) -> list[list[int]]:
-        # Attempt to directly read the move list from the full cache.
-        tileListAsStr = map(str, self.tiles)
-        tilesAsStr = "".join(tileListAsStr)
-        try:
-            moves = FULL_ROLL_CACHE[f"{roll}+{tilesAsStr}"]
-        except:
-            raise Exception(f"Missing cache entry for roll {roll}, tiles {tilesAsStr}")
-
-        # Return the final list of combinations.
-        return moves
+        dicePair = self._dice.roll()
+        if self._recording != RECORD_NONE:
+            self._lastRoll = dicePair
+        return dicePair[0] + dicePair[1]
+
+    def _getValidMovesForRoll(self, roll: int) -> tuple[tuple[int, ...], ...]:
+        # Rolls outside of the possible dice totals never have any moves.
+        if roll < 0 or roll > MAX_ROLL:
+            return ()
+        
+        # Read the interned move tuples directly from the move table.
+        return self._moveTable.movesAt(tableIndex(self._board, roll))
 
 
 # MAIN ENTRY.
@@ -0,0 +1,178 @@
+# dice.py
+# Desc: Seeded, splittable random streams and buffered dice sources for rolling dice.
+#   Every stream is derived from a root seed plus a path of integers (such as a shard index), so any
+#   piece of a run can be replayed on its own without depending on how work was scheduled.
+# Author: Noah Black (noah.black0425@gmail.com)
+# Last Updated: October 17th, 2026
+
+
+# NATIVE IMPORTS.
+import random
+from typing import TYPE_CHECKING
+# THIRD-PARTY IMPORTS.
+# NumPy is imported by the functions that use it, so that games can be played without the cost of loading it.
+if TYPE_CHECKING:
+    import numpy as np
+# LOCAL IMPORTS.
+
+
+# CONSTANTS.
+DEFAULT_BLOCK_SIZE: int = 4096
+# Each random byte below 252 maps evenly onto one of the 36 possible dice pairs. Higher bytes are rejected.
+ACCEPTED_BYTES: int = 252
+BYTE_PAIRS: list[tuple[int, int]] = [ (byte % 36 // 6 + 1, byte % 6 + 1) for byte in range(ACCEPTED_BYTES) ]
+
+
+# CLASSES.
+class DiceSource():
+    def __init__(self, rng: random.Random | None = None, blockSize: int = DEFAULT_BLOCK_SIZE, choiceRng: random.Random | None = None) -> None:
+        # Dice are drawn from their own RNG, which nothing else may draw from, so that its state only changes when the
+        # buffer is refilled. Its state at the end of the current buffer is captured at most once per refill, and
+        # shared by every snapshot taken until the next. Other random choices, such as by players, use choiceRng.
+        self._diceRng: random.Random = rng if rng is not None else random.Random()
+        self._rng: random.Random = choiceRng if choiceRng is not None else random.Random()
+        self._blockSize: int = blockSize
+        self._buffer: list[tuple[int, int]] = []
+        self._position: int = 0
+        self._rngState: tuple | None = None
+        self._rngBehind: bool = False
+
+    @property
+    def rng(self) -> random.Random:
+        return self._rng
+
+    def snapshot(self) -> tuple:
+        """Capture the position of the dice, so the same rolls can be replayed later with restore().
+
+        :return: Opaque dice state
+        :rtype: tuple
+        """
+        # Buffers are replaced rather than modified on refill, so they can be shared instead of copied.
+        if self._rngState is None:
+            self._rngState = self._diceRng.getstate()
+        return (self._rngState, self._buffer, self._position)
+
+    def restore(self, state: tuple) -> None:
+        """Return the dice to a position captured by snapshot().
+
+        :param state: Dice state from snapshot()
+        :type state: tuple
+        """
+        # The RNG is only moved to the captured state when the buffer next runs out.
+        self._rngState, self._buffer, self._position = state
+        self._rngBehind = True
+        return
+
+    def copy(self) -> "DiceSource":
+        """Create a dice source that rolls the same values as this one from its current position.
+
+        The copy rolls independently, but shares this source's RNG for other random choices.
+
+        :return: Copied dice source
+        :rtype: DiceSource
+        """
+        # The copy's RNG is only given a state when it is first needed, so it is never seeded here.
+        dice = DiceSource.__new__(DiceSource)
+        dice._diceRng = random.Random.__new__(random.Random)
+        dice._rng = self._rng
+        dice._blockSize = self._blockSize
+        dice.restore(self.snapshot())
+        return dice
+
+    def roll(self) -> tuple[int, int]:
+        """Roll a pair of dice, refilling the buffer from the RNG when it runs out.
+
+        :return: Face values of both dice
+        :rtype: tuple[int, int]
+        """
+        while self._position >= len(self._buffer):
+            self._refill()
+        dicePair = self._buffer[self._position]
+        self._position += 1
+        return dicePair
+
+    def _refill(self) -> None:
+        # Draw a whole block of random bytes at once, then keep every byte that maps onto a dice pair.
+        if self._rngBehind:
+            self._diceRng.setstate(self._rngState)
+            self._rngBehind = False
+        block = self._diceRng.getrandbits(8 * self._blockSize).to_bytes(self._blockSize, "little")
+        self._buffer = [ BYTE_PAIRS[byte] for byte in block if byte < ACCEPTED_BYTES ]
+        self._position = 0
+        self._rngState = None
+
+
+# FUNCTIONS.
+def newSeed() -> int:
+    """Draw a fresh root seed from OS entropy, so unseeded runs can still be reported and replayed.
+
+    :return: Root seed
+    :rtype: int
+    """
+    import numpy as np
+    return int(np.random.SeedSequence().entropy)
+
+def streamSequence(seed: int | None, *streamPath: int) -> "np.random.SeedSequence":
+    """Get the seed sequence for a single stream.
+
+    :param seed: Root seed, or None to use OS entropy
+    :type seed: int | None
+    :param streamPath: Stream indices below the root, such as a shard index
+    :type streamPath: int
+    :return: Seed sequence for the stream
+    :rtype: np.random.SeedSequence
+    """
+    import numpy as np
+    return np.random.SeedSequence(seed, spawn_key = streamPath)
+
+def makeRng(seed: int | None = None, *streamPath: int) -> random.Random:
+    """Create a standard library RNG for a single stream.
+
+    :param seed: Root seed, or None to use OS entropy
+    :type seed: int | None
+    :param streamPath: Stream indices below the root, such as a shard index
+    :type streamPath: int
+    :return: Seeded RNG
+    :rtype: random.Random
+    """
+    import numpy as np
+    state = streamSequence(seed, *streamPath).generate_state(4, dtype = np.uint64)
+    return random.Random(int.from_bytes(state.tobytes(), "little"))
+
+def makeDice(seed: int | None = None, *streamPath: int, blockSize: int = DEFAULT_BLOCK_SIZE) -> DiceSource:
+    """Create a buffered dice source for a single stream, as used by GameInstance.
+
+    :param seed: Root seed, or None to use OS entropy
+    :type seed: int | None
+    :param streamPath: Stream indices below the root, such as a shard index
+    :type streamPath: int
+    :param blockSize: Number of random bytes drawn each time the buffer is refilled
+    :type blockSize: int
+    :return: Seeded dice source
+    :rtype: DiceSource
+    """
+    # Dice are seeded from the first words of the stream, the same as makeRng(), and other choices from the next.
+    import numpy as np
+    state = streamSequence(seed, *streamPath).generate_state(8, dtype = np.uint64)
+    return DiceSource(random.Random(int.from_bytes(state[:4].tobytes(), "little")), blockSize = blockSize, choiceRng = random.Random(int.from_bytes(state[4:].tobytes(), "little")))
+
+def makeGenerator(seed: int | None = None, *streamPath: int) -> "np.random.Generator":
+    """Create a NumPy generator for a single stream, as used by the batch simulator.
+
+    :param seed: Root seed, or None to use OS entropy
+    :type seed: int | None
+    :param streamPath: Stream indices below the root, such as a shard index
+    :type streamPath: int
+    :return: Seeded generator
+    :rtype: np.random.Generator
+    """
+    import numpy as np
+    return np.random.default_rng(streamSequence(seed, *streamPath))
+
+
+# MAIN ENTRY.
+def main() -> None:
+    raise NotImplementedError
+
+if __name__=="__main__":
+    main()
@@ -0,0 +1,200 @@
+# solver.py
+# Desc: Exact dynamic-programming solver and policy evaluation for the expected final score of a game.
+#   Boards only lose tiles, so every state can be solved in increasing board order from the empty board up.
+# Author: Noah Black (noah.black0425@gmail.com)
+# Last Updated: October 17th, 2026
+
+
+# NATIVE IMPORTS.
+from functools import cache
+# THIRD-PARTY IMPORTS.
+import numpy as np
+# LOCAL IMPORTS.
+from .batch import emptyPolicy
+from .board import fullBoard, loadMoveTable, tableIndex
+from .cache import MAX_ROLL
+
+
+# CONSTANTS.
+ROLL_PROBABILITIES: dict[int, float] = { roll: (6 - abs(roll - 7)) / 36 for roll in range(2, MAX_ROLL + 1) }
+
+
+# FUNCTIONS.
+@cache
+def solveOptimal(tileCount: int = 9) -> tuple[list[float], np.ndarray]:
+    """Find the minimum expected final score from every board, along with the moves that achieve it.
+
+    :param tileCount: Number of tiles in the game
+    :type tileCount: int
+    :return: Expected final score before each roll, indexed by board, and the optimal deterministic policy table
+    :rtype: tuple[list[float], np.ndarray]
+    """
+    # The empty board has shut the box, so it always scores 0.
+    moveTable = loadMoveTable(tileCount)
+    boardCount = moveTable.boardCount
+    values = [ 0.0 ] * boardCount
+    policy = emptyPolicy(tileCount)
+    flatPolicy = [ 0 ] * policy.size
+    for board in range(1, boardCount):
+        expectedScore = 0.0
+        for roll, probability in ROLL_PROBABILITIES.items():
+            # With no moves the game ends at the current score, otherwise take the move with the lowest outcome.
+            bestValue = float(moveTable.sums[board])
+            bestMove = 0
+            for move in moveTable.masksAt(tableIndex(board, roll)):
+                moveValue = values[board ^ move]
+                if bestMove == 0 or moveValue < bestValue:
+                    bestValue = moveValue
+                    bestMove = move
+            expectedScore += probability * bestValue
+            flatPolicy[tableIndex(board, roll)] = bestMove
+        values[board] = expectedScore
+
+    # Values are shared through the cache, so hand back an immutable policy.
+    policy.reshape(-1)[:] = flatPolicy
+    policy.flags.writeable = False
+    return values, policy
+
+def policyTransitions(policy: np.ndarray, tileCount: int = 9) -> list[list[tuple[int, float]]]:
+    """Collapse a policy table into the chance of reaching each next board from every board.
+
+    A next board equal to the current board means that the game ends there, since every move removes tiles.
+
+    :param policy: Deterministic or stochastic policy table in the layout used by game.batch
+    :type policy: np.ndarray
+    :param tileCount: Number of tiles in the game
+    :type tileCount: int
+    :return: (next board, probability) pairs for each board, indexed by board
+    :rtype: list[list[tuple[int, float]]]
+    """
+    moveTable = loadMoveTable(tileCount)
+    isStochastic = (policy.ndim == 3)
+    flatPolicy = policy.reshape(moveTable.entryCount, -1).tolist() if isStochastic else policy.reshape(-1).tolist()
+
+    boardCount = moveTable.boardCount
+    transitions: list[list[tuple[int, float]]] = [ [] for _ in range(boardCount) ]
+    for board in range(1, boardCount):
+        outcomes: dict[int, float] = {}
+        for roll, probability in ROLL_PROBABILITIES.items():
+            index = tableIndex(board, roll)
+            masks = moveTable.masksAt(index)
+            if not masks:
+                outcomes[board] = outcomes.get(board, 0.0) + probability
+            elif isStochastic:
+                for slot, move in enumerate(masks):
+                    if flatPolicy[index][slot] > 0:
+                        outcomes[board ^ move] = outcomes.get(board ^ move, 0.0) + probability * flatPolicy[index][slot]
+            else:
+                nextBoard = board ^ flatPolicy[index]
+                outcomes[nextBoard] = outcomes.get(nextBoard, 0.0) + probability
+        transitions[board] = list(outcomes.items())
+    return transitions
+
+def evaluatePolicy(policy: np.ndarray, tileCount: int = 9) -> tuple[float, float]:
+    """Find the exact expected final score and perfect game chance of a policy.
+
+    :param policy: Deterministic or stochastic policy table in the layout used by game.batch
+    :type policy: np.ndarray
+    :param tileCount: Number of tiles in the game
+    :type tileCount: int
+    :return: Expected final score and probability of shutting the box, starting from a full board
+    :rtype: tuple[float, float]
+    """
+    # Work up from the empty board, which has already shut the box.
+    transitions = policyTransitions(policy, tileCount)
+    boardSums = loadMoveTable(tileCount).sums
+    expectedScores = [ 0.0 ] * len(transitions)
+    perfectChances = [ 1.0 ] + [ 0.0 ] * (len(transitions) - 1)
+    for board in range(1, len(transitions)):
+        for nextBoard, probability in transitions[board]:
+            if nextBoard == board:
+                expectedScores[board] += probability * boardSums[board]
+            else:
+                expectedScores[board] += probability * expectedScores[nextBoard]
+                perfectChances[board] += probability * perfectChances[nextBoard]
+
+    startBoard = fullBoard(tileCount)
+    return expectedScores[startBoard], perfectChances[startBoard]
+
+def outcomeDistributions(policy: np.ndarray, tileCount: int = 9) -> tuple[list[float], list[float]]:
+    """Find the exact probability of every final score and roll count under a policy.
+
+    :param policy: Deterministic or stochastic policy table in the layout used by game.batch
+    :type policy: np.ndarray
+    :param tileCount: Number of tiles in the game
+    :type tileCount: int
+    :return: Probability of each final score and of each roll count, indexed by value
+    :rtype: tuple[list[float], list[float]]
+    """
+    # Every roll flips at least one tile or ends the game, so no game can last more than one roll per tile.
+    transitions = policyTransitions(policy, tileCount)
+    boardSums = loadMoveTable(tileCount).sums
+    startBoard = fullBoard(tileCount)
+    scorePmf = [ 0.0 ] * (boardSums[startBoard] + 1)
+    rollPmf = [ 0.0 ] * (tileCount + 1)
+
+    # Push probability down from the full board, tracking the # of rolls made to reach each board.
+    reachChances = [ [ 0.0 ] * (tileCount + 1) for _ in range(len(transitions)) ]
+    reachChances[startBoard][0] = 1.0
+    for board in range(startBoard, 0, -1):
+        for rollCount, reachChance in enumerate(reachChances[board]):
+            if reachChance == 0.0:
+                continue
+            for nextBoard, probability in transitions[board]:
+                if nextBoard == board:
+                    scorePmf[boardSums[board]] += reachChance * probability
+                    rollPmf[rollCount + 1] += reachChance * probability
+                else:
+                    reachChances[nextBoard][rollCount + 1] += reachChance * probability
+
+    # Games that reach the empty board end without another roll.
+    for rollCount, reachChance in enumerate(reachChances[0]):
+        scorePmf[0] += reachChance
+        rollPmf[rollCount] += reachChance
+    return scorePmf, rollPmf
+
+def pmfMean(pmf: list[float]) -> float:
+    """Get the mean of a distribution indexed by value.
+
+    :param pmf: Probability of each value
+    :type pmf: list[float]
+    :return: Mean value
+    :rtype: float
+    """
+    return sum(value * probability for value, probability in enumerate(pmf))
+
+def pmfVariance(pmf: list[float]) -> float:
+    """Get the variance of a distribution indexed by value.
+
+    :param pmf: Probability of each value
+    :type pmf: list[float]
+    :return: Variance
+    :rtype: float
+    """
+    mean = pmfMean(pmf)
+    return sum(((value - mean) ** 2) * probability for value, probability in enumerate(pmf))
+
+def pmfQuantile(pmf: list[float], quantile: float) -> int:
+    """Get the smallest value whose cumulative probability reaches the given quantile.
+
+    :param pmf: Probability of each value
+    :type pmf: list[float]
+    :param quantile: Target quantile, between 0 and 1
+    :type quantile: float
+    :return: Quantile value
+    :rtype: int
+    """
+    cumulative = 0.0
+    for value, probability in enumerate(pmf):
+        cumulative += probability
+        if cumulative >= quantile - 1e-12:
+            return value
+    return len(pmf) - 1
+
+
+# MAIN ENTRY.
+def main() -> None:
+    raise NotImplementedError
+
+if __name__=="__main__":
+    main()
@@ -0,0 +1,239 @@
+# stats.py
+# Desc: Streaming statistics for the final scores and roll counts of many games.
+#   Results are accumulated game by game or batch by batch, and can be merged across workers and checkpoints.
+# Author: Noah Black (noah.black0425@gmail.com)
+# Last Updated: October 17th, 2026
+
+
+# NATIVE IMPORTS.
+from math import sqrt
+from statistics import NormalDist
+# THIRD-PARTY IMPORTS.
+import numpy as np
+# LOCAL IMPORTS.
+
+
+# CONSTANTS.
+DEFAULT_CONFIDENCE: float = 0.95
+
+
+# FUNCTIONS.
+def zScore(confidence: float = DEFAULT_CONFIDENCE) -> float:
+    # Get the # of standard errors on either side of an estimate that covers the given two-sided confidence level.
+    return NormalDist().inv_cdf(0.5 + confidence / 2)
+
+
+# CLASSES.
+class RunStats():
+    def __init__(self, tileCount: int = 9) -> None:
+        # The mean and sum of squared deviations of the final score are kept with Welford's method, alongside a count
+        # of games for every possible final score and roll count. A game can score at most the sum of all tiles, and
+        # can never take more rolls than there are tiles.
+        self._tileCount: int = tileCount
+        self._count: int = 0
+        self._mean: float = 0.0
+        self._squaredDeviations: float = 0.0
+        self._scoreCounts: list[int] = [ 0 ] * (tileCount * (tileCount + 1) // 2 + 1)
+        self._rollCounts: list[int] = [ 0 ] * (tileCount + 1)
+
+    @property
+    def tileCount(self) -> int:
+        return self._tileCount
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def mean(self) -> float:
+        return self._mean
+
+    @property
+    def variance(self) -> float:
+        return self._squaredDeviations / (self._count - 1) if self._count > 1 else 0.0
+
+    @property
+    def stdDev(self) -> float:
+        return sqrt(self.variance)
+
+    @property
+    def standardError(self) -> float:
+        return sqrt(self.variance / self._count) if self._count > 0 else 0.0
+
+    @property
+    def scoreCounts(self) -> list[int]:
+        return self._scoreCounts
+
+    @property
+    def rollCounts(self) -> list[int]:
+        return self._rollCounts
+
+    @property
+    def perfectGames(self) -> int:
+        return self._scoreCounts[0]
+
+    @property
+    def perfectRate(self) -> float:
+        return self._scoreCounts[0] / self._count if self._count > 0 else 0.0
+
+    def addGame(self, score: int, rollCount: int) -> None:
+        """Add the result of a single game.
+
+        :param score: Final score of the game
+        :type score: int
+        :param rollCount: Number of rolls made in the game
+        :type rollCount: int
+        """
+        self._count += 1
+        delta = score - self._mean
+        self._mean += delta / self._count
+        self._squaredDeviations += delta * (score - self._mean)
+        self._scoreCounts[score] += 1
+        self._rollCounts[rollCount] += 1
+        return
+
+    def addBatch(self, scores: np.ndarray, rollCounts: np.ndarray) -> None:
+        """Add the results of a batch of games, as returned by game.batch.runBatch().
+
+        :param scores: Final score of each game
+        :type scores: np.ndarray
+        :param rollCounts: Number of rolls made in each game
+        :type rollCounts: np.ndarray
+        """
+        if len(scores) == 0:
+            return
+        scoreCounts = np.bincount(scores, minlength = len(self._scoreCounts))
+        batchMean = float(scores.mean(dtype = np.float64))
+        batchSquaredDeviations = float((((np.arange(len(scoreCounts)) - batchMean) ** 2) * scoreCounts).sum())
+        self._combine(len(scores), batchMean, batchSquaredDeviations)
+        self._scoreCounts = [ total + added for total, added in zip(self._scoreCounts, scoreCounts.tolist()) ]
+        self._rollCounts = [ total + added for total, added in zip(self._rollCounts, np.bincount(rollCounts, minlength = len(self._rollCounts)).tolist()) ]
+        return
+
+    def merge(self, other: "RunStats") -> "RunStats":
+        """Combine the statistics of two sets of games.
+
+        :param other: Statistics to add to these
+        :type other: RunStats
+        :return: New statistics covering the games of both
+        :rtype: RunStats
+        """
+        if other.tileCount != self._tileCount:
+            raise Exception(f"Cannot merge statistics for {self._tileCount} and {other.tileCount} tiles.")
+        merged = RunStats.fromDict(self.toDict())
+        merged._combine(other.count, other.mean, other._squaredDeviations)
+        merged._scoreCounts = [ total + added for total, added in zip(self._scoreCounts, other.scoreCounts) ]
+        merged._rollCounts = [ total + added for total, added in zip(self._rollCounts, other.rollCounts) ]
+        return merged
+
+    def meanInterval(self, confidence: float = DEFAULT_CONFIDENCE) -> tuple[float, float]:
+        """Get a confidence interval on the expected final score.
+
+        :param confidence: Two-sided confidence level
+        :type confidence: float
+        :return: Lower and upper bounds
+        :rtype: tuple[float, float]
+        """
+        halfWidth = zScore(confidence) * self.standardError
+        return self._mean - halfWidth, self._mean + halfWidth
+
+    def perfectInterval(self, confidence: float = DEFAULT_CONFIDENCE) -> tuple[float, float]:
+        """Get a Wilson score interval on the chance of a perfect game, which stays sensible for rare events.
+
+        :param confidence: Two-sided confidence level
+        :type confidence: float
+        :return: Lower and upper bounds
+        :rtype: tuple[float, float]
+        """
+        if self._count == 0:
+            return 0.0, 1.0
+        z = zScore(confidence)
+        rate = self.perfectRate
+        denominator = 1 + z * z / self._count
+        center = (rate + z * z / (2 * self._count)) / denominator
+        halfWidth = z * sqrt(rate * (1 - rate) / self._count + z * z / (4 * self._count * self._count)) / denominator
+        return max(center - halfWidth, 0.0), min(center + halfWidth, 1.0)
+
+    def withinPrecision(self, precision: float | None = None, perfectPrecision: float | None = None, confidence: float = DEFAULT_CONFIDENCE) -> bool:
+        """Check whether enough games have been played to report results to the given precision.
+
+        Targets are half-widths of the confidence intervals, and every target that is given must be met. With no
+        targets at all, results are never precise enough, so that runs play every game they were asked to.
+
+        :param precision: Target half-width of the interval on the expected final score, or None
+        :type precision: float | None
+        :param perfectPrecision: Target half-width of the interval on the chance of a perfect game, or None
+        :type perfectPrecision: float | None
+        :param confidence: Two-sided confidence level
+        :type confidence: float
+        :return: Whether every target has been met
+        :rtype: bool
+        """
+        if (precision is None and perfectPrecision is None) or self._count < 2:
+            return False
+        if precision is not None and zScore(confidence) * self.standardError > precision:
+            return False
+        if perfectPrecision is not None:
+            perfectLow, perfectHigh = self.perfectInterval(confidence)
+            if (perfectHigh - perfectLow) / 2 > perfectPrecision:
+                return False
+        return True
+
+    def scorePmf(self) -> list[float]:
+        # Get the observed chance of every final score, in the same layout as game.solver.outcomeDistributions().
+        return [ scoreCount / self._count for scoreCount in self._scoreCounts ] if self._count > 0 else [ 0.0 ] * len(self._scoreCounts)
+
+    def rollPmf(self) -> list[float]:
+        # Get the observed chance of every roll count, in the same layout as game.solver.outcomeDistributions().
+        return [ rollCount / self._count for rollCount in self._rollCounts ] if self._count > 0 else [ 0.0 ] * len(self._rollCounts)
+
+    def toDict(self) -> dict:
+        """Convert the statistics into plain values that can be saved in a checkpoint.
+
+        :return: Statistics as a dictionary
+        :rtype: dict
+        """
+        return {
+            "tileCount": self._tileCount,
+            "count": self._count,
+            "mean": self._mean,
+            "squaredDeviations": self._squaredDeviations,
+            "scoreCounts": list(self._scoreCounts),
+            "rollCounts": list(self._rollCounts),
+        }
+
+    @classmethod
+    def fromDict(cls, values: dict) -> "RunStats":
+        """Rebuild statistics saved with toDict().
+
+        :param values: Statistics as a dictionary
+        :type values: dict
+        :return: Rebuilt statistics
+        :rtype: RunStats
+        """
+        stats = cls(values["tileCount"])
+        stats._count = values["count"]
+        stats._mean = values["mean"]
+        stats._squaredDeviations = values["squaredDeviations"]
+        stats._scoreCounts = list(values["scoreCounts"])
+        stats._rollCounts = list(values["rollCounts"])
+        return stats
+
+    def _combine(self, count: int, mean: float, squaredDeviations: float) -> None:
+        # Fold in the mean and squared deviations of another set of games, using Chan's parallel form of Welford.
+        if count == 0:
+            return
+        total = self._count + count
+        delta = mean - self._mean
+        self._mean += delta * count / total
+        self._squaredDeviations += squaredDeviations + delta * delta * self._count * count / total
+        self._count = total
+        return
+
+
+# MAIN ENTRY.
+def main() -> None:
+    raise NotImplementedError
+
+if __name__=="__main__":
+    main()
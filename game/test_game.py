@@ -5,9 +5,21 @@
 
 
 # NATIVE IMPORTS.
+import os
+import tempfile
+from itertools import combinations
 # THIRD-PARTY IMPORTS.
+import pytest
 # LOCAL IMPORTS.
-import core
+import game.cache as cache
+import game.checkpoint as checkpoint
+import game.core as core
+import game.dice as dice
+import game.solver as solver
+import game.stats as stats
+import game.batch as batch
+import game.board as board
+import numpy as np
 
 
 # CLASSES.
@@ -25,6 +37,15 @@ class TestCore():
         assert game.running
         assert not game.finished
         assert len(game.tiles) == TILE_COUNT
+        assert game.board == board.fullBoard(TILE_COUNT)
+        return
+
+    def test_smallTileCount(self) -> None:
+        TILE_COUNT: int = 4
+        game = core.GameInstance(tileCount = TILE_COUNT)
+        game.start()
+        assert game.tiles == [1, 2, 3, 4]
+        assert game.score == 10
         return
 
     def test_getMovesForRoll(self) -> None:
@@ -46,9 +67,60 @@ class TestCore():
 
         return
     
+    def test_largeTileCounts(self) -> None:
+        for tileCount in (10, 12, 16):
+            game = core.GameInstance(tileCount = tileCount)
+            moves = game.start()
+            assert game.tiles == list(range(1, tileCount + 1))
+            while not game.finished:
+                moves = game.turn(moves[-1])
+            assert game.score == sum(game.tiles)
+        return
+
+    def test_invalidMove(self) -> None:
+        game = core.GameInstance()
+        moves = game.start()
+        invalidMove = list(reversed(moves[-1])) if len(moves[-1]) > 1 else [0]
+        with pytest.raises(Exception, match = "not a possible move"):
+            game.turn(invalidMove)
+        return
+
+    def test_turnFlipsTiles(self) -> None:
+        game = core.GameInstance()
+        moves = game.start()
+        move = moves[0]
+        game.turn(move)
+        assert game.board == board.fullBoard(9) ^ board.tilesToMask(move)
+        assert all(tile not in game.tiles for tile in move)
+        assert game.score == 45 - sum(move)
+        assert game.moveHistory == [move]
+        return
+
+    def test_turnAcceptsLists(self) -> None:
+        game = core.GameInstance()
+        moves = game.start()
+        game.turn(list(moves[0]))
+        assert game.score == 45 - sum(moves[0])
+        return
+
+    def test_turnIndex(self) -> None:
+        game = core.GameInstance()
+        moves = game.start()
+        game.turnIndex(len(moves) - 1)
+        assert game.moveHistory == [ moves[-1] ]
+        assert game.score == 45 - sum(moves[-1])
+        return
+
+    def test_invalidMoveIndex(self) -> None:
+        game = core.GameInstance()
+        moves = game.start()
+        with pytest.raises(Exception, match = "Move index .* not a possible move"):
+            game.turnIndex(len(moves))
+        return
+
     def test_firstMove(self) -> None:
         game = core.GameInstance()
-        assert game.start() != []
+        assert len(game.start()) > 0
 
     def test_fullGameTerminates(self) -> None:
         game = core.GameInstance()
@@ -60,7 +132,7 @@ class TestCore():
             iteration += 1
             if iteration > MAX_ITERATIONS:
                 raise Exception("Game did not terminate past max # of possible iterations!")
-            assert moves != []
+            assert len(moves) > 0
             moves = game.turn(moves[0])
 
         return
@@ -74,7 +146,481 @@ class TestCore():
                 print(f"Failed on iteration {iteration}")
                 raise
         return
-        
+
+    def test_resetReplaysGame(self) -> None:
+        # A reset instance should play the same games as new instances drawing from the same dice.
+        reusedGame = core.GameInstance(dice = dice.makeDice(5))
+        sharedDice = dice.makeDice(5)
+        for _ in range(3):
+            reusedGame.reset()
+            assert not reusedGame.running and reusedGame.rollCount == 0 and reusedGame.moveHistory == []
+            freshGame = core.GameInstance(dice = sharedDice)
+            for game in (reusedGame, freshGame):
+                moves = game.start()
+                while not game.finished:
+                    moves = game.turn(moves[-1])
+            assert reusedGame.rollHistory == freshGame.rollHistory
+            assert reusedGame.moveHistory == freshGame.moveHistory
+        return
+
+    def test_recordingLevels(self) -> None:
+        # Every recording level should play the same game, only keeping what its level records.
+        games = [ core.GameInstance(dice = dice.makeDice(8), recording = recording) for recording in (core.RECORD_NONE, core.RECORD_SUMMARY, core.RECORD_FULL) ]
+        for game in games:
+            moves = game.start()
+            while not game.finished:
+                moves = game.turn(moves[0])
+        noneGame, summaryGame, fullGame = games
+        assert noneGame.board == summaryGame.board == fullGame.board
+        assert noneGame.lastRollTotal == summaryGame.lastRollTotal == fullGame.lastRollTotal
+        assert noneGame.rollHistory == [] and noneGame.moveHistory == []
+        with pytest.raises(Exception, match = "Roll count is not tracked"):
+            noneGame.rollCount
+        with pytest.raises(Exception, match = "Dice faces are not tracked"):
+            noneGame.lastRoll
+        assert summaryGame.rollCount == fullGame.rollCount == len(fullGame.rollHistory)
+        assert summaryGame.lastRoll == fullGame.lastRoll
+        assert summaryGame.rollHistory == [] and summaryGame.moveHistory == []
+        assert len(fullGame.moveHistory) > 0
+        return
+
+    def test_unsupportedRecording(self) -> None:
+        with pytest.raises(Exception, match = "Unsupported recording level: 3"):
+            core.GameInstance(recording = 3)
+        return
+
+    def test_snapshotRestore(self) -> None:
+        game = core.GameInstance(dice = dice.makeDice(11))
+        game.start()
+        state = game.snapshot()
+        playedGames = []
+        for _ in range(2):
+            game.restore(state)
+            moves = game.validMoves
+            while not game.finished:
+                moves = game.turn(moves[0])
+            playedGames.append((game.board, list(game.rollHistory), list(game.moveHistory)))
+        assert playedGames[0] == playedGames[1]
+        assert len(playedGames[0][1]) > 1
+        return
+
+    def test_cloneIsIndependent(self) -> None:
+        game = core.GameInstance(dice = dice.makeDice(12))
+        game.start()
+        clone = game.clone()
+        assert clone.board == game.board and clone.validMoves is game.validMoves
+        assert clone.rollHistory == [] and clone.recording == core.RECORD_NONE
+        for playedGame in (clone, game):
+            moves = playedGame.validMoves
+            while not playedGame.finished:
+                moves = playedGame.turn(moves[0])
+        assert clone.board == game.board and clone.lastRollTotal == game.lastRollTotal
+        assert len(game.rollHistory) > 0 and clone.rollHistory == []
+        return
+
+    def test_snapshotRejectedAfterReset(self) -> None:
+        game = core.GameInstance(dice = dice.makeDice(13))
+        game.start()
+        state = game.snapshot()
+        game.reset()
+        with pytest.raises(Exception, match = "taken before the game was reset"):
+            game.restore(state)
+        return
+
+    def test_cloneKeepsSubclass(self) -> None:
+        class SubclassedGame(core.GameInstance):
+            __slots__ = ()
+        game = SubclassedGame()
+        game.start()
+        assert type(game.clone()) is SubclassedGame
+        return
+
+    def test_hasNoInstanceDict(self) -> None:
+        game = core.GameInstance()
+        assert not hasattr(game, "__dict__")
+        return
+
+class TestDice():
+    def playSeededGame(self, seed: int, *streamPath: int) -> core.GameInstance:
+        game = core.GameInstance(dice = dice.makeDice(seed, *streamPath))
+        moves = game.start()
+        while not game.finished:
+            moves = game.turn(moves[0])
+        return game
+
+    def test_seededGamesReplay(self) -> None:
+        for seed in range(20):
+            firstGame = self.playSeededGame(seed, 3)
+            secondGame = self.playSeededGame(seed, 3)
+            assert firstGame.rollHistory == secondGame.rollHistory
+            assert firstGame.moveHistory == secondGame.moveHistory
+        return
+
+    def test_streamsAreIndependent(self) -> None:
+        firstStream = dice.makeRng(7, 0)
+        secondStream = dice.makeRng(7, 1)
+        assert [ firstStream.random() for _ in range(10) ] != [ secondStream.random() for _ in range(10) ]
+        return
+
+    def test_diceAreUniform(self) -> None:
+        diceSource = dice.makeDice(11, blockSize = 64)
+        pairCounts: dict[tuple[int, int], int] = {}
+        for _ in range(36000):
+            dicePair = diceSource.roll()
+            pairCounts[dicePair] = pairCounts.get(dicePair, 0) + 1
+        assert len(pairCounts) == 36
+        assert all(800 < count < 1200 for count in pairCounts.values())
+        return
+
+    def test_lastRollKeepsFaces(self) -> None:
+        game = core.GameInstance(dice = dice.makeDice(3))
+        game.start()
+        dice1, dice2 = game.lastRoll
+        assert 1 <= dice1 <= 6 and 1 <= dice2 <= 6
+        assert game.rollHistory == [dice1 + dice2]
+        return
+
+    def test_copyRollsSameValues(self) -> None:
+        diceSource = dice.makeDice(13, blockSize = 8)
+        for _ in range(5):
+            diceSource.roll()
+        copiedDice = diceSource.copy()
+        assert [ diceSource.roll() for _ in range(50) ] == [ copiedDice.roll() for _ in range(50) ]
+        return
+
+    def test_restoreReplaysAcrossRefills(self) -> None:
+        # Snapshots share the RNG state of their buffer, and restoring one rewinds the RNG only when it is next needed.
+        diceSource = dice.makeDice(14, blockSize = 8)
+        for _ in range(3):
+            diceSource.roll()
+        state = diceSource.snapshot()
+        expectedRolls = [ diceSource.roll() for _ in range(50) ]
+        copiedDice = diceSource.copy()
+        diceSource.restore(state)
+        assert [ diceSource.roll() for _ in range(50) ] == expectedRolls
+        assert [ copiedDice.roll() for _ in range(50) ] == [ diceSource.roll() for _ in range(50) ]
+        return
+
+    def test_choicesDoNotChangeRolls(self) -> None:
+        # Players draw choices from their own RNG, which leaves the rolls of a seeded game unchanged.
+        choosingDice = dice.makeDice(15, blockSize = 8)
+        rolls = []
+        for _ in range(50):
+            choosingDice.rng.random()
+            rolls.append(choosingDice.roll())
+        seededDice = dice.makeDice(15, blockSize = 8)
+        assert rolls == [ seededDice.roll() for _ in range(50) ]
+        return
+
+    def test_generatorStreamsReplay(self) -> None:
+        firstScores, _ = batch.runBatch(batch.uniformPolicy(), 1000, rng = dice.makeGenerator(5, 2))
+        secondScores, _ = batch.runBatch(batch.uniformPolicy(), 1000, rng = dice.makeGenerator(5, 2))
+        assert (firstScores == secondScores).all()
+        return
+
+class TestBoard():
+    def test_maskRoundTrip(self) -> None:
+        for mask in range(board.loadMoveTable().boardCount):
+            assert board.tilesToMask(board.maskToTiles(mask)) == mask
+        return
+
+    def test_moveMasksMatchLists(self) -> None:
+        moveTable = board.loadMoveTable()
+        for index in range(moveTable.entryCount):
+            assert moveTable.masksAt(index) == tuple(board.tilesToMask(move) for move in moveTable.movesAt(index))
+        return
+
+    def test_movesMatchCombinations(self) -> None:
+        moveTable = board.loadMoveTable()
+        for tableBoard in range(moveTable.boardCount):
+            tiles = board.maskToTiles(tableBoard)
+            for roll in range(2, cache.MAX_ROLL + 1):
+                expectedMoves = [ move for tileCount in range(1, len(tiles) + 1) for move in combinations(tiles, tileCount) if sum(move) == roll ]
+                expectedMoves.sort(key = lambda move: (len(move), move))
+                assert moveTable.movesAt(board.tableIndex(tableBoard, roll)) == tuple(expectedMoves)
+        return
+
+    def test_artifactMatchesGenerator(self) -> None:
+        tileCount, offsets, moveMasks = cache.readMoveTable()
+        assert (tileCount, offsets, moveMasks) == (9, *cache.generateMoveTable(9))
+        return
+
+    def test_generatedLargeTable(self) -> None:
+        moveTable = board.loadMoveTable(12)
+        assert moveTable is board.loadMoveTable(12)
+        for tableBoard in (board.fullBoard(12), 0b101010101010, 0b100000000000):
+            tiles = board.maskToTiles(tableBoard)
+            for roll in range(2, cache.MAX_ROLL + 1):
+                expectedMoves = [ move for tileCount in range(1, len(tiles) + 1) for move in combinations(tiles, tileCount) if sum(move) == roll ]
+                expectedMoves.sort(key = lambda move: (len(move), move))
+                assert moveTable.movesAt(board.tableIndex(tableBoard, roll)) == tuple(expectedMoves)
+        return
+
+    def test_unsupportedTileCount(self) -> None:
+        with pytest.raises(Exception, match = "is not supported by the move table"):
+            board.loadMoveTable(board.MAX_TILE_COUNT + 1)
+        return
+
+    def test_movesAreInterned(self) -> None:
+        moveTable = board.loadMoveTable()
+        firstMoves = moveTable.movesAt(board.tableIndex(0b11, 3))
+        secondMoves = moveTable.movesAt(board.tableIndex(0b111, 3))
+        assert firstMoves == ((1, 2),)
+        assert secondMoves == ((3,), (1, 2))
+        assert firstMoves[0] is secondMoves[1]
+        assert moveTable.movesAt(board.tableIndex(0b11, 3)) is firstMoves
+        return
+
+    def test_smallTablesArePrefixes(self) -> None:
+        fullTable = board.loadMoveTable(9)
+        smallTable = board.loadMoveTable(5)
+        assert smallTable.boardCount == 32
+        assert smallTable.offsets == fullTable.offsets[:smallTable.entryCount + 1]
+        assert all(smallTable.masksAt(index) == fullTable.masksAt(index) for index in range(smallTable.entryCount))
+        return
+
+    def test_artifactIsMapped(self) -> None:
+        moveTable = board.loadMoveTable()
+        assert isinstance(moveTable.offsets, memoryview) and moveTable.offsets.readonly
+        assert isinstance(moveTable.moveMasks, memoryview) and moveTable.moveMasks.readonly
+        return
+
+    def test_useMoveTableFile(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "moves.bin")
+            cache.writeMoveTable(path, 10)
+            try:
+                board.useMoveTableFile(path)
+                assert board.artifactTileCount() == 10
+                moveTable = board.loadMoveTable(10)
+                assert isinstance(moveTable.offsets, memoryview)
+                assert moveTable.offsets == cache.generateMoveTable(10)[0]
+            finally:
+                board.useMoveTableFile(cache.ARTIFACT_PATH)
+        return
+
+    def test_policyTableRoundTrip(self) -> None:
+        policy = batch.uniformPolicy(4)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "policy.npy")
+            cache.writePolicyTable(path, policy)
+            sharedPolicy = cache.readPolicyTable(path)
+            assert isinstance(sharedPolicy, np.memmap)
+            assert not sharedPolicy.flags.writeable
+            assert (sharedPolicy == policy).all()
+            del sharedPolicy
+        return
+
+
+class TestCheckpoint():
+    def test_roundTrip(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "checkpoint.json")
+            savedCheckpoint = checkpoint.Checkpoint(path, { "seed": 3, "tiles": 9 })
+            savedCheckpoint.state["totalScore"] = 12345678901234567890
+            savedCheckpoint.save({ "counts": np.arange(10) })
+            loadedCheckpoint = checkpoint.Checkpoint.load(path)
+            assert loadedCheckpoint.config == { "seed": 3, "tiles": 9 }
+            assert loadedCheckpoint.state == { "totalScore": 12345678901234567890 }
+            assert (loadedCheckpoint.loadTable("counts") == np.arange(10)).all()
+            assert not os.path.exists(f"{path}.tmp")
+
+            # Each save writes a new table file, and removes the one it replaces.
+            firstTablePath = loadedCheckpoint.tablePath("counts")
+            loadedCheckpoint.save({ "counts": np.arange(5) })
+            assert not os.path.exists(firstTablePath)
+            assert (checkpoint.Checkpoint.load(path).loadTable("counts") == np.arange(5)).all()
+        return
+
+    def test_requireConfig(self) -> None:
+        savedCheckpoint = checkpoint.Checkpoint("unused.json", { "seed": 3, "tiles": 9 })
+        savedCheckpoint.requireConfig({ "seed": 3 })
+        with pytest.raises(Exception, match = "was made with tiles = 9, not 10"):
+            savedCheckpoint.requireConfig({ "seed": 3, "tiles": 10 })
+        return
+
+    def test_saveIfDue(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "checkpoint.json")
+            assert not checkpoint.Checkpoint(path, {}, interval = 3600.0).saveIfDue()
+            assert not os.path.exists(path)
+            assert checkpoint.Checkpoint(path, {}, interval = 0.0).saveIfDue()
+            assert os.path.exists(path)
+        return
+
+class TestStats():
+    def test_matchesDirectStatistics(self) -> None:
+        scores, rollCounts = batch.runBatch(solver.solveOptimal(9)[1], 5000, rng = dice.makeGenerator(1))
+        gameStats = stats.RunStats()
+        for score, rollCount in zip(scores.tolist(), rollCounts.tolist()):
+            gameStats.addGame(score, rollCount)
+        assert gameStats.count == 5000
+        assert abs(gameStats.mean - scores.mean()) < 1e-9
+        assert abs(gameStats.variance - scores.var(ddof = 1)) < 1e-9
+        assert gameStats.scoreCounts == np.bincount(scores, minlength = 46).tolist()
+        assert gameStats.rollCounts == np.bincount(rollCounts, minlength = 10).tolist()
+        assert gameStats.perfectGames == int((scores == 0).sum())
+        return
+
+    def test_batchesAndMergesMatchGames(self) -> None:
+        scores, rollCounts = batch.runBatch(batch.uniformPolicy(9), 3000, rng = dice.makeGenerator(2))
+        gameStats = stats.RunStats()
+        for score, rollCount in zip(scores.tolist(), rollCounts.tolist()):
+            gameStats.addGame(score, rollCount)
+
+        # Split the same games across two batches and merge them, as workers and checkpoints do.
+        firstStats = stats.RunStats()
+        firstStats.addBatch(scores[:1000], rollCounts[:1000])
+        secondStats = stats.RunStats()
+        secondStats.addBatch(scores[1000:], rollCounts[1000:])
+        mergedStats = stats.RunStats.fromDict(firstStats.toDict()).merge(secondStats)
+        assert mergedStats.count == gameStats.count
+        assert abs(mergedStats.mean - gameStats.mean) < 1e-9
+        assert abs(mergedStats.variance - gameStats.variance) < 1e-9
+        assert mergedStats.scoreCounts == gameStats.scoreCounts
+        assert mergedStats.rollCounts == gameStats.rollCounts
+        assert firstStats.count == 1000
+        return
+
+    def test_intervalsCoverExactResults(self) -> None:
+        policy = solver.solveOptimal(9)[1]
+        expectedScore, perfectChance = solver.evaluatePolicy(policy, 9)
+        runStats = stats.RunStats()
+        runStats.addBatch(*batch.runBatch(policy, 200000, rng = dice.makeGenerator(3)))
+        scoreLow, scoreHigh = runStats.meanInterval(0.999)
+        perfectLow, perfectHigh = runStats.perfectInterval(0.999)
+        assert scoreLow < expectedScore < scoreHigh
+        assert perfectLow < perfectChance < perfectHigh
+        assert runStats.meanInterval(0.5)[1] < scoreHigh
+        return
+
+    def test_withinPrecision(self) -> None:
+        runStats = stats.RunStats()
+        runStats.addBatch(*batch.runBatch(solver.solveOptimal(9)[1], 10000, rng = dice.makeGenerator(4)))
+        scoreLow, scoreHigh = runStats.meanInterval(0.9)
+        perfectLow, perfectHigh = runStats.perfectInterval(0.9)
+        assert not runStats.withinPrecision()
+        assert runStats.withinPrecision(precision = (scoreHigh - scoreLow) / 2 + 1e-9, confidence = 0.9)
+        assert not runStats.withinPrecision(precision = (scoreHigh - scoreLow) / 2 - 1e-9, confidence = 0.9)
+        assert runStats.withinPrecision(perfectPrecision = (perfectHigh - perfectLow) / 2 + 1e-9, confidence = 0.9)
+        assert not runStats.withinPrecision(precision = 1.0, perfectPrecision = 0.001, confidence = 0.9)
+        return
+
+    def test_mergeRejectsOtherTileCounts(self) -> None:
+        with pytest.raises(Exception, match = "Cannot merge statistics for 9 and 5 tiles"):
+            stats.RunStats(9).merge(stats.RunStats(5))
+        return
+
+class TestBatch():
+    def test_emptyPolicyStopsImmediately(self) -> None:
+        scores, rollCounts = batch.runBatch(batch.emptyPolicy(), 100)
+        assert (scores == 45).all()
+        assert (rollCounts == 1).all()
+        return
+
+    def test_firstMovePolicy(self) -> None:
+        # Build a policy that always takes the first valid move, as in test_fullGameTerminates.
+        policy = batch.emptyPolicy().reshape(-1)
+        moveTable = board.loadMoveTable()
+        for index in range(moveTable.entryCount):
+            if moveTable.moveCount(index) > 0:
+                policy[index] = moveTable.masksAt(index)[0]
+        scores, rollCounts = batch.runBatch(policy.reshape(-1, board.ROLL_SLOTS), 1000, rng = np.random.default_rng(0))
+        assert scores.max() <= 45
+        assert rollCounts.min() >= 1
+        assert rollCounts.max() <= 9
+        return
+
+    def test_uniformPolicyIsNormalized(self) -> None:
+        probabilities = batch.uniformPolicy().reshape(-1, batch.moveArrays()[0].shape[1])
+        _, counts = batch.moveArrays()
+        assert np.allclose(probabilities.sum(axis = 1), counts > 0)
+        return
+
+    def test_iteratorCoversLimit(self) -> None:
+        chunks = list(batch.runBatchIterator(batch.uniformPolicy(), 2500, chunkSize = 1000))
+        assert [ len(scores) for scores, _ in chunks ] == [1000, 1000, 500]
+        return
+
+    def test_highTilePolicyMatchesExact(self) -> None:
+        # From 13 tiles up, a shifted board no longer fits in 16 bits. Play the first move only while tile 13 is up,
+        # so that reading the wrong policy row would end games early.
+        TILE_COUNT: int = 13
+        policy = batch.emptyPolicy(TILE_COUNT).reshape(-1)
+        moveTable = board.loadMoveTable(TILE_COUNT)
+        for index in range(moveTable.entryCount):
+            if (index >> 4) & (1 << (TILE_COUNT - 1)) and moveTable.moveCount(index) > 0:
+                policy[index] = moveTable.masksAt(index)[0]
+        policy = policy.reshape(-1, board.ROLL_SLOTS)
+        expectedScore, _ = solver.evaluatePolicy(policy, TILE_COUNT)
+        scores, _ = batch.runBatch(policy, 20000, TILE_COUNT, rng = dice.makeGenerator(5))
+        assert abs(scores.mean() - expectedScore) < 0.5
+        return
+
+class TestSolver():
+    def test_singleTileValues(self) -> None:
+        values, _ = solver.solveOptimal()
+        assert abs(values[board.tilesToMask([1])] - 1) < 1e-12
+        assert abs(values[board.tilesToMask([2])] - 2 * (35 / 36)) < 1e-12
+        return
+
+    def test_fullBoardValue(self) -> None:
+        values, policy = solver.solveOptimal()
+        assert abs(values[board.fullBoard(9)] - 11.1575) < 1e-4
+        assert not policy.flags.writeable
+        return
+
+    def test_policyIsBestMove(self) -> None:
+        values, policy = solver.solveOptimal()
+        moveTable = board.loadMoveTable()
+        for index in range(moveTable.entryCount):
+            masks = moveTable.masksAt(index)
+            if masks:
+                tableBoard = index >> 4
+                bestValue = min(values[tableBoard ^ move] for move in masks)
+                assert values[tableBoard ^ int(policy.reshape(-1)[index])] == bestValue
+        return
+
+    def test_evaluateOptimalPolicy(self) -> None:
+        values, policy = solver.solveOptimal()
+        expectedScore, perfectChance = solver.evaluatePolicy(policy)
+        assert abs(expectedScore - values[board.fullBoard(9)]) < 1e-9
+        assert 0 < perfectChance < 1
+        return
+
+    def test_evaluateEmptyPolicy(self) -> None:
+        expectedScore, perfectChance = solver.evaluatePolicy(batch.emptyPolicy())
+        assert abs(expectedScore - 45) < 1e-9
+        assert perfectChance == 0
+        return
+
+    def test_transitionsSumToOne(self) -> None:
+        transitions = solver.policyTransitions(batch.uniformPolicy())
+        for outcomes in transitions[1:]:
+            assert abs(sum(probability for _, probability in outcomes) - 1) < 1e-9
+        return
+
+    def test_distributionsMatchEvaluation(self) -> None:
+        policy = batch.uniformPolicy()
+        expectedScore, perfectChance = solver.evaluatePolicy(policy)
+        scorePmf, rollPmf = solver.outcomeDistributions(policy)
+        assert abs(sum(scorePmf) - 1) < 1e-9
+        assert abs(sum(rollPmf) - 1) < 1e-9
+        assert abs(solver.pmfMean(scorePmf) - expectedScore) < 1e-9
+        assert abs(scorePmf[0] - perfectChance) < 1e-9
+        assert rollPmf[0] == 0
+        return
+
+    def test_pmfStatistics(self) -> None:
+        pmf = [ 0.25, 0.5, 0.25 ]
+        assert solver.pmfMean(pmf) == 1
+        assert solver.pmfVariance(pmf) == 0.5
+        assert solver.pmfQuantile(pmf, 0.25) == 0
+        assert solver.pmfQuantile(pmf, 0.5) == 1
+        assert solver.pmfQuantile(pmf, 1) == 2
+        return
+
+
 # MAIN ENTRY.
 def main() -> None:
     raise NotImplementedError
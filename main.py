@@ -1,21 +1,37 @@
 # main.py
 # Desc: Main file for the shut-the-box-optimization project.
 # Author: Noah Black (noah.black0425@gmail.com)
-# Last Updated: June 21st, 2025
+# Last Updated: October 17th, 2026
 
 
 import argparse
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import cache
 from typing import Generator, Type
 # THIRD-PARTY IMPORTS.
+import numpy as np
 import tqdm
 # LOCAL IMPORTS.
 import player
+import game.batch as batch
+import game.board as board
+import game.cache as tableCache
+import game.checkpoint as checkpoint
 import game.core as core
+import game.dice as dice
+import game.solver as solver
+import game.stats as stats
 # NATIVE IMPORTS.
 
 
 # CONSTANTS.
 DEFAULT_ITERATIONS: int = 100000
+SHARD_SIZE: int = 10000
+BATCH_SHARD_SIZE: int = 250000
+# Precision targets are checked once per shard, so batch runs with a target use smaller shards to stop promptly.
+PRECISION_BATCH_SHARD_SIZE: int = 10000
 PLAYER_TYPES: dict[str, Type[player.PlayerInterface]] = {
     "manual":                player.ManualPlayer,
     "random":                player.RandomPlayer,
@@ -23,40 +39,228 @@ PLAYER_TYPES: dict[str, Type[player.PlayerInterface]] = {
     "largest-preserve-low":  player.LargePreserveLowPlayer,
     "most-then-small":       player.MostThenSmall,
     "most-then-large":       player.MostThenLarge,
+    "optimal":               player.OptimalPlayer,
+    "rollout":               player.RolloutPlayer,
+    "trained":               player.TrainedInterface,
+    "q-learning":            player.QLearningInterface,
 }
+# Players left out of compare. Manual players need a user, and rollout players are too slow for full comparisons.
+COMPARE_EXCLUDED: tuple[str, ...] = ("manual", "rollout")
 
 
 # FUNCTIONS.
-def runGame(player: player.PlayerInterface, **gameKwargs) -> core.GameInstance:
-    # Instantiate a new game using provided args.
-    newGame = core.GameInstance(**gameKwargs)
+def runGame(player: player.PlayerInterface, game: core.GameInstance | None = None, **gameKwargs) -> core.GameInstance:
+    # Reset the given game in place, or instantiate a new game using provided args. Games for trusted players skip
+    # move validation.
+    if game is not None:
+        game.reset()
+        newGame = game
+    else:
+        newGame = core.GameInstance(trusted = player.trusted, **gameKwargs)
 
     # Run the game until finished.
     moveList = newGame.start()
     while newGame.running and not newGame.finished:
         # If no moves are available, force an exit.
-        if moveList == []:
+        if len(moveList) == 0:
             break
 
-        # Select a move and play.
-        selectedMove = player.select(newGame)
-        moveList = newGame.turn(selectedMove)
+        # Select a move and play. Trusted players pick by position, which the game can apply directly.
+        if player.trusted:
+            moveList = newGame.turnIndex(player.selectIndex(newGame))
+        else:
+            selectedMove = player.select(newGame)
+            moveList = newGame.turn(selectedMove)
     
     # Return the completed game object.
     return newGame
 
-def runGameIterator(playerClass: Type[player.PlayerInterface], limit: int | None = None, **gameKwargs) -> Generator[core.GameInstance, None, None]:
-    # Initialize the player used during runs.
-    runPlayer = playerClass()
+def runGameIterator(playerClass: Type[player.PlayerInterface], limit: int | None = None, reuse: bool = False, playerOptions: dict | None = None, **gameKwargs) -> Generator[core.GameInstance, None, None]:
+    # Initialize the player used during runs. When reusing, every game is played on one instance that is reset
+    # in place, so callers must not keep a reference to a game past the next iteration.
+    runPlayer = playerClass(**(playerOptions or {}))
+    sharedGame = core.GameInstance(trusted = runPlayer.trusted, **gameKwargs) if reuse else None
 
     # Run game iterations and yield each resulting game.
     iteration = 0
     while True:
         if iteration == limit:
             return
-        yield runGame(runPlayer, **gameKwargs)
+        yield runGame(runPlayer, sharedGame, **gameKwargs)
         iteration += 1
 
+@cache
+def playerPolicy(playerClass: Type[player.PlayerInterface], tileCount: int = 9, optionItems: tuple = ()) -> np.ndarray | None:
+    # Compile each player at most once per process, returning None for players that cannot be compiled.
+    # Player options are passed as sorted (name, value) pairs, so that they can be cached.
+    try:
+        return player.compilePolicy(playerClass(**dict(optionItems)), tileCount)
+    except Exception:
+        return None
+
+@cache
+def sharedPolicy(policyPath: str) -> np.ndarray:
+    # Map a policy table written by the parent process, once per worker.
+    return tableCache.readPolicyTable(policyPath)
+
+def initWorker(moveTablePath: str | None = None) -> None:
+    # Point a pool worker at the move table written for the pool, so every worker maps the same pages.
+    if moveTablePath is not None:
+        board.useMoveTableFile(moveTablePath)
+
+def runShard(playerClass: Type[player.PlayerInterface], count: int, useBatch: bool = False, seed: int | None = None, shardIndex: int = 0, tileCount: int = 9, policyPath: str | None = None, playerOptions: dict | None = None) -> stats.RunStats:
+    # Run a single shard of games and accumulate the results. Each shard draws from its own stream of the root seed.
+    shardStats = stats.RunStats(tileCount)
+    if useBatch:
+        policy = sharedPolicy(policyPath) if policyPath is not None else playerPolicy(playerClass, tileCount, tuple(sorted((playerOptions or {}).items())))
+        for scores, rollCounts in batch.runBatchIterator(policy, count, tileCount = tileCount, rng = dice.makeGenerator(seed, shardIndex)):
+            shardStats.addBatch(scores, rollCounts)
+    else:
+        # Summary recording keeps the roll count of each game, without keeping every roll and move.
+        for game in runGameIterator(playerClass, limit = count, reuse = True, playerOptions = playerOptions, tileCount = tileCount, dice = dice.makeDice(seed, shardIndex), recording = core.RECORD_SUMMARY):
+            shardStats.addGame(game.score, game.rollCount)
+
+    return shardStats
+
+def runTotals(playerClass: Type[player.PlayerInterface], iterations: int, useBatch: bool = False, workers: int = 1, seed: int | None = None, tileCount: int = 9, playerOptions: dict | None = None, progress: dict | None = None, runCheckpoint: checkpoint.Checkpoint | None = None, precision: float | None = None, perfectPrecision: float | None = None, confidence: float = stats.DEFAULT_CONFIDENCE) -> stats.RunStats:
+    # Use the batch simulator when requested, as long as the player can be compiled into a policy table.
+    optionItems = tuple(sorted((playerOptions or {}).items()))
+    if useBatch and playerPolicy(playerClass, tileCount, optionItems) is None:
+        print(f"Player {playerClass.__name__} cannot be compiled into a policy table, running games individually.")
+        useBatch = False
+
+    # Split the iterations into fixed-size shards. Shard sizes never depend on the worker count, so a seeded run
+    # plays the same dice in every shard no matter how many workers are used.
+    hasTarget = (precision is not None or perfectPrecision is not None)
+    shardSize = (PRECISION_BATCH_SHARD_SIZE if hasTarget else BATCH_SHARD_SIZE) if useBatch else SHARD_SIZE
+    shards = [ min(shardSize, iterations - shardStart) for shardStart in range(0, iterations, shardSize) ]
+
+    # Skip any shards already completed in the given progress, which is updated in place as shards finish. Every
+    # shard draws from its own stream of the root seed, so a resumed run plays exactly the games that were left.
+    progress = progress if progress is not None else {}
+    completedShards = set(progress.setdefault("completedShards", []))
+    runStats = stats.RunStats.fromDict(progress["stats"]) if "stats" in progress else stats.RunStats(tileCount)
+    pendingShards = [ (shardIndex, count) for shardIndex, count in enumerate(shards) if shardIndex not in completedShards ]
+    if runStats.withinPrecision(precision, perfectPrecision, confidence):
+        pendingShards = []
+
+    # With precision targets, iterations is only an upper bound. Shards are merged strictly in order, holding back any
+    # that finish early, and the run stops at the first shard that meets every target. A seeded run therefore stops
+    # after the same games no matter how many workers are used.
+    finishedShards: dict[int, stats.RunStats] = {}
+    mergePosition = 0
+
+    def recordShard(shardIndex: int, shardStats: stats.RunStats) -> bool:
+        # Add finished shards to the progress in order, and checkpoint them if one is due. Returns whether to stop.
+        nonlocal runStats, mergePosition
+        finishedShards[shardIndex] = shardStats
+        isPrecise = False
+        while not isPrecise and mergePosition < len(pendingShards) and pendingShards[mergePosition][0] in finishedShards:
+            mergedIndex = pendingShards[mergePosition][0]
+            runStats = runStats.merge(finishedShards.pop(mergedIndex))
+            progress["stats"] = runStats.toDict()
+            progress["completedShards"].append(mergedIndex)
+            mergePosition += 1
+            isPrecise = runStats.withinPrecision(precision, perfectPrecision, confidence)
+        if runCheckpoint is not None:
+            runCheckpoint.saveIfDue()
+        return isPrecise
+
+    # Run all shards and merge the results, reporting progress on a single bar.
+    with tqdm.tqdm(total = iterations, initial = iterations - sum(count for _, count in pendingShards)) as progressBar:
+        if workers > 1:
+            # Write the tables every worker needs once, so workers map them read-only instead of each building a copy.
+            with tempfile.TemporaryDirectory() as sharedDirectory:
+                moveTablePath = None
+                if tileCount > board.artifactTileCount():
+                    moveTablePath = os.path.join(sharedDirectory, "moves.bin")
+                    tableCache.writeMoveTable(moveTablePath, tileCount)
+                policyPath = None
+                if useBatch:
+                    policyPath = os.path.join(sharedDirectory, "policy.npy")
+                    tableCache.writePolicyTable(policyPath, playerPolicy(playerClass, tileCount, optionItems))
+
+                with ProcessPoolExecutor(max_workers = workers, initializer = initWorker, initargs = (moveTablePath,)) as executor:
+                    futures = { executor.submit(runShard, playerClass, count, useBatch, seed, shardIndex, tileCount, policyPath, playerOptions): (shardIndex, count) for shardIndex, count in pendingShards }
+                    for future in as_completed(futures):
+                        shardIndex, count = futures[future]
+                        progressBar.update(count)
+                        if recordShard(shardIndex, future.result()):
+                            executor.shutdown(wait = False, cancel_futures = True)
+                            break
+        else:
+            for shardIndex, count in pendingShards:
+                progressBar.update(count)
+                if recordShard(shardIndex, runShard(playerClass, count, useBatch, seed, shardIndex, tileCount, playerOptions = playerOptions)):
+                    break
+
+    if runCheckpoint is not None:
+        runCheckpoint.save()
+    return runStats
+
+def exactResults(playerClass: Type[player.PlayerInterface], tileCount: int = 9, playerOptions: dict | None = None) -> tuple[float, float]:
+    # Compile the player, then evaluate its policy over every game state instead of sampling games.
+    policy = player.compilePolicy(playerClass(**(playerOptions or {})), tileCount)
+    return solver.evaluatePolicy(policy, tileCount)
+
+def distributionAsStr(name: str, pmf: list[float], showPmf: bool = False) -> str:
+    # Summarize the distribution, then optionally list the probability of every possible value.
+    output = (
+        f"{name}: mean {solver.pmfMean(pmf):.4f}, std. dev. {solver.pmfVariance(pmf) ** 0.5:.4f}, "
+        f"quartiles {solver.pmfQuantile(pmf, 0.25)} / {solver.pmfQuantile(pmf, 0.5)} / {solver.pmfQuantile(pmf, 0.75)}, "
+        f"5-95% {solver.pmfQuantile(pmf, 0.05)} - {solver.pmfQuantile(pmf, 0.95)}"
+    )
+    if showPmf:
+        for value, probability in enumerate(pmf):
+            if probability > 0:
+                output += f"\n  {value:>3}  {probability * 100:>8.4f}%"
+    return output
+
+def resolveSeed(specifiedSeed: int | None = None) -> int:
+    # Draw a root seed when none is given, and report it so that any run can be replayed.
+    seed = specifiedSeed if specifiedSeed is not None else dice.newSeed()
+    print(f"Using seed: {seed}")
+    return seed
+
+def playerOptionsFor(playerClass: Type[player.PlayerInterface], **kwargs) -> dict:
+    # Collect constructor options from the command line for the selected player, if it takes them.
+    if playerClass is player.RolloutPlayer:
+        return { "rollouts": kwargs.get("rollouts", None) or None, "moveTime": kwargs.get("move_time", None), "rolloutPolicy": kwargs.get("rollout_policy", "largest-first") }
+    if issubclass(playerClass, player.TablePlayer):
+        return { "tableFile": kwargs.get("table", None) }
+    return {}
+
+def playerIsReady(playerClass: Type[player.PlayerInterface], tileCount: int = 9, **kwargs) -> bool:
+    # Trained players can only play once a table has been trained for the tile count.
+    if issubclass(playerClass, player.TablePlayer):
+        return os.path.exists(playerClass(**playerOptionsFor(playerClass, **kwargs)).tablePath(tileCount))
+    return True
+
+def runSeed(**kwargs) -> int:
+    # Use the given seed, falling back to the seed of the run being resumed before drawing a new one.
+    seed = kwargs.get("seed", None)
+    if seed is None and kwargs.get("resume", False):
+        seed = checkpoint.Checkpoint.load(kwargs.get("checkpoint", None) or checkpoint.DEFAULT_CHECKPOINT_PATH).config.get("seed", None)
+    return resolveSeed(seed)
+
+def openCheckpoint(config: dict, **kwargs) -> checkpoint.Checkpoint | None:
+    # Continue the checkpoint being resumed, as long as it was made with the same settings, or start a new one.
+    checkpointPath = kwargs.get("checkpoint", None)
+    interval = kwargs.get("checkpoint_interval", checkpoint.DEFAULT_CHECKPOINT_INTERVAL)
+    if kwargs.get("resume", False):
+        runCheckpoint = checkpoint.Checkpoint.load(checkpointPath or checkpoint.DEFAULT_CHECKPOINT_PATH, interval = interval)
+        runCheckpoint.requireConfig(config)
+        print(f"Resuming from checkpoint: {runCheckpoint.path}")
+        return runCheckpoint
+    if checkpointPath is not None:
+        return checkpoint.Checkpoint(checkpointPath, config, interval = interval)
+    return None
+
+def precisionTargets(**kwargs) -> tuple[float | None, float | None, float]:
+    # Read precision targets from the command line. Perfect game precision is given in percentage points.
+    perfectPrecision = kwargs.get("perfect_precision", None)
+    return kwargs.get("precision", None), perfectPrecision / 100 if perfectPrecision is not None else None, kwargs.get("confidence", stats.DEFAULT_CONFIDENCE)
+
 def selectPlayer(specifiedPlayer: str | None = None) -> Type[player.PlayerInterface]:
     # If given from function inputs, verify specified player.
     if specifiedPlayer != None:
@@ -99,8 +303,9 @@ def simple(**kwargs) -> int:
     """
     # Run a single game and store the resulting game object.
     playerClass = selectPlayer(kwargs.get("player", None))
-    gamePlayer = playerClass()
-    game = runGame(gamePlayer)
+    gamePlayer = playerClass(**playerOptionsFor(playerClass, **kwargs))
+    seed = kwargs.get("seed", None)
+    game = runGame(gamePlayer, tileCount = kwargs.get("tiles", 9), dice = dice.makeDice(seed) if seed is not None else None)
 
     # Print one final round, if required, then a round summary.
     if isinstance(gamePlayer, player.ManualPlayer):
@@ -123,7 +328,8 @@ def iterate(**kwargs) -> int:
 
     # Start an iterator for continuous games.
     print("Starting games...")
-    for gameIndex, game in enumerate(runGameIterator(playerClass)):
+    seed = kwargs.get("seed", None)
+    for gameIndex, game in enumerate(runGameIterator(playerClass, reuse = True, playerOptions = playerOptionsFor(playerClass, **kwargs), tileCount = kwargs.get("tiles", 9), dice = dice.makeDice(seed) if seed is not None else None)):
         # Check if the current game was successful. If so, break from the loop.
         if game.finished and game.score == 0:
             break
@@ -151,24 +357,46 @@ def run(**kwargs) -> int:
     # Propmt the user to select the player they want to use.
     playerClass = selectPlayer(kwargs.get("player", None))
 
+    # In exact mode, skip sampling entirely and report the true results of the player.
+    if kwargs.get("exact", False):
+        print("Evaluating player over all game states...")
+        tileCount = kwargs.get("tiles", 9)
+        policy = player.compilePolicy(playerClass(**playerOptionsFor(playerClass, **kwargs)), tileCount)
+        expectedScore, perfectChance = solver.evaluatePolicy(policy, tileCount)
+        scorePmf, rollPmf = solver.outcomeDistributions(policy, tileCount)
+        print("Evaluation completed!")
+        print()
+        print(f"Player used: {playerClass.__name__}")
+        print(f"Expected score: {expectedScore:.4f}")
+        print(f"Perfect game chance: {perfectChance * 100:.4f}%")
+        print(distributionAsStr("Final score", scorePmf, kwargs.get("distribution", False)))
+        print(distributionAsStr("Roll count", rollPmf, kwargs.get("distribution", False)))
+        return 0
+
     # Start iterating and store all results.
-    print(f"Running {iterations} games...")
-    totalScore = 0
-    perfectGames = 0
-    for game in tqdm.tqdm(runGameIterator(playerClass, limit = iterations), total = iterations):
-        totalScore += game.score
-        if game.score == 0:
-            perfectGames += 1
+    print(f"Running {'up to ' if kwargs.get('precision', None) is not None or kwargs.get('perfect_precision', None) is not None else ''}{iterations} games...")
+    seed = runSeed(**kwargs)
+    playerOptions = playerOptionsFor(playerClass, **kwargs)
+    precision, perfectPrecision, confidence = precisionTargets(**kwargs)
+    runCheckpoint = openCheckpoint({ "command": "run", "player": playerClass.__name__, "playerOptions": playerOptions, "iterations": iterations, "tiles": kwargs.get("tiles", 9), "batch": kwargs.get("batch", False), "seed": seed, "precision": precision, "perfectPrecision": perfectPrecision, "confidence": confidence }, **kwargs)
+    progress = runCheckpoint.state.setdefault("progress", {}) if runCheckpoint is not None else None
+    runStats = runTotals(playerClass, iterations, kwargs.get("batch", False), kwargs.get("workers", 1), seed, kwargs.get("tiles", 9), playerOptions, progress, runCheckpoint, precision, perfectPrecision, confidence)
     
     print("Analyzing games...")
-    avgScore = totalScore / iterations
+    scoreLow, scoreHigh = runStats.meanInterval(confidence)
+    perfectLow, perfectHigh = runStats.perfectInterval(confidence)
+    confidenceAsStr = f"{confidence * 100:g}% CI"
 
     # Print an analysis of the completed games.
     print("Run completed!")
     print()
     print(f"Player used: {playerClass.__name__}")
-    print(f"Average score: {avgScore:.2f}")
-    print(f"Perfect games: {perfectGames}/{iterations} ({(perfectGames/iterations) * 100:.2f}%)")
+    if runStats.count < iterations:
+        print(f"Reached the target precision after {runStats.count}/{iterations} games.")
+    print(f"Average score: {runStats.mean:.2f} ({confidenceAsStr} {scoreLow:.2f} - {scoreHigh:.2f})")
+    print(f"Perfect games: {runStats.perfectGames}/{runStats.count} ({runStats.perfectRate * 100:.2f}%, {confidenceAsStr} {perfectLow * 100:.2f}% - {perfectHigh * 100:.2f}%)")
+    print(distributionAsStr("Final score", runStats.scorePmf(), kwargs.get("distribution", False)))
+    print(distributionAsStr("Roll count", runStats.rollPmf(), kwargs.get("distribution", False)))
 
     # Return once complete.
     return 0
@@ -181,53 +409,123 @@ def compare(**kwargs) -> int:
     :return: Return code
     :rtype: int
     """
+    # Every table player plays its own default table, since one table file cannot belong to all of them.
+    if kwargs.get("table", None) is not None:
+        raise Exception("Compare plays each table player with its default table, and does not accept --table.")
+
     # Get the # of iterations from provided args.
     iterations = kwargs.get("number", DEFAULT_ITERATIONS)
 
     # Initialize player fields.
-    totalScoreDict = {}
-    perfectGamesDict = {}
-    for playerName in PLAYER_TYPES.keys():
-        if playerName == "manual":
+    statsDict = {}
+    for playerName, playerClass in PLAYER_TYPES.items():
+        if playerName in COMPARE_EXCLUDED:
+            continue
+        if not playerIsReady(playerClass, kwargs.get("tiles", 9), **kwargs):
+            print(f"Skipping player {playerClass.__name__}, which has not been trained for {kwargs.get('tiles', 9)} tiles.")
             continue
-        totalScoreDict[playerName] = 0
-        perfectGamesDict[playerName] = 0
+        statsDict[playerName] = None
 
-    # Iterate over all player types and respective classes.
+    # In exact mode, evaluate every player directly and print results without game counts.
+    if kwargs.get("exact", False):
+        print("Evaluating all player types over all game states...")
+        print()
+        COLUMNS = [ "Player", "Expected Score", "Perfect Game %" ]
+        print(f"{COLUMNS[0]:<25} {COLUMNS[1]:<25} {COLUMNS[2]:<25}")
+        print("-" * 85)
+        for playerName in statsDict.keys():
+            expectedScore, perfectChance = exactResults(PLAYER_TYPES[playerName], kwargs.get("tiles", 9), playerOptionsFor(PLAYER_TYPES[playerName], **kwargs))
+            print(f"{playerName:<25} {expectedScore:<25.4f} {f'{perfectChance * 100:.4f}%':<25}")
+        return 0
+
+    # Iterate over all player types and respective classes. Every player sees the same dice streams.
     print("Running games for all player types...")
+    seed = runSeed(**kwargs)
+    precision, perfectPrecision, confidence = precisionTargets(**kwargs)
+    runCheckpoint = openCheckpoint({ "command": "compare", "players": list(statsDict.keys()), "iterations": iterations, "tiles": kwargs.get("tiles", 9), "batch": kwargs.get("batch", False), "seed": seed, "precision": precision, "perfectPrecision": perfectPrecision, "confidence": confidence }, **kwargs)
     print()
-    for playerName, playerClass in PLAYER_TYPES.items():
-        # If this player is manual, skip it.
-        if playerName == "manual":
-            continue
-            
-        # Run games with the current player for all iterations.
+    for playerName in statsDict.keys():
+        # Run games with the current player for all iterations, keeping each player's progress in the checkpoint.
+        playerClass = PLAYER_TYPES[playerName]
         print(f"Running player {playerClass.__name__}")
-        for game in tqdm.tqdm(runGameIterator(playerClass, limit = iterations), total = iterations):
-            totalScoreDict[playerName] += game.score
-            if game.score == 0:
-                perfectGamesDict[playerName] += 1
+        progress = runCheckpoint.state.setdefault(playerName, {}) if runCheckpoint is not None else None
+        statsDict[playerName] = runTotals(playerClass, iterations, kwargs.get("batch", False), kwargs.get("workers", 1), seed, kwargs.get("tiles", 9), playerOptionsFor(playerClass, **kwargs), progress, runCheckpoint, precision, perfectPrecision, confidence)
 
     # Once complete, print table of results.
     print("Runs complete!")
     print()
-    COLUMNS = [ "Player", "Avg. Score", "Perfect Games", "Perfect Game %" ]
-    print(f"{COLUMNS[0]:<25} {COLUMNS[1]:<25} {COLUMNS[2]:<25} {COLUMNS[3]:<25}")
-    print("-" * 110)
-    for playerName in totalScoreDict.keys():
+    print(f"Ranges are {confidence * 100:g}% confidence intervals.")
+    COLUMNS = [ "Player", "Avg. Score", "Std. Dev.", "Games", "Perfect Games", "Perfect Game %" ]
+    print(f"{COLUMNS[0]:<25} {COLUMNS[1]:<25} {COLUMNS[2]:<12} {COLUMNS[3]:<12} {COLUMNS[4]:<15} {COLUMNS[5]:<25}")
+    print("-" * 120)
+    for playerName, runStats in statsDict.items():
         # Determine player stats + format.
-        avgScore = totalScoreDict[playerName] / iterations
-        avgScoreAsStr = f"{avgScore:.2f}"
-        perfGameCount = perfectGamesDict[playerName]
-        perfGamePercent = (perfGameCount / iterations) * 100
-        perfGamePercentAsStr = f"{perfGamePercent:.2f}" + "%"
+        scoreLow, scoreHigh = runStats.meanInterval(confidence)
+        avgScoreAsStr = f"{runStats.mean:.2f} ({scoreLow:.2f} - {scoreHigh:.2f})"
+        perfectLow, perfectHigh = runStats.perfectInterval(confidence)
+        perfGamePercentAsStr = f"{runStats.perfectRate * 100:.2f}% ({perfectLow * 100:.2f} - {perfectHigh * 100:.2f})"
 
         # Print new table row.
-        print(f"{playerName:<25} {avgScoreAsStr:<25} {str(perfGameCount):<25} {perfGamePercentAsStr:<25}")
+        print(f"{playerName:<25} {avgScoreAsStr:<25} {runStats.stdDev:<12.2f} {str(runStats.count):<12} {str(runStats.perfectGames):<15} {perfGamePercentAsStr:<25}")
 
     # Return once complete.
     return 0
 
+def train(**kwargs) -> int:
+    """Train the Monte Carlo player for every game state and save its table.
+
+    :param **kwargs: Command line arguments
+    :type: dict
+    :return: Return code
+    :rtype: int
+    """
+    # Train every state, sharding each level of the game across the requested workers.
+    tileCount = kwargs.get("tiles", 9)
+    trainedPlayer = player.TrainedInterface(**playerOptionsFor(player.TrainedInterface, **kwargs))
+    print(f"Training {tileCount}-tile player with {kwargs.get('number', player.train.DEFAULT_ITERATIONS)} continuations per move...")
+    seed = runSeed(**kwargs)
+    tolerance = kwargs.get("tolerance", player.train.DEFAULT_TOLERANCE)
+    confidence = kwargs.get("confidence", player.train.DEFAULT_CONFIDENCE)
+    runCheckpoint = openCheckpoint({ "command": "train", "tableFile": trainedPlayer.tablePath(tileCount), "iterations": kwargs.get("number", player.train.DEFAULT_ITERATIONS), "tiles": tileCount, "seed": seed, "tolerance": tolerance, "confidence": confidence }, **kwargs)
+    policy = trainedPlayer.train(tileCount, kwargs.get("number", player.train.DEFAULT_ITERATIONS), kwargs.get("workers", 1), seed, runCheckpoint, tolerance, confidence)
+
+    # Report how the trained table performs, along with the best possible result.
+    expectedScore, perfectChance = solver.evaluatePolicy(policy, tileCount)
+    optimalScore, optimalPerfectChance = solver.evaluatePolicy(solver.solveOptimal(tileCount)[1], tileCount)
+    print("Training completed!")
+    print()
+    print(f"Saved table to: {trainedPlayer.tablePath(tileCount)}")
+    print(f"Expected score: {expectedScore:.4f} (optimal {optimalScore:.4f})")
+    print(f"Perfect game chance: {perfectChance * 100:.4f}% (optimal {optimalPerfectChance * 100:.4f}%)")
+    return 0
+
+def learn(**kwargs) -> int:
+    """Learn a table for the Q-learning player, reporting how it converges towards the optimal policy.
+
+    :param **kwargs: Command line arguments
+    :type: dict
+    :return: Return code
+    :rtype: int
+    """
+    # Learn from games played in lockstep, snapshotting the policy along the way.
+    tileCount = kwargs.get("tiles", 9)
+    learnedPlayer = player.QLearningInterface(**playerOptionsFor(player.QLearningInterface, **kwargs))
+    transitions = kwargs.get("number", player.temporal.DEFAULT_TRANSITIONS)
+    print(f"Learning {tileCount}-tile player from {transitions} moves...")
+    snapshots = learnedPlayer.learn(tileCount, transitions, kwargs.get("games", player.temporal.DEFAULT_PARALLEL_GAMES), kwargs.get("exploration", player.temporal.DEFAULT_EXPLORATION), runSeed(**kwargs), kwargs.get("report_every", None))
+
+    # Evaluate each snapshot exactly, to show how quickly the learned policy approaches the best possible result.
+    optimalScore, optimalPerfectChance = solver.evaluatePolicy(solver.solveOptimal(tileCount)[1], tileCount)
+    print("Learning completed!")
+    print()
+    print(f"Saved table to: {learnedPlayer.tablePath(tileCount)}")
+    print(f"{'Moves':>14} {'Seconds':>9} {'Moves/s':>12} {'Expected score':>15} {'Gap':>8} {'Perfect game chance':>20}")
+    for snapshotTransitions, seconds, policy in snapshots:
+        expectedScore, perfectChance = solver.evaluatePolicy(policy, tileCount)
+        print(f"{snapshotTransitions:>14} {seconds:>9.2f} {snapshotTransitions / seconds:>12.0f} {expectedScore:>15.4f} {expectedScore - optimalScore:>8.4f} {perfectChance * 100:>19.4f}%")
+    print(f"Optimal expected score: {optimalScore:.4f}, perfect game chance: {optimalPerfectChance * 100:.4f}%")
+    return 0
+
 # MAIN ENTRY.
 def main() -> int:
     # SET UP PARSER.
@@ -237,6 +535,15 @@ def main() -> int:
 
     # Add any global arguments here.
     parser.add_argument("-p", "--player", action = "store", default = None, help = "Select a player by name. Skips user prompts.")
+    parser.add_argument("-t", "--tiles", action = "store", type = int, default = 9, help = "Number of tiles in each game (1-16).")
+    parser.add_argument("-s", "--seed", action = "store", type = int, default = None, help = "Root seed for all dice rolls, for reproducible runs.")
+    parser.add_argument("-c", "--checkpoint", action = "store", default = None, help = "Periodically save progress of run, compare and train to this file.")
+    parser.add_argument("-r", "--resume", action = "store_true", help = f"Continue from the last checkpoint (default {checkpoint.DEFAULT_CHECKPOINT_PATH}).")
+    parser.add_argument("--checkpoint-interval", action = "store", type = float, default = checkpoint.DEFAULT_CHECKPOINT_INTERVAL, help = "Minimum # of seconds between checkpoints.")
+    parser.add_argument("--rollouts", action = "store", type = int, default = player.rollout.DEFAULT_ROLLOUTS, help = "Rollouts per candidate move for the rollout player (0 for no limit, with --move-time).")
+    parser.add_argument("--move-time", action = "store", type = float, default = None, help = "Time budget in seconds per move for the rollout player.")
+    parser.add_argument("--table", action = "store", default = None, help = "Table file for the selected trained or Q-learning player, or for train and learn. Defaults to one per tile count in the player folder. Not accepted by compare.")
+    parser.add_argument("--rollout-policy", action = "store", default = "largest-first", help = f"Policy used inside rollouts: {', '.join(player.rollout.ROLLOUT_POLICIES)}.")
 
     # Add a single subparser for each different run mode.
     subparsers = parser.add_subparsers(help = "Selected run mode.", required = True)
@@ -248,13 +555,40 @@ def main() -> int:
     iterParser.set_defaults(func = iterate)
     
     runParser = subparsers.add_parser(name = "run", help = "Run a single player for a specified number of iterations.")
-    runParser.add_argument("-n", "--number", action = "store", type = int, default = DEFAULT_ITERATIONS, help = "Number of iterations.")
+    runParser.add_argument("-n", "--number", action = "store", type = int, default = DEFAULT_ITERATIONS, help = "Number of iterations, or the most to run with a precision target.")
+    runParser.add_argument("--precision", action = "store", type = float, default = None, help = "Stop once the average score is known to within +/- this many points.")
+    runParser.add_argument("--perfect-precision", action = "store", type = float, default = None, help = "Stop once the perfect game rate is known to within +/- this many percentage points.")
+    runParser.add_argument("--confidence", action = "store", type = float, default = stats.DEFAULT_CONFIDENCE, help = "Confidence level of reported intervals and precision targets.")
+    runParser.add_argument("-b", "--batch", action = "store_true", help = "Simulate games in vectorized batches where the player supports it.")
+    runParser.add_argument("-w", "--workers", action = "store", type = int, default = 1, help = "Number of worker processes to split games across.")
+    runParser.add_argument("-e", "--exact", action = "store_true", help = "Compute exact results over all game states instead of sampling games.")
+    runParser.add_argument("-d", "--distribution", action = "store_true", help = "Print the full final score and roll count distributions.")
     runParser.set_defaults(func = run)
     
-    compareParser = subparsers.add_parser(name = "compare", help = "Run every non-manual player type for a number of iterations, then compare.")
-    compareParser.add_argument("-n", "--number", action = "store", type = int, default = DEFAULT_ITERATIONS, help = "Number of iterations.")
+    compareParser = subparsers.add_parser(name = "compare", help = "Run every player type except manual and rollout for a number of iterations, then compare.")
+    compareParser.add_argument("-n", "--number", action = "store", type = int, default = DEFAULT_ITERATIONS, help = "Number of iterations, or the most to run with a precision target.")
+    compareParser.add_argument("--precision", action = "store", type = float, default = None, help = "Stop once the average score is known to within +/- this many points.")
+    compareParser.add_argument("--perfect-precision", action = "store", type = float, default = None, help = "Stop once the perfect game rate is known to within +/- this many percentage points.")
+    compareParser.add_argument("--confidence", action = "store", type = float, default = stats.DEFAULT_CONFIDENCE, help = "Confidence level of reported intervals and precision targets.")
+    compareParser.add_argument("-b", "--batch", action = "store_true", help = "Simulate games in vectorized batches where the player supports it.")
+    compareParser.add_argument("-w", "--workers", action = "store", type = int, default = 1, help = "Number of worker processes to split games across.")
+    compareParser.add_argument("-e", "--exact", action = "store_true", help = "Compute exact results over all game states instead of sampling games.")
     compareParser.set_defaults(func = compare)
 
+    trainParser = subparsers.add_parser(name = "train", help = "Train the Monte Carlo player over every game state and save its table.")
+    trainParser.add_argument("-n", "--number", action = "store", type = int, default = player.train.DEFAULT_ITERATIONS, help = "Average number of continuations played from each move of each state.")
+    trainParser.add_argument("--tolerance", action = "store", type = float, default = player.train.DEFAULT_TOLERANCE, help = "Stop sampling a state once its two best moves are known to be within this many points of each other.")
+    trainParser.add_argument("--confidence", action = "store", type = float, default = player.train.DEFAULT_CONFIDENCE, help = "Confidence level used to decide that a state's best move is settled.")
+    trainParser.add_argument("-w", "--workers", action = "store", type = int, default = 1, help = "Number of worker processes to split states across.")
+    trainParser.set_defaults(func = train)
+
+    learnParser = subparsers.add_parser(name = "learn", help = "Learn a table for the Q-learning player from games played in parallel, and benchmark it against the exact solver.")
+    learnParser.add_argument("-n", "--number", action = "store", type = int, default = player.temporal.DEFAULT_TRANSITIONS, help = "Number of moves to learn from.")
+    learnParser.add_argument("-g", "--games", action = "store", type = int, default = player.temporal.DEFAULT_PARALLEL_GAMES, help = "Number of games played in lockstep.")
+    learnParser.add_argument("--exploration", action = "store", type = float, default = player.temporal.DEFAULT_EXPLORATION, help = "Chance of taking a random move instead of the best move so far.")
+    learnParser.add_argument("--report-every", action = "store", type = int, default = None, help = "Number of moves between convergence reports. Defaults to only the final policy.")
+    learnParser.set_defaults(func = learn)
+
     # START RUN.
     # Call user selections as a function call, then return results.
     args = parser.parse_args()
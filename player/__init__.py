@@ -1,4 +1,10 @@
 from .random import *
 from .manual import *
 from .largestFirst import *
-from .most import *
\ No newline at end of file
+from .most import *
+from .optimal import optimalMoveIndices, OptimalPlayer
+from .rollout import randomRolloutMove, largestFirstRolloutMove, rolloutScore, RolloutPlayer
+from .table import defaultTablePath, loadTablePolicy, tableMoveIndices, clearTableCaches, TablePlayer
+from .train import continuationScore, trainState, stateConverged, trainShard, TrainingTable, TrainedInterface
+from .temporal import QLearner, QLearningInterface
+from .compile import reachableStates, probePlayer, compilePolicy
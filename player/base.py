@@ -2,27 +2,58 @@
 # Desc: Base class for Shut-the-Box 'players' i.e. play strategies.
 #   Defines the minimum required methods to interact with a game instance.
 # Author: Noah Black (noah.black0425@gmail.com)
-# Last Updated: June 21st, 2025
+# Last Updated: October 17th, 2026
 
 
 # NATIVE IMPORTS.
 from abc import ABC, abstractmethod
 # THIRD-PARTY IMPORTS.
+import numpy as np
 # LOCAL IMPORTS.
 from game.core import GameInstance
 
 
 # CLASSES.
 class PlayerInterface(ABC):
+    # Set on players that prompt a user for moves, so they are never probed automatically.
+    interactive: bool = False
+    # Set on players that only ever pick moves from game.validMoves, so games can skip validating them.
+    trusted: bool = False
+    # Cleared on players whose choices depend on chance, so they are never probed automatically.
+    deterministic: bool = True
+
     @abstractmethod
-    def select(self, game: GameInstance) -> list[int]:
+    def select(self, game: GameInstance) -> tuple[int, ...]:
         """Given a specified game state, select a single move.
 
         :param game: Current game state to pick a move from
         :type game: list[bool]
         :return: Selected move
-        :rtype: list[int]
+        :rtype: tuple[int, ...]
+        """
+
+    def selectIndex(self, game: GameInstance) -> int:
+        """Given a specified game state, select a single move by its position in game.validMoves.
+
+        Players that naturally pick a position should override this, and derive select() from it.
+
+        :param game: Current game state to pick a move from
+        :type game: GameInstance
+        :return: Index of the selected move
+        :rtype: int
+        """
+        # Moves may be returned as any sequence of tiles, but are listed as tuples.
+        return game.validMoves.index(tuple(self.select(game)))
+
+    def policyTable(self, tileCount: int = 9) -> np.ndarray | None:
+        """Get a lookup table equivalent to select(), for use with the batch simulator.
+
+        :param tileCount: Number of tiles in the game
+        :type tileCount: int
+        :return: Policy table in the layout used by game.batch, or None if unsupported
+        :rtype: np.ndarray | None
         """
+        return None
 
     def roundAsStr(self, game: GameInstance) -> str:
         output = "\n"
@@ -33,11 +64,11 @@ class PlayerInterface(ABC):
     
     def tilesAsStr(self, game: GameInstance) -> str:
         tilePrintoutLines = ["", "", "", "", "" ]
-        for tileValue in range(1, 10):
+        for tileValue in range(1, game.tileCount + 1):
             if tileValue in game.tiles:
                 tilePrintoutLines[0] += "+---+"
                 tilePrintoutLines[1] += "|   |"
-                tilePrintoutLines[2] += f"| {tileValue} |"
+                tilePrintoutLines[2] += f"|{tileValue:^3}|"
                 tilePrintoutLines[3] += "|   |"
                 tilePrintoutLines[4] += "+---+"
             else:
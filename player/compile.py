@@ -0,0 +1,104 @@
+# compile.py
+# Desc: Converts a player into a lookup-table policy by probing select() once for every reachable game state.
+#   Compiled tables can be run by the batch simulator without calling back into Python each turn.
+# Author: Noah Black (noah.black0425@gmail.com)
+# Last Updated: October 17th, 2026
+
+
+# NATIVE IMPORTS.
+from copy import deepcopy
+# THIRD-PARTY IMPORTS.
+import numpy as np
+# LOCAL IMPORTS.
+from .base import PlayerInterface
+from game.batch import emptyPolicy
+from game.board import fullBoard, loadMoveTable, maskToTiles, tableIndex
+from game.cache import MAX_ROLL
+from game.core import GameInstance
+
+
+# FUNCTIONS.
+def reachableStates(tileCount: int = 9) -> list[tuple[int, int]]:
+    """List every (board, roll) pair where a player would be asked to select a move.
+
+    :param tileCount: Number of tiles in the game
+    :type tileCount: int
+    :return: Board masks and roll totals with at least one valid move
+    :rtype: list[tuple[int, int]]
+    """
+    moveTable = loadMoveTable(tileCount)
+    states = []
+    for board in range(1, fullBoard(tileCount) + 1):
+        for roll in range(2, MAX_ROLL + 1):
+            if moveTable.moveCount(tableIndex(board, roll)) > 0:
+                states.append((board, roll))
+    return states
+
+def probePlayer(gamePlayer: PlayerInterface, states: list[tuple[int, int]], tileCount: int = 9) -> np.ndarray:
+    """Ask a player for its move in each given state and store the results as a policy table.
+
+    :param gamePlayer: Player to probe
+    :type gamePlayer: PlayerInterface
+    :param states: Board masks and roll totals to probe, in order
+    :type states: list[tuple[int, int]]
+    :param tileCount: Number of tiles in the game
+    :type tileCount: int
+    :return: Deterministic policy table of move masks
+    :rtype: np.ndarray
+    """
+    policy = emptyPolicy(tileCount)
+    for board, roll in states:
+        game = GameInstance.fromState(board, roll, tileCount = tileCount)
+        move = gamePlayer.select(game)
+        moveIndex = next((index for index, validMove in enumerate(game.validMoves) if validMove == tuple(move)), -1)
+        if moveIndex < 0:
+            raise Exception(f"Player {type(gamePlayer).__name__} selected invalid move {move} for roll {roll}, tiles {maskToTiles(board)}")
+        policy[board, roll] = game.validMoveMasks[moveIndex]
+    return policy
+
+def compilePolicy(gamePlayer: PlayerInterface, tileCount: int = 9) -> np.ndarray:
+    """Compile a player into a policy table for the batch simulator.
+
+    Players that provide their own table through policyTable() (including stochastic ones) use it as-is.
+    Otherwise, every reachable state is probed twice in opposite orders, and the player is rejected if it is
+    interactive or not deterministic, changes its own attributes, or gives different answers between passes.
+
+    :param gamePlayer: Player to compile
+    :type gamePlayer: PlayerInterface
+    :param tileCount: Number of tiles in the game
+    :type tileCount: int
+    :return: Policy table in the layout used by game.batch
+    :rtype: np.ndarray
+    """
+    # Prefer any table that the player supplies directly.
+    explicitPolicy = gamePlayer.policyTable(tileCount)
+    if explicitPolicy is not None:
+        return explicitPolicy
+    playerName = type(gamePlayer).__name__
+    if gamePlayer.interactive:
+        raise Exception(f"Player {playerName} is interactive and cannot be compiled.")
+    if not gamePlayer.deterministic:
+        raise Exception(f"Player {playerName} is not deterministic and cannot be compiled.")
+
+    # Probe all states forward, then backward, watching for any changes in the player itself.
+    states = reachableStates(tileCount)
+    attributesBefore = deepcopy(vars(gamePlayer))
+    forwardPolicy = probePlayer(gamePlayer, states, tileCount = tileCount)
+    backwardPolicy = probePlayer(gamePlayer, states[::-1], tileCount = tileCount)
+    if vars(gamePlayer) != attributesBefore:
+        raise Exception(f"Player {playerName} is stateful and cannot be compiled.")
+
+    mismatches = np.argwhere(forwardPolicy != backwardPolicy)
+    if len(mismatches) > 0:
+        board, roll = mismatches[0]
+        raise Exception(f"Player {playerName} is not deterministic (roll {roll}, tiles {maskToTiles(int(board))}) and cannot be compiled.")
+
+    return forwardPolicy
+
+
+# MAIN ENTRY.
+def main() -> None:
+    raise NotImplementedError
+
+if __name__=="__main__":
+    main()
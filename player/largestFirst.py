@@ -13,39 +13,49 @@ from game.core import GameInstance
 
 # CLASSES.
 class LargestFirstPlayer(PlayerInterface):
-    def select(self, game: GameInstance) -> list[int]:
+    trusted: bool = True
+
+    def select(self, game: GameInstance) -> tuple[int, ...]:
+        return game.validMoves[self.selectIndex(game)]
+
+    def selectIndex(self, game: GameInstance) -> int:
         # If a single tile move is available, use that.
         if len(game.validMoves[0]) == 1:
-            return game.validMoves[0]
+            return 0
 
         # Otherwise, search over the available options and find the move with the largest # contained.
         largestNumFound = -1
-        move = []
-        for possibleMove in game.validMoves:
+        moveIndex = 0
+        for possibleIndex, possibleMove in enumerate(game.validMoves):
             largestNumInMove = possibleMove[-1]
             if largestNumInMove > largestNumFound:
                 largestNumFound = largestNumInMove
-                move = possibleMove
+                moveIndex = possibleIndex
 
         # Return the selected move.
-        return move
+        return moveIndex
     
 class LargePreserveLowPlayer(PlayerInterface):
-    def select(self, game: GameInstance) -> list[int]:
+    trusted: bool = True
+
+    def select(self, game: GameInstance) -> tuple[int, ...]:
+        return game.validMoves[self.selectIndex(game)]
+
+    def selectIndex(self, game: GameInstance) -> int:
         # If a single tile move is available, use that.
         if len(game.validMoves[0]) == 1:
-            return game.validMoves[0]
+            return 0
         
         # Otherwise, attempt to search for the move that preserves the lowest digits.
         highestMinDigit = -1
-        move = []
-        for possibleMove in game.validMoves:
+        moveIndex = 0
+        for possibleIndex, possibleMove in enumerate(game.validMoves):
             if highestMinDigit < possibleMove[0]:
                 highestMinDigit = possibleMove[0]
-                move = possibleMove
+                moveIndex = possibleIndex
 
         # Return the selected move.
-        return move
+        return moveIndex
 
 
 # MAIN ENTRY.
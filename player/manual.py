@@ -1,7 +1,7 @@
 # manual.py
 # Desc: Manual CLI for a single game instance.
 # Author: Noah Black (noah.black0425@gmail.com)
-# Last Updated: June 21st, 2025
+# Last Updated: October 17th, 2026
 
 
 # NATIVE IMPORTS.
@@ -13,10 +13,12 @@ from game.core import GameInstance
 
 # CLASSES.
 class ManualPlayer(PlayerInterface):
+    interactive: bool = True
+
     def __init__(self):
         super().__init__()
 
-    def select(self, game: GameInstance) -> list[int]:
+    def select(self, game: GameInstance) -> tuple[int, ...]:
         print(f"--- ROUND {game.rollCount} ---")
         
         # Print a summary of the board state for the player to view.
@@ -25,7 +27,7 @@ class ManualPlayer(PlayerInterface):
         # Prompt the user for which move they would like to select.
         validIndices = [ index for index in range(len(game.validMoves)) ]
         validIndicesAsStr = [ str(index) for index in validIndices ]
-        selectedMove = []
+        selectedMove = ()
         while True:
             moveSelection = input("Select a move: ")
             if moveSelection in validIndicesAsStr:
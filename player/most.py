@@ -13,22 +13,29 @@ from game.core import GameInstance
 
 # CLASSES.
 class MostThenSmall(PlayerInterface):
-    def select(self, game: GameInstance) -> list[int]:
-        # Find the length of the longest available move list, then isolate.
-        mostTilesPossible = len(game.validMoves[-1])
-        largeMoves = [ move for move in game.validMoves if len(move) == mostTilesPossible ]
+    trusted: bool = True
 
-        # Return the first element from the list, which generally has the lowest #'s possible.
-        return largeMoves[0]
+    def select(self, game: GameInstance) -> tuple[int, ...]:
+        return game.validMoves[self.selectIndex(game)]
 
-class MostThenLarge(PlayerInterface):
-    def select(self, game: GameInstance) -> list[int]:
-        # Find the length of the longest available move list, then isolate.
+    def selectIndex(self, game: GameInstance) -> int:
+        # Moves are ordered by length, so the longest moves are at the end. Walk back to the first of them, which
+        # generally has the lowest #'s possible.
         mostTilesPossible = len(game.validMoves[-1])
-        largeMoves = [ move for move in game.validMoves if len(move) == mostTilesPossible ]
+        moveIndex = len(game.validMoves) - 1
+        while moveIndex > 0 and len(game.validMoves[moveIndex - 1]) == mostTilesPossible:
+            moveIndex -= 1
+        return moveIndex
+
+class MostThenLarge(PlayerInterface):
+    trusted: bool = True
+
+    def select(self, game: GameInstance) -> tuple[int, ...]:
+        return game.validMoves[self.selectIndex(game)]
 
-        # Return the last element from the list, which generally has the largest #'s possible.
-        return largeMoves[-1]
+    def selectIndex(self, game: GameInstance) -> int:
+        # Moves are ordered by length, so the last move uses the most tiles and generally has the largest #'s possible.
+        return len(game.validMoves) - 1
 
 # MAIN ENTRY.
 def main() -> None:
@@ -0,0 +1,48 @@
+# optimal.py
+# Desc: Move strategy that always selects the move with the lowest expected final score.
+#   Moves are read from the exact solution in game.solver, so each selection is a single table lookup.
+# Author: Noah Black (noah.black0425@gmail.com)
+# Last Updated: October 17th, 2026
+
+
+# NATIVE IMPORTS.
+from functools import cache
+# THIRD-PARTY IMPORTS.
+import numpy as np
+# LOCAL IMPORTS.
+from .base import PlayerInterface
+from game.board import loadMoveTable, tableIndex
+from game.core import GameInstance
+from game.solver import solveOptimal
+
+
+# FUNCTIONS.
+@cache
+def optimalMoveIndices(tileCount: int = 9) -> list[int]:
+    # Convert the solved move masks into positions within each valid move list.
+    _, policy = solveOptimal(tileCount)
+    flatPolicy = policy.reshape(-1).tolist()
+    moveTable = loadMoveTable(tileCount)
+    return [ moveTable.masksAt(index).index(flatPolicy[index]) if flatPolicy[index] else -1 for index in range(moveTable.entryCount) ]
+
+
+# CLASSES.
+class OptimalPlayer(PlayerInterface):
+    trusted: bool = True
+
+    def select(self, game: GameInstance) -> tuple[int, ...]:
+        return game.validMoves[self.selectIndex(game)]
+
+    def selectIndex(self, game: GameInstance) -> int:
+        return optimalMoveIndices(game.tileCount)[tableIndex(game.board, game.lastRollTotal)]
+
+    def policyTable(self, tileCount: int = 9) -> np.ndarray | None:
+        return solveOptimal(tileCount)[1]
+
+
+# MAIN ENTRY.
+def main() -> None:
+    raise NotImplementedError
+
+if __name__=="__main__":
+    main()
@@ -1,24 +1,33 @@
 # random.py
 # Desc: Move strategy that select a random option from all available moves.
 # Author: Noah Black (noah.black0425@gmail.com)
-# Last Updated: June 21st, 2025
+# Last Updated: October 17th, 2026
 
 
 # NATIVE IMPORTS.
-from random import randint
-
 # THIRD-PARTY IMPORTS.
+import numpy as np
 # LOCAL IMPORTS.
 from .base import PlayerInterface
+from game.batch import uniformPolicy
 from game.core import GameInstance
 
 
 # CLASSES.
 class RandomPlayer(PlayerInterface):
-    def select(self, game: GameInstance) -> list[int]:
-        # Select a random move from the possible list, then return.
-        randomMoveIndex = randint(0, len(game.validMoves) - 1)
-        return game.validMoves[randomMoveIndex]
+    trusted: bool = True
+    deterministic: bool = False
+
+    def select(self, game: GameInstance) -> tuple[int, ...]:
+        return game.validMoves[self.selectIndex(game)]
+
+    def selectIndex(self, game: GameInstance) -> int:
+        # Select a random move from the possible list, then return. Draws come from the game's RNG for choices, so seeded games replay exactly.
+        return game.rng.randint(0, len(game.validMoves) - 1)
+
+    def policyTable(self, tileCount: int = 9) -> np.ndarray | None:
+        # Every valid move is equally likely, which the batch simulator can sample directly.
+        return uniformPolicy(tileCount)
 
 
 # MAIN ENTRY.
@@ -0,0 +1,131 @@
+# rollout.py
+# Desc: Monte Carlo player that scores each valid move by simulating games to completion after taking it.
+#   Rollouts run directly on board masks and a private dice source rather than on GameInstance objects.
+# Author: Noah Black (noah.black0425@gmail.com)
+# Last Updated: October 17th, 2026
+
+
+# NATIVE IMPORTS.
+import random
+from time import perf_counter
+from typing import Callable
+# THIRD-PARTY IMPORTS.
+# LOCAL IMPORTS.
+from .base import PlayerInterface
+from game.board import MoveTable, loadMoveTable, tableIndex
+from game.core import GameInstance
+from game.dice import DiceSource
+
+
+# CONSTANTS.
+DEFAULT_ROLLOUTS: int = 200
+
+
+# FUNCTIONS.
+def randomRolloutMove(moveMasks: tuple[int, ...], rng: random.Random) -> int:
+    # Pick any valid move with equal chance.
+    return moveMasks[rng.randrange(len(moveMasks))]
+
+def largestFirstRolloutMove(moveMasks: tuple[int, ...], rng: random.Random) -> int:
+    # Mirror LargestFirstPlayer: take a single tile move if there is one, otherwise the move with the largest tile.
+    if moveMasks[0] & (moveMasks[0] - 1) == 0:
+        return moveMasks[0]
+    return max(moveMasks, key = int.bit_length)
+
+ROLLOUT_POLICIES: dict[str, Callable[[tuple[int, ...], random.Random], int]] = {
+    "random":        randomRolloutMove,
+    "largest-first": largestFirstRolloutMove,
+}
+
+def rolloutScore(board: int, rolls: list[int], moveTable: MoveTable, rolloutMove: Callable[[tuple[int, ...], random.Random], int], rng: random.Random) -> int:
+    """Play out a game from the given board using a fixed sequence of roll totals.
+
+    :param board: Board mask to start from
+    :type board: int
+    :param rolls: Roll totals to use, at least one per tile left on the board
+    :type rolls: list[int]
+    :param moveTable: Move table for the game
+    :type moveTable: MoveTable
+    :param rolloutMove: Function that picks a move mask from the valid move masks
+    :type rolloutMove: Callable[[tuple[int, ...], random.Random], int]
+    :param rng: Random generator passed to rolloutMove
+    :type rng: random.Random
+    :return: Final score of the rollout
+    :rtype: int
+    """
+    # Every move flips at least one tile, so the game always ends before the rolls run out.
+    for roll in rolls:
+        if board == 0:
+            break
+        moveMasks = moveTable.masksAt(tableIndex(board, roll))
+        if not moveMasks:
+            break
+        board ^= rolloutMove(moveMasks, rng)
+    return moveTable.sums[board]
+
+
+# CLASSES.
+class RolloutPlayer(PlayerInterface):
+    trusted: bool = True
+    deterministic: bool = False
+
+    def __init__(self, rollouts: int | None = DEFAULT_ROLLOUTS, moveTime: float | None = None, rolloutPolicy: str = "largest-first") -> None:
+        if rollouts is None and moveTime is None:
+            raise Exception("Rollout player needs a rollout or time budget.")
+        if rolloutPolicy not in ROLLOUT_POLICIES:
+            raise Exception(f"Rollout policy {rolloutPolicy} does not match valid options: {', '.join(ROLLOUT_POLICIES)}")
+        self._rollouts: int | None = rollouts
+        self._moveTime: float | None = moveTime
+        self._rolloutPolicy: str = rolloutPolicy
+
+    @property
+    def rollouts(self) -> int | None:
+        return self._rollouts
+
+    @property
+    def moveTime(self) -> float | None:
+        return self._moveTime
+
+    @property
+    def rolloutPolicy(self) -> str:
+        return self._rolloutPolicy
+
+    def select(self, game: GameInstance) -> tuple[int, ...]:
+        return game.validMoves[self.selectIndex(game)]
+
+    def selectIndex(self, game: GameInstance) -> int:
+        # With only one valid move, there is nothing to simulate.
+        moveMasks = game.validMoveMasks
+        if len(moveMasks) == 1:
+            return 0
+
+        # Rollout dice get their own RNG, seeded from the game's RNG for choices, and rollout moves draw from the game's
+        # RNG directly. Seeded games with a rollout budget still replay exactly, and never touch the game's dice.
+        moveTable = loadMoveTable(game.tileCount)
+        diceSource = DiceSource(random.Random(game.rng.getrandbits(64)), choiceRng = game.rng)
+        rolloutMove = ROLLOUT_POLICIES[self._rolloutPolicy]
+        rollCount = len(game.tiles)
+        deadline = perf_counter() + self._moveTime if self._moveTime is not None else None
+
+        # Simulate every move in rounds. Each round plays all moves against the same rolls, so that differences
+        # between moves come from the moves themselves rather than from luckier dice.
+        totals = [ 0 ] * len(moveMasks)
+        rounds = 0
+        while self._rollouts is None or rounds < self._rollouts:
+            rolls = [ sum(diceSource.roll()) for _ in range(rollCount) ]
+            for moveIndex, moveMask in enumerate(moveMasks):
+                totals[moveIndex] += rolloutScore(game.board ^ moveMask, rolls, moveTable, rolloutMove, diceSource.rng)
+            rounds += 1
+            if deadline is not None and perf_counter() >= deadline:
+                break
+
+        # Pick the move with the lowest average final score.
+        return min(range(len(totals)), key = totals.__getitem__)
+
+
+# MAIN ENTRY.
+def main() -> None:
+    raise NotImplementedError
+
+if __name__=="__main__":
+    main()
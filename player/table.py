@@ -0,0 +1,110 @@
+# table.py
+# Desc: Base class for players that play from a policy table saved to disk, such as trained and Q-learned players.
+#   Tables are memory-mapped once per process, and each selection is a single lookup.
+# Author: Noah Black (noah.black0425@gmail.com)
+# Last Updated: October 17th, 2026
+
+
+# NATIVE IMPORTS.
+import os
+from functools import cache
+# THIRD-PARTY IMPORTS.
+import numpy as np
+# LOCAL IMPORTS.
+from .base import PlayerInterface
+from game.board import ROLL_SLOTS, loadMoveTable, tableIndex
+from game.cache import readPolicyTable
+from game.core import GameInstance
+
+
+# CONSTANTS.
+TABLE_DIRECTORY: str = os.path.dirname(os.path.abspath(__file__))
+
+
+# FUNCTIONS.
+def defaultTablePath(tableName: str, tileCount: int = 9) -> str:
+    """Get the path that a kind of table is saved to and loaded from by default.
+
+    :param tableName: Name of the kind of table, such as "trained"
+    :type tableName: str
+    :param tileCount: Number of tiles in the game
+    :type tileCount: int
+    :return: Table file path
+    :rtype: str
+    """
+    return os.path.join(TABLE_DIRECTORY, f"{tableName}{tileCount}.npy")
+
+@cache
+def loadTablePolicy(tablePath: str, tileCount: int = 9, trainCommand: str = "train") -> np.ndarray:
+    """Map a saved policy table into memory, once per process.
+
+    :param tablePath: Table file path
+    :type tablePath: str
+    :param tileCount: Number of tiles in the game the table is played in
+    :type tileCount: int
+    :param trainCommand: main.py command that builds the table, suggested when it is missing
+    :type trainCommand: str
+    :return: Deterministic policy table of move masks
+    :rtype: np.ndarray
+    """
+    if not os.path.exists(tablePath):
+        raise Exception(f"No table found at {tablePath}, run 'main.py {trainCommand}' first.")
+    policy = readPolicyTable(tablePath)
+    if policy.shape != (1 << tileCount, ROLL_SLOTS):
+        raise Exception(f"Table {tablePath} of shape {policy.shape} does not match {tileCount} tiles.")
+    return policy
+
+@cache
+def tableMoveIndices(tablePath: str, tileCount: int = 9, trainCommand: str = "train") -> list[int]:
+    # Convert the saved move masks into positions within each valid move list, for constant time selection.
+    flatPolicy = loadTablePolicy(tablePath, tileCount, trainCommand).reshape(-1).tolist()
+    moveTable = loadMoveTable(tileCount)
+    return [ moveTable.masksAt(index).index(flatPolicy[index]) if flatPolicy[index] else -1 for index in range(moveTable.entryCount) ]
+
+def clearTableCaches() -> None:
+    # Drop every table loaded in this process, after one has been rewritten.
+    loadTablePolicy.cache_clear()
+    tableMoveIndices.cache_clear()
+    return
+
+
+# CLASSES.
+class TablePlayer(PlayerInterface):
+    trusted: bool = True
+    # Default tables are named after tableName, and are built by the trainCommand subcommand of main.py.
+    tableName: str = "table"
+    trainCommand: str = "train"
+
+    def __init__(self, tableFile: str | None = None) -> None:
+        self._tableFile: str | None = tableFile
+
+    @property
+    def tableFile(self) -> str | None:
+        return self._tableFile
+
+    def tablePath(self, tileCount: int = 9) -> str:
+        """Get the table file used for games with the given # of tiles.
+
+        :param tileCount: Number of tiles in the game
+        :type tileCount: int
+        :return: Table file path
+        :rtype: str
+        """
+        return self._tableFile if self._tableFile is not None else defaultTablePath(self.tableName, tileCount)
+
+    def select(self, game: GameInstance) -> tuple[int, ...]:
+        return game.validMoves[self.selectIndex(game)]
+
+    def selectIndex(self, game: GameInstance) -> int:
+        return tableMoveIndices(self.tablePath(game.tileCount), game.tileCount, self.trainCommand)[tableIndex(game.board, game.lastRollTotal)]
+
+    def policyTable(self, tileCount: int = 9) -> np.ndarray | None:
+        return loadTablePolicy(self.tablePath(tileCount), tileCount, self.trainCommand)
+
+
+# MAIN ENTRY.
+def main() -> None:
+    raise NotImplementedError
+
+if __name__=="__main__":
+    main()
@@ -0,0 +1,189 @@
+# temporal.py
+# Desc: Player class that learns a value for every (board, roll, move) with tabular Q-learning.
+#   Many games are played in lockstep as arrays of board masks, and each step updates the value table in one batch.
+# Author: Noah Black (noah.black0425@gmail.com)
+# Last Updated: October 17th, 2026
+
+
+# NATIVE IMPORTS.
+from time import perf_counter
+# THIRD-PARTY IMPORTS.
+import numpy as np
+import tqdm
+# LOCAL IMPORTS.
+from .table import TablePlayer, clearTableCaches
+from game.batch import moveArrays, scoreArray
+from game.board import ROLL_SLOTS, fullBoard
+from game.cache import writePolicyTable
+from game.dice import makeGenerator, newSeed
+
+
+# CONSTANTS.
+DEFAULT_TRANSITIONS: int = 50000000
+DEFAULT_PARALLEL_GAMES: int = 65536
+DEFAULT_EXPLORATION: float = 0.1
+# Each value moves towards its targets at a rate of visits ** -LEARNING_RATE_POWER, which decays slowly enough for
+# values to keep up with the bootstrapped targets behind them as those targets improve.
+LEARNING_RATE_POWER: float = 0.6
+
+
+# FUNCTIONS.
+def rollDice(rng: np.random.Generator, count: int) -> np.ndarray:
+    # Roll two dice for each of count games, the same way as the batch simulator.
+    rolls = rng.integers(1, 7, size = count, dtype = np.uint16)
+    rolls += rng.integers(1, 7, size = count, dtype = np.uint16)
+    return rolls
+
+
+# CLASSES.
+class QLearner():
+    def __init__(self, tileCount: int = 9, games: int = DEFAULT_PARALLEL_GAMES, exploration: float = DEFAULT_EXPLORATION, rng: np.random.Generator | None = None) -> None:
+        # Values are stored with one row per table index and one column per move slot of moveArrays(), and estimate
+        # the final score after taking that move. Slots without a move hold infinity, so that they are never picked.
+        # Values start at 0, the best possible score, so untried moves look promising until they have been tried.
+        moves, counts = moveArrays(tileCount)
+        self._tileCount: int = tileCount
+        self._exploration: float = exploration
+        self._rng: np.random.Generator = rng if rng is not None else np.random.default_rng()
+        self._values: np.ndarray = np.where(np.arange(moves.shape[1]) < counts[:, None], 0.0, np.inf)
+        self._visits: np.ndarray = np.zeros(moves.shape, dtype = np.uint64)
+        self._transitions: int = 0
+
+        # Games in progress are kept as board and roll arrays, and always have at least one valid move.
+        self._boards: np.ndarray = np.full(games, fullBoard(tileCount), dtype = np.uint16)
+        self._rolls: np.ndarray = np.zeros(games, dtype = np.uint16)
+        self._restart(np.arange(games))
+
+    @property
+    def tileCount(self) -> int:
+        return self._tileCount
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._values.reshape(1 << self._tileCount, ROLL_SLOTS, -1)
+
+    @property
+    def visits(self) -> np.ndarray:
+        return self._visits.reshape(1 << self._tileCount, ROLL_SLOTS, -1)
+
+    @property
+    def transitions(self) -> int:
+        return self._transitions
+
+    def learn(self, transitions: int) -> None:
+        """Play at least the given # of moves across the games in progress, updating values after each step.
+
+        :param transitions: Number of moves to learn from
+        :type transitions: int
+        """
+        moves, counts = moveArrays(self._tileCount)
+        scores = scoreArray(self._tileCount)
+        slotCount = moves.shape[1]
+        flatValues = self._values.reshape(-1)
+        flatVisits = self._visits.reshape(-1)
+        gameCount = len(self._boards)
+        target = self._transitions + transitions
+        while self._transitions < target:
+            # Take the best move so far in each game, or a random valid move when exploring.
+            indices = (self._boards.astype(np.intp) << 4) | self._rolls
+            slots = np.argmin(self._values[indices], axis = 1)
+            exploring = self._rng.random(gameCount) < self._exploration
+            slots[exploring] = (self._rng.random(int(exploring.sum())) * counts[indices[exploring]]).astype(np.intp)
+
+            # Roll for the next turn. Games without a next move end with the score of their board, and every other
+            # game looks ahead to the best value of its next state.
+            nextBoards = self._boards ^ moves[indices, slots]
+            nextRolls = rollDice(self._rng, gameCount)
+            nextIndices = (nextBoards.astype(np.intp) << 4) | nextRolls
+            finished = counts[nextIndices] == 0
+            targets = scores[nextBoards].astype(np.float64)
+            targets[~finished] = self._values[nextIndices[~finished]].min(axis = 1)
+
+            # Apply every update of the step at once. Visits to the same value within a step are combined into one
+            # step of their average error, sized as if they had been applied one after another.
+            flatIndices = indices * slotCount + slots
+            batchVisits = np.bincount(flatIndices, minlength = flatValues.size)
+            errorSums = np.bincount(flatIndices, weights = targets - flatValues[flatIndices], minlength = flatValues.size)
+            touched = np.flatnonzero(batchVisits)
+            flatVisits[touched] += batchVisits[touched].astype(np.uint64)
+            learningRates = flatVisits[touched].astype(np.float64) ** -LEARNING_RATE_POWER
+            stepSizes = 1.0 - (1.0 - learningRates) ** batchVisits[touched]
+            flatValues[touched] += stepSizes * errorSums[touched] / batchVisits[touched]
+
+            # Finished games start over from a full board.
+            self._boards = nextBoards
+            self._rolls = nextRolls
+            self._restart(np.flatnonzero(finished))
+            self._transitions += gameCount
+        return
+
+    def bestMoves(self) -> np.ndarray:
+        """Pick the move with the lowest learned value in every state.
+
+        :return: Deterministic policy table of move masks, with 0 where no move exists
+        :rtype: np.ndarray
+        """
+        moves, _ = moveArrays(self._tileCount)
+        bestSlots = np.argmin(self._values, axis = 1)
+        return moves[np.arange(len(moves)), bestSlots].reshape(1 << self._tileCount, ROLL_SLOTS)
+
+    def _restart(self, games: np.ndarray) -> None:
+        # Start the given games from a full board, rolling again for any that could not move on their first roll.
+        _, counts = moveArrays(self._tileCount)
+        self._boards[games] = fullBoard(self._tileCount)
+        while games.size > 0:
+            self._rolls[games] = rollDice(self._rng, games.size)
+            games = games[counts[(self._boards[games].astype(np.intp) << 4) | self._rolls[games]] == 0]
+        return
+
+class QLearningInterface(TablePlayer):
+    tableName: str = "qlearned"
+    trainCommand: str = "learn"
+
+    def learn(self, tileCount: int = 9, transitions: int = DEFAULT_TRANSITIONS, games: int = DEFAULT_PARALLEL_GAMES, exploration: float = DEFAULT_EXPLORATION, seed: int | None = None, reportEvery: int | None = None) -> list[tuple[int, float, np.ndarray]]:
+        """Learn a policy table with Q-learning, then save it.
+
+        :param tileCount: Number of tiles in the game
+        :type tileCount: int
+        :param transitions: Number of moves to learn from
+        :type transitions: int
+        :param games: Number of games played in lockstep
+        :type games: int
+        :param exploration: Chance of taking a random move instead of the best move so far
+        :type exploration: float
+        :param seed: Root seed for dice and exploration, or None to draw one
+        :type seed: int | None
+        :param reportEvery: Number of moves between snapshots of the learned policy, or None for only the final one
+        :type reportEvery: int | None
+        :return: Moves learned from, seconds spent learning and the learned policy table at each snapshot
+        :rtype: list[tuple[int, float, np.ndarray]]
+        """
+        if seed is None:
+            seed = newSeed()
+
+        # Learn in chunks, so that the policy can be snapshotted along the way without counting that time.
+        learner = QLearner(tileCount, games, exploration, makeGenerator(seed))
+        chunkSize = reportEvery if reportEvery is not None else transitions
+        snapshots = []
+        seconds = 0.0
+        with tqdm.tqdm(total = transitions) as progressBar:
+            while learner.transitions < transitions:
+                startTime = perf_counter()
+                previousTransitions = learner.transitions
+                learner.learn(min(chunkSize, transitions - learner.transitions))
+                seconds += perf_counter() - startTime
+                snapshots.append((learner.transitions, seconds, learner.bestMoves()))
+                progressBar.update(min(learner.transitions, transitions) - previousTransitions)
+
+        # Save the final policy, then drop any stale copy that was already loaded in this process.
+        writePolicyTable(self.tablePath(tileCount), snapshots[-1][2])
+        clearTableCaches()
+        return snapshots
+
+
+# MAIN ENTRY.
+def main() -> None:
+    raise NotImplementedError
+
+if __name__=="__main__":
+    main()
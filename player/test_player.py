@@ -0,0 +1,351 @@
+# test_player.py
+# Desc: Unit tests for the player module.
+# Author: Noah Black (noah.black0425@gmail.com)
+# Last Updated: October 17th, 2026
+
+
+# NATIVE IMPORTS.
+import itertools
+import os
+import tempfile
+# THIRD-PARTY IMPORTS.
+import pytest
+# LOCAL IMPORTS.
+import player
+import game.board as board
+import game.cache as cache
+import game.checkpoint as checkpoint
+import game.dice as dice
+import game.solver as solver
+from game.core import GameInstance
+
+
+# CLASSES.
+class InterruptingCheckpoint(checkpoint.Checkpoint):
+    def __init__(self, *args, saveLimit: int = 1, **kwargs) -> None:
+        super().__init__(*args, interval = 0.0, **kwargs)
+        self.saveLimit = saveLimit
+
+    def save(self, tables = None) -> None:
+        # Save as usual, then stop the run as if it had been interrupted.
+        super().save(tables)
+        self.saveLimit -= 1
+        if self.saveLimit <= 0:
+            raise KeyboardInterrupt
+
+class CountingPlayer(player.PlayerInterface):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def select(self, game: GameInstance) -> tuple[int, ...]:
+        self.calls += 1
+        return game.validMoves[0]
+
+class ListPlayer(player.PlayerInterface):
+    def select(self, game: GameInstance) -> list[int]:
+        return list(game.validMoves[-1])
+
+class TestPackage():
+    def test_submodulesAreNotShadowed(self) -> None:
+        # Names imported inside player modules, like the standard library random, must not replace player modules.
+        assert player.random.RandomPlayer is player.RandomPlayer
+        assert player.train.TrainedInterface is player.TrainedInterface
+        assert not hasattr(player, "os")
+        assert not hasattr(player, "DEFAULT_ITERATIONS")
+        return
+
+class TestCompile():
+    def test_compiledMatchesSelect(self) -> None:
+        gamePlayer = player.LargestFirstPlayer()
+        policy = player.compilePolicy(gamePlayer)
+        for tableBoard, roll in player.reachableStates():
+            game = GameInstance.fromState(tableBoard, roll)
+            assert policy[tableBoard, roll] == board.tilesToMask(gamePlayer.select(game))
+        return
+
+    def test_unreachableStatesAreEmpty(self) -> None:
+        policy = player.compilePolicy(player.MostThenSmall())
+        assert (policy[0] == 0).all()
+        assert policy[board.fullBoard(9), 1] == 0
+        return
+
+    def test_randomIsStochastic(self) -> None:
+        policy = player.compilePolicy(player.RandomPlayer())
+        assert policy.ndim == 3
+        return
+
+    def test_rejectsManual(self) -> None:
+        with pytest.raises(Exception, match = "is interactive and cannot be compiled"):
+            player.compilePolicy(player.ManualPlayer())
+        return
+
+    def test_rejectsStateful(self) -> None:
+        with pytest.raises(Exception, match = "is stateful and cannot be compiled"):
+            player.compilePolicy(CountingPlayer())
+        return
+
+class TestSelectIndex():
+    def test_indexMatchesSelect(self) -> None:
+        for playerClass in (player.LargestFirstPlayer, player.LargePreserveLowPlayer, player.MostThenSmall, player.MostThenLarge, player.OptimalPlayer):
+            gamePlayer = playerClass()
+            assert gamePlayer.trusted
+            for tableBoard, roll in player.reachableStates():
+                game = GameInstance.fromState(tableBoard, roll)
+                assert game.validMoves[gamePlayer.selectIndex(game)] is gamePlayer.select(game)
+        return
+
+    def test_defaultIndexAcceptsLists(self) -> None:
+        game = GameInstance()
+        game.start()
+        assert ListPlayer().selectIndex(game) == len(game.validMoves) - 1
+        return
+
+    def test_defaultIndexUsesSelect(self) -> None:
+        gamePlayer = CountingPlayer()
+        game = GameInstance()
+        game.start()
+        assert not gamePlayer.trusted
+        assert gamePlayer.selectIndex(game) == 0
+        return
+
+class TestRollout():
+    def test_picksClearlyBetterMove(self) -> None:
+        # Flipping 1, 2 and 3 from this board costs over 9 points in expectation compared to flipping 6.
+        game = GameInstance.fromState(board.tilesToMask([ 1, 2, 3, 4, 5, 6, 7, 8, 9 ]) ^ board.tilesToMask([ 4, 5 ]), 6)
+        assert game.validMoves == ((6,), (1, 2, 3))
+        assert player.RolloutPlayer(rollouts = 200).select(game) == (6,)
+        return
+
+    def test_seededGamesReplay(self) -> None:
+        results = []
+        for _ in range(2):
+            gamePlayer = player.RolloutPlayer(rollouts = 20, rolloutPolicy = "random")
+            game = GameInstance(dice = dice.makeDice(21))
+            game.start()
+            while not game.finished:
+                game.turnIndex(gamePlayer.selectIndex(game))
+            results.append(game.moveHistory)
+        assert results[0] == results[1]
+        return
+
+    def test_needsBudget(self) -> None:
+        with pytest.raises(Exception, match = "needs a rollout or time budget"):
+            player.RolloutPlayer(rollouts = None)
+        return
+
+    def test_rejectsCompile(self) -> None:
+        with pytest.raises(Exception, match = "is not deterministic and cannot be compiled"):
+            player.compilePolicy(player.RolloutPlayer())
+        return
+
+class TestTrained():
+    def test_trainedNearOptimal(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            gamePlayer = player.TrainedInterface(os.path.join(directory, "trained.npy"))
+            policy = gamePlayer.train(tileCount = 5, iterations = 300, seed = 1)
+            expectedScore, _ = solver.evaluatePolicy(policy, 5)
+            optimalScore, _ = solver.evaluatePolicy(solver.solveOptimal(5)[1], 5)
+            assert expectedScore < optimalScore + 0.05
+
+            # A fresh player should load the saved table, and select the same moves as the table.
+            loadedPlayer = player.TrainedInterface(gamePlayer.tableFile)
+            assert (loadedPlayer.policyTable(5) == policy).all()
+            for tableBoard, roll in player.reachableStates(5):
+                game = GameInstance.fromState(tableBoard, roll, tileCount = 5)
+                assert board.tilesToMask(loadedPlayer.select(game)) == policy[tableBoard, roll]
+        return
+
+    def test_seededTrainingReplays(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            policies = [ player.TrainedInterface(os.path.join(directory, f"trained{index}.npy")).train(tileCount = 4, iterations = 50, seed = 2) for index in range(2) ]
+        assert (policies[0] == policies[1]).all()
+        return
+
+    def test_trainingTableMerge(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            gamePlayer = player.TrainedInterface(os.path.join(directory, "trained.npy"))
+            policy = gamePlayer.train(tileCount = 4, iterations = 50, seed = 3)
+            trainingTable = player.TrainingTable.load(gamePlayer.statsPath(4), 4)
+            assert not trainingTable.data.flags.writeable
+            assert (trainingTable.bestMoves() == policy).all()
+
+            # Merging adds counts and sums, which leaves every average, and so every best move, unchanged.
+            mergedTable = trainingTable.merge(trainingTable)
+            assert (mergedTable.counts == 2 * trainingTable.counts).all()
+            assert (mergedTable.bestMoves() == policy).all()
+            del trainingTable
+        return
+
+    def test_resumeMatchesFullTraining(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            fullPolicy = player.TrainedInterface(os.path.join(directory, "full.npy")).train(tileCount = 5, iterations = 20, seed = 4)
+
+            # Interrupt training partway through, then resume it from the checkpoint it left behind.
+            checkpointPath = os.path.join(directory, "checkpoint.json")
+            gamePlayer = player.TrainedInterface(os.path.join(directory, "resumed.npy"))
+            try:
+                gamePlayer.train(tileCount = 5, iterations = 20, seed = 4, trainingCheckpoint = InterruptingCheckpoint(checkpointPath, {}, saveLimit = 3))
+            except KeyboardInterrupt:
+                pass
+            resumedCheckpoint = checkpoint.Checkpoint.load(checkpointPath)
+            assert resumedCheckpoint.state["level"] > 0
+            resumedPolicy = gamePlayer.train(tileCount = 5, iterations = 20, seed = 4, trainingCheckpoint = resumedCheckpoint)
+            assert (resumedPolicy == fullPolicy).all()
+            assert (player.TrainingTable.load(gamePlayer.statsPath(5), 5).data == player.TrainingTable.load(os.path.join(directory, "full-stats.npy"), 5).data).all()
+        return
+
+    def test_resumeAfterCrashWhileSaving(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            fullPlayer = player.TrainedInterface(os.path.join(directory, "full.npy"))
+            fullPlayer.train(tileCount = 5, iterations = 20, seed = 4)
+
+            # Crash after the third training table is written, before the checkpoint naming it is.
+            writeCount = 0
+            def crashingWrite(path: str, table) -> None:
+                nonlocal writeCount
+                cache.writePolicyTable(path, table)
+                writeCount += 1
+                if writeCount == 3:
+                    raise KeyboardInterrupt
+            checkpointPath = os.path.join(directory, "checkpoint.json")
+            gamePlayer = player.TrainedInterface(os.path.join(directory, "resumed.npy"))
+            monkeypatch.setattr(checkpoint, "writePolicyTable", crashingWrite)
+            with pytest.raises(KeyboardInterrupt):
+                gamePlayer.train(tileCount = 5, iterations = 20, seed = 4, trainingCheckpoint = checkpoint.Checkpoint(checkpointPath, {}, interval = 0.0))
+            monkeypatch.undo()
+
+            # Shards in the unnamed table are trained again on resume, and must not be counted twice.
+            gamePlayer.train(tileCount = 5, iterations = 20, seed = 4, trainingCheckpoint = checkpoint.Checkpoint.load(checkpointPath))
+            assert (player.TrainingTable.load(gamePlayer.statsPath(5), 5).data == player.TrainingTable.load(fullPlayer.statsPath(5), 5).data).all()
+        return
+
+    def test_stateConverged(self) -> None:
+        # Moves 8 apart with little spread in their difference are told apart, but equal moves only settle within tolerance.
+        assert player.stateConverged(100, [ 100, 900 ], [ [ 0, 6500 ], [ 6500, 0 ] ])
+        assert not player.stateConverged(100, [ 500, 500 ], [ [ 0, 1000 ], [ 1000, 0 ] ], tolerance = 0.0)
+        assert player.stateConverged(100, [ 500, 500 ], [ [ 0, 1000 ], [ 1000, 0 ] ], tolerance = 10.0)
+        assert not player.stateConverged(1, [ 1, 9 ], [ [ 0, 64 ], [ 64, 0 ] ])
+        return
+
+    def test_stateConvergedIsPaired(self) -> None:
+        # Paired differences are summed from the scores of every move on the same rolls.
+        flatPolicy = solver.solveOptimal(5)[1].reshape(-1).tolist()
+        moveTable = board.loadMoveTable(5)
+        moveMasks = moveTable.masksAt(board.tableIndex(0b11111, 7))
+        totals, _, differenceSquares = player.trainState(0b11111, 7, flatPolicy, dice.makeDice(3), 50, 5)
+        replayDice = dice.makeDice(3)
+        expectedSquares = [ [ 0 ] * len(moveMasks) for _ in moveMasks ]
+        for _ in range(50):
+            rolls = [ sum(replayDice.roll()) for _ in range(5) ]
+            scores = [ player.continuationScore(0b11111 ^ moveMask, rolls, flatPolicy, moveTable) for moveMask in moveMasks ]
+            for moveIndex, otherIndex in itertools.product(range(len(moveMasks)), repeat = 2):
+                expectedSquares[moveIndex][otherIndex] += (scores[moveIndex] - scores[otherIndex]) ** 2
+        assert differenceSquares == expectedSquares
+
+        # Moves scoring anywhere from 0 to 20 but always 1 apart are widely spread, yet settle on their difference.
+        assert player.stateConverged(100, [ 1000, 1100 ], [ [ 0, 100 ], [ 100, 0 ] ], tolerance = 0.0)
+        return
+
+    def test_shardBudget(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            policyPath = os.path.join(directory, "policy.npy")
+            cache.writePolicyTable(policyPath, solver.solveOptimal(5)[1])
+            states = [ (tableBoard, roll) for tableBoard, roll in player.reachableStates(5) if len(board.loadMoveTable(5).masksAt(board.tableIndex(tableBoard, roll))) > 1 ]
+
+            # States stop once settled, so a shard never plays more than its budget, and an easy one plays less.
+            shardStats = player.trainShard(states, policyPath, 300, 0.05, 0.99, 5, 5)
+            counts = [ count for count, _, _ in shardStats ]
+            assert sum(counts) <= 300 * len(states)
+            assert min(counts) < max(counts)
+            assert shardStats == player.trainShard(states, policyPath, 300, 0.05, 0.99, 5, 5)
+
+            # Below one batch per state, every state still gets its share rather than the first few taking it all.
+            assert [ count for count, _, _ in player.trainShard(states, policyPath, 20, 0.05, 0.99, 5, 6) ] == [ 20 ] * len(states)
+        return
+
+    def test_tableShape(self) -> None:
+        # A table trained for one tile count is rejected by name when played with another.
+        with tempfile.TemporaryDirectory() as directory:
+            tablePath = os.path.join(directory, "trained5.npy")
+            cache.writePolicyTable(tablePath, solver.solveOptimal(5)[1])
+            game = GameInstance(dice = dice.makeDice(1))
+            game.start()
+            with pytest.raises(Exception, match = "trained5.npy of shape .* does not match 9 tiles"):
+                player.TrainedInterface(tablePath).selectIndex(game)
+            assert player.TrainedInterface(tablePath).policyTable(5).shape == (32, board.ROLL_SLOTS)
+        return
+
+    def test_trainingTableShape(self) -> None:
+        with pytest.raises(Exception, match = "does not match 4 tiles"):
+            player.TrainingTable(4, player.TrainingTable(5).data)
+        return
+
+    def test_missingTable(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            gamePlayer = player.TrainedInterface(os.path.join(directory, "missing.npy"))
+            with pytest.raises(Exception, match = "run 'main.py train' first"):
+                gamePlayer.policyTable()
+        return
+
+class TestQLearning():
+    def test_learnsNearOptimal(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            gamePlayer = player.QLearningInterface(os.path.join(directory, "qlearned.npy"))
+            snapshots = gamePlayer.learn(tileCount = 5, transitions = 2000000, games = 4096, seed = 1, reportEvery = 1000000)
+            assert [ transitions for transitions, _, _ in snapshots ] == sorted(transitions for transitions, _, _ in snapshots)
+            expectedScore, _ = solver.evaluatePolicy(snapshots[-1][2], 5)
+            optimalScore, _ = solver.evaluatePolicy(solver.solveOptimal(5)[1], 5)
+            assert expectedScore < optimalScore + 0.05
+            assert (gamePlayer.policyTable(5) == snapshots[-1][2]).all()
+        return
+
+    def test_seededLearningReplays(self) -> None:
+        learners = [ player.QLearner(4, games = 256, rng = dice.makeGenerator(2)) for _ in range(2) ]
+        for learner in learners:
+            learner.learn(20000)
+        assert (learners[0].values == learners[1].values).all()
+        assert (learners[0].visits == learners[1].visits).all()
+        return
+
+    def test_missingTableNamesLearn(self) -> None:
+        # Q-learned tables are built by the learn command, and Monte Carlo training must never overwrite them.
+        assert not hasattr(player.QLearningInterface, "train")
+        with tempfile.TemporaryDirectory() as directory:
+            gamePlayer = player.QLearningInterface(os.path.join(directory, "missing.npy"))
+            with pytest.raises(Exception, match = "run 'main.py learn' first"):
+                gamePlayer.policyTable()
+        return
+
+    def test_invalidMovesNeverPicked(self) -> None:
+        learner = player.QLearner(5, games = 256, rng = dice.makeGenerator(3))
+        learner.learn(20000)
+        policy = learner.bestMoves()
+        for tableBoard, roll in player.reachableStates(5):
+            masks = board.loadMoveTable(5).masksAt(board.tableIndex(tableBoard, roll))
+            assert policy[tableBoard, roll] in masks if masks else policy[tableBoard, roll] == 0
+        return
+
+class TestOptimal():
+    def test_selectMatchesPolicy(self) -> None:
+        gamePlayer = player.OptimalPlayer()
+        policy = gamePlayer.policyTable()
+        for tableBoard, roll in player.reachableStates():
+            game = GameInstance.fromState(tableBoard, roll)
+            assert board.tilesToMask(gamePlayer.select(game)) == policy[tableBoard, roll]
+        return
+
+    def test_smallTileCount(self) -> None:
+        gamePlayer = player.OptimalPlayer()
+        game = GameInstance(tileCount = 4)
+        game.start()
+        while not game.finished:
+            game.turn(gamePlayer.select(game))
+        return
+
+
+# MAIN ENTRY.
+def main() -> None:
+    raise NotImplementedError
+
+if __name__=="__main__":
+    main()
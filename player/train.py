@@ -1,31 +1,383 @@
 # train.py
 # Desc: Player class that supports both training off of a variety of game data and applying training in runs.
-#   Uses a monte-carlo style optimization strategy, selecting random moves for game states, then using results to inform future moves.
+#   Uses a monte-carlo style optimization strategy, simulating every move from each game state, then using results to inform future moves.
+#   States are trained in order of tiles remaining, so continuations always follow moves that have already been trained.
 # Author: Noah Black (noah.black0425@gmail.com)
-# Last Updated: June 21st, 2025
+# Last Updated: October 17th, 2026
 
 
 # NATIVE IMPORTS.
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from math import sqrt
+from statistics import NormalDist
 # THIRD-PARTY IMPORTS.
+import numpy as np
+import tqdm
 # LOCAL IMPORTS.
-from game.core import GameInstance
-from .base import PlayerInterface
+from .table import TablePlayer, clearTableCaches
+from game.batch import moveArrays
+from game.board import ROLL_SLOTS, MoveTable, fullBoard, loadMoveTable, tableIndex
+from game.cache import MAX_ROLL, readPolicyTable, writePolicyTable
+from game.checkpoint import Checkpoint
+from game.dice import DiceSource, makeDice, newSeed
 
 
 # CONSTANTS.
-DEFAULT_ITERATIONS: int = 100000
+DEFAULT_ITERATIONS: int = 1000
+# States are sampled in batches of continuations, and stop early once their best move is settled.
+BATCH_ITERATIONS: int = 100
+DEFAULT_TOLERANCE: float = 0.05
+DEFAULT_CONFIDENCE: float = 0.99
+# States are split into fixed-size shards, so a seeded training run learns the same table for any # of workers.
+TRAIN_SHARD_SIZE: int = 64
+# Positions of the continuation count, final score sum and squared final score sum for each move in a training table.
+COUNT_FIELD: int = 0
+SUM_FIELD: int = 1
+SQUARE_FIELD: int = 2
+
+
+# FUNCTIONS.
+def continuationScore(board: int, rolls: list[int], flatPolicy: list[int], moveTable: MoveTable) -> int:
+    # Play out the game from a board using the given rolls and the moves trained so far.
+    for roll in rolls:
+        if board == 0:
+            break
+        move = flatPolicy[(board << 4) | roll]
+        if move == 0:
+            break
+        board ^= move
+    return moveTable.sums[board]
+
+def trainState(board: int, roll: int, flatPolicy: list[int], diceSource: DiceSource, iterations: int = BATCH_ITERATIONS, tileCount: int = 9) -> tuple[list[int], list[int], list[list[int]]]:
+    """Sample the value of every move from a single state.
+
+    Each iteration plays every move against the same rolls, continuing with the moves already trained for smaller
+    boards, so that differences between moves come from the moves themselves rather than from luckier dice.
+
+    :param board: Board mask of the state
+    :type board: int
+    :param roll: Roll total of the state
+    :type roll: int
+    :param flatPolicy: Trained move masks so far, indexed by tableIndex()
+    :type flatPolicy: list[int]
+    :param diceSource: Dice used for continuations
+    :type diceSource: DiceSource
+    :param iterations: Number of continuations played from each move
+    :type iterations: int
+    :param tileCount: Number of tiles in the game
+    :type tileCount: int
+    :return: Sums of final scores and of squared final scores over all continuations from each move, in move table
+        order, and sums of squared differences between the final scores of each pair of moves on the same rolls
+    :rtype: tuple[list[int], list[int], list[list[int]]]
+    """
+    moveTable = loadMoveTable(tileCount)
+    moveMasks = moveTable.masksAt(tableIndex(board, roll))
+
+    # A continuation flips at least one tile per roll, so it never needs more rolls than tiles left on the board.
+    rollCount = board.bit_count()
+    scoreRows = []
+    for _ in range(iterations):
+        rolls = [ sum(diceSource.roll()) for _ in range(rollCount) ]
+        scoreRows.append([ continuationScore(board ^ moveMask, rolls, flatPolicy, moveTable) for moveMask in moveMasks ])
+
+    # Sum the products of every pair of moves' scores at once. Squared differences between two moves follow from their
+    # squares and their product, as (a - b) ** 2 = a * a + b * b - 2 * a * b.
+    scoreMatrix = np.array(scoreRows, dtype = np.int64).reshape(iterations, len(moveMasks))
+    products = scoreMatrix.T @ scoreMatrix
+    squareTotals = np.diagonal(products)
+    differenceSquares = squareTotals[:, None] + squareTotals[None, :] - 2 * products
+    return scoreMatrix.sum(axis = 0).tolist(), squareTotals.tolist(), differenceSquares.tolist()
+
+def stateConverged(count: int, totals: list[int], differenceSquares: list[list[int]], tolerance: float = DEFAULT_TOLERANCE, confidence: float = DEFAULT_CONFIDENCE) -> bool:
+    """Check whether a state has been sampled enough to settle on its best move.
+
+    Moves are played against the same rolls, so they are compared by the difference between their final scores on
+    each continuation. A state is settled once the confidence interval on that difference between its best and
+    second-best moves excludes zero, or is narrower than the tolerance, so that either move is as good.
+
+    :param count: Number of continuations played from each move
+    :type count: int
+    :param totals: Sum of final scores for each move
+    :type totals: list[int]
+    :param differenceSquares: Sum of squared differences between the final scores of each pair of moves
+    :type differenceSquares: list[list[int]]
+    :param tolerance: Largest difference in average final score that is not worth telling apart
+    :type tolerance: float
+    :param confidence: Two-sided confidence level of the interval
+    :type confidence: float
+    :return: Whether sampling can stop
+    :rtype: bool
+    """
+    if count < 2:
+        return False
+    means = [ total / count for total in totals ]
+    bestIndex, secondIndex = sorted(range(len(means)), key = means.__getitem__)[:2]
+    meanDifference = means[secondIndex] - means[bestIndex]
+    differenceVariance = max(differenceSquares[bestIndex][secondIndex] / count - meanDifference * meanDifference, 0.0) * count / (count - 1)
+
+    differenceWidth = NormalDist().inv_cdf(0.5 + confidence / 2) * sqrt(differenceVariance / count)
+    return meanDifference > differenceWidth or differenceWidth < tolerance
+
+def trainShard(states: list[tuple[int, int]], policyPath: str, iterations: int = DEFAULT_ITERATIONS, tolerance: float = DEFAULT_TOLERANCE, confidence: float = DEFAULT_CONFIDENCE, tileCount: int = 9, seed: int | None = None, *streamPath: int) -> list[tuple[int, list[int], list[int]]]:
+    """Train a shard of states against the policy trained so far.
+
+    The shard gets a budget of iterations continuations per state on average. States are sampled in batches, and
+    each state stops as soon as it converges, leaving the rest of the budget to the states that are still ambiguous.
+
+    :param states: Board masks and roll totals to train
+    :type states: list[tuple[int, int]]
+    :param policyPath: Policy table file holding the moves trained so far
+    :type policyPath: str
+    :param iterations: Average number of continuations played from each move of each state
+    :type iterations: int
+    :param tolerance: Largest difference in average final score that is not worth telling apart
+    :type tolerance: float
+    :param confidence: Two-sided confidence level used to compare moves
+    :type confidence: float
+    :param tileCount: Number of tiles in the game
+    :type tileCount: int
+    :param seed: Root seed for continuation dice
+    :type seed: int | None
+    :param streamPath: Stream indices of the shard below the root seed
+    :type streamPath: int
+    :return: Continuation count, sums of final scores and sums of squared final scores for each state, in order
+    :rtype: list[tuple[int, list[int], list[int]]]
+    """
+    flatPolicy = readPolicyTable(policyPath).reshape(-1).tolist()
+    diceSource = makeDice(seed, *streamPath)
+    results = [ (0, [], []) for _ in states ]
+    # Paired differences are only needed to decide when to stop, and are not kept in the training table.
+    differenceResults = [ [] for _ in states ]
+    remainingBudget = iterations * len(states)
+    activeIndices = list(range(len(states)))
+    while activeIndices and remainingBudget > 0:
+        # Give every unsettled state another batch, as far as the budget allows. First batches are capped at the
+        # average budget, so that every state is sampled before any budget is reallocated.
+        for stateIndex in activeIndices:
+            count, totals, squareTotals = results[stateIndex]
+            batchSize = min(BATCH_ITERATIONS, remainingBudget) if count > 0 else min(BATCH_ITERATIONS, iterations, remainingBudget)
+            if batchSize <= 0:
+                break
+            board, roll = states[stateIndex]
+            batchTotals, batchSquares, batchDifferences = trainState(board, roll, flatPolicy, diceSource, batchSize, tileCount)
+            if count > 0:
+                batchTotals = [ total + batchTotal for total, batchTotal in zip(totals, batchTotals) ]
+                batchSquares = [ squareTotal + batchSquare for squareTotal, batchSquare in zip(squareTotals, batchSquares) ]
+                batchDifferences = [ [ total + batchTotal for total, batchTotal in zip(row, batchRow) ] for row, batchRow in zip(differenceResults[stateIndex], batchDifferences) ]
+            results[stateIndex] = (count + batchSize, batchTotals, batchSquares)
+            differenceResults[stateIndex] = batchDifferences
+            remainingBudget -= batchSize
+        activeIndices = [ stateIndex for stateIndex in activeIndices if not stateConverged(results[stateIndex][0], results[stateIndex][1], differenceResults[stateIndex], tolerance, confidence) ]
+    return results
 
 
 # CLASSES.
-class TrainedInterface(PlayerInterface):
-    def select(self, game: GameInstance) -> list[int]:
-        ...
+class TrainingTable():
+    def __init__(self, tileCount: int = 9, data: np.ndarray | None = None) -> None:
+        # Statistics are stored as one fixed-width array of shape (boards, ROLL_SLOTS, max moves, 3), where the move
+        # slots line up with moveArrays(). Each slot holds the # of continuations played, the sum of their scores and
+        # the sum of their squared scores.
+        moves, _ = moveArrays(tileCount)
+        shape = (1 << tileCount, ROLL_SLOTS, moves.shape[1], 3)
+        if data is None:
+            data = np.zeros(shape, dtype = np.uint64)
+        if data.shape != shape or data.dtype != np.uint64:
+            raise Exception(f"Training table of shape {data.shape} ({data.dtype}) does not match {tileCount} tiles.")
+        self._tileCount: int = tileCount
+        self._data: np.ndarray = data
+
+    @property
+    def tileCount(self) -> int:
+        return self._tileCount
+
+    @property
+    def data(self) -> np.ndarray:
+        return self._data
+
+    @property
+    def counts(self) -> np.ndarray:
+        return self._data[..., COUNT_FIELD]
+
+    @property
+    def sums(self) -> np.ndarray:
+        return self._data[..., SUM_FIELD]
+
+    @property
+    def squareSums(self) -> np.ndarray:
+        return self._data[..., SQUARE_FIELD]
+
+    @classmethod
+    def load(cls, path: str, tileCount: int = 9) -> "TrainingTable":
+        """Map a saved training table into memory, read-only. Use merge() to build on it.
+
+        :param path: Table file path
+        :type path: str
+        :param tileCount: Number of tiles in the game
+        :type tileCount: int
+        :return: Training table backed by the mapped file
+        :rtype: TrainingTable
+        """
+        return cls(tileCount, readPolicyTable(path))
+
+    def save(self, path: str) -> None:
+        """Write the training table to a file that can be memory-mapped by load().
+
+        :param path: Table file path
+        :type path: str
+        """
+        writePolicyTable(path, self._data)
+        return
+
+    def merge(self, other: "TrainingTable") -> "TrainingTable":
+        """Combine the statistics of two training tables.
+
+        :param other: Table to add to this one
+        :type other: TrainingTable
+        :return: New table holding the statistics of both
+        :rtype: TrainingTable
+        """
+        if other.tileCount != self._tileCount:
+            raise Exception(f"Cannot merge training tables for {self._tileCount} and {other.tileCount} tiles.")
+        return TrainingTable(self._tileCount, self._data + other.data)
+
+    def record(self, board: int, roll: int, iterations: int, totals: list[int], squareTotals: list[int]) -> None:
+        """Add the results of training a single state. The table must not be memory-mapped.
+
+        :param board: Board mask of the state
+        :type board: int
+        :param roll: Roll total of the state
+        :type roll: int
+        :param iterations: Number of continuations played from each move
+        :type iterations: int
+        :param totals: Sum of final scores for each move, in move table order
+        :type totals: list[int]
+        :param squareTotals: Sum of squared final scores for each move, in move table order
+        :type squareTotals: list[int]
+        """
+        self._data[board, roll, :len(totals), COUNT_FIELD] += iterations
+        self._data[board, roll, :len(totals), SUM_FIELD] += np.array(totals, dtype = np.uint64)
+        self._data[board, roll, :len(totals), SQUARE_FIELD] += np.array(squareTotals, dtype = np.uint64)
+        return
+
+    def bestMoves(self) -> np.ndarray:
+        """Pick the move with the lowest average final score in every state.
+
+        States without any statistics, such as those with a single move, fall back to their first move.
+
+        :return: Deterministic policy table of move masks
+        :rtype: np.ndarray
+        """
+        moves, _ = moveArrays(self._tileCount)
+        counts = self.counts.reshape(len(moves), -1)
+        means = np.where(counts > 0, self.sums.reshape(len(moves), -1) / np.maximum(counts, 1), np.inf)
+        bestSlots = np.argmin(means, axis = 1)
+        return moves[np.arange(len(moves)), bestSlots].reshape(1 << self._tileCount, ROLL_SLOTS)
+
+class TrainedInterface(TablePlayer):
+    tableName: str = "trained"
+    trainCommand: str = "train"
+
+    def statsPath(self, tileCount: int = 9) -> str:
+        """Get the training table file saved next to the policy table.
+
+        :param tileCount: Number of tiles in the game
+        :type tileCount: int
+        :return: Training table file path
+        :rtype: str
+        """
+        return f"{os.path.splitext(self.tablePath(tileCount))[0]}-stats.npy"
+
+    def train(self, tileCount: int = 9, iterations: int = DEFAULT_ITERATIONS, workers: int = 1, seed: int | None = None, trainingCheckpoint: Checkpoint | None = None, tolerance: float = DEFAULT_TOLERANCE, confidence: float = DEFAULT_CONFIDENCE) -> np.ndarray:
+        """Train a policy table for every game state, then save it and the training table behind it.
+
+        States are trained in order of tiles remaining, since continuations from a state only ever reach boards with
+        fewer tiles. The states for each # of tiles are split into shards and trained across a process pool.
+
+        :param tileCount: Number of tiles in the game
+        :type tileCount: int
+        :param iterations: Average number of continuations played from each move of each state
+        :type iterations: int
+        :param workers: Number of worker processes to split states across
+        :type workers: int
+        :param seed: Root seed for continuation dice, or None to draw one
+        :type seed: int | None
+        :param trainingCheckpoint: Checkpoint to save progress to, continuing from any progress it already holds
+        :type trainingCheckpoint: Checkpoint | None
+        :param tolerance: Largest difference in average final score that is not worth telling apart
+        :type tolerance: float
+        :param confidence: Two-sided confidence level used to compare moves
+        :type confidence: float
+        :return: Trained deterministic policy table
+        :rtype: np.ndarray
+        """
+        if seed is None:
+            seed = newSeed()
+
+        # Continue from the training table saved with the checkpoint, if it has one. Progress tracks the first level
+        # that is not yet complete, along with the shards of that level that are.
+        progress = trainingCheckpoint.state if trainingCheckpoint is not None else {}
+        if "level" in progress:
+            trainingTable = TrainingTable(tileCount, np.array(trainingCheckpoint.loadTable("stats")))
+        else:
+            trainingTable = TrainingTable(tileCount)
+        progress.setdefault("level", 0)
+        progress.setdefault("completedShards", [])
+
+        # States with a single move have nothing to train, and always keep that move.
+        moveTable = loadMoveTable(tileCount)
+        policy = trainingTable.bestMoves()
+        statesByLevel: list[list[tuple[int, int]]] = [ [] for _ in range(tileCount + 1) ]
+        for board in range(1, fullBoard(tileCount) + 1):
+            for roll in range(2, MAX_ROLL + 1):
+                if moveTable.moveCount(tableIndex(board, roll)) > 1:
+                    statesByLevel[board.bit_count()].append((board, roll))
+
+        # Workers map the moves trained so far from a shared file, which is rewritten after each level.
+        executor = ProcessPoolExecutor(max_workers = workers) if workers > 1 else None
+        try:
+            with tempfile.TemporaryDirectory() as sharedDirectory, tqdm.tqdm(total = sum(len(states) for states in statesByLevel)) as progressBar:
+                policyPath = os.path.join(sharedDirectory, "policy.npy")
+                for level, states in enumerate(statesByLevel):
+                    if level < progress["level"]:
+                        progressBar.update(len(states))
+                        continue
+
+                    # Shards keep their index when resumed, so that each one still draws from the same dice stream.
+                    writePolicyTable(policyPath, policy)
+                    shards = [ states[shardStart:shardStart + TRAIN_SHARD_SIZE] for shardStart in range(0, len(states), TRAIN_SHARD_SIZE) ]
+                    pendingIndices = [ shardIndex for shardIndex in range(len(shards)) if shardIndex not in progress["completedShards"] ]
+                    progressBar.update(sum(len(shards[shardIndex]) for shardIndex in range(len(shards)) if shardIndex not in pendingIndices))
+                    pendingShards = [ shards[shardIndex] for shardIndex in pendingIndices ]
+                    if executor is not None:
+                        shardResults = executor.map(trainShard, pendingShards, [ policyPath ] * len(pendingShards), [ iterations ] * len(pendingShards), [ tolerance ] * len(pendingShards), [ confidence ] * len(pendingShards), [ tileCount ] * len(pendingShards), [ seed ] * len(pendingShards), [ level ] * len(pendingShards), pendingIndices)
+                    else:
+                        shardResults = ( trainShard(shards[shardIndex], policyPath, iterations, tolerance, confidence, tileCount, seed, level, shardIndex) for shardIndex in pendingIndices )
+                    for shardIndex, shardStats in zip(pendingIndices, shardResults):
+                        for (board, roll), stateStats in zip(shards[shardIndex], shardStats):
+                            trainingTable.record(board, roll, *stateStats)
+                        progressBar.update(len(shards[shardIndex]))
+                        progress["completedShards"].append(shardIndex)
+                        if trainingCheckpoint is not None:
+                            trainingCheckpoint.saveIfDue({ "stats": trainingTable.data })
+
+                    # Later levels continue with the moves learned here.
+                    policy = trainingTable.bestMoves()
+                    progress["level"] = level + 1
+                    progress["completedShards"] = []
+        finally:
+            if executor is not None:
+                executor.shutdown()
 
-    def train(self, outputFile: str = "training.csv") -> None:
-        ...
+        # Save both tables, then drop any stale copy of the policy that was already loaded in this process.
+        if trainingCheckpoint is not None:
+            trainingCheckpoint.save({ "stats": trainingTable.data })
+        trainingTable.save(self.statsPath(tileCount))
+        writePolicyTable(self.tablePath(tileCount), policy)
+        clearTableCaches()
+        return policy
 
-    def trainState(self, state: dict[str, list[int]], tiles: list[int], roll: int, iterations: int = DEFAULT_ITERATIONS) -> dict[]
-        ...
 
 # MAIN ENTRY.
 def main() -> None:
@@ -0,0 +1,70 @@
+# test_main.py
+# Desc: Unit tests for running and totalling games in main.
+# Author: Noah Black (noah.black0425@gmail.com)
+# Last Updated: October 17th, 2026
+
+
+# NATIVE IMPORTS.
+import os
+import tempfile
+# THIRD-PARTY IMPORTS.
+import pytest
+# LOCAL IMPORTS.
+import main
+import player
+import game.checkpoint as checkpoint
+import game.stats as stats
+from player.test_player import InterruptingCheckpoint
+
+
+# CLASSES.
+class TestRunTotals():
+    def test_workersMatchSingleProcess(self) -> None:
+        # Shards draw from fixed dice streams and are merged in order, so the worker count never changes results.
+        for useBatch, iterations in ((False, 25000), (True, 600000)):
+            results = [ main.runTotals(player.LargestFirstPlayer, iterations, useBatch, workers, seed = 7).toDict() for workers in (1, 2) ]
+            assert results[0] == results[1]
+            assert results[0]["count"] == iterations
+        return
+
+    def test_resumeMatchesFullRun(self) -> None:
+        fullStats = main.runTotals(player.LargestFirstPlayer, 50000, seed = 8)
+        with tempfile.TemporaryDirectory() as directory:
+            # Interrupt the run partway through, then resume it from the checkpoint it left behind.
+            checkpointPath = os.path.join(directory, "checkpoint.json")
+            config = { "command": "run", "iterations": 50000, "seed": 8 }
+            interruptingCheckpoint = InterruptingCheckpoint(checkpointPath, config, saveLimit = 2)
+            with pytest.raises(KeyboardInterrupt):
+                main.runTotals(player.LargestFirstPlayer, 50000, seed = 8, progress = interruptingCheckpoint.state.setdefault("progress", {}), runCheckpoint = interruptingCheckpoint)
+            resumedCheckpoint = checkpoint.Checkpoint.load(checkpointPath)
+            assert 0 < len(resumedCheckpoint.state["progress"]["completedShards"]) < 5
+            resumedStats = main.runTotals(player.LargestFirstPlayer, 50000, seed = 8, progress = resumedCheckpoint.state["progress"], runCheckpoint = resumedCheckpoint)
+            assert resumedStats.toDict() == fullStats.toDict()
+
+            # Runs can only be resumed with the settings they were started with.
+            with pytest.raises(Exception, match = "iterations"):
+                checkpoint.Checkpoint.load(checkpointPath).requireConfig({ **config, "iterations": 60000 })
+        return
+
+    def test_stopsAtFirstPreciseShard(self) -> None:
+        # Merge shards one at a time in order, and find the first point at which the target is met.
+        PRECISION: float = 0.1
+        expectedStats = stats.RunStats()
+        for shardIndex in range(10):
+            expectedStats = expectedStats.merge(main.runShard(player.LargestFirstPlayer, main.SHARD_SIZE, seed = 9, shardIndex = shardIndex))
+            if expectedStats.withinPrecision(PRECISION):
+                break
+        assert 1 < expectedStats.count // main.SHARD_SIZE < 10
+
+        # The run should stop there, with any # of workers.
+        for workers in (1, 3):
+            runStats = main.runTotals(player.LargestFirstPlayer, 10 * main.SHARD_SIZE, workers = workers, seed = 9, precision = PRECISION)
+            assert runStats.toDict() == expectedStats.toDict()
+        return
+
+class TestCompare():
+    def test_rejectsTable(self) -> None:
+        # A single table file would otherwise be played by every table player.
+        with pytest.raises(Exception, match = "does not accept --table"):
+            main.compare(table = "trained5.npy", tiles = 5, exact = True)
+        return